@@ -0,0 +1,446 @@
+"""
+Sinabro 캐시 관리
+Redis를 사용한 조회 결과 캐싱
+"""
+
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+import asyncio
+import hashlib
+import json
+import logging
+import time
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class TTLCache:
+    """크기 제한이 있는 프로세스 내 TTL 캐시 (초과 시 LRU 방출)"""
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """값 조회 (만료된 항목은 제거 후 default 반환)"""
+        item = self._data.get(key)
+        if item is None:
+            return default
+        value, expires = item
+        if expires < time.monotonic():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+    
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """값 저장"""
+        self._data[key] = (value, time.monotonic() + (ttl if ttl is not None else self.ttl))
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def pop(self, key: Hashable) -> None:
+        """항목 제거"""
+        self._data.pop(key, None)
+    
+    def clear(self) -> None:
+        """전체 제거"""
+        self._data.clear()
+    
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class CacheManager:
+    """Redis 캐시 관리 클래스"""
+    
+    def __init__(self):
+        self.client = aioredis.from_url(
+            settings.redis_url,
+            decode_responses=True,
+            socket_timeout=1.0,
+            socket_connect_timeout=1.0
+        )
+        self.enabled = settings.CACHE_ENABLED
+    
+    async def get_json(self, key: str) -> Optional[Any]:
+        """JSON 값 조회 (Redis 장애 시 None 반환)"""
+        if not self.enabled:
+            return None
+        try:
+            raw = await self.client.get(key)
+            return json.loads(raw) if raw is not None else None
+        except (RedisError, ValueError) as e:
+            logger.warning(f"Cache get failed for {key}: {e}")
+            return None
+    
+    async def set_json(self, key: str, value: Any, ttl: int, index_keys: tuple = ()) -> bool:
+        """
+        JSON 값 저장
+        index_keys가 주어지면 무효화용 역인덱스 집합에 키를 등록
+        """
+        if not self.enabled or ttl <= 0:
+            return False
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            pipe.set(key, json.dumps(value, ensure_ascii=False, default=str), ex=ttl)
+            for index_key in index_keys:
+                pipe.sadd(index_key, key)
+                pipe.expire(index_key, settings.CACHE_INDEX_TTL)
+            await pipe.execute()
+            return True
+        except RedisError as e:
+            logger.warning(f"Cache set failed for {key}: {e}")
+            return False
+    
+    async def get_many_json(self, keys: List[str]) -> Dict[str, Any]:
+        """여러 JSON 값을 한 번에 조회 (없는 키는 결과에서 제외, Redis 장애 시 빈 결과)"""
+        if not self.enabled or not keys:
+            return {}
+        try:
+            raws = await self.client.mget(keys)
+            return {key: json.loads(raw) for key, raw in zip(keys, raws) if raw is not None}
+        except (RedisError, ValueError) as e:
+            logger.warning(f"Cache mget failed for {len(keys)} keys: {e}")
+            return {}
+    
+    async def set_many_json(self, values: Dict[str, Any], ttl: int) -> bool:
+        """여러 JSON 값을 한 번의 왕복으로 저장"""
+        if not self.enabled or ttl <= 0 or not values:
+            return False
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for key, value in values.items():
+                pipe.set(key, json.dumps(value, ensure_ascii=False, default=str), ex=ttl)
+            await pipe.execute()
+            return True
+        except RedisError as e:
+            logger.warning(f"Cache set failed for {len(values)} keys: {e}")
+            return False
+    
+    async def delete(self, *keys: str) -> int:
+        """키 삭제"""
+        if not self.enabled or not keys:
+            return 0
+        try:
+            return await self.client.delete(*keys)
+        except RedisError as e:
+            logger.warning(f"Cache delete failed for {keys}: {e}")
+            return 0
+    
+    async def delete_indexed(self, index_key: str) -> int:
+        """역인덱스 집합에 등록된 모든 키와 인덱스 자체를 삭제"""
+        if not self.enabled:
+            return 0
+        try:
+            keys = await self.client.smembers(index_key)
+            return await self.client.delete(index_key, *keys)
+        except RedisError as e:
+            logger.warning(f"Cache index delete failed for {index_key}: {e}")
+            return 0
+    
+    async def ping(self) -> bool:
+        """Redis 연결 상태 확인"""
+        try:
+            return bool(await self.client.ping())
+        except RedisError:
+            return False
+    
+    async def close(self) -> None:
+        """연결 종료"""
+        await self.client.close()
+
+
+class AccessCodeCache:
+    """접속 코드 조회 응답 read-through 캐시"""
+    
+    KEY_PREFIX = "access_code:entry:"  # {"version", "result"} 형식
+    CHANNEL_INDEX_PREFIX = "access_code:idx:channel:"
+    USER_INDEX_PREFIX = "access_code:idx:user:"
+    
+    def __init__(self, cache: CacheManager):
+        self.cache = cache
+        self.stats = {"hits": 0, "misses": 0, "stores": 0, "invalidations": 0}
+    
+    def _key(self, code: str) -> str:
+        return f"{self.KEY_PREFIX}{code.upper()}"
+    
+    def _ttl_for(self, data: Dict[str, Any]) -> int:
+        """TTL 계산 (기본 TTL과 접속 코드 만료까지 남은 시간 중 작은 값)"""
+        ttl = settings.ACCESS_CODE_CACHE_TTL
+        expires_at = data.get("access_code", {}).get("expires_at")
+        if expires_at:
+            expires = datetime.fromisoformat(expires_at)
+            if expires.tzinfo is None:
+                expires = expires.replace(tzinfo=timezone.utc)
+            remaining = int((expires - datetime.now(timezone.utc)).total_seconds())
+            ttl = min(ttl, remaining)
+        return ttl
+    
+    async def get_or_load(
+        self,
+        code: str,
+        loader: Callable[[], Awaitable[Dict[str, Any]]]
+    ) -> Tuple[Dict[str, Any], Optional[str]]:
+        """
+        캐시에서 접속 코드 응답 조회, 없으면 loader로 조회 후 저장
+        응답 본문의 해시를 버전으로 함께 저장하므로 ETag는 항상 실제로 반환하는 본문과 일치
+        
+        Args:
+            code: 접속 코드
+            loader: 캐시 미스 시 서비스 응답을 반환하는 코루틴 함수
+        
+        Returns:
+            (서비스 응답 딕셔너리, 본문 버전) - 실패 응답은 캐싱하지 않으며 버전은 None
+        """
+        key = self._key(code)
+        cached = await self.cache.get_json(key)
+        if cached is not None:
+            self.stats["hits"] += 1
+            return cached["result"], cached["version"]
+        
+        self.stats["misses"] += 1
+        result = await loader()
+        
+        if not (result.get("success", True) and result.get("data")):
+            return result, None
+        
+        data = result["data"]
+        version = hashlib.sha256(
+            json.dumps(result, ensure_ascii=False, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        index_keys = []
+        if data.get("user_info"):
+            index_keys.append(f"{self.USER_INDEX_PREFIX}{data['user_info']['id']}")
+        if data.get("channel_info"):
+            index_keys.append(f"{self.CHANNEL_INDEX_PREFIX}{data['channel_info']['id']}")
+        
+        entry = {"version": version, "result": result}
+        if await self.cache.set_json(key, entry, self._ttl_for(data), tuple(index_keys)):
+            self.stats["stores"] += 1
+        
+        return result, version
+    
+    async def invalidate_code(self, code: str) -> None:
+        """접속 코드 캐시 무효화 (mark_as_used 등)"""
+        self.stats["invalidations"] += 1
+        await self.cache.delete(self._key(code))
+    
+    async def invalidate_channel(self, channel_id: Any) -> None:
+        """채널 정보 변경 시 해당 채널을 참조하는 모든 접속 코드 캐시 무효화"""
+        self.stats["invalidations"] += 1
+        await self.cache.delete_indexed(f"{self.CHANNEL_INDEX_PREFIX}{channel_id}")
+    
+    async def invalidate_user(self, user_id: Any) -> None:
+        """사용자 정보 변경 시 해당 사용자의 모든 접속 코드 캐시 무효화"""
+        self.stats["invalidations"] += 1
+        await self.cache.delete_indexed(f"{self.USER_INDEX_PREFIX}{user_id}")
+    
+    def get_stats(self) -> dict:
+        """캐시 적중/미스 통계"""
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "hit_rate": round(self.stats["hits"] / lookups, 4) if lookups else 0.0
+        }
+
+
+class AccessCodeVerifier:
+    """
+    요청 인증용 접속 코드 검증 캐시
+    프로세스 내 캐시 → Redis 공유 캐시 → DB 순으로 조회하며,
+    유효하지 않은 코드도 짧게 캐싱하여 무차별 대입 시 DB 부하를 막음
+    """
+    
+    KEY_PREFIX = "access_code:auth:"
+    INVALID = "__invalid__"
+    
+    def __init__(self, cache: CacheManager):
+        self.cache = cache
+        self.local = TTLCache(
+            maxsize=settings.ACCESS_CODE_LOCAL_CACHE_SIZE,
+            ttl=settings.ACCESS_CODE_LOCAL_CACHE_TTL
+        )
+        self.stats = {"local_hits": 0, "shared_hits": 0, "negative_hits": 0, "db_lookups": 0}
+    
+    def _key(self, code: str) -> str:
+        return f"{self.KEY_PREFIX}{code}"
+    
+    @staticmethod
+    def _is_expired(principal: Dict[str, Any]) -> bool:
+        expires_ts = principal.get("expires_ts")
+        return expires_ts is not None and expires_ts <= time.time()
+    
+    def _remember_invalid(self, code: str) -> None:
+        self.local.set(code, self.INVALID, ttl=settings.ACCESS_CODE_NEGATIVE_TTL)
+    
+    async def resolve(
+        self,
+        code: str,
+        loader: Callable[[str], Awaitable[Optional[Dict[str, Any]]]]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        접속 코드를 인증 주체 정보로 변환
+        
+        Args:
+            code: 접속 코드
+            loader: 모든 캐시 미스 시 DB에서 주체 정보를 조회하는 코루틴 함수
+        
+        Returns:
+            인증 주체 정보 (유효하지 않으면 None)
+        """
+        code = code.upper()
+        
+        # 1단계: 프로세스 내 캐시
+        entry = self.local.get(code)
+        if entry == self.INVALID:
+            self.stats["negative_hits"] += 1
+            return None
+        if entry is not None:
+            if not self._is_expired(entry):
+                self.stats["local_hits"] += 1
+                return entry
+            self.local.pop(code)
+        
+        # 2단계: Redis 공유 캐시
+        shared = await self.cache.get_json(self._key(code))
+        if shared == self.INVALID:
+            self.stats["negative_hits"] += 1
+            self._remember_invalid(code)
+            return None
+        if shared is not None and not self._is_expired(shared):
+            self.stats["shared_hits"] += 1
+            self.local.set(code, shared)
+            return shared
+        
+        # 3단계: 데이터베이스
+        self.stats["db_lookups"] += 1
+        principal = await loader(code)
+        
+        if principal is None:
+            self._remember_invalid(code)
+            await self.cache.set_json(self._key(code), self.INVALID, settings.ACCESS_CODE_NEGATIVE_TTL)
+            return None
+        
+        ttl = settings.ACCESS_CODE_CACHE_TTL
+        if principal.get("expires_ts") is not None:
+            ttl = min(ttl, int(principal["expires_ts"] - time.time()))
+        self.local.set(code, principal)
+        await self.cache.set_json(self._key(code), principal, ttl)
+        return principal
+    
+    async def invalidate(self, code: str) -> None:
+        """접속 코드 검증 캐시 무효화"""
+        code = code.upper()
+        self.local.pop(code)
+        await self.cache.delete(self._key(code))
+    
+    def get_stats(self) -> dict:
+        """검증 캐시 통계"""
+        return {**self.stats, "local_size": len(self.local)}
+
+
+class AccessCodeCacheInvalidator:
+    """
+    접속 코드 캐시 무효화 로그 적용
+    채널/시니어/사용자/접속 코드는 API 밖에서 변경되므로 DB 트리거가 남긴 무효화 로그를
+    주기적으로 읽어 응답 캐시(Redis)와 이 프로세스의 검증 캐시에서 해당 항목을 제거
+    """
+    
+    BATCH_SIZE = 500
+    PRUNE_INTERVAL = 600  # 무효화 로그 정리 주기 (초)
+    
+    def __init__(self, info_cache: AccessCodeCache, verifier: AccessCodeVerifier):
+        self.info_cache = info_cache
+        self.verifier = verifier
+        # 보존 기간 안의 기록을 모두 다시 적용하며 시작 (중단된 동안의 변경 반영)
+        self.position = ("0", 0)
+        self.stats = {"polls": 0, "applied": 0, "errors": 0}
+        self._last_prune = 0.0
+        self._task: Optional[asyncio.Task] = None
+    
+    async def _apply(self, invalidation: Dict[str, str]) -> None:
+        scope, target = invalidation["scope"], invalidation["target"]
+        if scope == "channel":
+            await self.info_cache.invalidate_channel(target)
+        elif scope == "user":
+            await self.info_cache.invalidate_user(target)
+        else:
+            await self.info_cache.invalidate_code(target)
+            await self.verifier.invalidate(target)
+    
+    async def poll(self, call: Callable[..., Awaitable[Dict[str, Any]]]) -> int:
+        """
+        쌓인 무효화 로그를 모두 적용
+        
+        Args:
+            call: 접속 코드 서비스 메서드를 이름으로 실행하는 코루틴 함수
+        
+        Returns:
+            적용한 무효화 건수
+        """
+        applied = 0
+        while True:
+            result = await call("get_cache_invalidations", self.position, self.BATCH_SIZE)
+            if not result.get("success", True):
+                raise RuntimeError(result.get("message"))
+            
+            data = result["data"]
+            # 같은 대상이 여러 번 바뀌어도 한 번만 제거
+            for invalidation in {(item["scope"], item["target"]): item for item in data["invalidations"]}.values():
+                await self._apply(invalidation)
+            applied += len(data["invalidations"])
+            self.position = tuple(data["position"])
+            if len(data["invalidations"]) < self.BATCH_SIZE:
+                break
+        
+        self.stats["polls"] += 1
+        self.stats["applied"] += applied
+        
+        # 캐시 역인덱스보다 오래된 기록은 어떤 캐시 항목에도 영향을 주지 않으므로 정리
+        if time.monotonic() - self._last_prune >= self.PRUNE_INTERVAL:
+            self._last_prune = time.monotonic()
+            await call("prune_cache_invalidations", settings.CACHE_INDEX_TTL)
+        return applied
+    
+    async def _poll_loop(self, call: Callable[..., Awaitable[Dict[str, Any]]]) -> None:
+        while True:
+            try:
+                await self.poll(call)
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.warning(f"Access code cache invalidation poll failed: {e}")
+            await asyncio.sleep(settings.ACCESS_CODE_INVALIDATION_POLL_SECONDS)
+    
+    def start(self, call: Callable[..., Awaitable[Dict[str, Any]]]) -> None:
+        """무효화 로그 폴링 시작"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._poll_loop(call))
+    
+    async def stop(self) -> None:
+        """무효화 로그 폴링 종료"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+    
+    def get_stats(self) -> dict:
+        """무효화 적용 통계"""
+        return {**self.stats, "position": list(self.position)}
+
+
+# 글로벌 캐시 인스턴스
+cache_manager = CacheManager()
+access_code_cache = AccessCodeCache(cache_manager)
+access_code_verifier = AccessCodeVerifier(cache_manager)
+access_code_invalidator = AccessCodeCacheInvalidator(access_code_cache, access_code_verifier)
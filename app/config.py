@@ -22,6 +22,10 @@ class Settings(BaseSettings):
     # 서버 설정
     API_HOST: str = "0.0.0.0"
     API_PORT: int = 8000
+    FAST_JSON_RESPONSES: bool = False  # True면 서비스 결과를 response_model 재검증 없이 orjson으로 직렬화
+    FAST_JSON_VALIDATE: bool = False  # 빠른 응답 경로에서도 response_model 적합성 확인 (개발/스테이징용)
+    MSGPACK_ENABLED: bool = True  # Accept: application/msgpack 요청에 MessagePack 응답
+    GZIP_MINIMUM_SIZE: int = 1024  # 이 크기(바이트) 이상 응답만 gzip 압축
     
     # 데이터베이스 설정
     DB_NAME: str
@@ -29,12 +33,35 @@ class Settings(BaseSettings):
     DB_PASSWORD: str
     DB_HOST: str = "localhost"
     DB_PORT: int = 5432
+    DB_ASYNC_MODE: bool = False  # True면 asyncpg 기반 비동기 세션 사용
     
     # Redis 설정
     REDIS_HOST: str = "localhost"
     REDIS_PORT: int = 6379
     REDIS_DB: int = 0
     
+    # 캐시 설정
+    CACHE_ENABLED: bool = True
+    ACCESS_CODE_CACHE_TTL: int = 300  # 접속 코드 조회 캐시 TTL (초)
+    CACHE_INDEX_TTL: int = 86400  # 무효화용 역인덱스 TTL (초)
+    ACCESS_CODE_LOCAL_CACHE_SIZE: int = 10000  # 프로세스 내 접속 코드 검증 캐시 크기
+    ACCESS_CODE_LOCAL_CACHE_TTL: int = 30  # 프로세스 내 접속 코드 검증 캐시 TTL (초)
+    ACCESS_CODE_NEGATIVE_TTL: int = 60  # 유효하지 않은 접속 코드 캐시 TTL (초)
+    ACCESS_CODE_INVALIDATION_POLL_SECONDS: float = 2.0  # 접속 코드 캐시 무효화 로그 폴링 주기 (초)
+    CHECKLIST_CATALOG_REFRESH_SECONDS: int = 60  # 체크리스트 템플릿 카탈로그 버전 확인 주기 (초)
+    
+    # 페이지네이션 설정
+    DEFAULT_PAGE_SIZE: int = 20
+    MAX_PAGE_SIZE: int = 100
+    PAGINATION_COUNT_CAP: int = 1000  # 전체 개수를 정확히 세는 상한 (초과 시 근사치)
+    SYNC_PAGE_SIZE: int = 200  # 델타 동기화 기본 변경 건수
+    SYNC_MAX_PAGE_SIZE: int = 1000  # 델타 동기화 최대 변경 건수
+    
+    # 헬스체크 설정
+    HEALTH_CHECK_INTERVAL: int = 10  # 백그라운드 헬스체크 주기 (초)
+    HEALTH_CHECK_TIMEOUT: float = 3.0  # 헬스체크 프로브 타임아웃 (초)
+    TABLE_STATS_TTL: int = 300  # /info 테이블 통계 캐시 TTL (초)
+    
     # 보안 설정
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
@@ -46,11 +73,73 @@ class Settings(BaseSettings):
     GOOGLE_TRANSLATE_API_KEY: Optional[str] = None
     GOOGLE_PROJECT_ID: Optional[str] = None
     
+    # AI 리포트 생성 작업 설정
+    REPORT_LLM_PROVIDER: str = "stub"  # stub(로컬 규칙 기반 생성기) / openai
+    REPORT_LLM_TIMEOUT_SECONDS: float = 60.0  # 리포트 1건 생성 제한 시간 (초)
+    REPORT_STUB_LATENCY_MS: int = 200  # stub 생성기의 모의 응답 지연 (밀리초)
+    REPORT_QUEUE_BACKEND: str = "auto"  # auto(Redis 연결 가능 시 Redis) / redis / memory
+    REPORT_QUEUE_KEY: str = "sinabro:report_jobs"
+    REPORT_QUEUE_POLL_SECONDS: float = 0.5  # Redis 큐 확인 주기 (초)
+    REPORT_WORKER_CONCURRENCY: int = 4  # 동시에 생성하는 리포트 수 (0이면 이 프로세스는 큐에 넣기만 함)
+    REPORT_JOB_MAX_ATTEMPTS: int = 3
+    REPORT_RETRY_BASE_SECONDS: float = 5.0  # 재시도 대기 시간 (실패할 때마다 2배)
+    REPORT_RETRY_MAX_SECONDS: float = 300.0
+    REPORT_JOB_STALE_SECONDS: int = 600  # 이 시간 넘게 실행 중인 작업은 워커 중단으로 보고 다시 큐에 넣음
+    REPORT_RECOVERY_INTERVAL_SECONDS: int = 30  # 유실된 큐 메시지 복구 주기 (초)
+    REPORT_RECOVERY_BATCH_SIZE: int = 500
+    
+    # AI 리포트 야간 일괄 생성 설정
+    REPORT_BATCH_ENABLED: bool = True
+    REPORT_BATCH_TIME: str = "02:00"  # 매일 실행 시각 (HH:MM, 이 시각에 전날 리포트 생성)
+    REPORT_BATCH_TIMEZONE: str = "Asia/Seoul"  # 실행 시각/리포트 날짜 기준 시간대
+    REPORT_BATCH_CONCURRENCY: int = 8  # 동시에 생성하는 리포트 수
+    REPORT_BATCH_PAGE_SIZE: int = 200  # 한 번에 기록을 조회하는 채널 수
+    REPORT_BATCH_STALE_SECONDS: int = 7200  # 이 시간 넘게 끝나지 않은 실행은 중단된 것으로 보고 다시 실행
+    
+    # 리포트 번역 설정
+    TRANSLATION_PROVIDER: str = "stub"  # stub(로컬 대역 번역기) / google (GOOGLE_TRANSLATE_API_KEY 사용)
+    TRANSLATION_SOURCE_LANGUAGE: str = "ko"  # 리포트 원문 언어
+    TRANSLATION_LANGUAGES: List[str] = ["en", "ja", "zh-CN", "vi"]  # 번역을 허용하는 대상 언어
+    TRANSLATION_CONCURRENCY: int = 4  # 동시에 보내는 번역 API 요청 수
+    TRANSLATION_BATCH_SEGMENTS: int = 100  # 번역 API 요청 1건에 담는 최대 문장 수
+    TRANSLATION_BATCH_CHARS: int = 5000  # 번역 API 요청 1건에 담는 최대 글자 수
+    TRANSLATION_TIMEOUT_SECONDS: float = 10.0  # 번역 API 요청 제한 시간 (초)
+    TRANSLATION_MAX_ATTEMPTS: int = 3  # 일시 오류 시 최대 요청 횟수
+    TRANSLATION_RETRY_BASE_SECONDS: float = 0.5  # 재시도 대기 시간 (실패할 때마다 2배)
+    TRANSLATION_CACHE_TTL: int = 2592000  # 문장 번역 Redis 캐시 TTL (초, 30일)
+    TRANSLATION_LOCAL_CACHE_SIZE: int = 20000  # 프로세스 내 문장 번역 캐시 크기
+    TRANSLATION_LOCAL_CACHE_TTL: int = 3600  # 프로세스 내 문장 번역 캐시 TTL (초)
+    TRANSLATION_STUB_LATENCY_MS: int = 50  # stub 번역기의 모의 응답 지연 (밀리초)
+    
     # 파일 업로드 설정
     UPLOAD_DIR: str = "uploads"
     MAX_FILE_SIZE: int = 10485760  # 10MB
     ALLOWED_EXTENSIONS: List[str] = ["jpg", "jpeg", "png", "gif", "pdf"]
     
+    # 사진 렌디션 설정
+    RENDITION_ENABLED: bool = True
+    RENDITION_WORKERS: int = 2  # 렌디션 생성 프로세스 수
+    RENDITION_WIDTHS: List[int] = [320, 640, 1280]  # 생성할 가로 크기 (px)
+    RENDITION_FORMATS: List[str] = ["jpeg", "webp"]
+    RENDITION_QUALITY: int = 80
+    
+    # 사진 파일 전송 설정
+    MEDIA_URL_BASE: str = "/media"  # 서명 URL 기준 주소 (앞단 프록시/CDN 주소로 변경 가능)
+    MEDIA_SIGNING_SECRET: Optional[str] = None  # 서명 URL 비밀 키 (기본값: SECRET_KEY, 프록시 설정과 동일해야 함)
+    MEDIA_URL_TTL: int = 300  # 서명 URL 유효 시간 (초)
+    MEDIA_ACCEL_REDIRECT_PREFIX: Optional[str] = None  # 설정 시 X-Accel-Redirect로 프록시가 파일 전송 (예: /_protected_media)
+    MEDIA_CHUNK_SIZE: int = 262144  # 앱이 직접 전송할 때의 읽기 단위 (256KB)
+    
+    # 사진 blob 수거 설정
+    BLOB_GC_INTERVAL_SECONDS: int = 3600  # 참조되지 않는 blob 수거 주기 (초)
+    BLOB_GC_GRACE_SECONDS: int = 3600  # 참조가 0이 된 뒤 수거까지의 유예 시간 (초)
+    BLOB_GC_BATCH_SIZE: int = 500
+    
+    # 델타 동기화 변경 로그 정리 설정
+    SYNC_TOMBSTONE_RETENTION_DAYS: int = 30  # 삭제 기록 보관 기간 (이보다 오래 동기화하지 않은 앱은 전체 재동기화)
+    SYNC_COMPACTION_INTERVAL_SECONDS: int = 3600  # 삭제 기록 정리 주기 (초)
+    SYNC_COMPACTION_BATCH_SIZE: int = 1000
+    
     # CORS 설정
     CORS_ORIGINS: List[str] = [
         "http://localhost:3000",
@@ -69,6 +158,11 @@ class Settings(BaseSettings):
         """데이터베이스 URL 생성"""
         return f"postgresql://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
     
+    @property
+    def async_database_url(self) -> str:
+        """비동기 데이터베이스 URL 생성 (asyncpg 드라이버)"""
+        return f"postgresql+asyncpg://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
+    
     @property
     def redis_url(self) -> str:
         """Redis URL 생성"""
@@ -95,6 +189,20 @@ class Settings(BaseSettings):
             return [i.strip() for i in v.split(",")]
         return v
     
+    @validator("TRANSLATION_LANGUAGES", pre=True)
+    def assemble_translation_languages(cls, v):
+        """번역 대상 언어 문자열을 리스트로 변환"""
+        if isinstance(v, str):
+            return [i.strip() for i in v.split(",")]
+        return v
+    
+    @validator("RENDITION_WIDTHS", "RENDITION_FORMATS", pre=True)
+    def assemble_rendition_options(cls, v):
+        """렌디션 크기/형식 문자열을 리스트로 변환"""
+        if isinstance(v, str):
+            return [i.strip() for i in v.split(",")]
+        return v
+    
     model_config = ConfigDict(
         env_file=".env",
         env_file_encoding="utf-8", 
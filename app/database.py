@@ -3,12 +3,15 @@ Sinabro 데이터베이스 연결 관리
 SQLAlchemy를 사용한 PostgreSQL 연결 설정
 """
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import StaticPool
+import asyncio
 import logging
-from typing import Generator
+import time
+from typing import AsyncGenerator, Dict, Generator, Set
 
 from config import settings
 
@@ -35,6 +38,26 @@ SessionLocal = sessionmaker(
     bind=engine
 )
 
+# 비동기 엔진 및 세션 팩토리 (DB_ASYNC_MODE 활성화 시에만 생성)
+async_engine = None
+AsyncSessionLocal = None
+
+if settings.DB_ASYNC_MODE:
+    async_engine = create_async_engine(
+        settings.async_database_url,
+        pool_size=10,
+        max_overflow=20,
+        pool_recycle=3600,
+        pool_pre_ping=True,
+        echo=settings.DEBUG,
+    )
+    AsyncSessionLocal = async_sessionmaker(
+        bind=async_engine,
+        class_=AsyncSession,
+        autoflush=False,
+        expire_on_commit=False
+    )
+
 # Base 클래스 생성 (모든 모델의 기본 클래스)
 Base = declarative_base()
 
@@ -55,6 +78,33 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    비동기 데이터베이스 세션 의존성
+    DB_ASYNC_MODE가 활성화된 경우 사용
+    """
+    if AsyncSessionLocal is None:
+        raise RuntimeError("DB_ASYNC_MODE가 비활성화되어 비동기 세션을 사용할 수 없습니다")
+    
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db
+        except Exception as e:
+            logger.error(f"Async database session error: {e}")
+            await db.rollback()
+            raise
+
+
+# DB_ASYNC_MODE 설정에 따라 선택되는 세션 의존성
+get_db_session = get_async_db if settings.DB_ASYNC_MODE else get_db
+
+
+async def close_async_db() -> None:
+    """비동기 엔진 연결 풀 정리 (종료 시 호출)"""
+    if async_engine is not None:
+        await async_engine.dispose()
+
+
 def init_db() -> None:
     """
     데이터베이스 초기화
@@ -77,7 +127,7 @@ def check_db_connection() -> bool:
     try:
         db = SessionLocal()
         # 간단한 쿼리로 연결 테스트
-        db.execute("SELECT 1")
+        db.execute(text("SELECT 1"))
         db.close()
         return True
     except Exception as e:
@@ -92,13 +142,13 @@ def get_db_info() -> dict:
     """
     try:
         db = SessionLocal()
-        result = db.execute("""
+        result = db.execute(text("""
             SELECT 
                 current_database() as database_name,
                 current_user as current_user,
                 version() as version,
                 NOW() as current_time
-        """).first()
+        """)).first()
         db.close()
         
         return {
@@ -116,12 +166,25 @@ def get_db_info() -> dict:
         }
 
 
+# /info 통계 대상 테이블
+STATS_TABLES = (
+    "guardians", "caregivers", "seniors", "channels",
+    "checklist_templates", "daily_checklists", "care_notes",
+    "photos", "admin_questions", "question_responses",
+    "ai_reports", "guardian_feedback", "access_codes",
+    "checklist_rollups", "sync_changelog", "photo_renditions", "photo_blobs",
+    "report_jobs", "report_batch_runs", "daily_digests"
+)
+
+
 class DatabaseManager:
     """데이터베이스 관리 클래스"""
     
     def __init__(self):
         self.engine = engine
         self.SessionLocal = SessionLocal
+        self._table_stats: Dict[str, dict] = {}
+        self._stats_refreshing: Set[str] = set()
     
     def create_session(self) -> Session:
         """새 세션 생성"""
@@ -131,33 +194,89 @@ class DatabaseManager:
         """헬스체크"""
         try:
             session = self.create_session()
-            session.execute("SELECT 1")
+            session.execute(text("SELECT 1"))
             session.close()
             return {"status": "healthy", "database": "connected"}
         except Exception as e:
             return {"status": "unhealthy", "error": str(e)}
     
-    def get_table_count(self) -> dict:
-        """테이블별 레코드 수 조회"""
+    def get_table_count(self, exact: bool = False) -> dict:
+        """
+        테이블별 레코드 수 조회 (한 번의 쿼리)
+        
+        Args:
+            exact: True면 UNION ALL로 정확한 COUNT(*), False면 pg_class 통계 기반 추정치
+        
+        Returns:
+            테이블명 → 레코드 수 딕셔너리
+        """
+        session = self.create_session()
         try:
-            session = self.create_session()
-            tables = [
-                "guardians", "caregivers", "seniors", "channels",
-                "checklist_templates", "daily_checklists", "care_notes",
-                "photos", "admin_questions", "question_responses",
-                "ai_reports", "guardian_feedback", "access_codes"
-            ]
-            
-            counts = {}
-            for table in tables:
-                result = session.execute(f"SELECT COUNT(*) FROM {table}").scalar()
-                counts[table] = result
+            if exact:
+                query = " UNION ALL ".join(
+                    f"SELECT '{table}' AS table_name, COUNT(*) AS row_count FROM {table}"
+                    for table in STATS_TABLES
+                )
+                rows = session.execute(text(query)).all()
+            else:
+                # reltuples는 ANALYZE 전에는 -1이므로 통계 수집기의 n_live_tup으로 대체
+                rows = session.execute(
+                    text("""
+                        SELECT c.relname AS table_name,
+                               CASE WHEN c.reltuples < 0 THEN COALESCE(s.n_live_tup, 0)
+                                    ELSE c.reltuples::bigint END AS row_count
+                        FROM pg_class c
+                        LEFT JOIN pg_stat_user_tables s ON s.relid = c.oid
+                        WHERE c.relkind = 'r'
+                          AND c.relnamespace = 'public'::regnamespace
+                          AND c.relname = ANY(:tables)
+                    """),
+                    {"tables": list(STATS_TABLES)}
+                ).all()
             
+            counts = {row.table_name: int(row.row_count) for row in rows}
+            return {table: counts.get(table) for table in STATS_TABLES}
+        finally:
             session.close()
-            return counts
+    
+    def refresh_table_stats(self, exact: bool = False) -> dict:
+        """테이블 통계 수집 후 수집 시각과 함께 캐싱"""
+        mode = "exact" if exact else "estimate"
+        start = time.perf_counter()
+        try:
+            counts = self.get_table_count(exact=exact)
+            self._table_stats[mode] = {
+                "mode": mode,
+                "counts": counts,
+                "collected_at": time.time(),
+                "duration_ms": round((time.perf_counter() - start) * 1000, 2)
+            }
         except Exception as e:
             logger.error(f"Failed to get table counts: {e}")
-            return {"error": str(e)}
+        finally:
+            self._stats_refreshing.discard(mode)
+        return self._table_stats.get(mode, {})
+    
+    def get_table_stats(self, exact: bool = False) -> dict:
+        """
+        캐싱된 테이블 통계 반환 (DB 조회 없음)
+        캐시가 없거나 TABLE_STATS_TTL보다 오래되었으면 백그라운드 갱신을 예약
+        """
+        mode = "exact" if exact else "estimate"
+        cached = self._table_stats.get(mode)
+        age = time.time() - cached["collected_at"] if cached else None
+        
+        if (age is None or age > settings.TABLE_STATS_TTL) and mode not in self._stats_refreshing:
+            self._stats_refreshing.add(mode)
+            asyncio.get_running_loop().run_in_executor(None, self.refresh_table_stats, exact)
+        
+        if not cached:
+            return {"mode": mode, "counts": None, "collected_at": None, "refreshing": True}
+        return {
+            **cached,
+            "age_seconds": round(age, 1),
+            "refreshing": mode in self._stats_refreshing
+        }
 
 
 # 글로벌 데이터베이스 매니저 인스턴스
@@ -3,14 +3,43 @@ Sinabro FastAPI 공통 의존성
 인증, 권한, 세션 관리 등
 """
 
-from fastapi import Depends, HTTPException, status, Request
+from fastapi import Depends, HTTPException, status, Request, Query
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
-from typing import Optional, Union
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+from typing import Any, AsyncGenerator, Callable, Optional, Union
+import inspect
 import logging
+import re
 
-from database import get_db, check_db_connection
+from database import get_db_session, SessionLocal, AsyncSessionLocal
 from config import settings
+from cache import access_code_verifier
+from health import health_monitor
+from security import decode_access_token
+from services import (
+    AccessCodeService,
+    AsyncAccessCodeService,
+    ChannelService,
+    AsyncChannelService,
+    ChecklistService,
+    AsyncChecklistService,
+    CatalogChecklistService,
+    checklist_catalog,
+    ChecklistIngestService,
+    AsyncChecklistIngestService,
+    DashboardService,
+    AsyncDashboardService,
+    ChecklistTrendService,
+    AsyncChecklistTrendService,
+    SyncService,
+    AsyncSyncService,
+    PhotoService,
+    AsyncPhotoService,
+    ReportService,
+    AsyncReportService
+)
 
 logger = logging.getLogger(__name__)
 
@@ -19,18 +48,16 @@ security = HTTPBearer(auto_error=False)
 
 
 async def get_current_user(
-    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
-    db: Session = Depends(get_db)
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security)
 ):
     """
     현재 사용자 정보 조회 (JWT 토큰 기반)
-    해커톤에서는 비활성화, 추후 구현 예정
+    서명과 만료만 확인하므로 DB 조회가 발생하지 않음
     """
-    # 해커톤 모드에서는 인증 비활성화
-    if settings.DEMO_MODE:
+    # 해커톤 모드에서는 토큰이 없으면 데모 사용자로 처리
+    if not credentials and settings.DEMO_MODE:
         return {"user_id": "demo_user", "user_type": "demo"}
     
-    # 실제 JWT 토큰 검증 로직 (추후 구현)
     if not credentials:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -38,13 +65,20 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    # TODO: JWT 토큰 검증 및 사용자 정보 조회
-    return {"user_id": "authenticated_user"}
+    principal = decode_access_token(credentials.credentials)
+    if not principal:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="유효하지 않거나 만료된 토큰입니다",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
+    return principal
 
 
 async def verify_database_connection():
-    """데이터베이스 연결 상태 확인"""
-    if not check_db_connection():
+    """데이터베이스 연결 상태 확인 (헬스체크 모니터의 마지막 확인 결과 사용)"""
+    if not health_monitor.database_healthy:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="데이터베이스 연결 실패"
@@ -66,18 +100,65 @@ def get_access_code_from_request(request: Request) -> Optional[str]:
     return request.query_params.get("access_code")
 
 
+# 접속 코드 형식 (형식이 맞지 않으면 캐시/DB 조회 없이 거부)
+ACCESS_CODE_PATTERN = re.compile(r"^[A-Za-z0-9]{4,20}$")
+
+
+async def load_access_code_principal(code: str) -> Optional[dict]:
+    """
+    DB에서 접속 코드 인증 주체 정보 조회
+    검증 캐시 미스 시에만 세션을 열어 사용
+    """
+    if settings.DB_ASYNC_MODE:
+        async with AsyncSessionLocal() as db:
+            return await AsyncAccessCodeService(db).verify_code(code)
+    
+    def _load() -> Optional[dict]:
+        db = SessionLocal()
+        try:
+            return AccessCodeService(db).verify_code(code)
+        finally:
+            db.close()
+    
+    return await run_in_threadpool(_load)
+
+
+async def call_access_code_service(method: str, *args) -> Any:
+    """호출마다 세션을 열어 접속 코드 서비스 메서드 실행 (요청 경로 밖의 캐시 무효화 폴링용)"""
+    if settings.DB_ASYNC_MODE:
+        async with AsyncSessionLocal() as db:
+            return await getattr(AsyncAccessCodeService(db), method)(*args)
+    
+    def _call() -> Any:
+        db = SessionLocal()
+        try:
+            return getattr(AccessCodeService(db), method)(*args)
+        finally:
+            db.close()
+    
+    return await run_in_threadpool(_call)
+
+
 class AccessCodeDependency:
     """접속 코드 의존성 클래스"""
     
     def __init__(self, required: bool = True):
         self.required = required
     
-    async def __call__(
-        self, 
-        request: Request, 
-        db: Session = Depends(get_db)
-    ) -> Optional[dict]:
+    async def __call__(self, request: Request) -> Optional[dict]:
         """접속 코드 검증 및 사용자 정보 반환"""
+        # 세션 토큰이 있으면 서명 검증만으로 인증 (DB/캐시 조회 없음)
+        auth_header = request.headers.get("Authorization")
+        if auth_header and auth_header.startswith("Bearer "):
+            principal = decode_access_token(auth_header[7:])
+            if not principal:
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="유효하지 않거나 만료된 토큰입니다",
+                    headers={"WWW-Authenticate": "Bearer"},
+                )
+            return principal
+        
         access_code = get_access_code_from_request(request)
         
         if not access_code and self.required:
@@ -89,39 +170,29 @@ class AccessCodeDependency:
         if not access_code:
             return None
         
-        # 데이터베이스에서 접속 코드 검증
-        try:
-            result = db.execute("""
-                SELECT 
-                    ac.user_type,
-                    ac.user_id,
-                    ac.channel_id,
-                    ac.is_used,
-                    ac.expires_at
-                FROM access_codes ac
-                WHERE ac.code = :code AND ac.expires_at > NOW()
-            """, {"code": access_code}).first()
-            
-            if not result:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="유효하지 않은 접속 코드입니다"
-                )
-            
-            return {
-                "access_code": access_code,
-                "user_type": result.user_type,
-                "user_id": result.user_id,
-                "channel_id": result.channel_id,
-                "is_used": result.is_used
-            }
+        if not ACCESS_CODE_PATTERN.match(access_code):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="유효하지 않은 접속 코드입니다"
+            )
         
+        # 프로세스 내 캐시 → Redis → DB 순으로 검증
+        try:
+            principal = await access_code_verifier.resolve(access_code, load_access_code_principal)
         except Exception as e:
             logger.error(f"Access code verification failed: {e}")
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="접속 코드 검증 중 오류가 발생했습니다"
             )
+        
+        if not principal:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="유효하지 않은 접속 코드입니다"
+            )
+        
+        return principal
 
 
 # 의존성 인스턴스들
@@ -152,6 +223,137 @@ def get_pagination_params(
     }
 
 
+def get_cursor_params(
+    cursor: Optional[str] = Query(None, description="이전 응답의 pagination.next_cursor"),
+    size: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE, description="페이지 크기"),
+    include_total: bool = Query(False, description="전체 개수 포함 여부 (상한 초과 시 근사치)")
+) -> dict:
+    """커서 페이지네이션 파라미터 (OFFSET 없이 정렬 키 기준으로 다음 페이지 조회)"""
+    return {
+        "cursor": cursor,
+        "size": size,
+        "include_total": include_total
+    }
+
+
+def get_sync_params(
+    watermark: Optional[str] = Query(None, description="이전 동기화 응답의 watermark (없으면 전체 동기화)"),
+    size: int = Query(settings.SYNC_PAGE_SIZE, ge=1, le=settings.SYNC_MAX_PAGE_SIZE, description="최대 변경 건수")
+) -> dict:
+    """델타 동기화 파라미터"""
+    return {
+        "watermark": watermark,
+        "size": size
+    }
+
+
+def get_access_code_service(
+    db: Union[Session, AsyncSession] = Depends(get_db_session)
+) -> Union[AccessCodeService, AsyncAccessCodeService]:
+    """접속 코드 서비스 의존성 (DB_ASYNC_MODE에 따라 동기/비동기 선택)"""
+    if settings.DB_ASYNC_MODE:
+        return AsyncAccessCodeService(db)
+    return AccessCodeService(db)
+
+
+def get_channel_service(
+    db: Union[Session, AsyncSession] = Depends(get_db_session)
+) -> Union[ChannelService, AsyncChannelService]:
+    """채널 서비스 의존성 (DB_ASYNC_MODE에 따라 동기/비동기 선택)"""
+    if settings.DB_ASYNC_MODE:
+        return AsyncChannelService(db)
+    return ChannelService(db)
+
+
+def get_dashboard_service(
+    db: Union[Session, AsyncSession] = Depends(get_db_session)
+) -> Union[DashboardService, AsyncDashboardService]:
+    """대시보드 서비스 의존성 (DB_ASYNC_MODE에 따라 동기/비동기 선택)"""
+    if settings.DB_ASYNC_MODE:
+        return AsyncDashboardService(db)
+    return DashboardService(db)
+
+
+def get_trend_service(
+    db: Union[Session, AsyncSession] = Depends(get_db_session)
+) -> Union[ChecklistTrendService, AsyncChecklistTrendService]:
+    """체크리스트 트렌드 서비스 의존성 (DB_ASYNC_MODE에 따라 동기/비동기 선택)"""
+    if settings.DB_ASYNC_MODE:
+        return AsyncChecklistTrendService(db)
+    return ChecklistTrendService(db)
+
+
+def get_sync_service(
+    db: Union[Session, AsyncSession] = Depends(get_db_session)
+) -> Union[SyncService, AsyncSyncService]:
+    """델타 동기화 서비스 의존성 (DB_ASYNC_MODE에 따라 동기/비동기 선택)"""
+    if settings.DB_ASYNC_MODE:
+        return AsyncSyncService(db)
+    return SyncService(db)
+
+
+def get_checklist_ingest_service(
+    db: Union[Session, AsyncSession] = Depends(get_db_session)
+) -> Union[ChecklistIngestService, AsyncChecklistIngestService]:
+    """체크리스트 일괄 제출 서비스 의존성 (DB_ASYNC_MODE에 따라 동기/비동기 선택)"""
+    if settings.DB_ASYNC_MODE:
+        return AsyncChecklistIngestService(db)
+    return ChecklistIngestService(db)
+
+
+def get_photo_service(
+    db: Union[Session, AsyncSession] = Depends(get_db_session)
+) -> Union[PhotoService, AsyncPhotoService]:
+    """사진 서비스 의존성 (DB_ASYNC_MODE에 따라 동기/비동기 선택)"""
+    if settings.DB_ASYNC_MODE:
+        return AsyncPhotoService(db)
+    return PhotoService(db)
+
+
+def get_report_service(
+    db: Union[Session, AsyncSession] = Depends(get_db_session)
+) -> Union[ReportService, AsyncReportService]:
+    """AI 리포트 서비스 의존성 (DB_ASYNC_MODE에 따라 동기/비동기 선택)"""
+    if settings.DB_ASYNC_MODE:
+        return AsyncReportService(db)
+    return ReportService(db)
+
+
+async def get_checklist_service() -> AsyncGenerator[
+    Union[CatalogChecklistService, ChecklistService, AsyncChecklistService], None
+]:
+    """
+    체크리스트 서비스 의존성
+    템플릿 카탈로그가 로딩되어 있으면 DB 세션 없이 메모리에서 응답하고,
+    로딩 전이거나 실패한 경우에만 DB 서비스로 대체
+    """
+    if checklist_catalog.is_loaded:
+        yield CatalogChecklistService(checklist_catalog)
+        return
+    
+    if settings.DB_ASYNC_MODE:
+        async with AsyncSessionLocal() as db:
+            yield AsyncChecklistService(db)
+        return
+    
+    db = SessionLocal()
+    try:
+        yield ChecklistService(db)
+    finally:
+        db.close()
+
+
+async def run_service(method: Callable[..., Any], *args, **kwargs) -> Any:
+    """
+    서비스 메서드 실행
+    비동기 서비스는 직접 await, 동기 서비스는 스레드풀에서 실행하여
+    이벤트 루프가 DB 왕복 동안 블로킹되지 않도록 함
+    """
+    if inspect.iscoroutinefunction(method):
+        return await method(*args, **kwargs)
+    return await run_in_threadpool(method, *args, **kwargs)
+
+
 async def log_request(request: Request):
     """요청 로깅"""
     if settings.DEBUG:
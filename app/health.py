@@ -0,0 +1,164 @@
+"""
+Sinabro 헬스체크 관리
+백그라운드에서 DB/Redis 상태를 주기적으로 확인하고 결과를 캐싱
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Optional
+import asyncio
+import logging
+import time
+
+from config import settings
+from database import get_db_info
+from cache import cache_manager
+
+logger = logging.getLogger(__name__)
+
+
+class HealthMonitor:
+    """
+    헬스체크 모니터
+    프로브 요청마다 DB에 접속하지 않도록 백그라운드 작업이 갱신한 상태를 제공
+    """
+    
+    def __init__(self):
+        self.started_at = time.time()
+        self.components: Dict[str, Dict[str, Any]] = {}
+        self._task: Optional[asyncio.Task] = None
+        # 타임아웃된 DB 프로브 스레드는 취소할 수 없으므로 전용 스레드 하나에서만 실행
+        self._db_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="health-db-probe")
+        self._db_probe: Optional[asyncio.Future] = None
+        self._database_info: Dict[str, Any] = {}
+    
+    async def _probe(self, name: str, check: Callable[[], Awaitable[bool]]) -> None:
+        """단일 구성요소 확인 후 상태와 지연 시간 기록"""
+        start = time.perf_counter()
+        error = None
+        try:
+            healthy = await asyncio.wait_for(check(), timeout=settings.HEALTH_CHECK_TIMEOUT)
+        except asyncio.TimeoutError:
+            healthy, error = False, f"timeout after {settings.HEALTH_CHECK_TIMEOUT}s"
+        except Exception as e:
+            healthy, error = False, str(e)
+        
+        previous = self.components.get(name, {}).get("status")
+        state = {
+            "status": "healthy" if healthy else "unhealthy",
+            "latency_ms": round((time.perf_counter() - start) * 1000, 2),
+            "checked_at": time.time()
+        }
+        if error:
+            state["error"] = error
+        self.components[name] = state
+        
+        if previous and previous != state["status"]:
+            logger.warning(f"Health of {name} changed: {previous} -> {state['status']}")
+    
+    async def _check_database(self) -> bool:
+        # 이전 프로브가 아직 DB 응답을 기다리는 중이면 새 스레드를 띄우지 않고 실패로 기록
+        if self._db_probe is not None and not self._db_probe.done():
+            raise RuntimeError("previous probe still running")
+        
+        # 프로브 쿼리로 /info용 DB 정보도 함께 수집
+        self._db_probe = asyncio.get_running_loop().run_in_executor(self._db_executor, get_db_info)
+        # 타임아웃 시 대기만 중단하고 프로브 future는 스레드가 끝날 때까지 유지
+        result = await asyncio.shield(self._db_probe)
+        if result["status"] != "connected":
+            raise RuntimeError(result.get("error", "database unhealthy"))
+        self._database_info = result
+        return True
+    
+    async def _check_redis(self) -> bool:
+        return await cache_manager.ping()
+    
+    async def refresh(self) -> None:
+        """모든 구성요소 상태 갱신"""
+        await asyncio.gather(
+            self._probe("database", self._check_database),
+            self._probe("redis", self._check_redis)
+        )
+    
+    async def _refresh_loop(self) -> None:
+        while True:
+            await asyncio.sleep(settings.HEALTH_CHECK_INTERVAL)
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.error(f"Health refresh failed: {e}")
+    
+    def start(self) -> None:
+        """백그라운드 확인 작업 시작"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._refresh_loop())
+    
+    async def stop(self) -> None:
+        """백그라운드 확인 작업 종료"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+    
+    def _component(self, name: str) -> Dict[str, Any]:
+        """구성요소 상태 (오래된 결과는 unhealthy로 간주)"""
+        state = self.components.get(name)
+        if state is None:
+            return {"status": "unknown"}
+        
+        age = time.time() - state["checked_at"]
+        if age > settings.HEALTH_CHECK_INTERVAL * 3 + settings.HEALTH_CHECK_TIMEOUT:
+            return {**state, "status": "unhealthy", "error": f"stale result ({age:.0f}s old)"}
+        return state
+    
+    @property
+    def database_healthy(self) -> bool:
+        """마지막 확인 기준 DB 정상 여부"""
+        return self._component("database")["status"] == "healthy"
+    
+    def database_info(self) -> Dict[str, Any]:
+        """마지막으로 성공한 프로브의 DB 정보 (요청마다 DB에 접속하지 않음)"""
+        if self.database_healthy:
+            return self._database_info
+        return {**self._database_info, "status": "error", "error": self._component("database").get("error")}
+    
+    def liveness(self) -> Dict[str, Any]:
+        """프로세스 생존 상태 (외부 의존성 확인 없음)"""
+        return {
+            "status": "alive",
+            "timestamp": time.time(),
+            "uptime_seconds": round(time.time() - self.started_at, 1)
+        }
+    
+    def readiness(self) -> Dict[str, Any]:
+        """
+        트래픽 수신 가능 상태
+        DB는 필수, Redis는 캐시 용도이므로 장애 시 degraded로 표시
+        """
+        database = self._component("database")
+        redis = self._component("redis")
+        
+        if database["status"] != "healthy":
+            status = "unhealthy"
+        elif redis["status"] != "healthy":
+            status = "degraded"
+        else:
+            status = "healthy"
+        
+        return {
+            "status": status,
+            "timestamp": time.time(),
+            "version": settings.APP_VERSION,
+            "environment": settings.ENVIRONMENT,
+            "services": {
+                "database": database,
+                "redis": redis,
+                "api": {"status": "healthy"}
+            }
+        }
+
+
+# 글로벌 헬스체크 모니터 인스턴스
+health_monitor = HealthMonitor()
@@ -0,0 +1,119 @@
+"""
+Sinabro 이미지 렌디션 생성
+프로세스 풀 워커에서 실행되는 Pillow 변환 함수 (앱 설정/DB에 의존하지 않음)
+"""
+
+from PIL import Image, ImageOps
+from typing import Dict, List, Sequence, Tuple
+import math
+import os
+import uuid
+
+# 렌디션 형식별 저장 옵션
+FORMAT_OPTIONS = {
+    "jpeg": {"extension": "jpg", "save": {"format": "JPEG", "optimize": True, "progressive": True}},
+    "webp": {"extension": "webp", "save": {"format": "WEBP", "method": 4}},
+}
+
+FORMAT_MEDIA_TYPES = {
+    "jpeg": "image/jpeg",
+    "webp": "image/webp",
+}
+
+
+# EXIF 방향 태그 (5~8은 90도 회전이 포함되어 가로/세로가 바뀜)
+ORIENTATION_TAG = 0x0112
+TRANSPOSED_ORIENTATIONS = (5, 6, 7, 8)
+
+
+def _oriented_size(image: Image.Image) -> Tuple[int, int]:
+    """EXIF 회전을 적용했을 때의 (가로, 세로) 크기"""
+    if image.getexif().get(ORIENTATION_TAG, 1) in TRANSPOSED_ORIENTATIONS:
+        return image.height, image.width
+    return image.width, image.height
+
+
+def _prepare(image: Image.Image, scale: float) -> Image.Image:
+    """디코딩 축소, EXIF 회전 적용, 저장 가능한 색 공간으로 변환"""
+    if image.format == "JPEG":
+        # JPEG는 DCT 단계에서 1/2~1/8로 축소 디코딩하여 큰 원본의 디코딩 비용을 줄임
+        image.draft("RGB", (math.ceil(image.width * scale), math.ceil(image.height * scale)))
+    image = ImageOps.exif_transpose(image)
+    if image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGBA" if "transparency" in image.info or image.mode in ("LA", "PA") else "RGB")
+    return image
+
+
+def _save(image: Image.Image, path: str, image_format: str, quality: int) -> int:
+    """임시 파일에 저장 후 원자적으로 이동 (중단 시 불완전한 파일이 남지 않도록)"""
+    options = FORMAT_OPTIONS[image_format]["save"]
+    if image_format == "jpeg" and image.mode == "RGBA":
+        image = image.convert("RGB")
+    temp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    try:
+        image.save(temp_path, quality=quality, **options)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    return os.path.getsize(path)
+
+
+def render_renditions(
+    source_path: str,
+    output_dir: str,
+    stem: str,
+    widths: Sequence[int],
+    formats: Sequence[str],
+    quality: int = 80
+) -> List[Dict[str, object]]:
+    """
+    원본 이미지에서 크기/형식별 렌디션 생성
+    
+    원본보다 작은 크기만 생성하며, 큰 크기부터 차례로 직전 결과를 다시 축소하여
+    매번 원본 전체를 리샘플링하지 않습니다. 같은 원본(blob)의 렌디션 파일이 이미 있으면
+    디코딩 없이 그대로 사용합니다.
+    
+    Args:
+        source_path: 원본 파일 경로
+        output_dir: 렌디션 저장 디렉토리
+        stem: 렌디션 파일명 접두사 (원본 파일명)
+        widths: 생성할 가로 크기 목록
+        formats: 생성할 형식 목록 (jpeg, webp)
+        quality: 손실 압축 품질
+    
+    Returns:
+        렌디션 목록 ({"width", "height", "format", "file_name", "file_size"})
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    renditions = []
+    
+    with Image.open(source_path) as original:
+        original_width, original_height = _oriented_size(original)
+        targets = sorted({width for width in widths if 0 < width < original_width}, reverse=True)
+        planned = [
+            (width, max(1, round(original_height * width / original_width)), image_format,
+             f"{stem}_{width}.{FORMAT_OPTIONS[image_format]['extension']}")
+            for width in targets for image_format in formats
+        ]
+        missing = {file_name for _, _, _, file_name in planned if not os.path.exists(os.path.join(output_dir, file_name))}
+        
+        image = _prepare(original, targets[0] / original_width) if missing else None
+        for width, height, image_format, file_name in planned:
+            path = os.path.join(output_dir, file_name)
+            if file_name in missing:
+                if image.size != (width, height):
+                    image = image.resize((width, height), Image.Resampling.LANCZOS, reducing_gap=3.0)
+                file_size = _save(image, path, image_format, quality)
+            else:
+                file_size = os.path.getsize(path)
+            renditions.append({
+                "width": width,
+                "height": height,
+                "format": image_format,
+                "file_name": file_name,
+                "file_size": file_size
+            })
+    
+    return renditions
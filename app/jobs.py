@@ -0,0 +1,173 @@
+"""
+Sinabro 작업 큐
+실행 예정 시각이 있는 작업 ID 큐 (Redis 정렬 집합, 연결할 수 없으면 프로세스 내 큐로 대체)
+"""
+
+from abc import ABC, abstractmethod
+from redis.exceptions import RedisError
+from typing import Dict, List, Optional, Tuple
+import asyncio
+import heapq
+import logging
+import time
+
+from config import settings
+from cache import cache_manager
+
+logger = logging.getLogger(__name__)
+
+# 실행 시각이 지난 작업 하나를 원자적으로 꺼냄 (여러 프로세스의 워커가 같은 작업을 받지 않도록)
+POP_READY_SCRIPT = """
+local items = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, 1)
+if #items == 0 then
+    return false
+end
+redis.call('ZREM', KEYS[1], items[1])
+return items[1]
+"""
+
+
+class JobQueue(ABC):
+    """
+    작업 ID 큐 기본 클래스
+    같은 작업 ID는 큐에 한 번만 들어가며, 작업 상태/재시도 횟수는 DB(report_jobs)가 기준
+    """
+    
+    backend = "none"
+    
+    @abstractmethod
+    async def push(self, job_id: str, delay: float = 0, replace: bool = True) -> bool:
+        """
+        작업 ID를 delay초 뒤에 꺼낼 수 있도록 추가
+        
+        Args:
+            job_id: 작업 ID
+            delay: 실행 대기 시간 (초)
+            replace: 이미 큐에 있으면 실행 시각을 바꿀지 여부 (False면 기존 시각 유지)
+        
+        Returns:
+            추가 성공 여부 (실패해도 DB 복구 작업이 다시 넣음)
+        """
+    
+    @abstractmethod
+    async def pop(self, timeout: float) -> Optional[str]:
+        """실행 시각이 지난 작업 ID를 꺼냄 (timeout초 안에 없으면 None)"""
+    
+    @abstractmethod
+    async def size(self) -> Optional[int]:
+        """큐에 있는 작업 수"""
+
+
+class MemoryJobQueue(JobQueue):
+    """
+    프로세스 내 지연 큐
+    Redis가 없는 개발 환경용 (재시작 시 내용은 사라지지만 미완료 작업은 DB에서 복구)
+    """
+    
+    backend = "memory"
+    
+    def __init__(self):
+        self._heap: List[Tuple[float, int, str]] = []
+        self._scheduled: Dict[str, float] = {}
+        self._sequence = 0
+        self._wakeup = asyncio.Event()
+    
+    async def push(self, job_id: str, delay: float = 0, replace: bool = True) -> bool:
+        if job_id in self._scheduled and not replace:
+            return True
+        ready_at = time.monotonic() + max(delay, 0)
+        self._scheduled[job_id] = ready_at
+        self._sequence += 1
+        heapq.heappush(self._heap, (ready_at, self._sequence, job_id))
+        self._wakeup.set()
+        return True
+    
+    def _discard_stale(self) -> None:
+        # 실행 시각이 바뀐 작업의 이전 항목 정리
+        while self._heap and self._scheduled.get(self._heap[0][2]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+    
+    async def pop(self, timeout: float) -> Optional[str]:
+        deadline = time.monotonic() + timeout
+        while True:
+            self._discard_stale()
+            now = time.monotonic()
+            if self._heap and self._heap[0][0] <= now:
+                _, _, job_id = heapq.heappop(self._heap)
+                del self._scheduled[job_id]
+                return job_id
+            if now >= deadline:
+                return None
+            
+            wait = deadline - now
+            if self._heap:
+                wait = min(wait, self._heap[0][0] - now)
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), wait)
+            except asyncio.TimeoutError:
+                pass
+    
+    async def size(self) -> Optional[int]:
+        return len(self._scheduled)
+
+
+class RedisJobQueue(JobQueue):
+    """
+    Redis 정렬 집합 기반 지연 큐 (점수 = 실행 가능 시각)
+    여러 API/워커 프로세스가 같은 큐를 공유
+    """
+    
+    backend = "redis"
+    
+    def __init__(self, client, key: str):
+        self.client = client
+        self.key = key
+        self._pop_ready = client.register_script(POP_READY_SCRIPT)
+    
+    async def push(self, job_id: str, delay: float = 0, replace: bool = True) -> bool:
+        try:
+            await self.client.zadd(self.key, {job_id: time.time() + max(delay, 0)}, nx=not replace)
+            return True
+        except RedisError as e:
+            logger.warning(f"Job queue push failed for {job_id}: {e}")
+            return False
+    
+    async def pop(self, timeout: float) -> Optional[str]:
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                job_id = await self._pop_ready(keys=[self.key], args=[time.time()])
+                if job_id:
+                    return job_id
+            except RedisError as e:
+                logger.warning(f"Job queue pop failed: {e}")
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            await asyncio.sleep(min(settings.REPORT_QUEUE_POLL_SECONDS, remaining))
+    
+    async def size(self) -> Optional[int]:
+        try:
+            return await self.client.zcard(self.key)
+        except RedisError:
+            return None
+
+
+async def create_job_queue(key: str) -> JobQueue:
+    """
+    설정(REPORT_QUEUE_BACKEND)에 맞는 작업 큐 생성
+    
+    auto면 Redis에 연결할 수 있을 때 Redis 큐, 아니면 프로세스 내 큐를 사용합니다.
+    """
+    backend = settings.REPORT_QUEUE_BACKEND.lower()
+    if backend not in ("auto", "redis", "memory"):
+        raise ValueError(f"지원하지 않는 REPORT_QUEUE_BACKEND입니다: {settings.REPORT_QUEUE_BACKEND}")
+    
+    if backend == "memory":
+        return MemoryJobQueue()
+    if backend == "redis" or await cache_manager.ping():
+        return RedisJobQueue(cache_manager.client, key)
+    
+    logger.warning("Redis unavailable, using in-process job queue")
+    return MemoryJobQueue()
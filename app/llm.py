@@ -0,0 +1,226 @@
+"""
+Sinabro AI 리포트 생성기
+하루치 돌봄 기록으로 요약/가족 코멘트를 만드는 LLM 클라이언트 (로컬 stub / OpenAI)
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List
+import asyncio
+import json
+import logging
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+# AIReport.summary_text 길이 (데모 시나리오의 150자 요약)
+SUMMARY_MAX_LENGTH = 150
+
+REPORT_SYSTEM_PROMPT = (
+    "당신은 해외에 사는 가족에게 부모님의 하루 돌봄 기록을 전하는 간병 리포트 작성자입니다. "
+    "주어진 체크리스트, 돌봄노트, 사진 설명, 질문 답변만 근거로 작성하고 기록에 없는 내용은 추측하지 마세요. "
+    "다음 키를 가진 JSON 객체 하나만 출력하세요: "
+    "summary_text(150자 이내 요약), family_comment(가족에게 전하는 따뜻한 코멘트), "
+    "mood_analysis({\"label\": positive|neutral|negative, \"score\": -1~1, \"evidence\": [문장]}), "
+    "health_status({\"checklist_completion\": 평균 완료율, \"concerns\": [문장]}), "
+    "recommendations([문장]), confidence_score(0~1)."
+)
+
+POSITIVE_KEYWORDS = ("좋", "웃", "즐거", "행복", "편안", "잘 드", "활기")
+NEGATIVE_KEYWORDS = ("우울", "아프", "통증", "불안", "거부", "힘들", "어지러", "못 드", "넘어")
+
+
+class ReportGenerationError(Exception):
+    """리포트 생성 실패 (retryable이면 작업 큐가 백오프 후 다시 시도)"""
+    
+    def __init__(self, message: str, retryable: bool = True):
+        super().__init__(message)
+        self.retryable = retryable
+
+
+def _prompt_payload(sources: Dict[str, Any]) -> Dict[str, Any]:
+    """LLM에 전달할 기록 (내부 ID 제외)"""
+    return {
+        "senior_name": sources["senior_name"],
+        "report_date": sources["report_date"],
+        "checklists": [
+            {key: value for key, value in checklist.items() if key != "id"}
+            for checklist in sources["checklists"]
+        ],
+        "care_notes": [{"note_type": note["note_type"], "content": note["content"]} for note in sources["care_notes"]],
+        "photos": [{"photo_type": photo["photo_type"], "description": photo["description"]} for photo in sources["photos"]],
+        "question_responses": [
+            {"question": response["question"], "answer": response["response_text"]}
+            for response in sources["question_responses"]
+        ]
+    }
+
+
+def _normalize(payload: Any) -> Dict[str, Any]:
+    """생성 결과를 AIReport 컬럼 형식으로 정리 (필수 항목이 없으면 재시도 대상 오류)"""
+    if not isinstance(payload, dict):
+        raise ReportGenerationError("리포트 생성 결과가 JSON 객체가 아닙니다.")
+    
+    summary = str(payload.get("summary_text") or "").strip()
+    comment = str(payload.get("family_comment") or "").strip()
+    if not summary or not comment:
+        raise ReportGenerationError("리포트 생성 결과에 요약 또는 가족 코멘트가 없습니다.")
+    
+    try:
+        confidence = min(max(float(payload.get("confidence_score") or 0), 0.0), 1.0)
+    except (TypeError, ValueError):
+        confidence = 0.0
+    recommendations = payload.get("recommendations")
+    
+    return {
+        "summary_text": summary[:SUMMARY_MAX_LENGTH],
+        "family_comment": comment,
+        "mood_analysis": payload.get("mood_analysis") if isinstance(payload.get("mood_analysis"), dict) else {},
+        "health_status": payload.get("health_status") if isinstance(payload.get("health_status"), dict) else {},
+        "recommendations": recommendations if isinstance(recommendations, list) else [],
+        "confidence_score": round(confidence, 2)
+    }
+
+
+class ReportGenerator(ABC):
+    """리포트 생성기 기본 클래스"""
+    
+    model = "unknown"
+    
+    @abstractmethod
+    async def generate(self, sources: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        하루치 기록으로 리포트 내용 생성
+        
+        Args:
+            sources: ReportService.claim_job이 수집한 기록
+        
+        Returns:
+            AIReport 생성 내용 (summary_text, family_comment, mood_analysis, health_status,
+            recommendations, confidence_score)
+        
+        Raises:
+            ReportGenerationError: 생성 실패
+        """
+    
+    async def close(self) -> None:
+        """클라이언트 연결 정리"""
+
+
+class StubReportGenerator(ReportGenerator):
+    """
+    로컬 규칙 기반 생성기
+    외부 API 없이 개발/데모 환경에서 작업 큐를 끝까지 실행하기 위한 LLM 대역
+    (응답 지연은 REPORT_STUB_LATENCY_MS로 흉내 냄)
+    """
+    
+    model = "sinabro-stub"
+    
+    async def generate(self, sources: Dict[str, Any]) -> Dict[str, Any]:
+        await asyncio.sleep(settings.REPORT_STUB_LATENCY_MS / 1000)
+        
+        checklists = sources["checklists"]
+        texts: List[str] = [note["content"] for note in sources["care_notes"]]
+        texts += [checklist["additional_notes"] for checklist in checklists if checklist["additional_notes"]]
+        texts += [response["response_text"] for response in sources["question_responses"]]
+        texts += [photo["description"] for photo in sources["photos"] if photo["description"]]
+        
+        positive = [text for text in texts if any(keyword in text for keyword in POSITIVE_KEYWORDS)]
+        negative = [text for text in texts if any(keyword in text for keyword in NEGATIVE_KEYWORDS)]
+        mood_score = (len(positive) - len(negative)) / max(len(positive) + len(negative), 1)
+        mood_label = "positive" if mood_score > 0.2 else "negative" if mood_score < -0.2 else "neutral"
+        mood_text = {"positive": "밝은 모습이었습니다", "neutral": "평소와 비슷했습니다", "negative": "기운이 없어 보였습니다"}[mood_label]
+        mood_phrase = {"positive": "밝은 모습으로", "neutral": "평소처럼", "negative": "조금 기운 없이"}[mood_label]
+        
+        completion = (
+            round(sum(checklist["completion_rate"] for checklist in checklists) / len(checklists), 1)
+            if checklists else None
+        )
+        
+        summary = (
+            f"{sources['senior_name']}님의 {sources['report_date']} 기록: "
+            f"체크리스트 {len(checklists)}건"
+            + (f"(평균 완료율 {completion:g}%)" if completion is not None else "")
+            + f", 돌봄노트 {len(sources['care_notes'])}건, 사진 {len(sources['photos'])}장. "
+            f"기분은 {mood_text}."
+        )
+        
+        recommendations = []
+        if completion is not None and completion < 70:
+            recommendations.append("완료하지 못한 체크리스트 항목을 케어기버와 함께 확인해 보세요.")
+        if negative:
+            recommendations.append("불편함을 보인 기록이 있어 다음 통화에서 컨디션을 여쭤보세요.")
+        if not sources["photos"]:
+            recommendations.append("케어기버에게 오늘의 사진을 요청해 보세요.")
+        
+        family_comment = (
+            f"오늘 {sources['senior_name']}님은 {mood_phrase} 하루를 보내셨어요. "
+            + ("걱정되는 기록이 있어 관심이 필요해 보입니다." if negative else "케어기버가 곁에서 잘 돌봐 드리고 있습니다.")
+        )
+        
+        source_count = len(checklists) + len(texts)
+        return _normalize({
+            "summary_text": summary,
+            "family_comment": family_comment,
+            "mood_analysis": {"label": mood_label, "score": round(mood_score, 2), "evidence": (negative or positive)[:3]},
+            "health_status": {"checklist_completion": completion, "concerns": negative[:3]},
+            "recommendations": recommendations,
+            "confidence_score": min(0.5 + 0.05 * source_count, 0.9)
+        })
+
+
+class OpenAIReportGenerator(ReportGenerator):
+    """OpenAI Chat Completions 기반 생성기"""
+    
+    def __init__(self):
+        from openai import AsyncOpenAI
+        
+        # 재시도/백오프는 작업 큐가 담당하므로 클라이언트 자체 재시도는 끔
+        self.client = AsyncOpenAI(
+            api_key=settings.OPENAI_API_KEY,
+            timeout=settings.REPORT_LLM_TIMEOUT_SECONDS,
+            max_retries=0
+        )
+        self.model = settings.OPENAI_MODEL
+    
+    async def generate(self, sources: Dict[str, Any]) -> Dict[str, Any]:
+        import openai
+        
+        try:
+            completion = await self.client.chat.completions.create(
+                model=self.model,
+                temperature=0.3,
+                messages=[
+                    {"role": "system", "content": REPORT_SYSTEM_PROMPT},
+                    {"role": "user", "content": json.dumps(_prompt_payload(sources), ensure_ascii=False, default=str)}
+                ]
+            )
+        except (openai.RateLimitError, openai.APIConnectionError, openai.InternalServerError) as e:
+            raise ReportGenerationError(f"OpenAI 일시 오류: {e}")
+        except openai.APIStatusError as e:
+            # 인증/요청 형식 오류는 다시 시도해도 같은 결과
+            raise ReportGenerationError(f"OpenAI 요청 오류: {e}", retryable=False)
+        
+        content = (completion.choices[0].message.content or "").strip()
+        if content.startswith("```"):
+            content = content.strip("`").removeprefix("json").strip()
+        try:
+            payload = json.loads(content)
+        except ValueError:
+            raise ReportGenerationError("OpenAI 응답을 JSON으로 해석할 수 없습니다.")
+        return _normalize(payload)
+    
+    async def close(self) -> None:
+        await self.client.close()
+
+
+def create_report_generator() -> ReportGenerator:
+    """설정(REPORT_LLM_PROVIDER)에 맞는 리포트 생성기 생성"""
+    provider = settings.REPORT_LLM_PROVIDER.lower()
+    if provider == "stub":
+        return StubReportGenerator()
+    if provider == "openai":
+        if not settings.OPENAI_API_KEY:
+            raise ValueError("REPORT_LLM_PROVIDER=openai에는 OPENAI_API_KEY가 필요합니다.")
+        return OpenAIReportGenerator()
+    raise ValueError(f"지원하지 않는 REPORT_LLM_PROVIDER입니다: {settings.REPORT_LLM_PROVIDER}")
@@ -3,18 +3,28 @@ Sinabro FastAPI 메인 애플리케이션
 재외동포 시니어 간병 서비스 API
 """
 
-from fastapi import FastAPI, Depends, HTTPException, status, Request
+from fastapi import FastAPI, Depends, HTTPException, status, Request, Query
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.responses import JSONResponse
 import logging
+import re
 import time
 from contextlib import asynccontextmanager
 
 from config import settings
-from database import init_db, check_db_connection, get_db_info, db_manager
-from dependencies import verify_database_connection, log_request
-from routers import access_code_router, channel_router, checklist_router
+from database import init_db, db_manager, close_async_db
+from cache import cache_manager, access_code_cache, access_code_verifier, access_code_invalidator
+from health import health_monitor
+from negotiation import MessagePackMiddleware, SelectiveGZipMiddleware
+from renditions import rendition_pool
+from storage import blob_collector
+from report_worker import report_workers
+from report_batch import nightly_report_batch
+from translation import translation_manager
+from services import checklist_catalog, sync_changelog_compactor
+from dependencies import verify_database_connection, log_request, call_access_code_service
+from routers import access_code_router, channel_router, checklist_router, photo_router, media_router, report_router
 
 # 로깅 설정
 logging.basicConfig(
@@ -32,16 +42,57 @@ async def lifespan(app: FastAPI):
     logger.info(f"Environment: {settings.ENVIRONMENT}")
     logger.info(f"Debug mode: {settings.DEBUG}")
     logger.info(f"Demo mode: {settings.DEMO_MODE}")
+    logger.info(f"Async DB mode: {settings.DB_ASYNC_MODE}")
     
-    # 데이터베이스 연결 확인
-    if check_db_connection():
+    # 데이터베이스/Redis 상태 확인 후 백그라운드 헬스체크 시작
+    await health_monitor.refresh()
+    if health_monitor.database_healthy:
         logger.info("✅ 데이터베이스 연결 성공")
     else:
         logger.error("❌ 데이터베이스 연결 실패")
+    health_monitor.start()
+    
+    # DB에서 변경된 채널/사용자/접속 코드의 캐시 무효화 적용 시작
+    access_code_invalidator.start(call_access_code_service)
+    
+    # 테이블 통계 추정치 미리 수집 (백그라운드)
+    db_manager.get_table_stats()
+    
+    # 체크리스트 템플릿 카탈로그 로딩 (실패 시 DB 조회로 대체)
+    try:
+        await checklist_catalog.refresh(force=True)
+    except Exception as e:
+        logger.error(f"❌ 체크리스트 템플릿 카탈로그 로딩 실패: {e}")
+    checklist_catalog.start()
+    
+    # 사진 렌디션 생성 프로세스 풀 및 blob 수거 작업 시작
+    rendition_pool.start()
+    blob_collector.start()
+    
+    # 보관 기간이 지난 동기화 삭제 기록 정리 작업 시작
+    sync_changelog_compactor.start()
+    
+    # AI 리포트 생성 작업 큐 및 워커, 야간 일괄 생성 스케줄 시작
+    await report_workers.start()
+    nightly_report_batch.start()
+    
+    # 리포트 번역기 생성
+    translation_manager.start()
     
     yield
     
     # 종료 시 실행
+    await translation_manager.stop()
+    await nightly_report_batch.stop()
+    await report_workers.stop()
+    await sync_changelog_compactor.stop()
+    await blob_collector.stop()
+    await rendition_pool.stop()
+    await checklist_catalog.stop()
+    await access_code_invalidator.stop()
+    await health_monitor.stop()
+    await close_async_db()
+    await cache_manager.close()
     logger.info("🛑 Sinabro API 서버 종료")
 
 
@@ -87,6 +138,17 @@ app.add_middleware(
     allowed_hosts=settings.TRUSTED_HOSTS
 )
 
+# 응답 인코딩 미들웨어 (나중에 추가한 미들웨어가 바깥쪽이므로 MessagePack 변환 후 압축)
+# 사진 파일 응답은 압축하지 않음
+MEDIA_PATH_PATTERN = re.compile(r"^(/api/v1/photos/[^/]+/file|/media/)")
+if settings.MSGPACK_ENABLED:
+    app.add_middleware(MessagePackMiddleware)
+app.add_middleware(
+    SelectiveGZipMiddleware,
+    minimum_size=settings.GZIP_MINIMUM_SIZE,
+    exclude_path=MEDIA_PATH_PATTERN
+)
+
 
 # 요청 로깅 미들웨어
 @app.middleware("http")
@@ -143,19 +205,8 @@ async def root():
 
 @app.get("/health", tags=["시스템"])
 async def health_check():
-    """시스템 헬스체크"""
-    db_health = db_manager.health_check()
-    
-    system_status = {
-        "status": "healthy" if db_health["status"] == "healthy" else "unhealthy",
-        "timestamp": time.time(),
-        "version": settings.APP_VERSION,
-        "environment": settings.ENVIRONMENT,
-        "services": {
-            "database": db_health,
-            "api": {"status": "healthy"}
-        }
-    }
+    """시스템 헬스체크 (백그라운드에서 갱신된 상태 반환)"""
+    system_status = health_monitor.readiness()
     
     if system_status["status"] == "unhealthy":
         raise HTTPException(
@@ -166,11 +217,33 @@ async def health_check():
     return system_status
 
 
+@app.get("/health/live", tags=["시스템"])
+async def liveness_check():
+    """라이브니스 프로브 (프로세스 생존 여부만 확인)"""
+    return health_monitor.liveness()
+
+
+@app.get("/health/ready", tags=["시스템"])
+async def readiness_check():
+    """레디니스 프로브 (DB 장애 시 503)"""
+    system_status = health_monitor.readiness()
+    
+    if system_status["status"] == "unhealthy":
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content=system_status
+        )
+    
+    return system_status
+
+
 @app.get("/info", tags=["시스템"])
-async def system_info(_: None = Depends(verify_database_connection)):
+async def system_info(
+    exact: bool = Query(False, description="정확한 COUNT(*) 통계 사용 (백그라운드에서 수집)"),
+    _: None = Depends(verify_database_connection)
+):
     """시스템 정보 조회"""
-    db_info = get_db_info()
-    table_counts = db_manager.get_table_count()
+    table_counts = db_manager.get_table_stats(exact=exact)
     
     return {
         "application": {
@@ -180,8 +253,18 @@ async def system_info(_: None = Depends(verify_database_connection)):
             "debug": settings.DEBUG,
             "demo_mode": settings.DEMO_MODE
         },
-        "database": db_info,
+        "database": health_monitor.database_info(),
+        "health": health_monitor.readiness()["services"],
         "table_counts": table_counts,
+        "cache": {
+            "access_code": access_code_cache.get_stats(),
+            "access_code_auth": access_code_verifier.get_stats(),
+            "access_code_invalidation": access_code_invalidator.get_stats(),
+            "checklist_templates": checklist_catalog.get_stats(),
+            "translations": translation_manager.get_stats()
+        },
+        "report_workers": await report_workers.get_stats(),
+        "report_batch": nightly_report_batch.get_stats(),
         "demo_codes": {
             "guardian": [settings.DEMO_GUARDIAN_CODE, "GUARD002", "GUARD003"],
             "caregiver": [settings.DEMO_CAREGIVER_CODE, "CARE002", "CARE003"]
@@ -242,10 +325,12 @@ async def demo_info():
 app.include_router(access_code_router, tags=["접속 코드"])
 app.include_router(channel_router, tags=["채널"])
 app.include_router(checklist_router, tags=["체크리스트"])
+app.include_router(photo_router, tags=["사진"])
+app.include_router(media_router, tags=["사진"])
+app.include_router(report_router, tags=["AI 리포트"])
 
 # 향후 추가 예정 라우터들
 # app.include_router(care_notes_router, prefix=f"{settings.API_PREFIX}/care-notes", tags=["돌봄노트"])  
-# app.include_router(ai_reports_router, prefix=f"{settings.API_PREFIX}/ai-reports", tags=["AI 리포트"])
 # app.include_router(feedback_router, prefix=f"{settings.API_PREFIX}/feedback", tags=["피드백"])
 
 if __name__ == "__main__":
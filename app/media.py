@@ -0,0 +1,239 @@
+"""
+Sinabro 미디어 파일 전송
+Range/조건부 요청을 지원하는 파일 응답과 앞단 프록시가 직접 검증할 수 있는 서명 URL
+"""
+
+from email.utils import formatdate, parsedate_to_datetime
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.types import Receive, Scope, Send
+from typing import Dict, Mapping, Optional, Tuple
+from urllib.parse import quote, urlencode, urlsplit
+import asyncio
+import base64
+import hashlib
+import hmac
+import logging
+import os
+import time
+
+from config import settings
+from storage import BLOB_SUBDIR
+
+logger = logging.getLogger(__name__)
+
+# 내용 주소 경로(blobs/...)는 내용이 바뀌지 않으므로 장기 캐시
+IMMUTABLE_CACHE_CONTROL = "private, max-age=31536000, immutable"
+
+
+class RangeNotSatisfiable(ValueError):
+    """파일 범위를 벗어난 Range 요청"""
+
+
+def is_content_addressed(relative_path: str) -> bool:
+    """내용 주소(SHA-256) 경로 여부"""
+    return relative_path.startswith(f"{BLOB_SUBDIR}/")
+
+
+def resolve_media_path(relative_path: str) -> Optional[str]:
+    """UPLOAD_DIR 기준 경로를 실제 경로로 변환 (UPLOAD_DIR 밖을 가리키면 None)"""
+    normalized = os.path.normpath(relative_path)
+    if os.path.isabs(normalized) or normalized == ".." or normalized.startswith(f"..{os.sep}"):
+        return None
+    return os.path.join(settings.UPLOAD_DIR, normalized)
+
+
+def parse_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    Range 헤더를 (시작, 끝) 바이트 위치로 변환 (끝 포함)
+    
+    단일 범위만 지원하며, 형식이 잘못되었거나 여러 범위를 요청하면 None(전체 전송)을 반환합니다.
+    
+    Raises:
+        RangeNotSatisfiable: 파일 크기를 벗어난 범위
+    """
+    if not header or not header.startswith("bytes=") or "," in header:
+        return None
+    
+    start, _, end = header[6:].strip().partition("-")
+    try:
+        first = int(start) if start else None
+        last = int(end) if end else None
+    except ValueError:
+        return None
+    
+    if first is None:
+        # bytes=-N: 마지막 N 바이트 (0바이트 또는 빈 파일은 만족할 수 없는 범위)
+        if last is None:
+            return None
+        if last <= 0 or size == 0:
+            raise RangeNotSatisfiable(header)
+        return max(size - last, 0), size - 1
+    if last is None:
+        last = size - 1
+    
+    if first >= size:
+        raise RangeNotSatisfiable(header)
+    if first > last:
+        return None
+    return first, min(last, size - 1)
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    """If-None-Match 비교 (약한 비교)"""
+    if header.strip() == "*":
+        return True
+    return etag in (tag.strip().removeprefix("W/") for tag in header.split(","))
+
+
+def _not_modified_since(header: Optional[str], mtime: float) -> bool:
+    if not header:
+        return False
+    try:
+        return int(mtime) <= parsedate_to_datetime(header).timestamp()
+    except (TypeError, ValueError):
+        return False
+
+
+def _media_uri(relative_path: str) -> str:
+    """서명 대상 URI 경로 (프록시의 $uri와 동일)"""
+    base_path = urlsplit(settings.MEDIA_URL_BASE).path.rstrip("/")
+    return f"{base_path}/{quote(relative_path)}"
+
+
+def _media_signature(uri: str, expires: int) -> str:
+    """
+    nginx secure_link 모듈과 같은 형식의 서명
+    (secure_link_md5 "$secure_link_expires$uri <MEDIA_SIGNING_SECRET>")
+    """
+    secret = settings.MEDIA_SIGNING_SECRET or settings.SECRET_KEY
+    digest = hashlib.md5(f"{expires}{uri} {secret}".encode()).digest()
+    return base64.urlsafe_b64encode(digest).decode().rstrip("=")
+
+
+def sign_media_url(relative_path: str, ttl: Optional[int] = None) -> Tuple[str, int]:
+    """
+    파일을 앱을 거치지 않고 받을 수 있는 단기 서명 URL 발급
+    
+    Args:
+        relative_path: UPLOAD_DIR 기준 파일 경로
+        ttl: 유효 시간 (초, 기본값: MEDIA_URL_TTL)
+    
+    Returns:
+        (서명 URL, 만료 시각 unix timestamp)
+    """
+    expires = int(time.time()) + (ttl or settings.MEDIA_URL_TTL)
+    uri = _media_uri(relative_path)
+    query = urlencode({"md5": _media_signature(uri, expires), "expires": expires})
+    return f"{settings.MEDIA_URL_BASE.rstrip('/')}/{quote(relative_path)}?{query}", expires
+
+
+def verify_media_signature(relative_path: str, signature: str, expires: int) -> bool:
+    """서명 URL 검증 (프록시 없이 앱이 직접 전송하는 경우)"""
+    if expires < time.time():
+        return False
+    return hmac.compare_digest(signature, _media_signature(_media_uri(relative_path), expires))
+
+
+class MediaFileResponse(Response):
+    """
+    파일 응답
+    조건부 요청(ETag/Last-Modified)과 단일 Range 요청을 처리하고, 본문은 청크 단위로 pread하여
+    파일 전체를 메모리에 올리지 않음. MEDIA_ACCEL_REDIRECT_PREFIX가 설정되면 본문 전송은
+    앞단 프록시(X-Accel-Redirect, sendfile)에 맡김.
+    """
+    
+    def __init__(
+        self,
+        path: str,
+        relative_path: str,
+        media_type: str,
+        cache_control: str,
+        headers: Optional[Mapping[str, str]] = None
+    ):
+        super().__init__(status_code=200, headers=headers, media_type=media_type)
+        self.path = path
+        self.relative_path = relative_path
+        # 본문 길이는 전송 시점에 결정
+        del self.headers["content-length"]
+        self.headers["cache-control"] = cache_control
+        self.headers["accept-ranges"] = "bytes"
+    
+    def _validators(self, stat: os.stat_result) -> Dict[str, str]:
+        if is_content_addressed(self.relative_path):
+            # 파일명(내용 해시 + 렌디션 크기/형식)이 내용을 식별하므로 그대로 강한 ETag로 사용
+            etag = f'"{os.path.basename(self.relative_path)}"'
+        else:
+            etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+        return {"etag": etag, "last-modified": formatdate(stat.st_mtime, usegmt=True)}
+    
+    async def _send_start(self, send: Send, status_code: int, headers: Dict[str, str]) -> None:
+        self.headers.update(headers)
+        await send({"type": "http.response.start", "status": status_code, "headers": self.raw_headers})
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            stat = await asyncio.to_thread(os.stat, self.path)
+        except FileNotFoundError:
+            await Response(status_code=404)(scope, receive, send)
+            return
+        
+        validators = self._validators(stat)
+        request_headers = Headers(scope=scope)
+        
+        # 조건부 요청: If-None-Match가 있으면 If-Modified-Since는 무시
+        if_none_match = request_headers.get("if-none-match")
+        if (if_none_match and _etag_matches(if_none_match, validators["etag"])) or (
+            not if_none_match and _not_modified_since(request_headers.get("if-modified-since"), stat.st_mtime)
+        ):
+            del self.headers["content-type"]
+            await self._send_start(send, 304, validators)
+            await send({"type": "http.response.body", "body": b""})
+            return
+        
+        if settings.MEDIA_ACCEL_REDIRECT_PREFIX:
+            # 프록시가 내부 경로의 파일을 sendfile로 전송 (Range도 프록시가 처리)
+            accel_path = f"{settings.MEDIA_ACCEL_REDIRECT_PREFIX.rstrip('/')}/{quote(self.relative_path)}"
+            await self._send_start(send, 200, {**validators, "x-accel-redirect": accel_path})
+            await send({"type": "http.response.body", "body": b""})
+            return
+        
+        # If-Range가 현재 버전과 다르면 전체 전송
+        byte_range = None
+        if_range = request_headers.get("if-range")
+        if not if_range or if_range in (validators["etag"], validators["last-modified"]):
+            try:
+                byte_range = parse_range(request_headers.get("range"), stat.st_size)
+            except RangeNotSatisfiable:
+                del self.headers["content-type"]
+                await self._send_start(send, 416, {"content-range": f"bytes */{stat.st_size}", "content-length": "0"})
+                await send({"type": "http.response.body", "body": b""})
+                return
+        
+        start, end = byte_range or (0, stat.st_size - 1)
+        length = max(end - start + 1, 0)
+        headers = {**validators, "content-length": str(length)}
+        if byte_range:
+            headers["content-range"] = f"bytes {start}-{end}/{stat.st_size}"
+        await self._send_start(send, 206 if byte_range else 200, headers)
+        
+        if scope.get("method") == "HEAD" or length == 0:
+            await send({"type": "http.response.body", "body": b""})
+            return
+        
+        fd = await asyncio.to_thread(os.open, self.path, os.O_RDONLY)
+        try:
+            offset, remaining = start, length
+            while remaining > 0:
+                chunk = await asyncio.to_thread(os.pread, fd, min(settings.MEDIA_CHUNK_SIZE, remaining), offset)
+                if not chunk:
+                    break
+                offset += len(chunk)
+                remaining -= len(chunk)
+                await send({"type": "http.response.body", "body": chunk, "more_body": remaining > 0})
+            if remaining > 0:
+                # 전송 중 파일이 잘린 경우 연결을 정상 종료
+                logger.warning(f"Media file truncated while sending: {self.path}")
+                await send({"type": "http.response.body", "body": b""})
+        finally:
+            os.close(fd)
@@ -15,10 +15,14 @@ from .channel import Channel
 # 체크리스트 모델
 from .checklist_template import ChecklistTemplate
 from .daily_checklist import DailyChecklist
+from .checklist_rollup import ChecklistRollup
+from .daily_digest import DailyDigest
 
 # 케어 관련 모델
 from .care_note import CareNote
 from .photo import Photo
+from .photo_blob import PhotoBlob
+from .photo_rendition import PhotoRendition
 
 # 질문 및 피드백 모델
 from .admin_question import AdminQuestion
@@ -27,6 +31,8 @@ from .guardian_feedback import GuardianFeedback
 
 # AI 관련 모델
 from .ai_report import AIReport
+from .report_job import ReportJob
+from .report_batch_run import ReportBatchRun
 
 __all__ = [
     # 기본 사용자 모델
@@ -41,10 +47,14 @@ __all__ = [
     # 체크리스트 모델
     "ChecklistTemplate",
     "DailyChecklist", 
+    "ChecklistRollup",
+    "DailyDigest",
     
     # 케어 관련 모델
     "CareNote",
     "Photo",
+    "PhotoBlob",
+    "PhotoRendition",
     
     # 질문 및 피드백 모델
     "AdminQuestion",
@@ -52,5 +62,7 @@ __all__ = [
     "GuardianFeedback",
     
     # AI 관련 모델
-    "AIReport"
+    "AIReport",
+    "ReportJob",
+    "ReportBatchRun"
 ]
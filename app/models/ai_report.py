@@ -3,7 +3,7 @@ AIReport (AI 리포트) 모델
 AI가 생성한 일일 케어 리포트를 저장하는 모델
 """
 
-from sqlalchemy import Column, String, Text, Date, DateTime, Integer, ForeignKey
+from sqlalchemy import Column, String, Text, Date, DateTime, Integer, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID, ARRAY, JSONB
 from sqlalchemy.types import DECIMAL
 from sqlalchemy.orm import relationship
@@ -50,6 +50,11 @@ class AIReport(Base):
     
     created_at = Column(DateTime(timezone=True), server_default=func.now(), comment="생성일시")
     
+    # 제약조건 (채널/날짜별 리포트 한 건)
+    __table_args__ = (
+        Index("uq_ai_reports_channel_date", "channel_id", "report_date", unique=True),
+    )
+    
     # 관계 정의
     channel = relationship("Channel", back_populates="ai_reports")
     guardian_feedback = relationship(
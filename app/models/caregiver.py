@@ -32,7 +32,7 @@ class Caregiver(Base):
     channels = relationship("Channel", back_populates="caregiver", cascade="all, delete-orphan")
     care_notes = relationship("CareNote", back_populates="caregiver", cascade="all, delete-orphan")
     photos = relationship("Photo", back_populates="caregiver", cascade="all, delete-orphan")
-    daily_checklists = relationship("DailyChecklist", back_populates="caregiver", cascade="all, delete-orphan")
+    daily_checklists = relationship("DailyChecklist", back_populates="creator", cascade="all, delete-orphan")
     
     def __repr__(self):
         return f"<Caregiver(name='{self.full_name}', experience={self.experience_years}년)>"
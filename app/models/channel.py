@@ -39,6 +39,7 @@ class Channel(Base):
     senior = relationship("Senior", back_populates="channels")
     
     # 역참조 관계들
+    access_codes = relationship("AccessCode", back_populates="channel")
     daily_checklists = relationship("DailyChecklist", back_populates="channel", cascade="all, delete-orphan")
     care_notes = relationship("CareNote", back_populates="channel", cascade="all, delete-orphan")
     photos = relationship("Photo", back_populates="channel", cascade="all, delete-orphan")
@@ -0,0 +1,55 @@
+"""
+ChecklistRollup (체크리스트 롤업) 모델
+채널별 일/주/월 단위 체크리스트 집계 (daily_checklists 트리거로 증분 갱신)
+"""
+
+from sqlalchemy import Column, String, Date, DateTime, Integer, Numeric, CheckConstraint
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+
+from ..database import Base
+
+
+class ChecklistRollup(Base):
+    """체크리스트 롤업 모델"""
+    
+    __tablename__ = "checklist_rollups"
+    
+    channel_id = Column(UUID(as_uuid=True), primary_key=True, comment="채널 ID")
+    period = Column(String(10), primary_key=True, comment="집계 단위 (day/week/month)")
+    period_start = Column(Date, primary_key=True, comment="집계 기간 시작일")
+    checklist_count = Column(Integer, nullable=False, default=0, comment="체크리스트 수")
+    completion_sum = Column(Numeric(12, 2), nullable=False, default=0, comment="완료율 합계")
+    checked_items = Column(Integer, nullable=False, default=0, comment="체크된 항목 수")
+    total_items = Column(Integer, nullable=False, default=0, comment="전체 항목 수")
+    required_checked = Column(Integer, nullable=False, default=0, comment="체크된 필수 항목 수")
+    required_unchecked = Column(Integer, nullable=False, default=0, comment="체크되지 않은 필수 항목 수")
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), comment="갱신일시")
+    
+    # 제약조건
+    __table_args__ = (
+        CheckConstraint("period IN ('day', 'week', 'month')", name="check_rollup_period"),
+    )
+    
+    def __repr__(self):
+        return f"<ChecklistRollup(period='{self.period}', start='{self.period_start}', count={self.checklist_count})>"
+    
+    @property
+    def average_completion_rate(self):
+        """평균 완료율"""
+        if not self.checklist_count:
+            return 0.0
+        return round(float(self.completion_sum) / self.checklist_count, 2)
+    
+    def to_dict(self):
+        """딕셔너리로 변환"""
+        return {
+            "period": self.period,
+            "period_start": self.period_start.isoformat() if self.period_start else None,
+            "checklist_count": self.checklist_count,
+            "average_completion_rate": self.average_completion_rate,
+            "checked_items": self.checked_items,
+            "total_items": self.total_items,
+            "required_checked": self.required_checked,
+            "required_unchecked": self.required_unchecked
+        }
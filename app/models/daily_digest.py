@@ -0,0 +1,56 @@
+"""
+DailyDigest (일일 기록 다이제스트) 모델
+채널별 하루치 체크리스트/돌봄노트/사진/질문답변 요약 (원본 테이블 트리거로 증분 갱신)
+"""
+
+from sqlalchemy import Column, Date, DateTime, Integer, Numeric
+from sqlalchemy.dialects.postgresql import UUID, ARRAY, JSONB
+from sqlalchemy.sql import func
+
+from ..database import Base
+
+
+class DailyDigest(Base):
+    """일일 기록 다이제스트 모델"""
+    
+    __tablename__ = "daily_digests"
+    
+    channel_id = Column(UUID(as_uuid=True), primary_key=True, comment="채널 ID")
+    digest_date = Column(Date, primary_key=True, comment="기록 날짜")
+    
+    # 항목 (원본 ID → 리포트 생성에 필요한 필드)
+    checklists = Column(JSONB, nullable=False, default=dict, comment="체크리스트 항목")
+    care_notes = Column(JSONB, nullable=False, default=dict, comment="돌봄노트 항목")
+    photos = Column(JSONB, nullable=False, default=dict, comment="사진 항목")
+    question_responses = Column(JSONB, nullable=False, default=dict, comment="질문답변 항목")
+    
+    # 원본 ID (작성 순서)
+    checklist_ids = Column(ARRAY(UUID(as_uuid=True)), nullable=False, default=list, comment="체크리스트 ID들")
+    care_note_ids = Column(ARRAY(UUID(as_uuid=True)), nullable=False, default=list, comment="돌봄노트 ID들")
+    photo_ids = Column(ARRAY(UUID(as_uuid=True)), nullable=False, default=list, comment="사진 ID들")
+    question_response_ids = Column(ARRAY(UUID(as_uuid=True)), nullable=False, default=list, comment="질문답변 ID들")
+    
+    # 집계
+    checklist_count = Column(Integer, nullable=False, default=0, comment="체크리스트 수")
+    completion_sum = Column(Numeric(12, 2), nullable=False, default=0, comment="완료율 합계")
+    checked_items = Column(Integer, nullable=False, default=0, comment="체크된 항목 수")
+    total_items = Column(Integer, nullable=False, default=0, comment="전체 항목 수")
+    care_note_count = Column(Integer, nullable=False, default=0, comment="돌봄노트 수")
+    photo_count = Column(Integer, nullable=False, default=0, comment="사진 수")
+    question_response_count = Column(Integer, nullable=False, default=0, comment="질문답변 수")
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), comment="갱신일시")
+    
+    def __repr__(self):
+        return f"<DailyDigest(date='{self.digest_date}', sources={self.source_count})>"
+    
+    @property
+    def source_count(self):
+        """다이제스트에 담긴 기록의 총 개수"""
+        return self.checklist_count + self.care_note_count + self.photo_count + self.question_response_count
+    
+    @property
+    def average_completion_rate(self):
+        """평균 완료율"""
+        if not self.checklist_count:
+            return 0.0
+        return round(float(self.completion_sum) / self.checklist_count, 2)
@@ -25,6 +25,7 @@ class Photo(Base):
     file_name = Column(String(255), comment="원본 파일명")
     description = Column(Text, comment="사진 설명")
     photo_type = Column(String(30), comment="사진 타입")
+    blob_sha256 = Column(String(64), ForeignKey("photo_blobs.sha256"), comment="원본 파일 blob SHA-256")
     taken_date = Column(Date, nullable=False, server_default=func.current_date(), comment="촬영 날짜")
     created_at = Column(DateTime(timezone=True), server_default=func.now(), comment="생성일시")
     
@@ -36,6 +37,7 @@ class Photo(Base):
     # 관계 정의
     channel = relationship("Channel", back_populates="photos")
     caregiver = relationship("Caregiver", back_populates="photos")
+    renditions = relationship("PhotoRendition", back_populates="photo", cascade="all, delete-orphan")
     
     def __repr__(self):
         return f"<Photo(type='{self.photo_type}', taken='{self.taken_date}')>"
@@ -0,0 +1,31 @@
+"""
+PhotoBlob (사진 blob) 모델
+SHA-256 내용 주소로 한 번만 저장되는 사진 원본 파일 (photos 트리거로 참조 카운트 관리)
+"""
+
+from sqlalchemy import Column, String, DateTime, Integer, BigInteger, Text, CheckConstraint
+from sqlalchemy.sql import func
+
+from ..database import Base
+
+
+class PhotoBlob(Base):
+    """사진 blob 모델"""
+    
+    __tablename__ = "photo_blobs"
+    
+    sha256 = Column(String(64), primary_key=True, comment="파일 내용 SHA-256 (hex)")
+    file_url = Column(Text, nullable=False, comment="파일 경로")
+    file_size = Column(BigInteger, nullable=False, comment="파일 크기 (bytes)")
+    file_type = Column(String(10), nullable=False, comment="파일 형식")
+    ref_count = Column(Integer, nullable=False, default=0, comment="참조하는 사진 수")
+    orphaned_at = Column(DateTime(timezone=True), server_default=func.now(), comment="참조가 0이 된 시점")
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), comment="생성일시")
+    
+    # 제약조건
+    __table_args__ = (
+        CheckConstraint("ref_count >= 0", name="check_blob_ref_count"),
+    )
+    
+    def __repr__(self):
+        return f"<PhotoBlob(sha256='{self.sha256[:12]}', refs={self.ref_count})>"
@@ -0,0 +1,46 @@
+"""
+PhotoRendition (사진 렌디션) 모델
+원본 사진에서 생성한 크기/형식별 축소본 메타데이터
+"""
+
+from sqlalchemy import Column, String, DateTime, Integer, Text, CheckConstraint, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+
+from ..database import Base
+
+
+class PhotoRendition(Base):
+    """사진 렌디션 모델"""
+    
+    __tablename__ = "photo_renditions"
+    
+    photo_id = Column(UUID(as_uuid=True), ForeignKey("photos.id", ondelete="CASCADE"), primary_key=True, comment="사진 ID")
+    width = Column(Integer, primary_key=True, comment="가로 크기 (px)")
+    format = Column(String(10), primary_key=True, comment="이미지 형식 (jpeg/webp)")
+    height = Column(Integer, nullable=False, comment="세로 크기 (px)")
+    file_url = Column(Text, nullable=False, comment="파일 경로")
+    file_size = Column(Integer, nullable=False, comment="파일 크기 (bytes)")
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), comment="생성일시")
+    
+    # 제약조건
+    __table_args__ = (
+        CheckConstraint("format IN ('jpeg', 'webp')", name="check_rendition_format"),
+    )
+    
+    # 관계 정의
+    photo = relationship("Photo", back_populates="renditions")
+    
+    def __repr__(self):
+        return f"<PhotoRendition(width={self.width}, format='{self.format}')>"
+    
+    def to_dict(self):
+        """딕셔너리로 변환"""
+        return {
+            "width": self.width,
+            "height": self.height,
+            "format": self.format,
+            "file_url": self.file_url,
+            "file_size": self.file_size
+        }
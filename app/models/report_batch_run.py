@@ -0,0 +1,59 @@
+"""
+ReportBatchRun (리포트 일괄 생성 실행) 모델
+활성 채널 전체의 하루치 AI 리포트를 만드는 야간 배치 실행 기록
+"""
+
+from sqlalchemy import Column, String, Date, DateTime, Integer, Text, CheckConstraint
+from sqlalchemy.sql import func
+
+from ..database import Base
+
+
+class ReportBatchRun(Base):
+    """리포트 일괄 생성 실행 모델"""
+    
+    __tablename__ = "report_batch_runs"
+    
+    report_date = Column(Date, primary_key=True, comment="리포트 날짜")
+    status = Column(String(20), nullable=False, default="running", comment="실행 상태")
+    started_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), comment="시작일시")
+    finished_at = Column(DateTime(timezone=True), comment="완료일시")
+    channel_count = Column(Integer, nullable=False, default=0, comment="대상 채널 수")
+    generated = Column(Integer, nullable=False, default=0, comment="생성한 리포트 수")
+    skipped = Column(Integer, nullable=False, default=0, comment="기록이 없어 건너뛴 채널 수")
+    failed = Column(Integer, nullable=False, default=0, comment="생성에 실패한 채널 수")
+    wall_time_ms = Column(Integer, comment="전체 실행 시간 (밀리초)")
+    latency_p50_ms = Column(Integer, comment="리포트 생성 시간 중앙값 (밀리초)")
+    latency_p90_ms = Column(Integer, comment="리포트 생성 시간 90 백분위수 (밀리초)")
+    latency_p99_ms = Column(Integer, comment="리포트 생성 시간 99 백분위수 (밀리초)")
+    latency_max_ms = Column(Integer, comment="리포트 생성 시간 최댓값 (밀리초)")
+    last_error = Column(Text, comment="실행 중단 사유")
+    
+    # 제약조건
+    __table_args__ = (
+        CheckConstraint("status IN ('running', 'succeeded', 'failed')", name="check_report_batch_run_status"),
+    )
+    
+    def __repr__(self):
+        return f"<ReportBatchRun(date='{self.report_date}', status='{self.status}', generated={self.generated})>"
+    
+    def to_dict(self):
+        """딕셔너리로 변환"""
+        return {
+            "report_date": self.report_date.isoformat() if self.report_date else None,
+            "status": self.status,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "channel_count": self.channel_count,
+            "generated": self.generated,
+            "skipped": self.skipped,
+            "failed": self.failed,
+            "wall_time_ms": self.wall_time_ms,
+            "latency_ms": {
+                "p50": self.latency_p50_ms,
+                "p90": self.latency_p90_ms,
+                "p99": self.latency_p99_ms,
+                "max": self.latency_max_ms
+            },
+            "last_error": self.last_error
+        }
@@ -0,0 +1,61 @@
+"""
+ReportJob (리포트 생성 작업) 모델
+백그라운드 워커가 처리하는 AI 리포트 생성 요청과 진행 상태
+"""
+
+from sqlalchemy import Column, String, Date, DateTime, Integer, Text, CheckConstraint, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+import uuid
+
+from ..database import Base
+
+
+class ReportJob(Base):
+    """리포트 생성 작업 모델"""
+    
+    __tablename__ = "report_jobs"
+    
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    channel_id = Column(UUID(as_uuid=True), ForeignKey("channels.id", ondelete="CASCADE"), nullable=False, comment="채널 ID")
+    report_date = Column(Date, nullable=False, comment="리포트 날짜")
+    status = Column(String(20), nullable=False, default="queued", comment="작업 상태")
+    attempts = Column(Integer, nullable=False, default=0, comment="실행 횟수")
+    max_attempts = Column(Integer, nullable=False, default=3, comment="최대 실행 횟수")
+    run_after = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), comment="다음 실행 가능 시각")
+    last_error = Column(Text, comment="마지막 실패 사유")
+    report_id = Column(UUID(as_uuid=True), ForeignKey("ai_reports.id", ondelete="SET NULL"), comment="생성된 리포트 ID")
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), comment="생성일시")
+    started_at = Column(DateTime(timezone=True), comment="마지막 실행 시작일시")
+    finished_at = Column(DateTime(timezone=True), comment="완료일시")
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), comment="수정일시")
+    
+    # 제약조건
+    __table_args__ = (
+        CheckConstraint("status IN ('queued', 'running', 'succeeded', 'failed')", name="check_report_job_status"),
+    )
+    
+    def __repr__(self):
+        return f"<ReportJob(date='{self.report_date}', status='{self.status}', attempts={self.attempts})>"
+    
+    @property
+    def is_finished(self):
+        """완료(성공/실패) 여부"""
+        return self.status in ("succeeded", "failed")
+    
+    def to_dict(self):
+        """딕셔너리로 변환"""
+        return {
+            "id": str(self.id),
+            "channel_id": str(self.channel_id),
+            "report_date": self.report_date.isoformat() if self.report_date else None,
+            "status": self.status,
+            "attempts": self.attempts,
+            "max_attempts": self.max_attempts,
+            "run_after": self.run_after.isoformat() if self.run_after else None,
+            "last_error": self.last_error,
+            "report_id": str(self.report_id) if self.report_id else None,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None
+        }
@@ -0,0 +1,180 @@
+"""
+Sinabro 응답 콘텐츠 협상
+Accept 헤더가 MessagePack을 요청하면 JSON 응답 본문을 MessagePack으로 변환하는 ASGI 미들웨어,
+이미 압축된 파일 응답을 제외하는 gzip 미들웨어
+"""
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.middleware.gzip import GZipMiddleware, GZipResponder
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from typing import List, Optional, Pattern
+import logging
+import msgpack
+import orjson
+
+logger = logging.getLogger(__name__)
+
+MSGPACK_MEDIA_TYPES = ("application/msgpack", "application/x-msgpack")
+MSGPACK_CONTENT_TYPE = "application/msgpack"
+
+# 이미 압축되어 있어 gzip으로 줄지 않는 본문 타입
+PRECOMPRESSED_TYPE_PREFIXES = ("image/", "video/", "audio/", "application/octet-stream", "application/zip", "application/gzip")
+
+# 같은 리소스의 JSON/MessagePack 표현이 서로 다른 강한 ETag를 갖도록 붙이는 접미사
+ETAG_SUFFIX = "-msgpack"
+
+
+def accepts_msgpack(accept: Optional[str]) -> bool:
+    """Accept 헤더에 MessagePack 미디어 타입이 q > 0으로 포함되어 있는지 확인"""
+    if not accept:
+        return False
+    for part in accept.split(","):
+        media_type, *params = [token.strip() for token in part.split(";")]
+        if media_type.lower() not in MSGPACK_MEDIA_TYPES:
+            continue
+        quality = next((param[2:] for param in params if param.startswith("q=")), "1")
+        try:
+            if float(quality) > 0:
+                return True
+        except ValueError:
+            return True
+    return False
+
+
+def _strip_etag_suffix(raw_headers: List[tuple]) -> List[tuple]:
+    """If-None-Match의 MessagePack ETag를 라우터가 계산하는 JSON ETag로 되돌림"""
+    suffix = f'{ETAG_SUFFIX}"'.encode()
+    return [
+        (name, value.replace(suffix, b'"')) if name == b"if-none-match" else (name, value)
+        for name, value in raw_headers
+    ]
+
+
+def _suffix_etag(headers: MutableHeaders) -> None:
+    etag = headers.get("etag")
+    if etag and etag.endswith('"') and not etag.endswith(f'{ETAG_SUFFIX}"'):
+        headers["etag"] = f'{etag[:-1]}{ETAG_SUFFIX}"'
+
+
+class MessagePackMiddleware:
+    """
+    MessagePack 콘텐츠 협상 미들웨어
+    서비스/라우터는 JSON만 생성하고, 요청한 클라이언트에게만 본문을 변환하여 전달
+    """
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        if not accepts_msgpack(Headers(scope=scope).get("accept")):
+            await self.app(scope, receive, self._add_vary(send))
+            return
+        
+        scope = dict(scope, headers=_strip_etag_suffix(scope["headers"]))
+        start: Optional[Message] = None
+        chunks: List[bytes] = []
+        passthrough = False
+        
+        async def send_msgpack(message: Message) -> None:
+            nonlocal start, passthrough
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                if message["status"] == 304:
+                    # 본문 없는 304도 클라이언트가 가진 MessagePack 표현의 ETag로 응답
+                    passthrough = True
+                    _suffix_etag(MutableHeaders(scope=message))
+                    await send(message)
+                elif not headers.get("content-type", "").startswith("application/json"):
+                    passthrough = True
+                    await send(message)
+                else:
+                    start = message
+                return
+            
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+            
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+            
+            await self._send_converted(start, b"".join(chunks), send)
+        
+        await self.app(scope, receive, send_msgpack)
+    
+    @staticmethod
+    def _add_vary(send: Send) -> Send:
+        """JSON 응답에 Vary: Accept 추가 (공유 캐시가 표현을 섞지 않도록)"""
+        async def send_with_vary(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                if headers.get("content-type", "").startswith("application/json"):
+                    headers.add_vary_header("Accept")
+            await send(message)
+        return send_with_vary
+    
+    @staticmethod
+    async def _send_converted(start: Message, body: bytes, send: Send) -> None:
+        """JSON 본문을 MessagePack으로 변환하여 전송 (변환 실패 시 원본 전송)"""
+        headers = MutableHeaders(scope=start)
+        headers.add_vary_header("Accept")
+        try:
+            body = msgpack.packb(orjson.loads(body), use_bin_type=True) if body else body
+        except (orjson.JSONDecodeError, TypeError, ValueError) as e:
+            logger.warning(f"MessagePack conversion failed: {e}")
+        else:
+            headers["content-type"] = MSGPACK_CONTENT_TYPE
+            _suffix_etag(headers)
+        
+        headers["content-length"] = str(len(body))
+        await send(start)
+        await send({"type": "http.response.body", "body": body, "more_body": False})
+
+
+def _skip_compression(message: Message) -> bool:
+    """부분 응답(206/Content-Range)이나 이미 압축된 타입의 응답인지 확인"""
+    headers = Headers(raw=message["headers"])
+    content_type = headers.get("content-type", "").lower()
+    return (
+        message["status"] == 206
+        or "content-range" in headers
+        or content_type.startswith(PRECOMPRESSED_TYPE_PREFIXES)
+    )
+
+
+class SelectiveGZipResponder(GZipResponder):
+    """응답 헤더를 보고 압축하지 않을 응답은 그대로 전달하는 GZipResponder"""
+    
+    async def send_with_gzip(self, message: Message) -> None:
+        await super().send_with_gzip(message)
+        # 이미 Content-Encoding이 있는 응답과 같은 경로(본문을 그대로 전달)로 처리
+        if message["type"] == "http.response.start" and _skip_compression(message):
+            self.content_encoding_set = True
+
+
+class SelectiveGZipMiddleware(GZipMiddleware):
+    """
+    압축하지 않을 응답을 건너뛰는 GZipMiddleware
+    사진 등 이미 압축된 파일은 다시 압축해도 크기가 줄지 않고, 압축하면 Range 응답의
+    Content-Length/Content-Range가 맞지 않게 되므로 그대로 전달
+    (exclude_path 경로는 응답을 보기 전에 건너뛰고, 그 밖의 경로도 206/Content-Range/이미 압축된 타입이면 건너뜀)
+    """
+    
+    def __init__(self, app: ASGIApp, minimum_size: int = 500, exclude_path: Optional[Pattern[str]] = None):
+        super().__init__(app, minimum_size=minimum_size)
+        self.exclude_path = exclude_path
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or (self.exclude_path is not None and self.exclude_path.match(scope["path"])):
+            await self.app(scope, receive, send)
+            return
+        if "gzip" not in Headers(scope=scope).get("Accept-Encoding", ""):
+            await self.app(scope, receive, send)
+            return
+        responder = SelectiveGZipResponder(self.app, self.minimum_size, compresslevel=self.compresslevel)
+        await responder(scope, receive, send)
@@ -0,0 +1,144 @@
+"""
+Sinabro 사진 렌디션 파이프라인
+업로드된 사진의 크기/형식별 렌디션을 요청 경로 밖의 프로세스 풀에서 생성하고 메타데이터 기록
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Set
+from uuid import UUID
+import asyncio
+import logging
+import multiprocessing
+import os
+
+from config import settings
+from database import SessionLocal, AsyncSessionLocal
+from imaging import render_renditions
+from services import PhotoService, AsyncPhotoService
+
+logger = logging.getLogger(__name__)
+
+# 렌디션을 생성하는 원본 형식 (PDF 등은 원본만 제공)
+RENDITION_SOURCE_TYPES = {"jpg", "png", "gif", "webp"}
+
+
+def select_rendition(photo_file: Dict[str, Any], width: Optional[int], accept_webp: bool) -> Optional[Dict[str, Any]]:
+    """
+    요청 크기에 맞는 가장 작은 렌디션 선택
+    
+    Args:
+        photo_file: PhotoService.get_photo_file 결과 데이터
+        width: 요청 가로 크기 (없으면 원본)
+        accept_webp: 클라이언트의 WebP 지원 여부
+    
+    Returns:
+        선택된 렌디션 (요청 크기 이상인 렌디션이 없으면 None → 원본 제공)
+    """
+    if not width:
+        return None
+    
+    formats = ("webp", "jpeg") if accept_webp else ("jpeg",)
+    candidates = [rendition for rendition in photo_file["renditions"] if rendition["format"] in formats]
+    suitable = [rendition for rendition in candidates if rendition["width"] >= width]
+    if not suitable:
+        return None
+    
+    # 같은 크기면 더 작은 파일 (보통 WebP)
+    return min(suitable, key=lambda rendition: (rendition["width"], rendition["file_size"]))
+
+
+class RenditionPool:
+    """
+    렌디션 생성 프로세스 풀
+    Pillow 변환은 CPU 작업이므로 이벤트 루프/스레드풀 대신 별도 프로세스에서 실행
+    """
+    
+    def __init__(self):
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._tasks: Set[asyncio.Task] = set()
+    
+    @property
+    def is_running(self) -> bool:
+        return self._executor is not None
+    
+    def start(self) -> None:
+        """프로세스 풀 시작"""
+        if self._executor is None and settings.RENDITION_ENABLED:
+            # 워커는 imaging 모듈만 임포트하도록 spawn 사용 (DB 연결/스레드 상태를 물려받지 않음)
+            self._executor = ProcessPoolExecutor(
+                max_workers=settings.RENDITION_WORKERS,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+            logger.info(f"Rendition pool started with {settings.RENDITION_WORKERS} workers")
+    
+    async def stop(self) -> None:
+        """진행 중인 작업 취소 및 프로세스 풀 종료"""
+        for task in list(self._tasks):
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+    
+    def schedule(self, photo_id: UUID, relative_path: str, file_type: str) -> bool:
+        """
+        렌디션 생성 예약 (요청은 완료를 기다리지 않음)
+        
+        Args:
+            photo_id: 사진 ID
+            relative_path: UPLOAD_DIR 기준 원본 경로
+            file_type: 원본 형식 (uploads.detect_file_type 결과)
+        
+        Returns:
+            예약 여부
+        """
+        if self._executor is None or file_type not in RENDITION_SOURCE_TYPES:
+            return False
+        task = asyncio.create_task(self._generate(photo_id, relative_path))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return True
+    
+    async def _generate(self, photo_id: UUID, relative_path: str) -> None:
+        # 원본 blob 옆에 "<sha256>_<width>.<ext>"로 저장하여 같은 내용의 사진끼리 렌디션 공유
+        relative_dir = os.path.dirname(relative_path)
+        try:
+            renditions = await asyncio.get_running_loop().run_in_executor(
+                self._executor,
+                render_renditions,
+                os.path.join(settings.UPLOAD_DIR, relative_path),
+                os.path.join(settings.UPLOAD_DIR, relative_dir),
+                os.path.splitext(os.path.basename(relative_path))[0],
+                settings.RENDITION_WIDTHS,
+                settings.RENDITION_FORMATS,
+                settings.RENDITION_QUALITY
+            )
+            for rendition in renditions:
+                rendition["file_url"] = os.path.join(relative_dir, rendition.pop("file_name"))
+            
+            result = await self._record(photo_id, renditions)
+            if not result.get("success", True):
+                logger.error(f"Failed to record renditions for photo {photo_id}: {result.get('message')}")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Rendition generation failed for photo {photo_id}: {e}")
+    
+    async def _record(self, photo_id: UUID, renditions: List[Dict[str, Any]]) -> Dict[str, Any]:
+        if settings.DB_ASYNC_MODE:
+            async with AsyncSessionLocal() as db:
+                return await AsyncPhotoService(db).record_renditions(photo_id, renditions)
+        
+        def _record_with_session() -> Dict[str, Any]:
+            db = SessionLocal()
+            try:
+                return PhotoService(db).record_renditions(photo_id, renditions)
+            finally:
+                db.close()
+        
+        return await asyncio.to_thread(_record_with_session)
+
+
+# 전역 렌디션 풀
+rendition_pool = RenditionPool()
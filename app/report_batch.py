@@ -0,0 +1,253 @@
+"""
+Sinabro AI 리포트 야간 일괄 생성
+매일 정해진 시각에 활성 채널 전체의 전날 리포트를 미리 생성 (기록은 페이지 단위 일괄 조회, 생성은 동시성 제한)
+
+수동 실행 (누락된 날짜 다시 생성):
+    python report_batch.py --date 2024-01-31 [--force]
+"""
+
+from datetime import date, datetime, time as dt_time, timedelta
+from typing import Any, Dict, List, Optional
+from zoneinfo import ZoneInfo
+import argparse
+import asyncio
+import logging
+import math
+import time
+
+from config import settings
+from llm import ReportGenerationError, ReportGenerator, create_report_generator
+from report_worker import SOURCE_KEYS, call_report_service, retry_delay
+
+logger = logging.getLogger(__name__)
+
+
+def latency_percentiles(latencies: List[int]) -> Dict[str, Optional[int]]:
+    """
+    리포트 생성 시간 백분위수 (nearest-rank)
+    
+    Args:
+        latencies: 리포트별 생성 시간 (밀리초)
+    
+    Returns:
+        p50/p90/p99/max (생성한 리포트가 없으면 None)
+    """
+    if not latencies:
+        return {"p50": None, "p90": None, "p99": None, "max": None}
+    ordered = sorted(latencies)
+    
+    def _rank(percentile: int) -> int:
+        return ordered[max(math.ceil(percentile / 100 * len(ordered)), 1) - 1]
+    
+    return {"p50": _rank(50), "p90": _rank(90), "p99": _rank(99), "max": ordered[-1]}
+
+
+def _batch_time() -> dt_time:
+    hour, minute = settings.REPORT_BATCH_TIME.split(":")
+    return dt_time(int(hour), int(minute))
+
+
+def last_scheduled_at(now: datetime) -> datetime:
+    """now 이전의 가장 최근 실행 예정 시각"""
+    scheduled = datetime.combine(now.date(), _batch_time(), tzinfo=now.tzinfo)
+    return scheduled if scheduled <= now else scheduled - timedelta(days=1)
+
+
+class NightlyReportBatch:
+    """
+    야간 리포트 일괄 생성
+    가족들이 각자의 시간대에 앱을 열 때 생성 요청이 한꺼번에 몰리지 않도록 하루치 리포트를 미리 생성
+    """
+    
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+        self.running_date: Optional[date] = None
+        self.last_run: Optional[Dict[str, Any]] = None
+    
+    async def run(self, report_date: date, force: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        리포트 날짜의 일괄 생성 실행
+        
+        이미 완료했거나 다른 인스턴스가 실행 중인 날짜는 실행하지 않습니다.
+        리포트가 있는 채널은 건너뛰므로 다시 실행하면 실패한 채널만 생성합니다.
+        
+        Args:
+            report_date: 리포트 날짜
+            force: 완료된 날짜도 다시 실행
+        
+        Returns:
+            실행 결과 요약 (실행하지 않았으면 None)
+        """
+        claim = await call_report_service("start_batch_run", report_date, settings.REPORT_BATCH_STALE_SECONDS, force)
+        if not claim.get("success", True):
+            logger.error(f"Failed to start report batch for {report_date}: {claim.get('message')}")
+            return None
+        if not claim["data"]["claimed"]:
+            logger.info(f"Report batch for {report_date} already finished or running elsewhere, skipping")
+            return None
+        
+        self.running_date = report_date
+        generator = create_report_generator()
+        summary: Dict[str, Any] = {"report_date": report_date.isoformat(), "channels": 0, "generated": 0, "skipped": 0, "failed": 0}
+        latencies: List[int] = []
+        start = time.perf_counter()
+        try:
+            await self._generate_all(report_date, generator, summary, latencies)
+        except BaseException as e:
+            summary.update(wall_time_ms=int((time.perf_counter() - start) * 1000), latency_ms=latency_percentiles(latencies))
+            # 취소된 경우에도 기록해 두면 다음 실행(재시작 후 따라잡기)이 바로 다시 선점
+            await self._finish(report_date, "failed", summary, str(e) or type(e).__name__)
+            raise
+        finally:
+            self.running_date = None
+            await generator.close()
+        
+        summary.update(wall_time_ms=int((time.perf_counter() - start) * 1000), latency_ms=latency_percentiles(latencies))
+        await self._finish(report_date, "succeeded", summary)
+        latency = summary["latency_ms"]
+        logger.info(
+            f"Report batch for {report_date}: {summary['channels']} channels, {summary['generated']} generated, "
+            f"{summary['skipped']} skipped, {summary['failed']} failed in {summary['wall_time_ms'] / 1000:.1f}s "
+            f"(p50={latency['p50']}ms p90={latency['p90']}ms p99={latency['p99']}ms max={latency['max']}ms)"
+        )
+        return summary
+    
+    async def _generate_all(
+        self,
+        report_date: date,
+        generator: ReportGenerator,
+        summary: Dict[str, Any],
+        latencies: List[int]
+    ) -> None:
+        semaphore = asyncio.Semaphore(settings.REPORT_BATCH_CONCURRENCY)
+        # 현재 페이지를 생성하는 동안 다음 페이지 기록을 미리 조회
+        next_page = asyncio.create_task(self._fetch_page(report_date, None))
+        try:
+            while next_page is not None:
+                page = await next_page
+                next_page = None
+                if page["next_after"] is not None:
+                    next_page = asyncio.create_task(self._fetch_page(report_date, page["next_after"]))
+                
+                targets = [sources for sources in page["sources"] if any(sources[key] for key in SOURCE_KEYS)]
+                summary["channels"] += len(page["sources"])
+                summary["skipped"] += len(page["sources"]) - len(targets)
+                
+                results = await asyncio.gather(*(self._generate(generator, semaphore, sources) for sources in targets))
+                reports = [report for report in results if report is not None]
+                summary["failed"] += len(targets) - len(reports)
+                
+                saved = await call_report_service("save_batch_reports", reports, generator.model)
+                if not saved.get("success", True):
+                    raise RuntimeError(f"리포트 저장에 실패했습니다: {saved.get('message')}")
+                summary["generated"] += saved["data"]["saved"]
+                summary["skipped"] += saved["data"]["duplicates"]
+                latencies.extend(report["generation_time_ms"] for report in reports)
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+    
+    async def _fetch_page(self, report_date: date, after_id) -> Dict[str, Any]:
+        result = await call_report_service("get_batch_page", report_date, after_id, settings.REPORT_BATCH_PAGE_SIZE)
+        if not result.get("success", True):
+            raise RuntimeError(f"채널 기록 조회에 실패했습니다: {result.get('message')}")
+        return result["data"]
+    
+    async def _generate(
+        self,
+        generator: ReportGenerator,
+        semaphore: asyncio.Semaphore,
+        sources: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """채널 하나의 리포트 생성 (재시도 대기 중에는 동시성 자리를 비워 둠)"""
+        for attempt in range(1, settings.REPORT_JOB_MAX_ATTEMPTS + 1):
+            retryable = True
+            async with semaphore:
+                start = time.perf_counter()
+                try:
+                    content = await asyncio.wait_for(generator.generate(sources), settings.REPORT_LLM_TIMEOUT_SECONDS)
+                    return {
+                        "sources": sources,
+                        "content": content,
+                        "generation_time_ms": int((time.perf_counter() - start) * 1000)
+                    }
+                except asyncio.TimeoutError:
+                    error = f"리포트 생성이 {settings.REPORT_LLM_TIMEOUT_SECONDS:g}초 안에 끝나지 않았습니다."
+                except ReportGenerationError as e:
+                    error, retryable = str(e), e.retryable
+                except Exception as e:
+                    error = f"리포트 생성 중 오류가 발생했습니다: {e}"
+            
+            if not retryable or attempt == settings.REPORT_JOB_MAX_ATTEMPTS:
+                break
+            await asyncio.sleep(retry_delay(attempt))
+        
+        logger.warning(f"Batch report for channel {sources['channel_id']} failed after {attempt} attempts: {error}")
+        return None
+    
+    async def _finish(self, report_date: date, status: str, summary: Dict[str, Any], error: Optional[str] = None) -> None:
+        result = await call_report_service("finish_batch_run", report_date, status, summary, error)
+        if not result.get("success", True):
+            # 기록하지 못한 실행은 제한 시간이 지나면 다음 스케줄이 다시 선점
+            logger.error(f"Failed to record report batch for {report_date}: {result.get('message')}")
+            return
+        self.last_run = result["data"]
+    
+    async def _schedule_loop(self) -> None:
+        zone = ZoneInfo(settings.REPORT_BATCH_TIMEZONE)
+        while True:
+            # 시작 직후에는 가장 최근 실행 예정분을 따라잡음 (이미 완료했으면 선점하지 않고 넘어감)
+            scheduled = last_scheduled_at(datetime.now(zone))
+            try:
+                await self.run(scheduled.date() - timedelta(days=1))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Report batch failed: {e}")
+            next_run = scheduled + timedelta(days=1)
+            await asyncio.sleep(max((next_run - datetime.now(zone)).total_seconds(), 1))
+    
+    def start(self) -> None:
+        """매일 실행 스케줄 시작"""
+        if self._task is None and settings.REPORT_BATCH_ENABLED:
+            self._task = asyncio.create_task(self._schedule_loop())
+    
+    async def stop(self) -> None:
+        """스케줄 종료 (실행 중인 배치는 실패로 기록되고 재시작 후 다시 실행)"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """일괄 생성 상태 통계"""
+        return {
+            "enabled": settings.REPORT_BATCH_ENABLED,
+            "schedule": f"{settings.REPORT_BATCH_TIME} {settings.REPORT_BATCH_TIMEZONE}",
+            "running_date": self.running_date.isoformat() if self.running_date else None,
+            "last_run": self.last_run
+        }
+
+
+# 전역 야간 리포트 일괄 생성기
+nightly_report_batch = NightlyReportBatch()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="AI 리포트 일괄 생성")
+    parser.add_argument("--date", type=date.fromisoformat, help="리포트 날짜 (기본값: 설정 시간대 기준 어제)")
+    parser.add_argument("--force", action="store_true", help="이미 완료된 날짜도 다시 실행 (리포트가 없는 채널만 생성)")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO)
+    report_date = args.date or datetime.now(ZoneInfo(settings.REPORT_BATCH_TIMEZONE)).date() - timedelta(days=1)
+    summary = asyncio.run(nightly_report_batch.run(report_date, force=args.force))
+    if summary is None:
+        print(f"{report_date}: 이미 완료했거나 다른 곳에서 실행 중입니다 (--force로 다시 실행)")
+
+
+if __name__ == "__main__":
+    main()
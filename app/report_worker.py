@@ -0,0 +1,235 @@
+"""
+Sinabro AI 리포트 생성 워커
+요청 경로 밖에서 작업 큐의 리포트 생성 작업을 정해진 동시성으로 실행 (재시도/백오프, 중단 작업 복구)
+"""
+
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+import asyncio
+import logging
+import random
+import time
+
+from config import settings
+from database import SessionLocal, AsyncSessionLocal
+from jobs import JobQueue, create_job_queue
+from llm import ReportGenerationError, ReportGenerator, create_report_generator
+from services import ReportService, AsyncReportService
+
+logger = logging.getLogger(__name__)
+
+# 작업 큐 대기 시간 (종료 시 워커가 오래 붙잡혀 있지 않도록 짧게)
+POP_TIMEOUT_SECONDS = 5.0
+
+SOURCE_KEYS = ("checklists", "care_notes", "photos", "question_responses")
+
+
+def retry_delay(attempts: int) -> float:
+    """
+    재시도 대기 시간 (지수 백오프 + 지터)
+    
+    Args:
+        attempts: 지금까지 실행한 횟수
+    
+    Returns:
+        대기 시간 (초)
+    """
+    delay = min(settings.REPORT_RETRY_BASE_SECONDS * 2 ** (attempts - 1), settings.REPORT_RETRY_MAX_SECONDS)
+    # 같은 장애로 동시에 실패한 작업들이 한꺼번에 다시 몰리지 않도록 절반 범위에서 분산
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+async def call_report_service(method: str, *args) -> Dict[str, Any]:
+    """호출마다 세션을 열어 리포트 서비스 메서드 실행 (요청 경로 밖의 워커/배치용)"""
+    if settings.DB_ASYNC_MODE:
+        async with AsyncSessionLocal() as db:
+            return await getattr(AsyncReportService(db), method)(*args)
+    
+    def _call_with_session() -> Dict[str, Any]:
+        db = SessionLocal()
+        try:
+            return getattr(ReportService(db), method)(*args)
+        finally:
+            db.close()
+    
+    return await asyncio.to_thread(_call_with_session)
+
+
+class ReportWorkerPool:
+    """
+    리포트 생성 워커 풀
+    LLM 호출은 대기 시간이 대부분이므로 프로세스/스레드 대신 이벤트 루프의 작업 N개로 동시성을 제한
+    """
+    
+    def __init__(self):
+        self.queue: Optional[JobQueue] = None
+        self.generator: Optional[ReportGenerator] = None
+        self._workers: List[asyncio.Task] = []
+        self._recovery_task: Optional[asyncio.Task] = None
+        self._active = 0
+        self.stats = {"succeeded": 0, "retried": 0, "failed": 0}
+    
+    @property
+    def is_running(self) -> bool:
+        return self.queue is not None
+    
+    async def start(self) -> None:
+        """작업 큐 연결 후 워커와 복구 작업 시작"""
+        if self.queue is not None:
+            return
+        self.queue = await create_job_queue(settings.REPORT_QUEUE_KEY)
+        if settings.REPORT_WORKER_CONCURRENCY > 0:
+            self.generator = create_report_generator()
+            self._workers = [
+                asyncio.create_task(self._worker_loop(index))
+                for index in range(settings.REPORT_WORKER_CONCURRENCY)
+            ]
+            self._recovery_task = asyncio.create_task(self._recovery_loop())
+        logger.info(
+            f"Report workers started: queue={self.queue.backend}, concurrency={settings.REPORT_WORKER_CONCURRENCY}, "
+            f"model={self.generator.model if self.generator else None}"
+        )
+    
+    async def stop(self) -> None:
+        """워커 종료 (실행 중이던 작업은 복구 작업이 다시 큐에 넣음)"""
+        tasks = self._workers + ([self._recovery_task] if self._recovery_task else [])
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._workers = []
+        self._recovery_task = None
+        if self.generator is not None:
+            await self.generator.close()
+            self.generator = None
+        self.queue = None
+    
+    async def enqueue(self, job_id: str, delay: float = 0) -> bool:
+        """
+        등록된 작업을 큐에 추가
+        
+        Args:
+            job_id: ReportService.enqueue_report로 등록한 작업 ID
+            delay: 실행 대기 시간 (초)
+        
+        Returns:
+            추가 여부 (실패해도 작업은 DB에 남아 있으므로 복구 작업이 다시 넣음)
+        """
+        if self.queue is None:
+            return False
+        return await self.queue.push(job_id, delay)
+    
+    async def get_stats(self) -> Dict[str, Any]:
+        """워커 상태 통계"""
+        return {
+            "queue": self.queue.backend if self.queue else None,
+            "queued": await self.queue.size() if self.queue else None,
+            "concurrency": len(self._workers),
+            "active": self._active,
+            "model": self.generator.model if self.generator else None,
+            **self.stats
+        }
+    
+    async def _worker_loop(self, index: int) -> None:
+        while True:
+            try:
+                job_id = await self.queue.pop(POP_TIMEOUT_SECONDS)
+                if job_id is None:
+                    continue
+                self._active += 1
+                try:
+                    await self._process(job_id)
+                finally:
+                    self._active -= 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Report worker {index} error: {e}")
+                await asyncio.sleep(1)
+    
+    async def _process(self, job_id: str) -> None:
+        claim = await call_report_service("claim_job", UUID(job_id))
+        if not claim.get("success", True):
+            # 재시도 대기 시간 전에 꺼낸 작업은 실행 시각에 맞춰 다시 넣음
+            if claim.get("error_code") == "JOB_NOT_DUE":
+                await self.queue.push(job_id, claim["details"]["delay"], replace=False)
+                return
+            # 이미 다른 워커가 실행 중이거나 완료된 작업 (중복 큐 메시지)
+            if claim.get("error_code") != "JOB_NOT_QUEUED":
+                logger.error(f"Failed to claim report job {job_id}: {claim.get('message')}")
+            return
+        
+        job, sources = claim["data"]["job"], claim["data"]["sources"]
+        if not any(sources[key] for key in SOURCE_KEYS):
+            await self._fail(job, "리포트를 만들 돌봄 기록이 없습니다.", retryable=False)
+            return
+        
+        start = time.perf_counter()
+        try:
+            content = await asyncio.wait_for(self.generator.generate(sources), settings.REPORT_LLM_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            await self._fail(job, f"리포트 생성이 {settings.REPORT_LLM_TIMEOUT_SECONDS:g}초 안에 끝나지 않았습니다.")
+            return
+        except ReportGenerationError as e:
+            await self._fail(job, str(e), retryable=e.retryable)
+            return
+        except Exception as e:
+            logger.error(f"Report generation failed for job {job_id}: {e}")
+            await self._fail(job, f"리포트 생성 중 오류가 발생했습니다: {e}")
+            return
+        generation_time_ms = int((time.perf_counter() - start) * 1000)
+        
+        result = await call_report_service("complete_job", job, sources, content, self.generator.model, generation_time_ms)
+        if result.get("success", True):
+            self.stats["succeeded"] += 1
+        elif result.get("error_code") == "JOB_NOT_RUNNING":
+            logger.warning(f"Report job {job_id} was reclaimed before completion, discarding result")
+        else:
+            await self._fail(job, result.get("message", "리포트 저장에 실패했습니다."))
+    
+    async def _fail(self, job: Dict[str, Any], error: str, retryable: bool = True) -> None:
+        """실패 기록 후 남은 횟수가 있으면 백오프 뒤 다시 큐에 넣음"""
+        delay = retry_delay(job["attempts"]) if retryable and job["attempts"] < job["max_attempts"] else None
+        result = await call_report_service("fail_job", job, error, delay)
+        if not result.get("success", True):
+            # 기록하지 못한 실행은 실행 제한 시간이 지나면 복구 작업이 다시 큐에 넣음
+            logger.error(f"Failed to record failure of report job {job['id']}: {result.get('message')}")
+            return
+        
+        if delay is None:
+            self.stats["failed"] += 1
+            logger.warning(f"Report job {job['id']} failed after {job['attempts']} attempts: {error}")
+        else:
+            self.stats["retried"] += 1
+            logger.info(f"Report job {job['id']} attempt {job['attempts']} failed, retrying in {delay:.1f}s: {error}")
+            await self.queue.push(job["id"], delay)
+    
+    async def recover(self) -> int:
+        """
+        중단된 실행 복구 및 큐에서 유실된 대기 작업 다시 추가
+        
+        Returns:
+            큐에 다시 넣은 작업 수 (이미 큐에 있는 작업은 실행 시각을 유지)
+        """
+        result = await call_report_service("recover_jobs", settings.REPORT_JOB_STALE_SECONDS, settings.REPORT_RECOVERY_BATCH_SIZE)
+        if not result.get("success", True):
+            logger.error(f"Report job recovery failed: {result.get('message')}")
+            return 0
+        
+        if result["data"]["reset"]:
+            logger.warning(f"Reset {result['data']['reset']} stalled report jobs")
+        for job in result["data"]["jobs"]:
+            await self.queue.push(job["id"], job["delay"], replace=False)
+        return len(result["data"]["jobs"])
+    
+    async def _recovery_loop(self) -> None:
+        while True:
+            try:
+                await self.recover()
+            except Exception as e:
+                logger.error(f"Report job recovery failed: {e}")
+            await asyncio.sleep(settings.REPORT_RECOVERY_INTERVAL_SECONDS)
+
+
+# 전역 리포트 워커 풀
+report_workers = ReportWorkerPool()
@@ -0,0 +1,123 @@
+"""
+Sinabro 응답 직렬화
+서비스 결과를 response_model 재검증 없이 orjson으로 바로 직렬화하는 빠른 응답 경로와
+ETag 기반 조건부 GET 헬퍼
+"""
+
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, ValidationError
+from decimal import Decimal
+from typing import Any, Dict, Mapping, Optional, Type
+import hashlib
+import logging
+import orjson
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _default(value: Any) -> Any:
+    """orjson이 기본 지원하지 않는 타입 변환 (UUID, datetime, date는 기본 지원)"""
+    if isinstance(value, Decimal):
+        # pydantic JSON 직렬화와 동일하게 문자열로 표현
+        return str(value)
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+class FastJSONResponse(JSONResponse):
+    """orjson 기반 JSON 응답"""
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def fast_response(
+    result: Any,
+    response_model: Optional[Type[BaseModel]] = None,
+    status_code: int = 200,
+    headers: Optional[Mapping[str, str]] = None
+) -> Any:
+    """
+    서비스 결과 반환
+    
+    FAST_JSON_RESPONSES가 꺼져 있으면 결과를 그대로 반환하여 FastAPI가 response_model로
+    검증/직렬화하고, 켜져 있으면 Response 객체를 반환하여 재검증을 건너뜀.
+    라우터의 response_model 선언은 그대로 두므로 OpenAPI 스키마는 유지됨.
+    
+    Args:
+        result: 서비스 응답 딕셔너리
+        response_model: 라우터에 선언된 응답 스키마 (FAST_JSON_VALIDATE 시 적합성 확인)
+        status_code: HTTP 상태 코드
+        headers: FastJSONResponse에 설정할 헤더 (딕셔너리 반환 시에는 cache_headers가 하위 응답에 설정)
+    
+    Returns:
+        결과 딕셔너리 또는 FastJSONResponse
+    """
+    if not settings.FAST_JSON_RESPONSES:
+        return result
+    
+    if settings.FAST_JSON_VALIDATE and response_model is not None:
+        try:
+            response_model.model_validate(result)
+        except ValidationError as e:
+            # 빠른 경로가 스키마와 어긋나면 운영 전에 드러나도록 기록
+            logger.error(f"Fast response does not match {response_model.__name__}: {e}")
+    
+    return FastJSONResponse(content=result, status_code=status_code, headers=headers)
+
+
+def partial_response(
+    result: Any,
+    status_code: int = 200,
+    headers: Optional[Mapping[str, str]] = None
+) -> FastJSONResponse:
+    """
+    fields/include로 일부 필드만 선택한 응답 반환
+    response_model의 필수 필드를 만족하지 않으므로 검증 없이 바로 직렬화
+    """
+    return FastJSONResponse(content=result, status_code=status_code, headers=headers)
+
+
+def make_etag(version: str, *variant: Any) -> str:
+    """
+    강한 ETag 생성
+    
+    Args:
+        version: 서비스가 조회한 행 버전 문자열
+        variant: 응답 본문을 바꾸는 요청 파라미터 (필드 선택, 커서 등)
+    
+    Returns:
+        따옴표로 감싼 ETag 값
+    """
+    raw = "|".join([settings.APP_VERSION, version, *("" if value is None else str(value) for value in variant)])
+    return '"' + hashlib.sha256(raw.encode()).hexdigest()[:32] + '"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """If-None-Match 헤더가 ETag와 일치하는지 확인 (약한 비교, * 포함)"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = [candidate.strip() for candidate in header.split(",")]
+    return "*" in candidates or any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+
+def cache_headers(response: Response, etag: str, cache_control: str) -> Dict[str, str]:
+    """
+    ETag/Cache-Control 헤더 설정
+    딕셔너리 반환 경로를 위해 하위 응답에 설정하고, Response 반환 경로를 위해 헤더를 반환
+    """
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    response.headers.update(headers)
+    return headers
+
+
+def not_modified_response(headers: Mapping[str, str]) -> Response:
+    """304 Not Modified 응답 (본문 없음)"""
+    return Response(status_code=304, headers=dict(headers))
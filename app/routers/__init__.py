@@ -6,9 +6,15 @@ FastAPI 라우터들
 from access_code import router as access_code_router
 from channel import router as channel_router
 from checklist import router as checklist_router
+from photo import router as photo_router
+from signed_media import router as media_router
+from report import router as report_router
 
 __all__ = [
     "access_code_router",
     "channel_router", 
-    "checklist_router"
+    "checklist_router",
+    "photo_router",
+    "media_router",
+    "report_router"
 ]
@@ -3,15 +3,21 @@ Access Code API Router for Sinabro
 접속 코드 관련 API 엔드포인트
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Response
+from datetime import datetime, timezone
 
-from database import get_db
+from cache import access_code_cache, access_code_verifier
+from dependencies import get_access_code_service, run_service
+from responses import fast_response, make_etag, etag_matches, cache_headers, not_modified_response
+from security import create_access_token
 from services import AccessCodeService
-from schemas import AccessCodeResponse, ErrorResponse
+from schemas import AccessCodeResponse, AccessTokenResponse, ErrorResponse
 
 router = APIRouter(prefix="/api/v1/access", tags=["접속 코드"])
 
+# 접속 코드 정보는 사용자별 정보이므로 공유 캐시 금지, 매 요청 ETag로 재검증
+ACCESS_CODE_CACHE_CONTROL = "private, no-cache"
+
 
 @router.get("/{code}", 
     response_model=AccessCodeResponse,
@@ -19,7 +25,9 @@ router = APIRouter(prefix="/api/v1/access", tags=["접속 코드"])
     description="접속 코드를 사용하여 해당 사용자의 정보와 연결된 채널 정보를 조회합니다.")
 async def get_access_code_info(
     code: str,
-    db: Session = Depends(get_db)
+    request: Request,
+    response: Response,
+    access_code_service: AccessCodeService = Depends(get_access_code_service)
 ):
     """
     접속 코드로 사용자 정보 조회
@@ -32,13 +40,24 @@ async def get_access_code_info(
     - 접속 코드 정보 (만료시간, 사용여부 등)
     - 사용자 정보 (가디언 또는 케어기버)
     - 연결된 채널 정보 (있는 경우)
+    
+    **조건부 요청:**
+    - 응답의 `ETag`를 `If-None-Match`로 보내면 변경이 없을 때 본문 없이 304를 반환합니다.
     """
     try:
-        # 접속 코드 서비스 인스턴스 생성
-        access_code_service = AccessCodeService(db)
+        # 접속 코드 정보 조회 (Redis read-through 캐시, 본문과 함께 저장된 버전 포함)
+        result, version = await access_code_cache.get_or_load(
+            code,
+            lambda: run_service(access_code_service.get_access_code_info, code)
+        )
         
-        # 접속 코드 정보 조회
-        result = access_code_service.get_access_code_info(code)
+        # 캐시된 본문의 버전으로 ETag 확인 (변경이 없으면 본문 없이 304)
+        headers = None
+        if version:
+            etag = make_etag(version)
+            headers = cache_headers(response, etag, ACCESS_CODE_CACHE_CONTROL)
+            if etag_matches(request, etag):
+                return not_modified_response(headers)
         
         # 에러 응답 처리
         if not result.get("success", True):
@@ -66,7 +85,7 @@ async def get_access_code_info(
                     detail=message
                 )
         
-        return result
+        return fast_response(result, AccessCodeResponse, headers=headers)
         
     except HTTPException:
         raise
@@ -78,11 +97,12 @@ async def get_access_code_info(
 
 
 @router.post("/{code}/mark-used",
+    response_model=AccessTokenResponse,
     summary="접속 코드를 사용됨으로 표시",
-    description="접속 코드를 사용됨으로 표시하여 중복 사용을 방지합니다.")
+    description="접속 코드를 사용됨으로 표시하고, 이후 요청에 사용할 세션 토큰을 발급합니다.")
 async def mark_access_code_as_used(
     code: str,
-    db: Session = Depends(get_db)
+    access_code_service: AccessCodeService = Depends(get_access_code_service)
 ):
     """
     접속 코드를 사용됨으로 표시
@@ -90,13 +110,19 @@ async def mark_access_code_as_used(
     **사용 시나리오:**
     - 사용자가 성공적으로 로그인한 후 호출
     - 접속 코드의 중복 사용 방지
+    
+    **응답 정보:**
+    - `access_token`: 이후 요청의 `Authorization: Bearer <token>` 헤더에 사용하는 JWT
+    - 토큰에는 사용자 유형, 사용자 ID, 채널 범위가 담겨 있어 DB 조회 없이 검증됩니다
     """
     try:
-        # 접속 코드 서비스 인스턴스 생성
-        access_code_service = AccessCodeService(db)
-        
         # 접속 코드를 사용됨으로 표시
-        result = access_code_service.mark_as_used(code)
+        result = await run_service(access_code_service.mark_as_used, code)
+        
+        # 사용 여부가 바뀌었으므로 캐시 무효화
+        if result.get("success", True):
+            await access_code_cache.invalidate_code(code)
+            await access_code_verifier.invalidate(code)
         
         # 에러 응답 처리
         if not result.get("success", True):
@@ -108,13 +134,31 @@ async def mark_access_code_as_used(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail=message
                 )
+            elif error_code == "EXPIRED_ACCESS_CODE":
+                raise HTTPException(
+                    status_code=status.HTTP_410_GONE,
+                    detail=message
+                )
             else:
                 raise HTTPException(
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                     detail=message
                 )
         
-        return result
+        # 세션 토큰 발급 (접속 코드 만료 시각을 상한으로 사용)
+        principal = result["data"]
+        expires_at = None
+        if principal.get("expires_ts"):
+            expires_at = datetime.fromtimestamp(principal["expires_ts"], tz=timezone.utc)
+        token = create_access_token(principal, expires_at=expires_at)
+        
+        result["data"] = {
+            **token,
+            "user_type": principal["user_type"],
+            "user_id": principal["user_id"],
+            "channel_id": principal["channel_id"]
+        }
+        return fast_response(result, AccessTokenResponse)
         
     except HTTPException:
         raise
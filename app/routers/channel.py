@@ -3,17 +3,35 @@ Channel API Router for Sinabro
 채널 관련 API 엔드포인트
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from datetime import date
 from typing import Optional
 from uuid import UUID
 
-from database import get_db
-from services import ChannelService
-from schemas import MyChannelsResponse, ChannelResponse
+from dependencies import (
+    get_channel_service,
+    get_dashboard_service,
+    get_sync_service,
+    get_cursor_params,
+    get_sync_params,
+    run_service
+)
+from responses import fast_response, partial_response, make_etag, etag_matches, cache_headers, not_modified_response
+from services import ChannelService, DashboardService, SyncService
+from schemas import (
+    MyChannelsResponse,
+    ChannelResponse,
+    ChannelBatchRequest,
+    ChannelBatchResponse,
+    ChannelDashboardResponse,
+    ChannelSyncResponse
+)
 
 router = APIRouter(prefix="/api/v1/channels", tags=["채널"])
 
+# 채널 상세는 사용자별 정보이므로 공유 캐시 금지, 매 요청 ETag로 재검증
+CHANNEL_CACHE_CONTROL = "private, no-cache"
+
 
 @router.get("/my",
     response_model=MyChannelsResponse,
@@ -22,7 +40,10 @@ router = APIRouter(prefix="/api/v1/channels", tags=["채널"])
 async def get_my_channels(
     user_id: UUID = Query(..., description="사용자 ID"),
     user_type: str = Query(..., description="사용자 유형 (guardian 또는 caregiver)"),
-    db: Session = Depends(get_db)
+    page: dict = Depends(get_cursor_params),
+    fields: Optional[str] = Query(None, description="응답 필드 선택 (예: channel_name,status,senior.full_name)"),
+    include: Optional[str] = Query(None, description="포함할 관계 (guardian, caregiver, senior)"),
+    channel_service: ChannelService = Depends(get_channel_service)
 ):
     """
     내 채널 목록 조회
@@ -30,10 +51,17 @@ async def get_my_channels(
     **쿼리 파라미터:**
     - `user_id`: 사용자의 UUID
     - `user_type`: 'guardian' 또는 'caregiver'
+    - `cursor`: 이전 응답의 `pagination.next_cursor` (첫 페이지는 생략)
+    - `size`: 페이지 크기 (기본값: 20, 최대 100)
+    - `include_total`: 전체 개수 포함 여부
+    - `fields`: 응답에 포함할 필드 (쉼표 구분, `관계.필드` 형식 지원)
+    - `include`: 응답에 포함할 관계 (쉼표 구분)
+    - `fields`/`include`를 지정하면 요청한 컬럼과 관계만 조회하며, 지정하지 않은 관계는 조인하지 않습니다.
     
     **사용 예시:**
     - 가디언: `/api/v1/channels/my?user_id=550e8400-e29b-41d4-a716-446655440001&user_type=guardian`
     - 케어기버: `/api/v1/channels/my?user_id=550e8400-e29b-41d4-a716-446655440004&user_type=caregiver`
+    - 목록 화면용: `/api/v1/channels/my?user_id=...&user_type=guardian&fields=channel_name,status,senior.full_name`
     
     **응답 정보:**
     - 채널 기본 정보
@@ -48,11 +76,80 @@ async def get_my_channels(
                 detail="user_type은 'guardian' 또는 'caregiver'여야 합니다."
             )
         
-        # 채널 서비스 인스턴스 생성
-        channel_service = ChannelService(db)
-        
         # 내 채널 목록 조회
-        result = channel_service.get_my_channels(user_id, user_type)
+        result = await run_service(
+            channel_service.get_my_channels, user_id, user_type, fields=fields, include=include, **page
+        )
+        
+        # 에러 응답 처리
+        if not result.get("success", True):
+            error_code = result.get("error_code")
+            message = result.get("message", "알 수 없는 오류가 발생했습니다.")
+            
+            if error_code in ("INVALID_USER_TYPE", "INVALID_CURSOR", "INVALID_FIELDS"):
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=message
+                )
+            else:
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail=message
+                )
+        
+        if fields or include:
+            return partial_response(result)
+        return fast_response(result, MyChannelsResponse)
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="서버 내부 오류가 발생했습니다."
+        )
+
+
+@router.get("/dashboard",
+    response_model=ChannelDashboardResponse,
+    summary="채널 대시보드 조회",
+    description="홈 화면에 필요한 채널별 요약(체크리스트 완료율, 최신 리포트, 새 노트/사진, 대기 피드백)을 한 번에 조회합니다.")
+async def get_channel_dashboard(
+    user_id: UUID = Query(..., description="사용자 ID"),
+    user_type: str = Query(..., description="사용자 유형 (guardian 또는 caregiver)"),
+    target_date: Optional[date] = Query(None, alias="date", description="체크리스트 기준 날짜 (기본값: 오늘)"),
+    since: Optional[date] = Query(None, description="새 돌봄노트/사진 집계 시작 날짜 (기본값: 기준 날짜)"),
+    dashboard_service: DashboardService = Depends(get_dashboard_service)
+):
+    """
+    채널 대시보드 조회
+    
+    **쿼리 파라미터:**
+    - `user_id`: 사용자의 UUID
+    - `user_type`: 'guardian' 또는 'caregiver'
+    - `date`: 체크리스트 완료율 기준 날짜 (선택사항)
+    - `since`: 새 돌봄노트/사진 집계 시작 날짜 (선택사항)
+    
+    **사용 예시:**
+    - `/api/v1/channels/dashboard?user_id=550e8400-e29b-41d4-a716-446655440001&user_type=guardian`
+    
+    **응답 정보:**
+    - 채널별 오늘 체크리스트 완료율
+    - 최신 AI 리포트 요약
+    - 새 돌봄노트/사진 수, 처리 대기 피드백 수
+    """
+    try:
+        # 사용자 유형 검증
+        if user_type not in ["guardian", "caregiver"]:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="user_type은 'guardian' 또는 'caregiver'여야 합니다."
+            )
+        
+        # 채널별 요약 조회 (단일 쿼리)
+        result = await run_service(
+            dashboard_service.get_channel_dashboard, user_id, user_type, day=target_date, since=since
+        )
         
         # 에러 응답 처리
         if not result.get("success", True):
@@ -70,8 +167,68 @@ async def get_my_channels(
                     detail=message
                 )
         
-        return result
+        return fast_response(result, ChannelDashboardResponse)
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="서버 내부 오류가 발생했습니다."
+        )
+
+
+@router.post("/batch",
+    response_model=ChannelBatchResponse,
+    summary="채널 일괄 조회",
+    description="여러 채널을 한 번의 요청으로 조회합니다. 없는 채널은 not_found 항목으로 반환됩니다.")
+async def get_channels_batch(
+    request: ChannelBatchRequest,
+    fields: Optional[str] = Query(None, description="응답 필드 선택 (예: channel_name,status,senior.full_name)"),
+    include: Optional[str] = Query(None, description="포함할 관계 (guardian, caregiver, senior)"),
+    channel_service: ChannelService = Depends(get_channel_service)
+):
+    """
+    채널 일괄 조회
+    
+    **요청 본문:**
+    - `channel_ids`: 조회할 채널 UUID 목록 (최대 50개, 중복 제거)
+    
+    **쿼리 파라미터:**
+    - `fields`, `include`: 채널 상세 조회와 동일
+    
+    **사용 예시:**
+    - `POST /api/v1/channels/batch` `{"channel_ids": ["550e8400-e29b-41d4-a716-446655440010", "..."]}`
+    
+    **응답 정보:**
+    - 채널 ID별 `status` (`ok`/`not_found`)와 채널 상세 정보
+    """
+    try:
+        # 채널 일괄 조회
+        result = await run_service(
+            channel_service.get_channels_by_ids, request.channel_ids, fields=fields, include=include
+        )
+        
+        # 에러 응답 처리
+        if not result.get("success", True):
+            error_code = result.get("error_code")
+            message = result.get("message", "알 수 없는 오류가 발생했습니다.")
+            
+            if error_code == "INVALID_FIELDS":
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=message
+                )
+            else:
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail=message
+                )
         
+        if fields or include:
+            return partial_response(result)
+        return fast_response(result, ChannelBatchResponse)
+    
     except HTTPException:
         raise
     except Exception as e:
@@ -87,7 +244,11 @@ async def get_my_channels(
     description="채널 ID로 특정 채널의 상세 정보를 조회합니다.")
 async def get_channel_by_id(
     channel_id: UUID,
-    db: Session = Depends(get_db)
+    request: Request,
+    response: Response,
+    fields: Optional[str] = Query(None, description="응답 필드 선택 (예: channel_name,status,senior.full_name)"),
+    include: Optional[str] = Query(None, description="포함할 관계 (guardian, caregiver, senior)"),
+    channel_service: ChannelService = Depends(get_channel_service)
 ):
     """
     채널 상세 정보 조회
@@ -95,6 +256,14 @@ async def get_channel_by_id(
     **경로 파라미터:**
     - `channel_id`: 조회할 채널의 UUID
     
+    **쿼리 파라미터:**
+    - `fields`: 응답에 포함할 필드 (쉼표 구분, `관계.필드` 형식 지원)
+    - `include`: 응답에 포함할 관계 (쉼표 구분)
+    - `fields`/`include`를 지정하면 요청한 컬럼과 관계만 조회하며, 지정하지 않은 관계는 조인하지 않습니다.
+    
+    **조건부 요청:**
+    - 응답의 `ETag`를 `If-None-Match`로 보내면 변경이 없을 때 본문 없이 304를 반환합니다.
+    
     **사용 예시:**
     - `/api/v1/channels/550e8400-e29b-41d4-a716-446655440010`
     
@@ -104,11 +273,19 @@ async def get_channel_by_id(
     - 채널 상태 및 운영 기간
     """
     try:
-        # 채널 서비스 인스턴스 생성
-        channel_service = ChannelService(db)
+        # 행 버전으로 ETag 확인 (변경이 없으면 본문 조회 없이 304)
+        headers = None
+        version = await run_service(channel_service.get_channel_version, channel_id)
+        if version:
+            etag = make_etag(version, fields, include)
+            headers = cache_headers(response, etag, CHANNEL_CACHE_CONTROL)
+            if etag_matches(request, etag):
+                return not_modified_response(headers)
         
         # 채널 상세 정보 조회
-        result = channel_service.get_channel_by_id(channel_id)
+        result = await run_service(
+            channel_service.get_channel_by_id, channel_id, fields=fields, include=include
+        )
         
         # 에러 응답 처리
         if not result.get("success", True):
@@ -120,13 +297,20 @@ async def get_channel_by_id(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail=message
                 )
+            elif error_code == "INVALID_FIELDS":
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=message
+                )
             else:
                 raise HTTPException(
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                     detail=message
                 )
         
-        return result
+        if fields or include:
+            return partial_response(result, headers=headers)
+        return fast_response(result, ChannelResponse, headers=headers)
         
     except HTTPException:
         raise
@@ -135,3 +319,67 @@ async def get_channel_by_id(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="서버 내부 오류가 발생했습니다."
         )
+
+
+@router.get("/{channel_id}/sync",
+    response_model=ChannelSyncResponse,
+    summary="채널 델타 동기화",
+    description="워터마크 이후 추가/수정/삭제된 체크리스트, 돌봄노트, 사진, 질문 응답, AI 리포트만 조회합니다.")
+async def sync_channel(
+    channel_id: UUID,
+    params: dict = Depends(get_sync_params),
+    sync_service: SyncService = Depends(get_sync_service)
+):
+    """
+    채널 델타 동기화
+    
+    **경로 파라미터:**
+    - `channel_id`: 동기화할 채널의 UUID
+    
+    **쿼리 파라미터:**
+    - `watermark`: 이전 응답의 `watermark` (없으면 전체 동기화)
+    - `size`: 최대 변경 건수
+    
+    **사용 방법:**
+    - 응답의 `watermark`를 저장해 두고 다음 동기화 때 전달합니다.
+    - `has_more`가 true이면 새 워터마크로 즉시 다시 요청합니다.
+    - 삭제 기록은 `SYNC_TOMBSTONE_RETENTION_DAYS` 동안만 보관됩니다. 그보다 오래된 워터마크는
+      410 (`WATERMARK_EXPIRED`)으로 거절되므로, 저장된 채널 데이터를 지우고 워터마크 없이 전체 동기화합니다.
+    
+    **응답 정보:**
+    - 엔티티별 추가/수정된 행 (`upserted`)과 삭제된 행 ID (`deleted`)
+    """
+    try:
+        # 변경 사항 조회
+        result = await run_service(sync_service.get_channel_changes, channel_id, **params)
+        
+        # 에러 응답 처리
+        if not result.get("success", True):
+            error_code = result.get("error_code")
+            message = result.get("message", "알 수 없는 오류가 발생했습니다.")
+            
+            if error_code == "INVALID_WATERMARK":
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=message
+                )
+            elif error_code == "WATERMARK_EXPIRED":
+                raise HTTPException(
+                    status_code=status.HTTP_410_GONE,
+                    detail=message
+                )
+            else:
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail=message
+                )
+        
+        return fast_response(result, ChannelSyncResponse)
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="서버 내부 오류가 발생했습니다."
+        )
@@ -3,26 +3,45 @@ Checklist API Router for Sinabro
 체크리스트 템플릿 관련 API 엔드포인트
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from datetime import date
 from typing import Optional
 from uuid import UUID
 
-from database import get_db
-from services import ChecklistService
-from schemas import ChecklistTemplateListResponse, ChecklistTemplateResponse
+from dependencies import (
+    get_checklist_service,
+    get_checklist_ingest_service,
+    get_trend_service,
+    get_cursor_params,
+    run_service
+)
+from responses import fast_response, make_etag, etag_matches, cache_headers, not_modified_response
+from services import ChecklistService, ChecklistIngestService, ChecklistTrendService
+from schemas import (
+    ChecklistTemplateListResponse,
+    ChecklistTemplateResponse,
+    ChecklistTrendResponse,
+    DailyChecklistBulkRequest,
+    DailyChecklistBulkResponse
+)
 
 router = APIRouter(prefix="/api/v1/checklists", tags=["체크리스트"])
 
+# 템플릿은 사용자와 무관하고 카탈로그 갱신 주기 안에서만 바뀌므로 짧게 공유 캐시 허용
+TEMPLATES_CACHE_CONTROL = "public, max-age=60, must-revalidate"
+
 
 @router.get("/templates",
     response_model=ChecklistTemplateListResponse,
     summary="체크리스트 템플릿 목록 조회",
     description="활성화된 체크리스트 템플릿 목록을 조회합니다. 카테고리별 필터링이 가능합니다.")
 async def get_checklist_templates(
+    request: Request,
+    response: Response,
     category: Optional[str] = Query(None, description="카테고리 필터 (health_management, daily_care 등)"),
     is_active: bool = Query(True, description="활성 상태 필터"),
-    db: Session = Depends(get_db)
+    page: dict = Depends(get_cursor_params),
+    checklist_service: ChecklistService = Depends(get_checklist_service)
 ):
     """
     체크리스트 템플릿 목록 조회
@@ -33,6 +52,10 @@ async def get_checklist_templates(
       - `daily_care`: 일상생활관리
       - 기타 카테고리들
     - `is_active`: 활성 상태 필터 (기본값: true)
+    - `cursor`, `size`, `include_total`: 커서 페이지네이션
+    
+    **조건부 요청:**
+    - 응답의 `ETag`를 `If-None-Match`로 보내면 변경이 없을 때 본문 없이 304를 반환합니다.
     
     **사용 예시:**
     - 모든 템플릿: `/api/v1/checklists/templates`
@@ -45,21 +68,35 @@ async def get_checklist_templates(
     - 각 아이템의 필수 여부 및 유형
     """
     try:
-        # 체크리스트 서비스 인스턴스 생성
-        checklist_service = ChecklistService(db)
+        # 템플릿 버전 스탬프로 ETag 확인 (카탈로그 로딩 시 DB 조회 없음)
+        headers = None
+        version = await run_service(checklist_service.get_templates_version)
+        if version:
+            etag = make_etag(version, category, is_active, *page.values())
+            headers = cache_headers(response, etag, TEMPLATES_CACHE_CONTROL)
+            if etag_matches(request, etag):
+                return not_modified_response(headers)
         
         # 템플릿 목록 조회
-        result = checklist_service.get_all_templates(category=category, is_active=is_active)
+        result = await run_service(checklist_service.get_all_templates, category=category, is_active=is_active, **page)
         
         # 에러 응답 처리
         if not result.get("success", True):
+            error_code = result.get("error_code")
             message = result.get("message", "알 수 없는 오류가 발생했습니다.")
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=message
-            )
+            
+            if error_code == "INVALID_CURSOR":
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=message
+                )
+            else:
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail=message
+                )
         
-        return result
+        return fast_response(result, ChecklistTemplateListResponse, headers=headers)
         
     except HTTPException:
         raise
@@ -76,7 +113,7 @@ async def get_checklist_templates(
     description="템플릿 ID로 특정 체크리스트 템플릿의 상세 정보를 조회합니다.")
 async def get_checklist_template_by_id(
     template_id: UUID,
-    db: Session = Depends(get_db)
+    checklist_service: ChecklistService = Depends(get_checklist_service)
 ):
     """
     체크리스트 템플릿 상세 조회
@@ -93,11 +130,8 @@ async def get_checklist_template_by_id(
     - 각 아이템의 유형별 분류
     """
     try:
-        # 체크리스트 서비스 인스턴스 생성
-        checklist_service = ChecklistService(db)
-        
         # 템플릿 상세 정보 조회
-        result = checklist_service.get_template_by_id(template_id)
+        result = await run_service(checklist_service.get_template_by_id, template_id)
         
         # 에러 응답 처리
         if not result.get("success", True):
@@ -115,7 +149,7 @@ async def get_checklist_template_by_id(
                     detail=message
                 )
         
-        return result
+        return fast_response(result, ChecklistTemplateResponse)
         
     except HTTPException:
         raise
@@ -132,7 +166,8 @@ async def get_checklist_template_by_id(
     description="특정 카테고리의 체크리스트 템플릿들을 조회합니다.")
 async def get_templates_by_category(
     category: str,
-    db: Session = Depends(get_db)
+    page: dict = Depends(get_cursor_params),
+    checklist_service: ChecklistService = Depends(get_checklist_service)
 ):
     """
     카테고리별 체크리스트 템플릿 조회
@@ -147,22 +182,143 @@ async def get_templates_by_category(
     - `/api/v1/checklists/templates/category/daily_care`
     """
     try:
-        # 체크리스트 서비스 인스턴스 생성
-        checklist_service = ChecklistService(db)
-        
         # 카테고리별 템플릿 조회
-        result = checklist_service.get_templates_by_category(category)
+        result = await run_service(checklist_service.get_templates_by_category, category, **page)
         
         # 에러 응답 처리
         if not result.get("success", True):
+            error_code = result.get("error_code")
             message = result.get("message", "알 수 없는 오류가 발생했습니다.")
+            
+            if error_code == "INVALID_CURSOR":
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=message
+                )
+            else:
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail=message
+                )
+        
+        return fast_response(result, ChecklistTemplateListResponse)
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="서버 내부 오류가 발생했습니다."
+        )
+
+
+@router.get("/trends/{channel_id}",
+    response_model=ChecklistTrendResponse,
+    summary="체크리스트 완료율 트렌드 조회",
+    description="채널의 일/주/월 단위 체크리스트 완료율 트렌드를 롤업 테이블에서 조회합니다.")
+async def get_checklist_trends(
+    channel_id: UUID,
+    period: str = Query("day", description="집계 단위 (day, week, month)"),
+    start_date: Optional[date] = Query(None, description="조회 시작일"),
+    end_date: Optional[date] = Query(None, description="조회 종료일"),
+    limit: int = Query(30, ge=1, le=366, description="최대 기간 수 (최근 기간부터)"),
+    trend_service: ChecklistTrendService = Depends(get_trend_service)
+):
+    """
+    체크리스트 완료율 트렌드 조회
+    
+    **경로 파라미터:**
+    - `channel_id`: 채널의 UUID
+    
+    **쿼리 파라미터:**
+    - `period`: `day`, `week`, `month` (기본값: day)
+    - `start_date`, `end_date`: 기간 시작일 범위 (선택사항)
+    - `limit`: 최대 기간 수 (기본값: 30)
+    
+    **사용 예시:**
+    - `/api/v1/checklists/trends/550e8400-e29b-41d4-a716-446655440010?period=week`
+    
+    **응답 정보:**
+    - 기간별 평균 완료율, 체크리스트 수
+    - 필수 항목 체크/미체크 수
+    """
+    try:
+        # 트렌드 조회
+        result = await run_service(
+            trend_service.get_completion_trends,
+            channel_id,
+            period=period,
+            start_date=start_date,
+            end_date=end_date,
+            limit=limit
+        )
+        
+        # 에러 응답 처리
+        if not result.get("success", True):
+            error_code = result.get("error_code")
+            message = result.get("message", "알 수 없는 오류가 발생했습니다.")
+            
+            if error_code == "INVALID_PERIOD":
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=message
+                )
+            else:
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail=message
+                )
+        
+        return fast_response(result, ChecklistTrendResponse)
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="서버 내부 오류가 발생했습니다."
+        )
+
+
+@router.post("/daily/bulk",
+    response_model=DailyChecklistBulkResponse,
+    summary="일일 체크리스트 일괄 제출",
+    description="여러 일일 체크리스트를 한 번에 제출합니다. 행별로 검증하여 유효한 행만 저장하고 결과를 반환합니다.")
+async def submit_daily_checklists(
+    request: DailyChecklistBulkRequest,
+    ingest_service: ChecklistIngestService = Depends(get_checklist_ingest_service)
+):
+    """
+    일일 체크리스트 일괄 제출
+    
+    **요청 본문:**
+    - `checklists`: 제출할 체크리스트 목록 (최대 500개)
+      - `id`: 클라이언트가 생성한 체크리스트 UUID (선택사항, 재전송해도 한 번만 저장)
+      - `channel_id`, `template_id`: 채널 및 템플릿 UUID
+      - `checked_items`: 항목별 `{"id": 1, "checked": true}` 목록
+      - `additional_notes`, `created_date`, `created_by`: 선택사항
+    
+    **검증:**
+    - 항목 ID는 템플릿에 정의된 항목이어야 하며 중복될 수 없습니다.
+    - 채널/템플릿/작성자가 없으면 해당 행만 거부됩니다.
+    
+    **응답 정보:**
+    - 요청 순서대로의 행별 결과 (`created`, `duplicate` 또는 `rejected`)
+    - 생성된 체크리스트 ID와 계산된 완료율
+    """
+    try:
+        # 일괄 제출
+        result = await run_service(ingest_service.submit_daily_checklists, request.checklists)
+        
+        # 에러 응답 처리
+        if not result.get("success", True):
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=message
+                detail=result.get("message", "알 수 없는 오류가 발생했습니다.")
             )
         
-        return result
-        
+        return fast_response(result, DailyChecklistBulkResponse)
+    
     except HTTPException:
         raise
     except Exception as e:
@@ -0,0 +1,342 @@
+"""
+Photo API Router for Sinabro
+사진 업로드/조회 관련 API 엔드포인트
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from pydantic import ValidationError
+from datetime import datetime, timezone
+from typing import Optional, Tuple
+from uuid import UUID
+import mimetypes
+import uuid
+
+from dependencies import get_photo_service, require_access_code, run_service
+from responses import fast_response
+from services import PhotoService
+from schemas import PhotoUploadForm, PhotoResponse, PhotoUrlResponse
+from uploads import UploadRejected, receive_upload
+from storage import blob_relative_path, store_blob
+from imaging import FORMAT_MEDIA_TYPES
+from renditions import rendition_pool, select_rendition
+from media import MediaFileResponse, resolve_media_path, sign_media_url
+
+router = APIRouter(prefix="/api/v1/photos", tags=["사진"])
+
+# 사진 ID 주소의 파일 응답 (렌디션 생성 전에는 원본이 전달되므로 너무 길게 두지 않음)
+PHOTO_CACHE_CONTROL = "private, max-age=3600"
+
+# 요청 본문을 직접 스트리밍하므로 OpenAPI 문서에만 multipart 형식을 명시
+PHOTO_UPLOAD_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "required": ["channel_id", "caregiver_id", "file"],
+                    "properties": {
+                        "channel_id": {"type": "string", "format": "uuid"},
+                        "caregiver_id": {"type": "string", "format": "uuid"},
+                        "photo_type": {"type": "string", "enum": ["activity", "meal", "medication", "family_moment"]},
+                        "description": {"type": "string"},
+                        "taken_date": {"type": "string", "format": "date"},
+                        "file": {"type": "string", "format": "binary"}
+                    }
+                }
+            }
+        }
+    }
+}
+
+
+def _check_upload_access(principal: dict) -> None:
+    """채널에 연결된 케어기버의 접속 코드/세션 토큰인지 확인"""
+    if principal.get("user_type") != "caregiver" or not principal.get("channel_id"):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="케어기버만 사진을 업로드할 수 있습니다."
+        )
+
+
+@router.post("",
+    response_model=PhotoResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="사진 업로드",
+    description="사진 파일을 스트리밍으로 저장한 뒤 사진 정보를 등록합니다.",
+    openapi_extra=PHOTO_UPLOAD_BODY)
+async def upload_photo(
+    request: Request,
+    principal: dict = Depends(require_access_code),
+    photo_service: PhotoService = Depends(get_photo_service)
+):
+    """
+    사진 업로드
+    
+    **권한:**
+    - 케어기버의 접속 코드/세션 토큰이 필요합니다.
+    - 폼의 `channel_id`, `caregiver_id`가 접속 코드의 채널/케어기버와 다르면 거부합니다 (403).
+    
+    **요청 본문 (multipart/form-data):**
+    - `channel_id`, `caregiver_id`: 채널 및 업로드한 케어기버 UUID
+    - `photo_type`: 사진 타입 (activity, meal, medication, family_moment, 선택사항)
+    - `description`, `taken_date`: 선택사항
+    - `file`: 사진 파일 (JPG, PNG, GIF 등 허용된 형식)
+    
+    **업로드 처리:**
+    - 본문을 청크 단위로 디스크에 기록하므로 파일 전체를 메모리에 올리지 않습니다.
+    - 최대 크기를 초과하거나 파일 선두 바이트가 허용된 형식이 아니면 즉시 중단합니다 (413/415).
+    - 파일 내용(SHA-256)이 같은 사진은 파일을 한 번만 저장하고 공유합니다.
+    - 파일이 디스크에 기록된 뒤에만 사진 정보를 저장합니다.
+    - 썸네일/축소본(렌디션)은 응답 후 백그라운드에서 생성됩니다.
+    
+    **응답 정보:**
+    - 등록된 사진 정보 (ID, 저장 경로, 촬영 날짜 등)
+    """
+    upload = None
+    try:
+        # 본문을 받기 전에 업로드 권한 확인
+        _check_upload_access(principal)
+        
+        # 본문 스트리밍 수신 (임시 파일)
+        try:
+            upload = await receive_upload(request)
+        except UploadRejected as e:
+            raise HTTPException(status_code=e.status_code, detail=e.message)
+        
+        # 폼 필드 검증
+        try:
+            form = PhotoUploadForm.model_validate(upload.fields)
+        except ValidationError as e:
+            upload.discard()
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=e.errors(include_url=False, include_context=False)
+            )
+        
+        # 폼의 채널/케어기버는 접속 코드와 일치해야 함
+        channel_id, caregiver_id = UUID(principal["channel_id"]), UUID(principal["user_id"])
+        if form.channel_id != channel_id or form.caregiver_id != caregiver_id:
+            upload.discard()
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="해당 채널에 사진을 업로드할 수 없습니다."
+            )
+        
+        # 같은 내용의 blob 선점 후 파일 저장 (이미 있으면 임시 파일만 삭제)
+        relative_path = blob_relative_path(upload.sha256, upload.file_type)
+        claim = await run_service(
+            photo_service.claim_blob, upload.sha256, relative_path, upload.size, upload.file_type
+        )
+        if not claim.get("success", True):
+            upload.discard()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=claim.get("message", "알 수 없는 오류가 발생했습니다.")
+            )
+        relative_path = claim["data"]["file_url"]
+        await store_blob(upload, relative_path)
+        
+        # DB 저장 (blob 참조 카운트는 트리거가 증가)
+        photo_id = uuid.uuid4()
+        result = await run_service(
+            photo_service.create_photo,
+            photo_id,
+            channel_id,
+            caregiver_id,
+            relative_path,
+            file_name=upload.file_name,
+            description=form.description,
+            photo_type=form.photo_type,
+            taken_date=form.taken_date,
+            blob_sha256=upload.sha256
+        )
+        
+        # 에러 응답 처리 (참조되지 않은 blob은 수거 작업이 정리)
+        if not result.get("success", True):
+            error_code = result.get("error_code")
+            message = result.get("message", "알 수 없는 오류가 발생했습니다.")
+            
+            if error_code == "CHANNEL_NOT_FOUND":
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=message
+                )
+            elif error_code == "CAREGIVER_MISMATCH":
+                raise HTTPException(
+                    status_code=status.HTTP_403_FORBIDDEN,
+                    detail=message
+                )
+            else:
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail=message
+                )
+        
+        # 렌디션은 요청 경로 밖에서 생성
+        rendition_pool.schedule(photo_id, relative_path, upload.file_type)
+        
+        return fast_response(result, PhotoResponse, status_code=status.HTTP_201_CREATED)
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        if upload is not None:
+            upload.discard()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="서버 내부 오류가 발생했습니다."
+        )
+
+
+async def _authorized_photo_file(photo_service: PhotoService, photo_id: UUID, principal: dict) -> dict:
+    """사진 파일 정보 조회 및 채널 접근 권한 확인"""
+    result = await run_service(photo_service.get_photo_file, photo_id)
+    
+    # 에러 응답 처리
+    if not result.get("success", True):
+        error_code = result.get("error_code")
+        message = result.get("message", "알 수 없는 오류가 발생했습니다.")
+        
+        if error_code == "PHOTO_NOT_FOUND":
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=message
+            )
+        else:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=message
+            )
+    
+    photo_file = result["data"]
+    if principal.get("channel_id") != photo_file["channel_id"]:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="해당 채널의 사진에 접근할 수 없습니다."
+        )
+    return photo_file
+
+
+def _chosen_file(photo_file: dict, width: Optional[int], request: Request) -> Tuple[str, str, Optional[dict]]:
+    """요청 크기/Accept에 맞는 파일의 (UPLOAD_DIR 기준 경로, 미디어 타입, 렌디션)"""
+    rendition = select_rendition(photo_file, width, "image/webp" in request.headers.get("accept", ""))
+    if rendition:
+        return rendition["file_url"], FORMAT_MEDIA_TYPES[rendition["format"]], rendition
+    relative_path = photo_file["file_url"]
+    return relative_path, mimetypes.guess_type(relative_path)[0] or "application/octet-stream", None
+
+
+@router.get("/{photo_id}/file",
+    summary="사진 파일 조회",
+    description="요청한 가로 크기 이상인 가장 작은 렌디션을 전달합니다. 적합한 렌디션이 없으면 원본을 전달합니다.",
+    response_class=MediaFileResponse)
+async def get_photo_file(
+    photo_id: UUID,
+    request: Request,
+    width: Optional[int] = Query(None, ge=1, le=4096, description="표시할 가로 크기 (px, 없으면 원본)"),
+    principal: dict = Depends(require_access_code),
+    photo_service: PhotoService = Depends(get_photo_service)
+):
+    """
+    사진 파일 조회
+    
+    **권한:**
+    - 사진이 속한 채널의 접속 코드/세션 토큰이 필요합니다.
+    
+    **쿼리 파라미터:**
+    - `width`: 표시할 가로 크기 (기기 픽셀 기준, 선택사항)
+    
+    **렌디션 선택:**
+    - `Accept` 헤더에 `image/webp`가 있으면 WebP 렌디션을 우선합니다.
+    - 렌디션이 아직 생성되지 않았거나 요청 크기가 더 크면 원본을 전달합니다.
+    
+    **전송:**
+    - `Range` 요청(206)과 `If-None-Match`/`If-Modified-Since` 조건부 요청(304)을 지원합니다.
+    - 앞단 프록시가 설정된 경우 `X-Accel-Redirect`로 프록시가 파일을 직접 전송합니다.
+    
+    **사용 예시:**
+    - 갤러리 썸네일: `/api/v1/photos/{photo_id}/file?width=320`
+    - 원본: `/api/v1/photos/{photo_id}/file`
+    """
+    try:
+        photo_file = await _authorized_photo_file(photo_service, photo_id, principal)
+        relative_path, media_type, _ = _chosen_file(photo_file, width, request)
+        
+        path = resolve_media_path(relative_path)
+        if path is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="사진 파일을 찾을 수 없습니다."
+            )
+        
+        # 같은 주소에서 렌디션 생성 후 다른 파일이 전달될 수 있으므로 짧게 캐시하고 ETag로 재검증
+        return MediaFileResponse(
+            path,
+            relative_path,
+            media_type,
+            cache_control=PHOTO_CACHE_CONTROL,
+            headers={"Vary": "Accept"}
+        )
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="서버 내부 오류가 발생했습니다."
+        )
+
+
+@router.get("/{photo_id}/url",
+    response_model=PhotoUrlResponse,
+    summary="사진 서명 URL 발급",
+    description="앞단 프록시/CDN이 앱을 거치지 않고 파일을 전송할 수 있는 단기 서명 URL을 발급합니다.")
+async def get_photo_url(
+    photo_id: UUID,
+    request: Request,
+    response: Response,
+    width: Optional[int] = Query(None, ge=1, le=4096, description="표시할 가로 크기 (px, 없으면 원본)"),
+    principal: dict = Depends(require_access_code),
+    photo_service: PhotoService = Depends(get_photo_service)
+):
+    """
+    사진 서명 URL 발급
+    
+    **권한:**
+    - 사진이 속한 채널의 접속 코드/세션 토큰이 필요합니다.
+    
+    **서명 URL:**
+    - `MEDIA_URL_TTL` 동안만 유효하며, nginx `secure_link` 모듈로 프록시에서 검증할 수 있습니다.
+    - 내용 주소 경로이므로 받은 파일은 만료 후에도 그대로 캐시해 둘 수 있습니다.
+    
+    **응답 정보:**
+    - 서명 URL, 만료 시각, 선택된 렌디션 크기/형식
+    """
+    try:
+        photo_file = await _authorized_photo_file(photo_service, photo_id, principal)
+        relative_path, _, rendition = _chosen_file(photo_file, width, request)
+        url, expires = sign_media_url(relative_path)
+        
+        # 서명 URL은 매번 새로 발급하므로 캐시하지 않음
+        headers = {"Cache-Control": "no-store", "Vary": "Accept"}
+        response.headers.update(headers)
+        
+        return fast_response({
+            "success": True,
+            "message": "사진 서명 URL을 발급했습니다.",
+            "data": {
+                "url": url,
+                "expires_at": datetime.fromtimestamp(expires, timezone.utc),
+                "width": rendition["width"] if rendition else None,
+                "format": rendition["format"] if rendition else None
+            }
+        }, PhotoUrlResponse, headers=headers)
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="서버 내부 오류가 발생했습니다."
+        )
@@ -0,0 +1,262 @@
+"""
+AI Report API Router for Sinabro
+AI 리포트 생성 요청/조회 관련 API 엔드포인트
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, status, Response
+from datetime import date
+from uuid import UUID
+
+from config import settings
+from dependencies import get_report_service, require_access_code, run_service
+from responses import fast_response
+from services import ReportService
+from schemas import (
+    ReportJobRequest,
+    ReportJobResponse,
+    AIReportResponse,
+    ReportTranslationRequest,
+    ReportTranslationsResponse
+)
+from report_worker import report_workers
+from translation import TranslationError, translation_manager
+
+router = APIRouter(prefix="/api/v1/reports", tags=["AI 리포트"])
+
+# 작업 상태 재조회 권장 간격 (초)
+POLL_RETRY_AFTER = "2"
+
+
+def _check_channel_access(principal: dict, channel_id) -> None:
+    """접속 코드/세션 토큰의 채널과 요청 채널 비교"""
+    if principal.get("channel_id") != str(channel_id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="해당 채널의 리포트에 접근할 수 없습니다."
+        )
+
+
+def _raise_for_error(result: dict) -> None:
+    """서비스 에러 응답을 HTTP 에러로 변환"""
+    if result.get("success", True):
+        return
+    error_code = result.get("error_code")
+    message = result.get("message", "알 수 없는 오류가 발생했습니다.")
+    
+    if error_code in ("CHANNEL_NOT_FOUND", "JOB_NOT_FOUND", "REPORT_NOT_FOUND"):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=message
+        )
+    elif error_code in ("ENQUEUE_CONFLICT", "REPORT_EXISTS"):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=message
+        )
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=message
+        )
+
+
+def _job_headers(job: dict) -> dict:
+    headers = {"Cache-Control": "no-store", "Location": f"{router.prefix}/jobs/{job['id']}"}
+    if job["status"] in ("queued", "running"):
+        headers["Retry-After"] = POLL_RETRY_AFTER
+    return headers
+
+
+@router.post("/jobs",
+    response_model=ReportJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="AI 리포트 생성 요청",
+    description="리포트 생성 작업을 큐에 등록하고 바로 응답합니다. 작업 상태는 Location 주소로 조회합니다.")
+async def create_report_job(
+    request: ReportJobRequest,
+    response: Response,
+    principal: dict = Depends(require_access_code),
+    report_service: ReportService = Depends(get_report_service)
+):
+    """
+    AI 리포트 생성 요청
+    
+    **권한:**
+    - 채널의 접속 코드/세션 토큰이 필요합니다.
+    
+    **요청 본문:**
+    - `channel_id`: 채널 UUID
+    - `report_date`: 리포트 날짜 (선택사항, 기본값: 오늘)
+    
+    **처리 방식:**
+    - 리포트는 백그라운드 워커가 생성하므로 요청은 LLM 응답을 기다리지 않습니다 (202).
+    - 같은 채널/날짜에 대기 중이거나 생성 중인 작업이 있으면 새로 만들지 않고 그 작업을 반환합니다 (`created: false`).
+    - 이미 리포트가 생성된 날짜는 다시 요청할 수 없습니다 (409).
+    - 일시적인 실패는 지수 백오프로 `max_attempts`회까지 다시 시도합니다.
+    
+    **응답 정보:**
+    - 작업 정보 (`Location` 헤더의 주소를 `Retry-After` 간격으로 조회)
+    """
+    try:
+        _check_channel_access(principal, request.channel_id)
+        
+        result = await run_service(
+            report_service.enqueue_report,
+            request.channel_id,
+            request.report_date or date.today(),
+            settings.REPORT_JOB_MAX_ATTEMPTS
+        )
+        _raise_for_error(result)
+        
+        job = result["data"]
+        if job["created"]:
+            # 큐 추가에 실패해도 작업은 DB에 남아 있으므로 복구 작업이 다시 넣음
+            await report_workers.enqueue(job["id"])
+        
+        headers = _job_headers(job)
+        response.headers.update(headers)
+        return fast_response(result, ReportJobResponse, status_code=status.HTTP_202_ACCEPTED, headers=headers)
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="서버 내부 오류가 발생했습니다."
+        )
+
+
+@router.get("/jobs/{job_id}",
+    response_model=ReportJobResponse,
+    summary="AI 리포트 생성 작업 조회",
+    description="리포트 생성 작업의 상태를 조회합니다. 완료되면 report_id로 리포트를 조회합니다.")
+async def get_report_job(
+    job_id: UUID,
+    response: Response,
+    principal: dict = Depends(require_access_code),
+    report_service: ReportService = Depends(get_report_service)
+):
+    """
+    AI 리포트 생성 작업 조회
+    
+    **작업 상태:**
+    - `queued`: 대기 중 (재시도 대기 중이면 `run_after`가 미래 시각)
+    - `running`: 생성 중
+    - `succeeded`: 완료 (`report_id`로 리포트 조회)
+    - `failed`: 최대 횟수까지 실패 (`last_error`에 사유)
+    """
+    try:
+        result = await run_service(report_service.get_job, job_id)
+        _raise_for_error(result)
+        _check_channel_access(principal, result["data"]["channel_id"])
+        
+        headers = _job_headers(result["data"])
+        response.headers.update(headers)
+        return fast_response(result, ReportJobResponse, headers=headers)
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="서버 내부 오류가 발생했습니다."
+        )
+
+
+@router.get("/{report_id}",
+    response_model=AIReportResponse,
+    summary="AI 리포트 조회",
+    description="생성된 AI 리포트를 조회합니다.")
+async def get_report(
+    report_id: UUID,
+    principal: dict = Depends(require_access_code),
+    report_service: ReportService = Depends(get_report_service)
+):
+    """
+    AI 리포트 조회
+    
+    **응답 정보:**
+    - 요약, 가족 코멘트, 기분/건강 분석, 추천사항
+    - 참조된 체크리스트/돌봄노트/사진/질문답변 ID와 생성 모델, 생성 소요 시간
+    """
+    try:
+        result = await run_service(report_service.get_report, report_id)
+        _raise_for_error(result)
+        _check_channel_access(principal, result["data"]["channel_id"])
+        
+        return fast_response(result, AIReportResponse)
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="서버 내부 오류가 발생했습니다."
+        )
+
+
+@router.post("/{report_id}/translations",
+    response_model=ReportTranslationsResponse,
+    summary="AI 리포트 번역",
+    description="리포트를 요청한 언어들로 번역하고 리포트에 저장합니다.")
+async def translate_report(
+    report_id: UUID,
+    request: ReportTranslationRequest,
+    principal: dict = Depends(require_access_code),
+    report_service: ReportService = Depends(get_report_service)
+):
+    """
+    AI 리포트 번역
+    
+    **요청 본문:**
+    - `languages`: 대상 언어 코드 목록 (`TRANSLATION_LANGUAGES`에 설정된 언어만 가능)
+    
+    **처리 방식:**
+    - 문장 단위로 번역하며 이미 번역한 문장은 캐시(프로세스 내 → Redis)에서 가져옵니다.
+    - 캐시에 없는 문장만 묶어서 번역 API로 보내고, 여러 언어는 동시에 번역합니다.
+    - 원문이 바뀌지 않은 기존 번역은 다시 번역하지 않습니다.
+    
+    **응답 정보:**
+    - 언어 코드별 요약, 가족 코멘트, 추천사항 번역
+    """
+    try:
+        languages = list(dict.fromkeys(request.languages))
+        unsupported = [language for language in languages if language not in settings.TRANSLATION_LANGUAGES]
+        if unsupported:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"지원하지 않는 언어입니다: {', '.join(unsupported)}"
+            )
+        
+        result = await run_service(report_service.get_report, report_id)
+        _raise_for_error(result)
+        report = result["data"]
+        _check_channel_access(principal, report["channel_id"])
+        
+        try:
+            translations = await translation_manager.translate_report(report, languages)
+        except TranslationError as e:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE if e.retryable else status.HTTP_502_BAD_GATEWAY,
+                detail="번역 서비스를 사용할 수 없습니다. 잠시 후 다시 시도해 주세요."
+            )
+        
+        # 새로 번역한 언어만 리포트에 저장
+        existing = report.get("translations") or {}
+        updated = {language: value for language, value in translations.items() if existing.get(language) != value}
+        if updated:
+            _raise_for_error(await run_service(report_service.save_translations, report_id, updated))
+        
+        return fast_response({
+            "success": True,
+            "message": "리포트를 번역했습니다.",
+            "data": {"report_id": report["id"], "translations": translations}
+        }, ReportTranslationsResponse)
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="서버 내부 오류가 발생했습니다."
+        )
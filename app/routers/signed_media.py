@@ -0,0 +1,58 @@
+"""
+Media API Router for Sinabro
+서명 URL로 사진 파일을 전송하는 엔드포인트 (앞단 프록시가 없을 때의 대체 경로)
+"""
+
+from fastapi import APIRouter, HTTPException, status, Query
+import mimetypes
+
+from config import settings
+from media import (
+    IMMUTABLE_CACHE_CONTROL,
+    MediaFileResponse,
+    is_content_addressed,
+    resolve_media_path,
+    verify_media_signature
+)
+
+router = APIRouter(prefix="/media", tags=["사진"])
+
+# 내용 주소가 아닌 경로(이전 업로드)는 짧게 캐시
+MEDIA_CACHE_CONTROL = "private, max-age=3600"
+
+
+@router.get("/{file_path:path}",
+    summary="서명 URL 파일 전송",
+    description="/api/v1/photos/{photo_id}/url에서 발급한 서명 URL의 파일을 전송합니다.",
+    response_class=MediaFileResponse,
+    include_in_schema=settings.DEBUG)
+async def get_media_file(
+    file_path: str,
+    md5: str = Query(..., description="서명"),
+    expires: int = Query(..., description="만료 시각 (unix timestamp)")
+):
+    """
+    서명 URL 파일 전송
+    
+    운영 환경에서는 앞단 프록시가 같은 서명을 검증하고 파일을 직접 전송하므로
+    이 경로까지 요청이 오지 않습니다. `Range`/조건부 요청을 지원합니다.
+    """
+    if not verify_media_signature(file_path, md5, expires):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="유효하지 않거나 만료된 URL입니다."
+        )
+    
+    path = resolve_media_path(file_path)
+    if path is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="파일을 찾을 수 없습니다."
+        )
+    
+    return MediaFileResponse(
+        path,
+        file_path,
+        mimetypes.guess_type(file_path)[0] or "application/octet-stream",
+        cache_control=IMMUTABLE_CACHE_CONTROL if is_content_addressed(file_path) else MEDIA_CACHE_CONTROL
+    )
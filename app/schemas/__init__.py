@@ -8,7 +8,9 @@ from .base import (
     BaseResponse,
     ErrorResponse,
     PaginationInfo,
-    PaginatedResponse
+    PaginatedResponse,
+    CursorPaginationInfo,
+    CursorPaginatedResponse
 )
 
 # 사용자 관련 스키마
@@ -22,7 +24,9 @@ from .user import (
 # 접속 코드 관련 스키마
 from .access_code import (
     AccessCodeInfo,
-    AccessCodeResponse
+    AccessCodeResponse,
+    AccessTokenInfo,
+    AccessTokenResponse
 )
 
 # 채널 관련 스키마
@@ -31,7 +35,15 @@ from .channel import (
     ChannelDetailInfo,
     ChannelResponse,
     ChannelListResponse,
-    MyChannelsResponse
+    MyChannelsResponse,
+    ChannelBatchRequest,
+    ChannelBatchItem,
+    ChannelBatchResponse,
+    ChannelDashboardInfo,
+    ChannelDashboardResponse,
+    SyncEntityChanges,
+    ChannelSyncInfo,
+    ChannelSyncResponse
 )
 
 # 체크리스트 관련 스키마
@@ -39,7 +51,38 @@ from .checklist import (
     ChecklistItem,
     ChecklistTemplateInfo,
     ChecklistTemplateResponse,
-    ChecklistTemplateListResponse
+    ChecklistTemplateListResponse,
+    ChecklistTrendPoint,
+    ChecklistTrendInfo,
+    ChecklistTrendResponse,
+    DailyChecklistEntry,
+    DailyChecklistSubmission,
+    DailyChecklistBulkRequest,
+    DailyChecklistBulkResult,
+    DailyChecklistBulkInfo,
+    DailyChecklistBulkResponse
+)
+
+# 사진 관련 스키마
+from .photo import (
+    PhotoUploadForm,
+    PhotoInfo,
+    PhotoResponse,
+    PhotoUrlInfo,
+    PhotoUrlResponse
+)
+
+# AI 리포트 관련 스키마
+from .report import (
+    ReportJobRequest,
+    ReportJobInfo,
+    ReportJobResponse,
+    AIReportInfo,
+    AIReportResponse,
+    ReportTranslationRequest,
+    ReportTranslation,
+    ReportTranslationsInfo,
+    ReportTranslationsResponse
 )
 
 __all__ = [
@@ -48,6 +91,8 @@ __all__ = [
     "ErrorResponse", 
     "PaginationInfo",
     "PaginatedResponse",
+    "CursorPaginationInfo",
+    "CursorPaginatedResponse",
     
     # 사용자 관련 스키마
     "GuardianInfo",
@@ -58,6 +103,8 @@ __all__ = [
     # 접속 코드 관련 스키마
     "AccessCodeInfo",
     "AccessCodeResponse",
+    "AccessTokenInfo",
+    "AccessTokenResponse",
     
     # 채널 관련 스키마
     "ChannelInfo",
@@ -65,10 +112,45 @@ __all__ = [
     "ChannelResponse",
     "ChannelListResponse",
     "MyChannelsResponse",
+    "ChannelBatchRequest",
+    "ChannelBatchItem",
+    "ChannelBatchResponse",
+    "ChannelDashboardInfo",
+    "ChannelDashboardResponse",
+    "SyncEntityChanges",
+    "ChannelSyncInfo",
+    "ChannelSyncResponse",
     
     # 체크리스트 관련 스키마
     "ChecklistItem",
     "ChecklistTemplateInfo",
     "ChecklistTemplateResponse",
-    "ChecklistTemplateListResponse"
+    "ChecklistTemplateListResponse",
+    "ChecklistTrendPoint",
+    "ChecklistTrendInfo",
+    "ChecklistTrendResponse",
+    "DailyChecklistEntry",
+    "DailyChecklistSubmission",
+    "DailyChecklistBulkRequest",
+    "DailyChecklistBulkResult",
+    "DailyChecklistBulkInfo",
+    "DailyChecklistBulkResponse",
+    
+    # 사진 관련 스키마
+    "PhotoUploadForm",
+    "PhotoInfo",
+    "PhotoResponse",
+    "PhotoUrlInfo",
+    "PhotoUrlResponse",
+    
+    # AI 리포트 관련 스키마
+    "ReportJobRequest",
+    "ReportJobInfo",
+    "ReportJobResponse",
+    "AIReportInfo",
+    "AIReportResponse",
+    "ReportTranslationRequest",
+    "ReportTranslation",
+    "ReportTranslationsInfo",
+    "ReportTranslationsResponse"
 ]
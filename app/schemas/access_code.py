@@ -54,3 +54,18 @@ class AccessCodeResponse(BaseResponse):
                 }
             }
         }
+
+
+class AccessTokenInfo(BaseModel):
+    """세션 토큰 정보 스키마"""
+    access_token: str = Field(description="서명된 JWT 액세스 토큰")
+    token_type: str = Field(default="bearer", description="토큰 유형")
+    expires_in: int = Field(description="만료까지 남은 시간 (초)")
+    user_type: str = Field(description="사용자 유형 (guardian/caregiver)")
+    user_id: UUID = Field(description="사용자 ID")
+    channel_id: Optional[UUID] = Field(None, description="접근 가능한 채널 ID")
+
+
+class AccessTokenResponse(BaseResponse):
+    """접속 코드 사용 처리 및 토큰 발급 응답 스키마"""
+    data: AccessTokenInfo = Field(description="세션 토큰 정보")
@@ -37,7 +37,22 @@ class PaginationInfo(BaseModel):
     total_pages: int = Field(ge=0, description="전체 페이지 수")
 
 
+class CursorPaginationInfo(BaseModel):
+    """커서 페이지네이션 정보"""
+    size: int = Field(ge=1, le=100, description="페이지 크기")
+    has_more: bool = Field(description="다음 페이지 존재 여부")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 조회용 커서")
+    total: Optional[int] = Field(None, ge=0, description="전체 항목 수 (include_total 요청 시)")
+    total_is_exact: Optional[bool] = Field(None, description="전체 항목 수가 정확한 값인지 여부 (상한 초과 시 false)")
+
+
 class PaginatedResponse(BaseResponse):
     """페이지네이션된 응답 스키마"""
     pagination: PaginationInfo = Field(description="페이지네이션 정보")
     data: List[Any] = Field(default_factory=list, description="데이터 목록")
+
+
+class CursorPaginatedResponse(BaseResponse):
+    """커서 페이지네이션된 응답 스키마"""
+    pagination: CursorPaginationInfo = Field(description="커서 페이지네이션 정보")
+    data: List[Any] = Field(default_factory=list, description="데이터 목록")
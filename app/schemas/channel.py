@@ -5,10 +5,10 @@ Channel related schemas for Sinabro API
 
 from pydantic import BaseModel, Field
 from datetime import datetime, date
-from typing import Optional, List
+from typing import Optional, List, Dict, Any
 from uuid import UUID
 
-from .base import BaseResponse, PaginatedResponse
+from .base import BaseResponse, PaginatedResponse, CursorPaginationInfo
 from .user import GuardianInfo, CaregiverInfo, SeniorInfo
 
 
@@ -69,3 +69,71 @@ class ChannelListResponse(PaginatedResponse):
 class MyChannelsResponse(BaseResponse):
     """내 채널 목록 응답 스키마"""
     data: List[ChannelDetailInfo] = Field(description="내 채널 목록 (상세 정보 포함)")
+    pagination: Optional[CursorPaginationInfo] = Field(None, description="커서 페이지네이션 정보")
+
+
+class ChannelBatchRequest(BaseModel):
+    """채널 일괄 조회 요청 스키마"""
+    channel_ids: List[UUID] = Field(min_length=1, max_length=50, description="조회할 채널 ID 목록 (최대 50개)")
+
+
+class ChannelBatchItem(BaseModel):
+    """채널 일괄 조회 결과 항목"""
+    status: str = Field(description="조회 결과 (ok/not_found)")
+    channel: Optional[ChannelDetailInfo] = Field(None, description="채널 상세 정보 (없으면 null)")
+
+
+class ChannelBatchResponse(BaseResponse):
+    """채널 일괄 조회 응답 스키마"""
+    data: Dict[str, ChannelBatchItem] = Field(description="채널 ID별 조회 결과")
+
+
+class DashboardChecklistSummary(BaseModel):
+    """대시보드 체크리스트 요약"""
+    target_date: date = Field(description="기준 날짜")
+    checklist_count: int = Field(description="기준 날짜 체크리스트 수")
+    completion_rate: Optional[float] = Field(None, description="평균 완료율 (기록이 없으면 null)")
+
+
+class DashboardReportSummary(BaseModel):
+    """대시보드 최신 AI 리포트 요약"""
+    id: UUID = Field(description="리포트 ID")
+    report_date: date = Field(description="리포트 날짜")
+    summary_text: str = Field(description="요약 (앞부분)")
+
+
+class ChannelDashboardInfo(BaseModel):
+    """채널별 홈 화면 요약 스키마"""
+    channel_id: UUID = Field(description="채널 ID")
+    channel_name: str = Field(description="채널 이름")
+    status: str = Field(description="채널 상태")
+    senior_name: str = Field(description="시니어 이름")
+    today_checklist: DashboardChecklistSummary = Field(description="기준 날짜 체크리스트 요약")
+    latest_report: Optional[DashboardReportSummary] = Field(None, description="최신 AI 리포트")
+    new_care_notes: int = Field(description="새 돌봄노트 수")
+    new_photos: int = Field(description="새 사진 수")
+    pending_feedback: int = Field(description="처리 대기 중인 피드백 수")
+
+
+class ChannelDashboardResponse(BaseResponse):
+    """채널 대시보드 응답 스키마"""
+    data: List[ChannelDashboardInfo] = Field(description="채널별 요약 목록")
+
+
+class SyncEntityChanges(BaseModel):
+    """엔티티별 변경 사항"""
+    upserted: List[Dict[str, Any]] = Field(description="추가/수정된 행")
+    deleted: List[UUID] = Field(description="삭제된 행 ID")
+
+
+class ChannelSyncInfo(BaseModel):
+    """채널 델타 동기화 정보"""
+    channel_id: UUID = Field(description="채널 ID")
+    watermark: str = Field(description="다음 동기화 요청에 전달할 워터마크")
+    has_more: bool = Field(description="같은 요청을 새 워터마크로 반복해야 하는지 여부")
+    changes: Dict[str, SyncEntityChanges] = Field(description="엔티티(테이블)별 변경 사항")
+
+
+class ChannelSyncResponse(BaseResponse):
+    """채널 델타 동기화 응답 스키마"""
+    data: ChannelSyncInfo = Field(description="델타 동기화 결과")
@@ -3,12 +3,12 @@ Checklist template related schemas for Sinabro API
 체크리스트 템플릿 관련 스키마들
 """
 
-from pydantic import BaseModel, Field
-from datetime import datetime
+from pydantic import BaseModel, ConfigDict, Field
+from datetime import datetime, date
 from typing import Optional, List, Dict, Any
 from uuid import UUID
 
-from .base import BaseResponse, PaginatedResponse
+from .base import BaseResponse, PaginatedResponse, CursorPaginationInfo
 
 
 class ChecklistItem(BaseModel):
@@ -37,6 +37,7 @@ class ChecklistTemplateResponse(BaseResponse):
 class ChecklistTemplateListResponse(BaseResponse):
     """체크리스트 템플릿 목록 응답 스키마"""
     data: List[ChecklistTemplateInfo] = Field(description="체크리스트 템플릿 목록")
+    pagination: Optional[CursorPaginationInfo] = Field(None, description="커서 페이지네이션 정보")
     
     class Config:
         json_schema_extra = {
@@ -68,3 +69,74 @@ class ChecklistTemplateListResponse(BaseResponse):
                 ]
             }
         }
+
+
+class ChecklistTrendPoint(BaseModel):
+    """체크리스트 트렌드 기간별 집계"""
+    period: str = Field(description="집계 단위 (day/week/month)")
+    period_start: date = Field(description="기간 시작일")
+    checklist_count: int = Field(description="체크리스트 수")
+    average_completion_rate: float = Field(description="평균 완료율")
+    checked_items: int = Field(description="체크된 항목 수")
+    total_items: int = Field(description="전체 항목 수")
+    required_checked: int = Field(description="체크된 필수 항목 수")
+    required_unchecked: int = Field(description="체크되지 않은 필수 항목 수")
+
+
+class ChecklistTrendInfo(BaseModel):
+    """체크리스트 트렌드 정보"""
+    channel_id: UUID = Field(description="채널 ID")
+    period: str = Field(description="집계 단위")
+    points: List[ChecklistTrendPoint] = Field(description="시간순 집계 목록")
+
+
+class ChecklistTrendResponse(BaseResponse):
+    """체크리스트 트렌드 응답 스키마"""
+    data: ChecklistTrendInfo = Field(description="체크리스트 트렌드")
+
+
+class DailyChecklistEntry(BaseModel):
+    """일일 체크리스트 항목 체크 상태 (값, 시간 등 추가 필드는 그대로 저장)"""
+    model_config = ConfigDict(extra="allow")
+    
+    id: int = Field(description="템플릿 아이템 ID")
+    checked: bool = Field(default=False, description="체크 여부")
+
+
+class DailyChecklistSubmission(BaseModel):
+    """일일 체크리스트 제출 항목"""
+    id: Optional[UUID] = Field(None, description="클라이언트가 생성한 체크리스트 ID (재전송 시 중복 저장 방지)")
+    channel_id: UUID = Field(description="채널 ID")
+    template_id: UUID = Field(description="템플릿 ID")
+    checked_items: List[DailyChecklistEntry] = Field(description="항목별 체크 상태")
+    additional_notes: Optional[str] = Field(None, description="추가 메모")
+    created_date: Optional[date] = Field(None, description="기록 날짜 (기본값: 오늘)")
+    created_by: Optional[UUID] = Field(None, description="작성자(케어기버) ID")
+
+
+class DailyChecklistBulkRequest(BaseModel):
+    """일일 체크리스트 일괄 제출 요청 스키마"""
+    checklists: List[DailyChecklistSubmission] = Field(min_length=1, max_length=500, description="제출할 체크리스트 목록 (최대 500개)")
+
+
+class DailyChecklistBulkResult(BaseModel):
+    """일괄 제출 행별 결과"""
+    index: int = Field(description="요청 목록 내 순번")
+    status: str = Field(description="처리 결과 (created/duplicate/rejected)")
+    id: Optional[UUID] = Field(None, description="생성된(또는 이미 저장된) 체크리스트 ID")
+    completion_rate: Optional[float] = Field(None, description="계산된 완료율")
+    error_code: Optional[str] = Field(None, description="거부 사유 코드")
+    message: Optional[str] = Field(None, description="거부 사유")
+
+
+class DailyChecklistBulkInfo(BaseModel):
+    """일괄 제출 결과 요약"""
+    created_count: int = Field(description="생성된 체크리스트 수")
+    duplicate_count: int = Field(default=0, description="이미 저장되어 건너뛴 체크리스트 수")
+    rejected_count: int = Field(description="거부된 체크리스트 수")
+    results: List[DailyChecklistBulkResult] = Field(description="요청 순서대로의 행별 결과")
+
+
+class DailyChecklistBulkResponse(BaseResponse):
+    """일일 체크리스트 일괄 제출 응답 스키마"""
+    data: DailyChecklistBulkInfo = Field(description="일괄 제출 결과")
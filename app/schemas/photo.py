@@ -0,0 +1,57 @@
+"""
+Photo related schemas for Sinabro API
+사진 관련 스키마들
+"""
+
+from pydantic import BaseModel, Field
+from datetime import datetime, date
+from typing import Optional, Literal
+from uuid import UUID
+
+from .base import BaseResponse
+
+PhotoType = Literal["activity", "meal", "medication", "family_moment"]
+
+
+class PhotoUploadForm(BaseModel):
+    """사진 업로드 폼 필드 스키마 (파일 파트 외)"""
+    channel_id: UUID = Field(description="채널 ID")
+    caregiver_id: UUID = Field(description="업로드한 케어기버 ID")
+    photo_type: Optional[PhotoType] = Field(None, description="사진 타입")
+    description: Optional[str] = Field(None, max_length=1000, description="사진 설명")
+    taken_date: Optional[date] = Field(None, description="촬영 날짜 (기본값: 오늘)")
+
+
+class PhotoInfo(BaseModel):
+    """사진 정보 스키마"""
+    id: UUID = Field(description="사진 ID")
+    channel_id: UUID = Field(description="채널 ID")
+    caregiver_id: UUID = Field(description="케어기버 ID")
+    file_url: str = Field(description="파일 저장 경로 (UPLOAD_DIR 기준)")
+    file_name: Optional[str] = Field(None, description="원본 파일명")
+    file_extension: Optional[str] = Field(None, description="파일 확장자")
+    description: Optional[str] = Field(None, description="사진 설명")
+    photo_type: Optional[str] = Field(None, description="사진 타입")
+    display_name: str = Field(description="표시용 이름")
+    is_image: bool = Field(description="이미지 파일 여부")
+    is_recent: bool = Field(description="최근 7일 이내 촬영 여부")
+    taken_date: date = Field(description="촬영 날짜")
+    created_at: Optional[datetime] = Field(None, description="생성일시")
+
+
+class PhotoResponse(BaseResponse):
+    """단일 사진 응답 스키마"""
+    data: PhotoInfo = Field(description="사진 정보")
+
+
+class PhotoUrlInfo(BaseModel):
+    """사진 서명 URL 정보 스키마"""
+    url: str = Field(description="앱 인증 없이 파일을 받을 수 있는 단기 서명 URL")
+    expires_at: datetime = Field(description="URL 만료 시각")
+    width: Optional[int] = Field(None, description="렌디션 가로 크기 (원본이면 null)")
+    format: Optional[str] = Field(None, description="렌디션 형식 (원본이면 null)")
+
+
+class PhotoUrlResponse(BaseResponse):
+    """사진 서명 URL 응답 스키마"""
+    data: PhotoUrlInfo = Field(description="서명 URL 정보")
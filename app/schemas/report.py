@@ -0,0 +1,96 @@
+"""
+AI report related schemas for Sinabro API
+AI 리포트 관련 스키마들
+"""
+
+from pydantic import BaseModel, Field
+from datetime import datetime, date
+from typing import Optional, List, Dict, Any, Literal
+from uuid import UUID
+
+from .base import BaseResponse
+
+ReportJobStatus = Literal["queued", "running", "succeeded", "failed"]
+
+
+class ReportJobRequest(BaseModel):
+    """리포트 생성 요청 스키마"""
+    channel_id: UUID = Field(description="채널 ID")
+    report_date: Optional[date] = Field(None, description="리포트 날짜 (기본값: 오늘)")
+
+
+class ReportJobInfo(BaseModel):
+    """리포트 생성 작업 정보 스키마"""
+    id: UUID = Field(description="작업 ID")
+    channel_id: UUID = Field(description="채널 ID")
+    report_date: date = Field(description="리포트 날짜")
+    status: ReportJobStatus = Field(description="작업 상태 (queued/running/succeeded/failed)")
+    attempts: int = Field(description="실행 횟수")
+    max_attempts: int = Field(description="최대 실행 횟수")
+    run_after: Optional[datetime] = Field(None, description="다음 실행 가능 시각 (재시도 대기 중이면 미래 시각)")
+    last_error: Optional[str] = Field(None, description="마지막 실패 사유")
+    report_id: Optional[UUID] = Field(None, description="생성된 리포트 ID (성공 시)")
+    created: Optional[bool] = Field(None, description="새로 등록된 작업 여부 (진행 중인 작업이 있으면 false)")
+    created_at: Optional[datetime] = Field(None, description="생성일시")
+    started_at: Optional[datetime] = Field(None, description="마지막 실행 시작일시")
+    finished_at: Optional[datetime] = Field(None, description="완료일시")
+
+
+class ReportJobResponse(BaseResponse):
+    """리포트 생성 작업 응답 스키마"""
+    data: ReportJobInfo = Field(description="작업 정보")
+
+
+class AIReportInfo(BaseModel):
+    """AI 리포트 정보 스키마"""
+    id: UUID = Field(description="리포트 ID")
+    channel_id: UUID = Field(description="채널 ID")
+    report_date: date = Field(description="리포트 날짜")
+    checklist_ids: List[UUID] = Field(default_factory=list, description="참조된 체크리스트 ID들")
+    care_note_ids: List[UUID] = Field(default_factory=list, description="참조된 돌봄노트 ID들")
+    photo_ids: List[UUID] = Field(default_factory=list, description="참조된 사진 ID들")
+    question_response_ids: List[UUID] = Field(default_factory=list, description="참조된 질문답변 ID들")
+    summary_text: str = Field(description="AI 생성 요약")
+    family_comment: str = Field(description="가족을 위한 코멘트")
+    mood_analysis: Optional[Dict[str, Any]] = Field(None, description="기분 분석 결과")
+    health_status: Optional[Dict[str, Any]] = Field(None, description="건강 상태 평가")
+    recommendations: Optional[List[Any]] = Field(None, description="AI 추천사항")
+    translations: Optional[Dict[str, Any]] = Field(None, description="다국어 번역 버전")
+    generation_model: Optional[str] = Field(None, description="생성에 사용된 AI 모델")
+    generation_time_ms: Optional[int] = Field(None, description="생성 소요 시간 (밀리초)")
+    confidence_score: float = Field(description="AI 신뢰도 점수")
+    data_source_count: Optional[int] = Field(None, description="참조된 기록 수")
+    has_high_confidence: Optional[bool] = Field(None, description="높은 신뢰도(0.8 이상) 여부")
+    created_at: Optional[datetime] = Field(None, description="생성일시")
+
+
+class AIReportResponse(BaseResponse):
+    """AI 리포트 응답 스키마"""
+    data: AIReportInfo = Field(description="리포트 정보")
+
+
+class ReportTranslationRequest(BaseModel):
+    """리포트 번역 요청 스키마"""
+    languages: List[str] = Field(min_length=1, max_length=10, description="대상 언어 코드들 (예: en, ja, zh-CN)")
+
+
+class ReportTranslation(BaseModel):
+    """언어별 리포트 번역 스키마"""
+    summary_text: str = Field(description="번역된 요약")
+    family_comment: str = Field(description="번역된 가족 코멘트")
+    recommendations: List[str] = Field(default_factory=list, description="번역된 추천사항")
+    source_language: Optional[str] = Field(None, description="원문 언어")
+    source_hash: Optional[str] = Field(None, description="번역한 원문의 해시 (원문이 바뀌면 다시 번역)")
+    provider: Optional[str] = Field(None, description="번역기")
+    translated_at: Optional[datetime] = Field(None, description="번역일시")
+
+
+class ReportTranslationsInfo(BaseModel):
+    """리포트 번역 결과 스키마"""
+    report_id: UUID = Field(description="리포트 ID")
+    translations: Dict[str, ReportTranslation] = Field(description="언어 코드별 번역")
+
+
+class ReportTranslationsResponse(BaseResponse):
+    """리포트 번역 응답 스키마"""
+    data: ReportTranslationsInfo = Field(description="번역 결과")
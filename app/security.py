@@ -0,0 +1,79 @@
+"""
+Sinabro 인증 토큰 관리
+SECRET_KEY로 서명한 JWT 세션 토큰 발급 및 검증
+"""
+
+from jose import JWTError, jwt
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+import logging
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+TOKEN_TYPE = "access"
+
+
+def create_access_token(
+    principal: Dict[str, Any],
+    expires_at: Optional[datetime] = None
+) -> Dict[str, Any]:
+    """
+    인증 주체 정보로 서명된 액세스 토큰 발급
+    
+    Args:
+        principal: user_type, user_id, channel_id, access_code를 담은 주체 정보
+        expires_at: 토큰 만료 상한 (접속 코드 만료 시각 등)
+    
+    Returns:
+        access_token, token_type, expires_in을 담은 딕셔너리
+    """
+    now = datetime.now(timezone.utc)
+    expire = now + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    if expires_at is not None:
+        expire = min(expire, expires_at)
+    
+    claims = {
+        "sub": str(principal["user_id"]),
+        "user_type": principal["user_type"],
+        "channel_id": str(principal["channel_id"]) if principal.get("channel_id") else None,
+        "access_code": principal.get("access_code"),
+        "type": TOKEN_TYPE,
+        "iat": now,
+        "exp": expire
+    }
+    
+    return {
+        "access_token": jwt.encode(claims, settings.SECRET_KEY, algorithm=settings.ALGORITHM),
+        "token_type": "bearer",
+        "expires_in": max(int((expire - now).total_seconds()), 0)
+    }
+
+
+def decode_access_token(token: str) -> Optional[Dict[str, Any]]:
+    """
+    액세스 토큰 검증 (DB 조회 없이 서명과 만료만 확인)
+    
+    Args:
+        token: JWT 문자열
+    
+    Returns:
+        인증 주체 정보 (유효하지 않으면 None)
+    """
+    try:
+        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    except JWTError as e:
+        logger.debug(f"Access token rejected: {e}")
+        return None
+    
+    if payload.get("type") != TOKEN_TYPE or not payload.get("sub"):
+        return None
+    
+    return {
+        "access_code": payload.get("access_code"),
+        "user_type": payload.get("user_type"),
+        "user_id": payload["sub"],
+        "channel_id": payload.get("channel_id"),
+        "expires_ts": payload.get("exp")
+    }
@@ -4,20 +4,58 @@ Sinabro API Services
 """
 
 # 기본 서비스
-from .base import BaseService
+from .base import BaseService, AsyncBaseService
 
 # 접속 코드 서비스
-from .access_code import AccessCodeService
+from .access_code import AccessCodeService, AsyncAccessCodeService
 
 # 채널 서비스
-from .channel import ChannelService
+from .channel import ChannelService, AsyncChannelService
 
 # 체크리스트 서비스
-from .checklist import ChecklistService
+from .checklist import ChecklistService, AsyncChecklistService
+from .checklist_catalog import ChecklistTemplateCatalog, CatalogChecklistService, checklist_catalog
+from .checklist_ingest import ChecklistIngestService, AsyncChecklistIngestService
+
+# 대시보드 서비스
+from .dashboard import DashboardService, AsyncDashboardService
+
+# 체크리스트 트렌드 서비스
+from .trends import ChecklistTrendService, AsyncChecklistTrendService
+
+# 델타 동기화 서비스
+from .sync import SyncService, AsyncSyncService, SyncChangelogCompactor, sync_changelog_compactor
+
+# 사진 서비스
+from .photo import PhotoService, AsyncPhotoService
+
+# AI 리포트 서비스
+from .report import ReportService, AsyncReportService
 
 __all__ = [
     "BaseService",
+    "AsyncBaseService",
     "AccessCodeService",
+    "AsyncAccessCodeService",
     "ChannelService",
-    "ChecklistService"
+    "AsyncChannelService",
+    "ChecklistService",
+    "AsyncChecklistService",
+    "ChecklistTemplateCatalog",
+    "CatalogChecklistService",
+    "checklist_catalog",
+    "ChecklistIngestService",
+    "AsyncChecklistIngestService",
+    "DashboardService",
+    "AsyncDashboardService",
+    "ChecklistTrendService",
+    "AsyncChecklistTrendService",
+    "SyncService",
+    "AsyncSyncService",
+    "SyncChangelogCompactor",
+    "sync_changelog_compactor",
+    "PhotoService",
+    "AsyncPhotoService",
+    "ReportService",
+    "AsyncReportService"
 ]
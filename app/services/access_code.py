@@ -3,17 +3,112 @@ Access Code Service for Sinabro API
 접속 코드 관련 비즈니스 로직
 """
 
+from sqlalchemy import select, func, text
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy.exc import SQLAlchemyError
-from typing import Optional, Dict, Any
-from datetime import datetime
+from typing import Optional, Dict, Any, Tuple
 import logging
 
 from ..models import AccessCode, Guardian, Caregiver, Channel, Senior
-from .base import BaseService
+from .base import BaseService, AsyncBaseService
 
 logger = logging.getLogger(__name__)
 
+# 사용자 유형별 모델 매핑
+USER_MODELS = {
+    "guardian": Guardian,
+    "caregiver": Caregiver
+}
+
+
+# 워터마크 이후 캐시 무효화 로그 조회 (동기화 변경 로그와 같은 (txid, seq) 워터마크)
+# 진행 중인 트랜잭션보다 앞선 기록만 읽어 늦게 커밋된 기록을 건너뛰지 않음
+# (긴 트랜잭션이 열려 있는 동안에는 그 이후 기록의 적용도 함께 늦어짐)
+INVALIDATIONS_SQL = text("""
+    SELECT scope, target, txid::text AS txid, seq
+    FROM access_code_invalidations
+    WHERE txid < pg_snapshot_xmin(pg_current_snapshot())
+      AND (txid, seq) > (CAST(:txid AS xid8), :seq)
+    ORDER BY txid, seq
+    LIMIT :limit
+""")
+
+# 보존 기간이 지난 무효화 로그 정리
+PRUNE_INVALIDATIONS_SQL = text("""
+    DELETE FROM access_code_invalidations
+    WHERE created_at < NOW() - make_interval(secs => :retention_seconds)
+""")
+
+
+def _build_channel_info(channel: Optional[Channel]) -> Optional[Dict[str, Any]]:
+    """접속 코드 응답용 채널 요약 정보 생성"""
+    if not channel:
+        return None
+    
+    return {
+        "id": str(channel.id),
+        "channel_name": channel.channel_name,
+        "status": channel.status,
+        "start_date": channel.start_date.isoformat() if channel.start_date else None,
+        "senior_name": channel.senior.full_name if channel.senior else None
+    }
+
+
+def _build_access_code_data(
+    access_code: AccessCode,
+    user_info: Dict[str, Any],
+    channel_info: Optional[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """접속 코드 응답 데이터 구성"""
+    return {
+        "access_code": {
+            "code": access_code.code,
+            "user_type": access_code.user_type,
+            "is_used": access_code.is_used,
+            "expires_at": access_code.expires_at.isoformat()
+        },
+        "user_info": user_info,
+        "channel_info": channel_info
+    }
+
+
+def _principal_statement(code: str):
+    """인증용 접속 코드 조회 쿼리 (필요한 컬럼만, 만료되지 않은 코드)"""
+    return select(
+        AccessCode.code,
+        AccessCode.user_type,
+        AccessCode.user_id,
+        AccessCode.channel_id,
+        AccessCode.is_used,
+        AccessCode.expires_at
+    ).where(
+        AccessCode.code == code.upper(),
+        AccessCode.expires_at > func.now()
+    )
+
+
+def _build_principal(row) -> Optional[Dict[str, Any]]:
+    """인증 주체 정보 구성 (캐시 저장이 가능하도록 JSON 직렬화 가능한 값만 사용)"""
+    if row is None:
+        return None
+    
+    return {
+        "access_code": row.code,
+        "user_type": row.user_type,
+        "user_id": str(row.user_id),
+        "channel_id": str(row.channel_id) if row.channel_id else None,
+        "is_used": row.is_used,
+        "expires_ts": row.expires_at.timestamp() if row.expires_at else None
+    }
+
+
+def _invalidation_data(position: Tuple[str, int], rows) -> Dict[str, Any]:
+    """무효화 대상 목록과 다음 워터마크 (기록이 없으면 워터마크 유지)"""
+    return {
+        "invalidations": [{"scope": row.scope, "target": row.target} for row in rows],
+        "position": (rows[-1].txid, rows[-1].seq) if rows else position
+    }
+
 
 class AccessCodeService(BaseService):
     """접속 코드 서비스"""
@@ -24,7 +119,7 @@ class AccessCodeService(BaseService):
         
         Args:
             code: 접속 코드 (예: GUARD001, CARE001)
-            
+        
         Returns:
             Dict containing access code info, user info, and channel info
         """
@@ -41,7 +136,7 @@ class AccessCodeService(BaseService):
                 )
             
             # 만료 시간 확인
-            if access_code.expires_at < datetime.now():
+            if access_code.is_expired:
                 return self.create_error_response(
                     message="만료된 접속 코드입니다.",
                     error_code="EXPIRED_ACCESS_CODE"
@@ -49,16 +144,10 @@ class AccessCodeService(BaseService):
             
             # 사용자 정보 조회
             user_info = None
-            if access_code.user_type == "guardian":
-                user = self.db.query(Guardian).filter(
-                    Guardian.id == access_code.user_id
-                ).first()
-                if user:
-                    user_info = user.to_dict()
-            
-            elif access_code.user_type == "caregiver":
-                user = self.db.query(Caregiver).filter(
-                    Caregiver.id == access_code.user_id
+            user_model = USER_MODELS.get(access_code.user_type)
+            if user_model:
+                user = self.db.query(user_model).filter(
+                    user_model.id == access_code.user_id
                 ).first()
                 if user:
                     user_info = user.to_dict()
@@ -70,40 +159,17 @@ class AccessCodeService(BaseService):
                 )
             
             # 채널 정보 조회 (있는 경우)
-            channel_info = None
+            channel = None
             if access_code.channel_id:
                 channel = self.db.query(Channel).options(
-                    joinedload(Channel.guardian),
-                    joinedload(Channel.caregiver),
                     joinedload(Channel.senior)
                 ).filter(Channel.id == access_code.channel_id).first()
-                
-                if channel:
-                    channel_info = {
-                        "id": str(channel.id),
-                        "channel_name": channel.channel_name,
-                        "status": channel.status,
-                        "start_date": channel.start_date.isoformat() if channel.start_date else None,
-                        "senior_name": channel.senior.full_name if channel.senior else None
-                    }
-            
-            # 응답 데이터 구성
-            response_data = {
-                "access_code": {
-                    "code": access_code.code,
-                    "user_type": access_code.user_type,
-                    "is_used": access_code.is_used,
-                    "expires_at": access_code.expires_at.isoformat()
-                },
-                "user_info": user_info,
-                "channel_info": channel_info
-            }
             
             return self.create_response(
                 message="접속 코드 정보를 성공적으로 조회했습니다.",
-                data=response_data
+                data=_build_access_code_data(access_code, user_info, _build_channel_info(channel))
             )
-            
+        
         except SQLAlchemyError as e:
             return self.handle_db_error(e, "get access code info")
         except Exception as e:
@@ -119,7 +185,7 @@ class AccessCodeService(BaseService):
         
         Args:
             code: 접속 코드
-            
+        
         Returns:
             Success response
         """
@@ -134,13 +200,21 @@ class AccessCodeService(BaseService):
                     error_code="INVALID_ACCESS_CODE"
                 )
             
+            if access_code.is_expired:
+                return self.create_error_response(
+                    message="만료된 접속 코드입니다.",
+                    error_code="EXPIRED_ACCESS_CODE"
+                )
+            
             access_code.is_used = True
             self.db.commit()
             
+            # 세션 토큰 발급에 필요한 주체 정보 반환
             return self.create_response(
-                message="접속 코드가 사용됨으로 표시되었습니다."
+                message="접속 코드가 사용됨으로 표시되었습니다.",
+                data=_build_principal(access_code)
             )
-            
+        
         except SQLAlchemyError as e:
             return self.handle_db_error(e, "mark access code as used")
         except Exception as e:
@@ -149,3 +223,262 @@ class AccessCodeService(BaseService):
                 message="서버 오류가 발생했습니다.",
                 error_code="INTERNAL_ERROR"
             )
+
+    def verify_code(self, code: str) -> Optional[Dict[str, Any]]:
+        """
+        요청 인증용 접속 코드 검증
+        
+        Args:
+            code: 접속 코드
+        
+        Returns:
+            인증 주체 정보 (유효하지 않으면 None)
+        """
+        row = self.db.execute(_principal_statement(code)).first()
+        return _build_principal(row)
+
+    def get_cache_invalidations(self, position: Tuple[str, int], limit: int) -> Dict[str, Any]:
+        """
+        워터마크 이후의 접속 코드 캐시 무효화 로그 조회
+        
+        Args:
+            position: 마지막으로 적용한 (txid, seq)
+            limit: 최대 조회 건수
+        
+        Returns:
+            Dict containing invalidation targets and the next position
+        """
+        try:
+            rows = self.db.execute(
+                INVALIDATIONS_SQL,
+                {"txid": position[0], "seq": position[1], "limit": limit}
+            ).all()
+            
+            return self.create_response(
+                message=f"{len(rows)}건의 캐시 무효화 기록을 조회했습니다.",
+                data=_invalidation_data(position, rows)
+            )
+        
+        except SQLAlchemyError as e:
+            return self.handle_db_error(e, "get cache invalidations")
+        except Exception as e:
+            logger.error(f"Unexpected error in get_cache_invalidations: {str(e)}")
+            return self.create_error_response(
+                message="서버 오류가 발생했습니다.",
+                error_code="INTERNAL_ERROR"
+            )
+    
+    def prune_cache_invalidations(self, retention_seconds: int) -> Dict[str, Any]:
+        """
+        보존 기간이 지난 접속 코드 캐시 무효화 로그 정리
+        
+        Args:
+            retention_seconds: 보존 기간 (초)
+        
+        Returns:
+            Dict containing deleted row count
+        """
+        try:
+            deleted = self.db.execute(PRUNE_INVALIDATIONS_SQL, {"retention_seconds": retention_seconds}).rowcount
+            self.db.commit()
+            
+            return self.create_response(
+                message=f"{deleted}건의 캐시 무효화 기록을 정리했습니다.",
+                data={"deleted": deleted}
+            )
+        
+        except SQLAlchemyError as e:
+            return self.handle_db_error(e, "prune cache invalidations")
+        except Exception as e:
+            logger.error(f"Unexpected error in prune_cache_invalidations: {str(e)}")
+            return self.create_error_response(
+                message="서버 오류가 발생했습니다.",
+                error_code="INTERNAL_ERROR"
+            )
+
+
+class AsyncAccessCodeService(AsyncBaseService):
+    """접속 코드 서비스 (비동기)"""
+    
+    async def get_access_code_info(self, code: str) -> Dict[str, Any]:
+        """
+        접속 코드로 사용자 정보 조회
+        
+        Args:
+            code: 접속 코드 (예: GUARD001, CARE001)
+        
+        Returns:
+            Dict containing access code info, user info, and channel info
+        """
+        try:
+            # 접속 코드 조회
+            access_code = (await self.db.execute(
+                select(AccessCode).where(AccessCode.code == code.upper())
+            )).scalar_one_or_none()
+            
+            if not access_code:
+                return self.create_error_response(
+                    message="유효하지 않은 접속 코드입니다.",
+                    error_code="INVALID_ACCESS_CODE"
+                )
+            
+            # 만료 시간 확인
+            if access_code.is_expired:
+                return self.create_error_response(
+                    message="만료된 접속 코드입니다.",
+                    error_code="EXPIRED_ACCESS_CODE"
+                )
+            
+            # 사용자 정보 조회
+            user_info = None
+            user_model = USER_MODELS.get(access_code.user_type)
+            if user_model:
+                user = await self.db.get(user_model, access_code.user_id)
+                if user:
+                    user_info = user.to_dict()
+            
+            if not user_info:
+                return self.create_error_response(
+                    message="사용자 정보를 찾을 수 없습니다.",
+                    error_code="USER_NOT_FOUND"
+                )
+            
+            # 채널 정보 조회 (있는 경우)
+            channel = None
+            if access_code.channel_id:
+                channel = (await self.db.execute(
+                    select(Channel)
+                    .options(joinedload(Channel.senior))
+                    .where(Channel.id == access_code.channel_id)
+                )).scalar_one_or_none()
+            
+            return self.create_response(
+                message="접속 코드 정보를 성공적으로 조회했습니다.",
+                data=_build_access_code_data(access_code, user_info, _build_channel_info(channel))
+            )
+        
+        except SQLAlchemyError as e:
+            return await self.handle_db_error(e, "get access code info")
+        except Exception as e:
+            logger.error(f"Unexpected error in get_access_code_info: {str(e)}")
+            return self.create_error_response(
+                message="서버 오류가 발생했습니다.",
+                error_code="INTERNAL_ERROR"
+            )
+    
+    async def mark_as_used(self, code: str) -> Dict[str, Any]:
+        """
+        접속 코드를 사용됨으로 표시
+        
+        Args:
+            code: 접속 코드
+        
+        Returns:
+            Success response
+        """
+        try:
+            access_code = (await self.db.execute(
+                select(AccessCode).where(AccessCode.code == code.upper())
+            )).scalar_one_or_none()
+            
+            if not access_code:
+                return self.create_error_response(
+                    message="유효하지 않은 접속 코드입니다.",
+                    error_code="INVALID_ACCESS_CODE"
+                )
+            
+            if access_code.is_expired:
+                return self.create_error_response(
+                    message="만료된 접속 코드입니다.",
+                    error_code="EXPIRED_ACCESS_CODE"
+                )
+            
+            access_code.is_used = True
+            await self.db.commit()
+            
+            # 세션 토큰 발급에 필요한 주체 정보 반환
+            return self.create_response(
+                message="접속 코드가 사용됨으로 표시되었습니다.",
+                data=_build_principal(access_code)
+            )
+        
+        except SQLAlchemyError as e:
+            return await self.handle_db_error(e, "mark access code as used")
+        except Exception as e:
+            logger.error(f"Unexpected error in mark_as_used: {str(e)}")
+            return self.create_error_response(
+                message="서버 오류가 발생했습니다.",
+                error_code="INTERNAL_ERROR"
+            )
+
+    async def verify_code(self, code: str) -> Optional[Dict[str, Any]]:
+        """
+        요청 인증용 접속 코드 검증
+        
+        Args:
+            code: 접속 코드
+        
+        Returns:
+            인증 주체 정보 (유효하지 않으면 None)
+        """
+        row = (await self.db.execute(_principal_statement(code))).first()
+        return _build_principal(row)
+
+    async def get_cache_invalidations(self, position: Tuple[str, int], limit: int) -> Dict[str, Any]:
+        """
+        워터마크 이후의 접속 코드 캐시 무효화 로그 조회
+        
+        Args:
+            position: 마지막으로 적용한 (txid, seq)
+            limit: 최대 조회 건수
+        
+        Returns:
+            Dict containing invalidation targets and the next position
+        """
+        try:
+            rows = (await self.db.execute(
+                INVALIDATIONS_SQL,
+                {"txid": position[0], "seq": position[1], "limit": limit}
+            )).all()
+            
+            return self.create_response(
+                message=f"{len(rows)}건의 캐시 무효화 기록을 조회했습니다.",
+                data=_invalidation_data(position, rows)
+            )
+        
+        except SQLAlchemyError as e:
+            return await self.handle_db_error(e, "get cache invalidations")
+        except Exception as e:
+            logger.error(f"Unexpected error in get_cache_invalidations: {str(e)}")
+            return self.create_error_response(
+                message="서버 오류가 발생했습니다.",
+                error_code="INTERNAL_ERROR"
+            )
+    
+    async def prune_cache_invalidations(self, retention_seconds: int) -> Dict[str, Any]:
+        """
+        보존 기간이 지난 접속 코드 캐시 무효화 로그 정리
+        
+        Args:
+            retention_seconds: 보존 기간 (초)
+        
+        Returns:
+            Dict containing deleted row count
+        """
+        try:
+            deleted = (await self.db.execute(PRUNE_INVALIDATIONS_SQL, {"retention_seconds": retention_seconds})).rowcount
+            await self.db.commit()
+            
+            return self.create_response(
+                message=f"{deleted}건의 캐시 무효화 기록을 정리했습니다.",
+                data={"deleted": deleted}
+            )
+        
+        except SQLAlchemyError as e:
+            return await self.handle_db_error(e, "prune cache invalidations")
+        except Exception as e:
+            logger.error(f"Unexpected error in prune_cache_invalidations: {str(e)}")
+            return self.create_error_response(
+                message="서버 오류가 발생했습니다.",
+                error_code="INTERNAL_ERROR"
+            )
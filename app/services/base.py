@@ -4,6 +4,7 @@ Base service class for Sinabro API
 """
 
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 from typing import Optional, List, Dict, Any
 from uuid import UUID
@@ -40,6 +41,12 @@ class BaseService:
             
         return response
     
+    def create_page_response(self, message: str, data: List[Any], pagination: Dict[str, Any]):
+        """커서 페이지네이션 응답 생성"""
+        response = self.create_response(message=message, data=data)
+        response["pagination"] = pagination
+        return response
+    
     def create_error_response(self, message: str, error_code: str = None, details: Dict[str, Any] = None):
         """에러 응답 생성"""
         response = {
@@ -54,3 +61,17 @@ class BaseService:
             response["details"] = details
             
         return response
+
+
+class AsyncBaseService(BaseService):
+    """비동기 기본 서비스 클래스 (AsyncSession 사용)"""
+    
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    
+    async def handle_db_error(self, error: Exception, operation: str = "database operation"):
+        """데이터베이스 에러 처리"""
+        logger.error(f"Database error during {operation}: {str(error)}")
+        if isinstance(error, SQLAlchemyError):
+            await self.db.rollback()
+        raise error
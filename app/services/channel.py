@@ -3,77 +3,280 @@ Channel Service for Sinabro API
 채널 관련 비즈니스 로직
 """
 
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session, joinedload, load_only, selectinload
 from sqlalchemy.exc import SQLAlchemyError
+from datetime import date, datetime
 from typing import Optional, List, Dict, Any
 from uuid import UUID
 import logging
 
+from ..config import settings
 from ..models import Channel, Guardian, Caregiver, Senior
-from .base import BaseService
+from .base import BaseService, AsyncBaseService
+from .pagination import (
+    InvalidCursorError,
+    decode_cursor,
+    keyset_statement,
+    capped_count_statement,
+    build_page
+)
 
 logger = logging.getLogger(__name__)
 
+# 채널 조회 시 함께 로딩하는 관계
+CHANNEL_RELATION_OPTIONS = (
+    joinedload(Channel.guardian),
+    joinedload(Channel.caregiver),
+    joinedload(Channel.senior)
+)
+
+# 채널 목록 커서 정렬 키 (생성일 역순, 동일 시각은 ID 역순)
+CHANNEL_PAGE_COLUMNS = (Channel.created_at, Channel.id)
+
+# 채널 상세 응답에 포함되는 행들의 버전 (ETag 계산용)
+# updated_at은 ORM 수정 시에만 갱신되므로 모든 수정에서 바뀌는 행 버전(xmin)을 사용
+CHANNEL_VERSION_SQL = text("""
+    SELECT concat_ws(':', c.xmin, g.xmin, cg.xmin, s.xmin)
+    FROM channels c
+    LEFT JOIN guardians g ON g.id = c.guardian_id
+    LEFT JOIN caregivers cg ON cg.id = c.caregiver_id
+    LEFT JOIN seniors s ON s.id = c.senior_id
+    WHERE c.id = :channel_id
+""")
+
+# fields/include 파라미터로 선택 가능한 관계
+CHANNEL_RELATIONS = {
+    "guardian": (Channel.guardian, Guardian),
+    "caregiver": (Channel.caregiver, Caregiver),
+    "senior": (Channel.senior, Senior)
+}
+
+
+class InvalidFieldSelectionError(ValueError):
+    """잘못된 fields/include 파라미터"""
+
+
+def _column_names(model) -> List[str]:
+    return [attr.key for attr in model.__mapper__.column_attrs]
+
+
+def parse_field_selection(fields: Optional[str] = None, include: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    fields/include 파라미터 해석
+    
+    Args:
+        fields: 쉼표로 구분한 채널 컬럼 또는 "관계.컬럼" (예: "channel_name,status,senior.full_name")
+        include: 쉼표로 구분한 관계 이름 (예: "senior")
+    
+    Returns:
+        {"columns": 채널 컬럼 목록, "relations": {관계: 컬럼 목록 또는 None(전체)}}
+        두 파라미터가 모두 없으면 None (전체 응답)
+    """
+    if not fields and not include:
+        return None
+    
+    channel_columns = _column_names(Channel)
+    columns: List[str] = []
+    relations: Dict[str, Optional[List[str]]] = {}
+    
+    for name in filter(None, (part.strip() for part in (include or "").split(","))):
+        if name not in CHANNEL_RELATIONS:
+            raise InvalidFieldSelectionError(f"지원하지 않는 관계입니다: {name}")
+        relations.setdefault(name, None)
+    
+    for name in filter(None, (part.strip() for part in (fields or "").split(","))):
+        relation, _, column = name.partition(".")
+        if column:
+            if relation not in CHANNEL_RELATIONS or column not in _column_names(CHANNEL_RELATIONS[relation][1]):
+                raise InvalidFieldSelectionError(f"지원하지 않는 필드입니다: {name}")
+            selected = relations.get(relation)
+            relations[relation] = (selected or []) + [column]
+        elif name in channel_columns:
+            columns.append(name)
+        else:
+            raise InvalidFieldSelectionError(f"지원하지 않는 필드입니다: {name}")
+    
+    # 채널 컬럼을 지정하지 않았으면 채널 컬럼 전체
+    return {"columns": columns or channel_columns, "relations": relations}
+
+
+def _channel_load_options(selection: Optional[Dict[str, Any]], loader=joinedload) -> tuple:
+    """
+    선택한 컬럼/관계만 SQL에서 로딩하는 옵션 (선택하지 않은 관계는 조인하지 않음)
+    loader: 관계 로딩 전략 (단건/목록은 joinedload, 일괄 조회는 selectinload)
+    """
+    if selection is None:
+        if loader is joinedload:
+            return CHANNEL_RELATION_OPTIONS
+        return tuple(loader(attr) for attr, _ in CHANNEL_RELATIONS.values())
+    
+    # id, created_at은 커서 키로 항상 로딩
+    columns = set(selection["columns"]) | {"id", "created_at"}
+    options = [load_only(*(getattr(Channel, name) for name in columns))]
+    for relation, relation_columns in selection["relations"].items():
+        attr, model = CHANNEL_RELATIONS[relation]
+        option = loader(attr)
+        if relation_columns:
+            option = option.load_only(*(getattr(model, name) for name in relation_columns))
+        options.append(option)
+    return tuple(options)
+
+
+def _json_value(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def _serialize_channel_fields(channel: Channel, selection: Dict[str, Any]) -> Dict[str, Any]:
+    """선택한 필드만 딕셔너리로 변환"""
+    data = {name: _json_value(getattr(channel, name)) for name in selection["columns"]}
+    for relation, relation_columns in selection["relations"].items():
+        related = getattr(channel, relation)
+        if related is None:
+            data[relation] = None
+        elif relation_columns:
+            data[relation] = {"id": str(related.id)}
+            data[relation].update({name: _json_value(getattr(related, name)) for name in relation_columns})
+        else:
+            data[relation] = related.to_dict()
+    return data
+
+
+def _serialize(channel: Channel, selection: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    if selection is None:
+        return _serialize_channel(channel)
+    return _serialize_channel_fields(channel, selection)
+
+
+def _serialize_channel(channel: Channel) -> Dict[str, Any]:
+    """채널 정보를 관계 정보와 함께 딕셔너리로 변환"""
+    return {
+        "id": str(channel.id),
+        "channel_name": channel.channel_name,
+        "guardian_id": str(channel.guardian_id),
+        "caregiver_id": str(channel.caregiver_id),
+        "senior_id": str(channel.senior_id),
+        "status": channel.status,
+        "start_date": channel.start_date.isoformat() if channel.start_date else None,
+        "end_date": channel.end_date.isoformat() if channel.end_date else None,
+        "created_at": channel.created_at.isoformat() if channel.created_at else None,
+        "updated_at": channel.updated_at.isoformat() if channel.updated_at else None,
+        
+        # 관계 정보
+        "guardian": channel.guardian.to_dict() if channel.guardian else None,
+        "caregiver": channel.caregiver.to_dict() if channel.caregiver else None,
+        "senior": channel.senior.to_dict() if channel.senior else None
+    }
+
+
+def _user_filter(user_id: UUID, user_type: str):
+    """사용자 유형별 채널 필터 조건 (유효하지 않은 유형이면 None)"""
+    if user_type == "guardian":
+        return Channel.guardian_id == user_id
+    if user_type == "caregiver":
+        return Channel.caregiver_id == user_id
+    return None
+
+
+def _channel_page_key(channel: Channel) -> tuple:
+    return (channel.created_at, channel.id)
+
+
+def _my_channels_statements(user_filter, cursor: Optional[str], size: int, selection: Optional[Dict[str, Any]] = None):
+    """내 채널 목록 페이지 조회 쿼리와 개수 조회 쿼리 생성"""
+    base_stmt = select(Channel).where(user_filter)
+    page_stmt = keyset_statement(
+        base_stmt.options(*_channel_load_options(selection)),
+        CHANNEL_PAGE_COLUMNS,
+        decode_cursor(cursor),
+        size
+    )
+    return page_stmt, capped_count_statement(base_stmt, settings.PAGINATION_COUNT_CAP)
+
+
+def _batch_statement(channel_ids: List[UUID], selection: Optional[Dict[str, Any]]):
+    """여러 채널을 IN 조건 한 번으로 조회 (관계는 selectin으로 관계별 한 번씩 로딩)"""
+    return select(Channel).options(
+        *_channel_load_options(selection, loader=selectinload)
+    ).where(Channel.id.in_(channel_ids))
+
+
+def _batch_result(channel_ids: List[UUID], channels: List[Channel], selection: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """요청한 ID 순서대로 결과 구성 (없는 ID는 not_found 항목)"""
+    found = {channel.id: channel for channel in channels}
+    return {
+        str(channel_id): (
+            {"status": "ok", "channel": _serialize(found[channel_id], selection)}
+            if channel_id in found else
+            {"status": "not_found", "channel": None}
+        )
+        for channel_id in channel_ids
+    }
+
 
 class ChannelService(BaseService):
     """채널 서비스"""
     
-    def get_my_channels(self, user_id: UUID, user_type: str) -> Dict[str, Any]:
+    def get_my_channels(
+        self,
+        user_id: UUID,
+        user_type: str,
+        cursor: Optional[str] = None,
+        size: int = settings.DEFAULT_PAGE_SIZE,
+        include_total: bool = False,
+        fields: Optional[str] = None,
+        include: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
-        사용자의 채널 목록 조회
+        사용자의 채널 목록 조회 (커서 페이지네이션)
         
         Args:
             user_id: 사용자 ID
             user_type: 사용자 유형 ('guardian' or 'caregiver')
-            
+            cursor: 이전 페이지의 next_cursor (선택사항)
+            size: 페이지 크기
+            include_total: 전체 개수 포함 여부 (PAGINATION_COUNT_CAP 초과 시 근사치)
+            fields: 응답에 포함할 필드 (선택사항, parse_field_selection 참고)
+            include: 응답에 포함할 관계 (선택사항)
+        
         Returns:
             Dict containing user's channels with detailed info
         """
         try:
-            # 사용자 유형에 따라 필터링
-            query = self.db.query(Channel).options(
-                joinedload(Channel.guardian),
-                joinedload(Channel.caregiver),
-                joinedload(Channel.senior)
-            )
+            selection = parse_field_selection(fields, include)
             
-            if user_type == "guardian":
-                channels = query.filter(Channel.guardian_id == user_id).all()
-            elif user_type == "caregiver":
-                channels = query.filter(Channel.caregiver_id == user_id).all()
-            else:
+            # 사용자 유형에 따라 필터링
+            user_filter = _user_filter(user_id, user_type)
+            if user_filter is None:
                 return self.create_error_response(
                     message="유효하지 않은 사용자 유형입니다.",
                     error_code="INVALID_USER_TYPE"
                 )
             
+            page_stmt, count_stmt = _my_channels_statements(user_filter, cursor, size, selection)
+            channels = self.db.execute(page_stmt).unique().scalars().all()
+            total = self.db.execute(count_stmt).scalar() if include_total else None
+            channels, pagination = build_page(
+                channels, size, _channel_page_key, total, settings.PAGINATION_COUNT_CAP
+            )
+            
             # 채널 정보를 딕셔너리로 변환
-            channels_data = []
-            for channel in channels:
-                channel_data = {
-                    "id": str(channel.id),
-                    "channel_name": channel.channel_name,
-                    "guardian_id": str(channel.guardian_id),
-                    "caregiver_id": str(channel.caregiver_id),
-                    "senior_id": str(channel.senior_id),
-                    "status": channel.status,
-                    "start_date": channel.start_date.isoformat() if channel.start_date else None,
-                    "end_date": channel.end_date.isoformat() if channel.end_date else None,
-                    "created_at": channel.created_at.isoformat() if channel.created_at else None,
-                    "updated_at": channel.updated_at.isoformat() if channel.updated_at else None,
-                    
-                    # 관계 정보
-                    "guardian": channel.guardian.to_dict() if channel.guardian else None,
-                    "caregiver": channel.caregiver.to_dict() if channel.caregiver else None,
-                    "senior": channel.senior.to_dict() if channel.senior else None
-                }
-                channels_data.append(channel_data)
+            channels_data = [_serialize(channel, selection) for channel in channels]
             
-            return self.create_response(
+            return self.create_page_response(
                 message=f"{len(channels_data)}개의 채널을 성공적으로 조회했습니다.",
-                data=channels_data
+                data=channels_data,
+                pagination=pagination
             )
-            
+        
+        except InvalidCursorError as e:
+            return self.create_error_response(message=str(e), error_code="INVALID_CURSOR")
+        except InvalidFieldSelectionError as e:
+            return self.create_error_response(message=str(e), error_code="INVALID_FIELDS")
         except SQLAlchemyError as e:
             return self.handle_db_error(e, "get my channels")
         except Exception as e:
@@ -83,21 +286,27 @@ class ChannelService(BaseService):
                 error_code="INTERNAL_ERROR"
             )
     
-    def get_channel_by_id(self, channel_id: UUID) -> Dict[str, Any]:
+    def get_channel_by_id(
+        self,
+        channel_id: UUID,
+        fields: Optional[str] = None,
+        include: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         채널 ID로 상세 정보 조회
         
         Args:
             channel_id: 채널 ID
-            
+            fields: 응답에 포함할 필드 (선택사항, parse_field_selection 참고)
+            include: 응답에 포함할 관계 (선택사항)
+        
         Returns:
             Dict containing channel detailed info
         """
         try:
+            selection = parse_field_selection(fields, include)
             channel = self.db.query(Channel).options(
-                joinedload(Channel.guardian),
-                joinedload(Channel.caregiver),
-                joinedload(Channel.senior)
+                *_channel_load_options(selection)
             ).filter(Channel.id == channel_id).first()
             
             if not channel:
@@ -106,29 +315,13 @@ class ChannelService(BaseService):
                     error_code="CHANNEL_NOT_FOUND"
                 )
             
-            channel_data = {
-                "id": str(channel.id),
-                "channel_name": channel.channel_name,
-                "guardian_id": str(channel.guardian_id),
-                "caregiver_id": str(channel.caregiver_id),
-                "senior_id": str(channel.senior_id),
-                "status": channel.status,
-                "start_date": channel.start_date.isoformat() if channel.start_date else None,
-                "end_date": channel.end_date.isoformat() if channel.end_date else None,
-                "created_at": channel.created_at.isoformat() if channel.created_at else None,
-                "updated_at": channel.updated_at.isoformat() if channel.updated_at else None,
-                
-                # 관계 정보
-                "guardian": channel.guardian.to_dict() if channel.guardian else None,
-                "caregiver": channel.caregiver.to_dict() if channel.caregiver else None,
-                "senior": channel.senior.to_dict() if channel.senior else None
-            }
-            
             return self.create_response(
                 message="채널 정보를 성공적으로 조회했습니다.",
-                data=channel_data
+                data=_serialize(channel, selection)
             )
-            
+        
+        except InvalidFieldSelectionError as e:
+            return self.create_error_response(message=str(e), error_code="INVALID_FIELDS")
         except SQLAlchemyError as e:
             return self.handle_db_error(e, "get channel by id")
         except Exception as e:
@@ -137,3 +330,232 @@ class ChannelService(BaseService):
                 message="서버 오류가 발생했습니다.",
                 error_code="INTERNAL_ERROR"
             )
+    
+    def get_channel_version(self, channel_id: UUID) -> Optional[str]:
+        """
+        채널 상세 응답의 버전 (ETag 계산용, 응답 본문을 구성하지 않음)
+        
+        Args:
+            channel_id: 채널 ID
+        
+        Returns:
+            버전 문자열 (채널이 없거나 조회 실패 시 None)
+        """
+        try:
+            return self.db.execute(CHANNEL_VERSION_SQL, {"channel_id": channel_id}).scalar()
+        except SQLAlchemyError as e:
+            logger.warning(f"Failed to load channel version: {str(e)}")
+            self.db.rollback()
+            return None
+    
+    def get_channels_by_ids(
+        self,
+        channel_ids: List[UUID],
+        fields: Optional[str] = None,
+        include: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        여러 채널 일괄 조회
+        
+        Args:
+            channel_ids: 채널 ID 목록 (중복은 제거)
+            fields: 응답에 포함할 필드 (선택사항, parse_field_selection 참고)
+            include: 응답에 포함할 관계 (선택사항)
+        
+        Returns:
+            Dict containing channels keyed by id (없는 채널은 not_found)
+        """
+        try:
+            selection = parse_field_selection(fields, include)
+            channel_ids = list(dict.fromkeys(channel_ids))
+            channels = self.db.execute(_batch_statement(channel_ids, selection)).scalars().all()
+            
+            data = _batch_result(channel_ids, channels, selection)
+            
+            return self.create_response(
+                message=f"{len(channels)}/{len(channel_ids)}개의 채널을 성공적으로 조회했습니다.",
+                data=data
+            )
+        
+        except InvalidFieldSelectionError as e:
+            return self.create_error_response(message=str(e), error_code="INVALID_FIELDS")
+        except SQLAlchemyError as e:
+            return self.handle_db_error(e, "get channels by ids")
+        except Exception as e:
+            logger.error(f"Unexpected error in get_channels_by_ids: {str(e)}")
+            return self.create_error_response(
+                message="서버 오류가 발생했습니다.",
+                error_code="INTERNAL_ERROR"
+            )
+
+
+class AsyncChannelService(AsyncBaseService):
+    """채널 서비스 (비동기)"""
+    
+    async def get_my_channels(
+        self,
+        user_id: UUID,
+        user_type: str,
+        cursor: Optional[str] = None,
+        size: int = settings.DEFAULT_PAGE_SIZE,
+        include_total: bool = False,
+        fields: Optional[str] = None,
+        include: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        사용자의 채널 목록 조회 (커서 페이지네이션)
+        
+        Args:
+            user_id: 사용자 ID
+            user_type: 사용자 유형 ('guardian' or 'caregiver')
+            cursor: 이전 페이지의 next_cursor (선택사항)
+            size: 페이지 크기
+            include_total: 전체 개수 포함 여부 (PAGINATION_COUNT_CAP 초과 시 근사치)
+            fields: 응답에 포함할 필드 (선택사항, parse_field_selection 참고)
+            include: 응답에 포함할 관계 (선택사항)
+        
+        Returns:
+            Dict containing user's channels with detailed info
+        """
+        try:
+            selection = parse_field_selection(fields, include)
+            
+            # 사용자 유형에 따라 필터링
+            user_filter = _user_filter(user_id, user_type)
+            if user_filter is None:
+                return self.create_error_response(
+                    message="유효하지 않은 사용자 유형입니다.",
+                    error_code="INVALID_USER_TYPE"
+                )
+            
+            page_stmt, count_stmt = _my_channels_statements(user_filter, cursor, size, selection)
+            channels = (await self.db.execute(page_stmt)).unique().scalars().all()
+            total = (await self.db.execute(count_stmt)).scalar() if include_total else None
+            channels, pagination = build_page(
+                channels, size, _channel_page_key, total, settings.PAGINATION_COUNT_CAP
+            )
+            
+            # 채널 정보를 딕셔너리로 변환
+            channels_data = [_serialize(channel, selection) for channel in channels]
+            
+            return self.create_page_response(
+                message=f"{len(channels_data)}개의 채널을 성공적으로 조회했습니다.",
+                data=channels_data,
+                pagination=pagination
+            )
+        
+        except InvalidCursorError as e:
+            return self.create_error_response(message=str(e), error_code="INVALID_CURSOR")
+        except InvalidFieldSelectionError as e:
+            return self.create_error_response(message=str(e), error_code="INVALID_FIELDS")
+        except SQLAlchemyError as e:
+            return await self.handle_db_error(e, "get my channels")
+        except Exception as e:
+            logger.error(f"Unexpected error in get_my_channels: {str(e)}")
+            return self.create_error_response(
+                message="서버 오류가 발생했습니다.",
+                error_code="INTERNAL_ERROR"
+            )
+    
+    async def get_channel_by_id(
+        self,
+        channel_id: UUID,
+        fields: Optional[str] = None,
+        include: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        채널 ID로 상세 정보 조회
+        
+        Args:
+            channel_id: 채널 ID
+            fields: 응답에 포함할 필드 (선택사항, parse_field_selection 참고)
+            include: 응답에 포함할 관계 (선택사항)
+        
+        Returns:
+            Dict containing channel detailed info
+        """
+        try:
+            selection = parse_field_selection(fields, include)
+            result = await self.db.execute(
+                select(Channel).options(*_channel_load_options(selection)).where(Channel.id == channel_id)
+            )
+            channel = result.unique().scalar_one_or_none()
+            
+            if not channel:
+                return self.create_error_response(
+                    message="채널을 찾을 수 없습니다.",
+                    error_code="CHANNEL_NOT_FOUND"
+                )
+            
+            return self.create_response(
+                message="채널 정보를 성공적으로 조회했습니다.",
+                data=_serialize(channel, selection)
+            )
+        
+        except InvalidFieldSelectionError as e:
+            return self.create_error_response(message=str(e), error_code="INVALID_FIELDS")
+        except SQLAlchemyError as e:
+            return await self.handle_db_error(e, "get channel by id")
+        except Exception as e:
+            logger.error(f"Unexpected error in get_channel_by_id: {str(e)}")
+            return self.create_error_response(
+                message="서버 오류가 발생했습니다.",
+                error_code="INTERNAL_ERROR"
+            )
+    
+    async def get_channel_version(self, channel_id: UUID) -> Optional[str]:
+        """
+        채널 상세 응답의 버전 (ETag 계산용, 응답 본문을 구성하지 않음)
+        
+        Args:
+            channel_id: 채널 ID
+        
+        Returns:
+            버전 문자열 (채널이 없거나 조회 실패 시 None)
+        """
+        try:
+            return (await self.db.execute(CHANNEL_VERSION_SQL, {"channel_id": channel_id})).scalar()
+        except SQLAlchemyError as e:
+            logger.warning(f"Failed to load channel version: {str(e)}")
+            await self.db.rollback()
+            return None
+    
+    async def get_channels_by_ids(
+        self,
+        channel_ids: List[UUID],
+        fields: Optional[str] = None,
+        include: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        여러 채널 일괄 조회
+        
+        Args:
+            channel_ids: 채널 ID 목록 (중복은 제거)
+            fields: 응답에 포함할 필드 (선택사항, parse_field_selection 참고)
+            include: 응답에 포함할 관계 (선택사항)
+        
+        Returns:
+            Dict containing channels keyed by id (없는 채널은 not_found)
+        """
+        try:
+            selection = parse_field_selection(fields, include)
+            channel_ids = list(dict.fromkeys(channel_ids))
+            channels = (await self.db.execute(_batch_statement(channel_ids, selection))).scalars().all()
+            
+            data = _batch_result(channel_ids, channels, selection)
+            
+            return self.create_response(
+                message=f"{len(channels)}/{len(channel_ids)}개의 채널을 성공적으로 조회했습니다.",
+                data=data
+            )
+        
+        except InvalidFieldSelectionError as e:
+            return self.create_error_response(message=str(e), error_code="INVALID_FIELDS")
+        except SQLAlchemyError as e:
+            return await self.handle_db_error(e, "get channels by ids")
+        except Exception as e:
+            logger.error(f"Unexpected error in get_channels_by_ids: {str(e)}")
+            return self.create_error_response(
+                message="서버 오류가 발생했습니다.",
+                error_code="INTERNAL_ERROR"
+            )
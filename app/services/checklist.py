@@ -3,6 +3,7 @@ Checklist Service for Sinabro API
 체크리스트 템플릿 관련 비즈니스 로직
 """
 
+from sqlalchemy import select, text
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 from typing import Optional, List, Dict, Any
@@ -10,71 +11,129 @@ from uuid import UUID
 import logging
 import json
 
+from ..config import settings
 from ..models import ChecklistTemplate
-from .base import BaseService
+from .base import BaseService, AsyncBaseService
+from .pagination import (
+    InvalidCursorError,
+    decode_cursor,
+    keyset_statement,
+    capped_count_statement,
+    build_page
+)
 
 logger = logging.getLogger(__name__)
 
+# 템플릿 테이블 내용이 바뀌면 달라지는 버전 스탬프 (카탈로그 갱신 및 ETag 계산용)
+VERSION_STAMP_SQL = text("""
+    SELECT md5(COALESCE(string_agg(
+        id::text || ':' || name || ':' || category || ':' ||
+        COALESCE(is_default::text, '') || ':' || md5(items::text),
+        ',' ORDER BY id
+    ), ''))
+    FROM checklist_templates
+""")
+
+# 템플릿 목록 커서 정렬 키 (생성일 역순, 동일 시각은 ID 역순)
+TEMPLATE_PAGE_COLUMNS = (ChecklistTemplate.created_at, ChecklistTemplate.id)
+
+
+def _parse_template_items(template: ChecklistTemplate) -> List[Dict[str, Any]]:
+    """JSON 형태의 템플릿 항목 파싱"""
+    if not template.items:
+        return []
+    
+    try:
+        items_data = json.loads(template.items) if isinstance(template.items, str) else template.items
+        if isinstance(items_data, dict) and "items" in items_data:
+            return items_data["items"]
+        if isinstance(items_data, list):
+            return items_data
+    except (json.JSONDecodeError, TypeError) as e:
+        logger.warning(f"Failed to parse items for template {template.id}: {str(e)}")
+    return []
+
+
+def _serialize_template(template: ChecklistTemplate) -> Dict[str, Any]:
+    """템플릿 정보를 딕셔너리로 변환"""
+    return {
+        "id": str(template.id),
+        "name": template.name,
+        "category": template.category,
+        "items": _parse_template_items(template),
+        "is_active": template.is_default,
+        "created_at": template.created_at.isoformat() if template.created_at else None
+    }
+
+
+def _templates_statement(category: Optional[str] = None, is_active: Optional[bool] = True):
+    """템플릿 목록 조회 쿼리 생성"""
+    stmt = select(ChecklistTemplate)
+    
+    # 활성 상태 필터링
+    if is_active is not None:
+        stmt = stmt.where(ChecklistTemplate.is_default == is_active)
+    
+    # 카테고리 필터링
+    if category:
+        stmt = stmt.where(ChecklistTemplate.category == category)
+    
+    # 생성일 순으로 정렬
+    return stmt.order_by(ChecklistTemplate.created_at.desc(), ChecklistTemplate.id.desc())
+
+
+def _template_page_key(template: ChecklistTemplate) -> tuple:
+    return (template.created_at, template.id)
+
 
 class ChecklistService(BaseService):
     """체크리스트 서비스"""
     
-    def get_all_templates(self, category: Optional[str] = None, is_active: bool = True) -> Dict[str, Any]:
+    def get_all_templates(
+        self,
+        category: Optional[str] = None,
+        is_active: bool = True,
+        cursor: Optional[str] = None,
+        size: int = settings.DEFAULT_PAGE_SIZE,
+        include_total: bool = False
+    ) -> Dict[str, Any]:
         """
-        체크리스트 템플릿 목록 조회
+        체크리스트 템플릿 목록 조회 (커서 페이지네이션)
         
         Args:
             category: 카테고리 필터 (선택사항)
             is_active: 활성 상태 필터
-            
+            cursor: 이전 페이지의 next_cursor (선택사항)
+            size: 페이지 크기
+            include_total: 전체 개수 포함 여부
+        
         Returns:
             Dict containing list of checklist templates
         """
         try:
-            query = self.db.query(ChecklistTemplate)
-            
-            # 활성 상태 필터링
-            if is_active is not None:
-                query = query.filter(ChecklistTemplate.is_active == is_active)
-            
-            # 카테고리 필터링
-            if category:
-                query = query.filter(ChecklistTemplate.category == category)
-            
-            # 생성일 순으로 정렬
-            templates = query.order_by(ChecklistTemplate.created_at.desc()).all()
+            base_stmt = _templates_statement(category, is_active)
+            page_stmt = keyset_statement(base_stmt, TEMPLATE_PAGE_COLUMNS, decode_cursor(cursor), size)
+            templates = self.db.execute(page_stmt).scalars().all()
+            total = None
+            if include_total:
+                total = self.db.execute(
+                    capped_count_statement(base_stmt, settings.PAGINATION_COUNT_CAP)
+                ).scalar()
+            templates, pagination = build_page(
+                templates, size, _template_page_key, total, settings.PAGINATION_COUNT_CAP
+            )
             
             # 템플릿 정보를 딕셔너리로 변환
-            templates_data = []
-            for template in templates:
-                # JSON 형태의 template_items 파싱
-                items = []
-                if template.template_items:
-                    try:
-                        items_data = json.loads(template.template_items) if isinstance(template.template_items, str) else template.template_items
-                        if isinstance(items_data, dict) and "items" in items_data:
-                            items = items_data["items"]
-                        elif isinstance(items_data, list):
-                            items = items_data
-                    except (json.JSONDecodeError, TypeError) as e:
-                        logger.warning(f"Failed to parse template_items for template {template.id}: {str(e)}")
-                        items = []
-                
-                template_data = {
-                    "id": str(template.id),
-                    "name": template.name,
-                    "category": template.category,
-                    "items": items,
-                    "is_active": template.is_active,
-                    "created_at": template.created_at.isoformat() if template.created_at else None
-                }
-                templates_data.append(template_data)
+            templates_data = [_serialize_template(template) for template in templates]
             
-            return self.create_response(
+            return self.create_page_response(
                 message=f"{len(templates_data)}개의 체크리스트 템플릿을 성공적으로 조회했습니다.",
-                data=templates_data
+                data=templates_data,
+                pagination=pagination
             )
-            
+        
+        except InvalidCursorError as e:
+            return self.create_error_response(message=str(e), error_code="INVALID_CURSOR")
         except SQLAlchemyError as e:
             return self.handle_db_error(e, "get all templates")
         except Exception as e:
@@ -90,7 +149,7 @@ class ChecklistService(BaseService):
         
         Args:
             template_id: 템플릿 ID
-            
+        
         Returns:
             Dict containing template detailed info
         """
@@ -105,33 +164,11 @@ class ChecklistService(BaseService):
                     error_code="TEMPLATE_NOT_FOUND"
                 )
             
-            # JSON 형태의 template_items 파싱
-            items = []
-            if template.template_items:
-                try:
-                    items_data = json.loads(template.template_items) if isinstance(template.template_items, str) else template.template_items
-                    if isinstance(items_data, dict) and "items" in items_data:
-                        items = items_data["items"]
-                    elif isinstance(items_data, list):
-                        items = items_data
-                except (json.JSONDecodeError, TypeError) as e:
-                    logger.warning(f"Failed to parse template_items for template {template.id}: {str(e)}")
-                    items = []
-            
-            template_data = {
-                "id": str(template.id),
-                "name": template.name,
-                "category": template.category,
-                "items": items,
-                "is_active": template.is_active,
-                "created_at": template.created_at.isoformat() if template.created_at else None
-            }
-            
             return self.create_response(
                 message="체크리스트 템플릿을 성공적으로 조회했습니다.",
-                data=template_data
+                data=_serialize_template(template)
             )
-            
+        
         except SQLAlchemyError as e:
             return self.handle_db_error(e, "get template by id")
         except Exception as e:
@@ -141,14 +178,147 @@ class ChecklistService(BaseService):
                 error_code="INTERNAL_ERROR"
             )
     
-    def get_templates_by_category(self, category: str) -> Dict[str, Any]:
+    def get_templates_by_category(self, category: str, **page_params) -> Dict[str, Any]:
         """
         카테고리별 체크리스트 템플릿 조회
         
         Args:
             category: 카테고리명
+            page_params: cursor, size, include_total
+        
+        Returns:
+            Dict containing templates for the category
+        """
+        return self.get_all_templates(category=category, is_active=True, **page_params)
+    
+    def get_templates_version(self) -> Optional[str]:
+        """
+        템플릿 목록 버전 스탬프 (ETag 계산용, 응답 본문을 구성하지 않음)
+        
+        Returns:
+            버전 문자열 (조회 실패 시 None)
+        """
+        try:
+            return self.db.execute(VERSION_STAMP_SQL).scalar()
+        except SQLAlchemyError as e:
+            logger.warning(f"Failed to load template version: {str(e)}")
+            self.db.rollback()
+            return None
+
+
+class AsyncChecklistService(AsyncBaseService):
+    """체크리스트 서비스 (비동기)"""
+    
+    async def get_all_templates(
+        self,
+        category: Optional[str] = None,
+        is_active: bool = True,
+        cursor: Optional[str] = None,
+        size: int = settings.DEFAULT_PAGE_SIZE,
+        include_total: bool = False
+    ) -> Dict[str, Any]:
+        """
+        체크리스트 템플릿 목록 조회 (커서 페이지네이션)
+        
+        Args:
+            category: 카테고리 필터 (선택사항)
+            is_active: 활성 상태 필터
+            cursor: 이전 페이지의 next_cursor (선택사항)
+            size: 페이지 크기
+            include_total: 전체 개수 포함 여부
+        
+        Returns:
+            Dict containing list of checklist templates
+        """
+        try:
+            base_stmt = _templates_statement(category, is_active)
+            page_stmt = keyset_statement(base_stmt, TEMPLATE_PAGE_COLUMNS, decode_cursor(cursor), size)
+            templates = (await self.db.execute(page_stmt)).scalars().all()
+            total = None
+            if include_total:
+                total = (await self.db.execute(
+                    capped_count_statement(base_stmt, settings.PAGINATION_COUNT_CAP)
+                )).scalar()
+            templates, pagination = build_page(
+                templates, size, _template_page_key, total, settings.PAGINATION_COUNT_CAP
+            )
             
+            # 템플릿 정보를 딕셔너리로 변환
+            templates_data = [_serialize_template(template) for template in templates]
+            
+            return self.create_page_response(
+                message=f"{len(templates_data)}개의 체크리스트 템플릿을 성공적으로 조회했습니다.",
+                data=templates_data,
+                pagination=pagination
+            )
+        
+        except InvalidCursorError as e:
+            return self.create_error_response(message=str(e), error_code="INVALID_CURSOR")
+        except SQLAlchemyError as e:
+            return await self.handle_db_error(e, "get all templates")
+        except Exception as e:
+            logger.error(f"Unexpected error in get_all_templates: {str(e)}")
+            return self.create_error_response(
+                message="서버 오류가 발생했습니다.",
+                error_code="INTERNAL_ERROR"
+            )
+    
+    async def get_template_by_id(self, template_id: UUID) -> Dict[str, Any]:
+        """
+        체크리스트 템플릿 ID로 상세 정보 조회
+        
+        Args:
+            template_id: 템플릿 ID
+        
+        Returns:
+            Dict containing template detailed info
+        """
+        try:
+            template = await self.db.get(ChecklistTemplate, template_id)
+            
+            if not template:
+                return self.create_error_response(
+                    message="체크리스트 템플릿을 찾을 수 없습니다.",
+                    error_code="TEMPLATE_NOT_FOUND"
+                )
+            
+            return self.create_response(
+                message="체크리스트 템플릿을 성공적으로 조회했습니다.",
+                data=_serialize_template(template)
+            )
+        
+        except SQLAlchemyError as e:
+            return await self.handle_db_error(e, "get template by id")
+        except Exception as e:
+            logger.error(f"Unexpected error in get_template_by_id: {str(e)}")
+            return self.create_error_response(
+                message="서버 오류가 발생했습니다.",
+                error_code="INTERNAL_ERROR"
+            )
+    
+    async def get_templates_by_category(self, category: str, **page_params) -> Dict[str, Any]:
+        """
+        카테고리별 체크리스트 템플릿 조회
+        
+        Args:
+            category: 카테고리명
+            page_params: cursor, size, include_total
+        
         Returns:
             Dict containing templates for the category
         """
-        return self.get_all_templates(category=category, is_active=True)
+        return await self.get_all_templates(category=category, is_active=True, **page_params)
+    
+    async def get_templates_version(self) -> Optional[str]:
+        """
+        템플릿 목록 버전 스탬프 (ETag 계산용, 응답 본문을 구성하지 않음)
+        
+        Returns:
+            버전 문자열 (조회 실패 시 None)
+        """
+        try:
+            return (await self.db.execute(VERSION_STAMP_SQL)).scalar()
+        except SQLAlchemyError as e:
+            logger.warning(f"Failed to load template version: {str(e)}")
+            await self.db.rollback()
+            return None
@@ -0,0 +1,258 @@
+"""
+Checklist Template Catalog for Sinabro API
+체크리스트 템플릿 메모리 카탈로그 (시작 시 로딩, 버전 스탬프로 갱신)
+"""
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from pydantic import ValidationError
+from datetime import datetime, timezone
+from typing import Optional, List, Dict, Any
+from uuid import UUID
+import asyncio
+import logging
+
+from ..config import settings
+from ..database import SessionLocal, AsyncSessionLocal
+from ..models import ChecklistTemplate
+from ..schemas import ChecklistItem
+from .base import BaseService
+from .checklist import VERSION_STAMP_SQL, _parse_template_items
+from .pagination import InvalidCursorError, decode_cursor, paginate_sequence
+
+logger = logging.getLogger(__name__)
+
+
+def _catalog_page_key(entry: Dict[str, Any]) -> tuple:
+    """DB 조회와 동일한 (생성일, ID) 커서 키 (ISO 문자열 비교)"""
+    return (entry["created_at"] or "", entry["id"])
+
+
+def validated_items(template: ChecklistTemplate) -> List[ChecklistItem]:
+    """템플릿 JSONB 항목을 ChecklistItem으로 검증 (잘못된 항목은 경고 후 제외)"""
+    items = []
+    for raw_item in _parse_template_items(template):
+        try:
+            items.append(ChecklistItem.model_validate(raw_item))
+        except ValidationError as e:
+            logger.warning(f"Invalid checklist item in template {template.id}: {e}")
+    return items
+
+
+class ChecklistTemplateCatalog:
+    """
+    체크리스트 템플릿 카탈로그
+    파싱/검증된 ChecklistItem을 ID와 카테고리로 색인하여 메모리에 보관
+    """
+    
+    def __init__(self):
+        self.version: Optional[str] = None
+        self.loaded_at: Optional[datetime] = None
+        self._ordered: List[Dict[str, Any]] = []
+        self._by_id: Dict[str, Dict[str, Any]] = {}
+        self._by_category: Dict[str, List[Dict[str, Any]]] = {}
+        self._items: Dict[str, Dict[int, ChecklistItem]] = {}
+        self._task: Optional[asyncio.Task] = None
+    
+    @property
+    def is_loaded(self) -> bool:
+        """카탈로그 로딩 여부"""
+        return self.version is not None
+    
+    def _build(self, templates: List[ChecklistTemplate]) -> None:
+        """템플릿 행을 파싱/검증하여 색인 구성 후 한 번에 교체"""
+        ordered, by_id, by_category, items_index = [], {}, {}, {}
+        
+        for template in templates:
+            items = validated_items(template)
+            template_id = str(template.id)
+            entry = {
+                "id": template_id,
+                "name": template.name,
+                "category": template.category,
+                "items": [item.model_dump() for item in items],
+                "is_active": template.is_default,
+                "created_at": template.created_at.isoformat() if template.created_at else None
+            }
+            ordered.append(entry)
+            by_id[template_id] = entry
+            by_category.setdefault(template.category, []).append(entry)
+            items_index[template_id] = {item.id: item for item in items}
+        
+        self._ordered, self._by_id, self._by_category, self._items = ordered, by_id, by_category, items_index
+    
+    def _refresh(self, db: Session, force: bool = False) -> bool:
+        """버전 스탬프가 바뀐 경우에만 템플릿 재로딩 (동기 세션)"""
+        version = db.execute(VERSION_STAMP_SQL).scalar()
+        if not force and version == self.version:
+            return False
+        
+        templates = db.execute(
+            select(ChecklistTemplate).order_by(
+                ChecklistTemplate.created_at.desc(), ChecklistTemplate.id.desc()
+            )
+        ).scalars().all()
+        self._build(templates)
+        self.version = version
+        self.loaded_at = datetime.now(timezone.utc)
+        logger.info(f"Checklist template catalog loaded: {len(templates)} templates (version {version[:8]})")
+        return True
+    
+    def _refresh_with_session(self, force: bool) -> bool:
+        db = SessionLocal()
+        try:
+            return self._refresh(db, force)
+        finally:
+            db.close()
+    
+    async def refresh(self, force: bool = False) -> bool:
+        """
+        카탈로그 갱신
+        
+        Args:
+            force: 버전 스탬프와 관계없이 재로딩
+        
+        Returns:
+            재로딩 여부
+        """
+        if settings.DB_ASYNC_MODE:
+            async with AsyncSessionLocal() as db:
+                return await db.run_sync(self._refresh, force)
+        return await asyncio.to_thread(self._refresh_with_session, force)
+    
+    async def _refresh_loop(self) -> None:
+        while True:
+            await asyncio.sleep(settings.CHECKLIST_CATALOG_REFRESH_SECONDS)
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.error(f"Checklist template catalog refresh failed: {e}")
+    
+    def start(self) -> None:
+        """백그라운드 갱신 작업 시작"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._refresh_loop())
+    
+    async def stop(self) -> None:
+        """백그라운드 갱신 작업 종료"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+    
+    def list_templates(self, category: Optional[str] = None, is_active: Optional[bool] = True) -> List[Dict[str, Any]]:
+        """템플릿 목록 (생성일 역순)"""
+        templates = self._by_category.get(category, []) if category else self._ordered
+        if is_active is None:
+            return list(templates)
+        return [template for template in templates if template["is_active"] == is_active]
+    
+    def get_template(self, template_id: Any) -> Optional[Dict[str, Any]]:
+        """템플릿 ID로 조회"""
+        return self._by_id.get(str(template_id))
+    
+    def get_items(self, template_id: Any) -> Dict[int, ChecklistItem]:
+        """템플릿의 검증된 항목 (항목 ID로 색인)"""
+        return self._items.get(str(template_id), {})
+    
+    def get_stats(self) -> dict:
+        """카탈로그 상태"""
+        return {
+            "loaded": self.is_loaded,
+            "version": self.version,
+            "loaded_at": self.loaded_at.isoformat() if self.loaded_at else None,
+            "template_count": len(self._ordered),
+            "categories": sorted(self._by_category)
+        }
+
+
+class CatalogChecklistService(BaseService):
+    """체크리스트 서비스 (메모리 카탈로그 기반, DB 조회 없음)"""
+    
+    def __init__(self, catalog: ChecklistTemplateCatalog):
+        super().__init__(db=None)
+        self.catalog = catalog
+    
+    async def get_all_templates(
+        self,
+        category: Optional[str] = None,
+        is_active: bool = True,
+        cursor: Optional[str] = None,
+        size: int = settings.DEFAULT_PAGE_SIZE,
+        include_total: bool = False
+    ) -> Dict[str, Any]:
+        """
+        체크리스트 템플릿 목록 조회 (커서 페이지네이션)
+        
+        Args:
+            category: 카테고리 필터 (선택사항)
+            is_active: 활성 상태 필터
+            cursor: 이전 페이지의 next_cursor (선택사항)
+            size: 페이지 크기
+            include_total: 전체 개수 포함 여부
+        
+        Returns:
+            Dict containing list of checklist templates
+        """
+        try:
+            templates_data, pagination = paginate_sequence(
+                self.catalog.list_templates(category=category, is_active=is_active),
+                _catalog_page_key,
+                decode_cursor(cursor),
+                size,
+                include_total
+            )
+        except InvalidCursorError as e:
+            return self.create_error_response(message=str(e), error_code="INVALID_CURSOR")
+        
+        return self.create_page_response(
+            message=f"{len(templates_data)}개의 체크리스트 템플릿을 성공적으로 조회했습니다.",
+            data=templates_data,
+            pagination=pagination
+        )
+    
+    async def get_template_by_id(self, template_id: UUID) -> Dict[str, Any]:
+        """
+        체크리스트 템플릿 ID로 상세 정보 조회
+        
+        Args:
+            template_id: 템플릿 ID
+        
+        Returns:
+            Dict containing template detailed info
+        """
+        template = self.catalog.get_template(template_id)
+        if not template:
+            return self.create_error_response(
+                message="체크리스트 템플릿을 찾을 수 없습니다.",
+                error_code="TEMPLATE_NOT_FOUND"
+            )
+        
+        return self.create_response(
+            message="체크리스트 템플릿을 성공적으로 조회했습니다.",
+            data=template
+        )
+    
+    async def get_templates_by_category(self, category: str, **page_params) -> Dict[str, Any]:
+        """
+        카테고리별 체크리스트 템플릿 조회
+        
+        Args:
+            category: 카테고리명
+            page_params: cursor, size, include_total
+        
+        Returns:
+            Dict containing templates for the category
+        """
+        return await self.get_all_templates(category=category, is_active=True, **page_params)
+    
+    async def get_templates_version(self) -> Optional[str]:
+        """템플릿 목록 버전 스탬프 (로딩된 카탈로그 버전, DB 조회 없음)"""
+        return self.catalog.version
+
+
+# 글로벌 템플릿 카탈로그 인스턴스
+checklist_catalog = ChecklistTemplateCatalog()
@@ -0,0 +1,269 @@
+"""
+Checklist Ingest Service for Sinabro API
+일일 체크리스트 일괄 제출 (카탈로그 기반 검증, 배치 단위 완료율 계산, 단일 INSERT, 클라이언트 ID로 재전송 중복 방지)
+"""
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import SQLAlchemyError
+from datetime import date
+from itertools import accumulate
+from typing import Optional, List, Dict, Any, Iterable, Sequence, Tuple
+from uuid import UUID
+import logging
+import uuid
+
+from ..models import Channel, Caregiver, ChecklistTemplate, DailyChecklist
+from ..schemas import ChecklistItem, DailyChecklistSubmission
+from .base import BaseService, AsyncBaseService
+from .checklist_catalog import ChecklistTemplateCatalog, checklist_catalog, validated_items
+
+logger = logging.getLogger(__name__)
+
+
+def compute_completion_rates(item_lists: Sequence[Sequence[Dict[str, Any]]]) -> List[float]:
+    """
+    배치 전체의 완료율을 한 번에 계산 (DailyChecklist.calculate_completion_rate와 동일한 값)
+    
+    모든 행의 체크 여부를 하나의 누적합으로 펼친 뒤 행 경계 구간의 차이로
+    체크 수를 구하므로 행마다 항목 목록을 다시 순회하지 않음.
+    
+    Args:
+        item_lists: 행별 항목 목록 ({"id", "checked", ...})
+    
+    Returns:
+        행 순서대로의 완료율 (항목이 없으면 0.0)
+    """
+    checked = list(accumulate((bool(item.get("checked", False)) for items in item_lists for item in items), initial=0))
+    bounds = list(accumulate((len(items) for items in item_lists), initial=0))
+    return [
+        round((checked[end] - checked[start]) / (end - start) * 100, 2) if end > start else 0.0
+        for start, end in zip(bounds, bounds[1:])
+    ]
+
+
+def _catalog_template_items(
+    catalog: ChecklistTemplateCatalog,
+    template_ids: Iterable[UUID]
+) -> Tuple[Dict[UUID, Dict[int, ChecklistItem]], List[UUID]]:
+    """카탈로그에서 템플릿 항목 조회 (카탈로그에 없는 ID는 DB 조회 대상으로 반환)"""
+    found, missing = {}, []
+    for template_id in template_ids:
+        if catalog.get_template(template_id) is not None:
+            found[template_id] = catalog.get_items(template_id)
+        else:
+            missing.append(template_id)
+    return found, missing
+
+
+def _template_item_index(templates: Iterable[ChecklistTemplate]) -> Dict[UUID, Dict[int, ChecklistItem]]:
+    """DB에서 조회한 템플릿을 카탈로그와 같은 형태로 색인"""
+    return {template.id: {item.id: item for item in validated_items(template)} for template in templates}
+
+
+def _reject(index: int, error_code: str, message: str) -> Dict[str, Any]:
+    return {"index": index, "status": "rejected", "error_code": error_code, "message": message}
+
+
+def _prepare_batch(
+    submissions: Sequence[DailyChecklistSubmission],
+    template_items: Dict[UUID, Dict[int, ChecklistItem]],
+    channel_ids: set,
+    creator_ids: set
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    제출 목록을 검증하고 INSERT 행 구성
+    
+    Returns:
+        (요청 순서대로의 행별 결과, INSERT할 행 목록)
+    """
+    results: List[Optional[Dict[str, Any]]] = []
+    accepted: List[Tuple[int, Dict[str, Any]]] = []
+    today = date.today()
+    
+    for index, submission in enumerate(submissions):
+        items = template_items.get(submission.template_id)
+        item_ids = [entry.id for entry in submission.checked_items]
+        
+        if submission.channel_id not in channel_ids:
+            results.append(_reject(index, "CHANNEL_NOT_FOUND", "채널을 찾을 수 없습니다."))
+        elif items is None:
+            results.append(_reject(index, "TEMPLATE_NOT_FOUND", "체크리스트 템플릿을 찾을 수 없습니다."))
+        elif submission.created_by is not None and submission.created_by not in creator_ids:
+            results.append(_reject(index, "CREATOR_NOT_FOUND", "작성자를 찾을 수 없습니다."))
+        elif len(set(item_ids)) != len(item_ids):
+            results.append(_reject(index, "DUPLICATE_ITEMS", "중복된 항목 ID가 있습니다."))
+        elif any(item_id not in items for item_id in item_ids):
+            unknown = sorted(item_id for item_id in item_ids if item_id not in items)
+            results.append(_reject(index, "UNKNOWN_ITEMS", f"템플릿에 없는 항목 ID입니다: {unknown}"))
+        else:
+            results.append(None)
+            accepted.append((index, {
+                "id": submission.id or uuid.uuid4(),
+                "channel_id": submission.channel_id,
+                "template_id": submission.template_id,
+                "checked_items": {"items": [entry.model_dump() for entry in submission.checked_items]},
+                "additional_notes": submission.additional_notes,
+                "created_date": submission.created_date or today,
+                "created_by": submission.created_by
+            }))
+    
+    rates = compute_completion_rates([row["checked_items"]["items"] for _, row in accepted])
+    rows = []
+    for (index, row), rate in zip(accepted, rates):
+        row["completion_rate"] = rate
+        rows.append(row)
+        results[index] = {"index": index, "status": "created", "id": str(row["id"]), "completion_rate": rate}
+    
+    return results, rows
+
+
+def _lookup_ids(submissions: Sequence[DailyChecklistSubmission]) -> Tuple[List[UUID], List[UUID], List[UUID]]:
+    """배치에서 참조하는 (채널, 템플릿, 작성자) ID 목록"""
+    channel_ids = sorted({submission.channel_id for submission in submissions})
+    template_ids = sorted({submission.template_id for submission in submissions})
+    creator_ids = sorted({submission.created_by for submission in submissions if submission.created_by is not None})
+    return channel_ids, template_ids, creator_ids
+
+
+def _insert_statement(rows: List[Dict[str, Any]]):
+    """다중 행 INSERT (이미 저장된 ID는 건너뛰고 새로 저장된 ID만 반환)"""
+    return insert(DailyChecklist).values(rows).on_conflict_do_nothing(index_elements=["id"]).returning(DailyChecklist.id)
+
+
+def _mark_duplicates(results: List[Dict[str, Any]], inserted: set) -> None:
+    """재전송 등으로 이미 저장되어 있던 행(같은 요청 안의 반복 포함)을 duplicate로 표시"""
+    created = set()
+    for result in results:
+        if result["status"] != "created":
+            continue
+        checklist_id = UUID(result["id"])
+        if checklist_id in inserted and checklist_id not in created:
+            created.add(checklist_id)
+        else:
+            # 저장된 완료율은 이전 제출 기준이므로 이번 계산값은 제외
+            result["status"] = "duplicate"
+            result.pop("completion_rate")
+
+
+def _bulk_response_data(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    counts = {status: sum(1 for result in results if result["status"] == status) for status in ("created", "duplicate", "rejected")}
+    return {
+        "created_count": counts["created"],
+        "duplicate_count": counts["duplicate"],
+        "rejected_count": counts["rejected"],
+        "results": results
+    }
+
+
+class ChecklistIngestService(BaseService):
+    """일일 체크리스트 일괄 제출 서비스"""
+    
+    def __init__(self, db, catalog: ChecklistTemplateCatalog = checklist_catalog):
+        super().__init__(db)
+        self.catalog = catalog
+    
+    def submit_daily_checklists(self, submissions: Sequence[DailyChecklistSubmission]) -> Dict[str, Any]:
+        """
+        일일 체크리스트 일괄 제출
+        
+        템플릿 항목은 카탈로그에서 검증하고(카탈로그에 없는 템플릿만 DB 조회),
+        채널/작성자 존재 여부는 IN 조회 한 번씩으로 확인한 뒤
+        유효한 행을 다중 행 INSERT 한 번으로 저장합니다.
+        클라이언트가 보낸 ID가 이미 저장되어 있으면(오프라인 재전송) 다시 저장하지 않습니다.
+        
+        Args:
+            submissions: 제출할 체크리스트 목록
+        
+        Returns:
+            Dict containing per-row results in request order
+        """
+        try:
+            channel_ids, template_ids, creator_ids = _lookup_ids(submissions)
+            
+            template_items, missing = _catalog_template_items(self.catalog, template_ids)
+            if missing:
+                templates = self.db.execute(
+                    select(ChecklistTemplate).where(ChecklistTemplate.id.in_(missing))
+                ).scalars().all()
+                template_items.update(_template_item_index(templates))
+            
+            channels = set(self.db.execute(select(Channel.id).where(Channel.id.in_(channel_ids))).scalars())
+            creators = set(
+                self.db.execute(select(Caregiver.id).where(Caregiver.id.in_(creator_ids))).scalars()
+            ) if creator_ids else set()
+            
+            results, rows = _prepare_batch(submissions, template_items, channels, creators)
+            inserted = set()
+            if rows:
+                inserted = set(self.db.execute(_insert_statement(rows)).scalars())
+                self.db.commit()
+            _mark_duplicates(results, inserted)
+            
+            return self.create_response(
+                message=f"{len(inserted)}/{len(submissions)}개의 체크리스트를 저장했습니다.",
+                data=_bulk_response_data(results)
+            )
+        
+        except SQLAlchemyError as e:
+            return self.handle_db_error(e, "submit daily checklists")
+        except Exception as e:
+            logger.error(f"Unexpected error in submit_daily_checklists: {str(e)}")
+            return self.create_error_response(
+                message="서버 오류가 발생했습니다.",
+                error_code="INTERNAL_ERROR"
+            )
+
+
+class AsyncChecklistIngestService(AsyncBaseService):
+    """일일 체크리스트 일괄 제출 서비스 (비동기)"""
+    
+    def __init__(self, db, catalog: ChecklistTemplateCatalog = checklist_catalog):
+        super().__init__(db)
+        self.catalog = catalog
+    
+    async def submit_daily_checklists(self, submissions: Sequence[DailyChecklistSubmission]) -> Dict[str, Any]:
+        """
+        일일 체크리스트 일괄 제출
+        
+        Args:
+            submissions: 제출할 체크리스트 목록
+        
+        Returns:
+            Dict containing per-row results in request order
+        """
+        try:
+            channel_ids, template_ids, creator_ids = _lookup_ids(submissions)
+            
+            template_items, missing = _catalog_template_items(self.catalog, template_ids)
+            if missing:
+                templates = (await self.db.execute(
+                    select(ChecklistTemplate).where(ChecklistTemplate.id.in_(missing))
+                )).scalars().all()
+                template_items.update(_template_item_index(templates))
+            
+            channels = set((await self.db.execute(select(Channel.id).where(Channel.id.in_(channel_ids)))).scalars())
+            creators = set(
+                (await self.db.execute(select(Caregiver.id).where(Caregiver.id.in_(creator_ids)))).scalars()
+            ) if creator_ids else set()
+            
+            results, rows = _prepare_batch(submissions, template_items, channels, creators)
+            inserted = set()
+            if rows:
+                inserted = set((await self.db.execute(_insert_statement(rows))).scalars())
+                await self.db.commit()
+            _mark_duplicates(results, inserted)
+            
+            return self.create_response(
+                message=f"{len(inserted)}/{len(submissions)}개의 체크리스트를 저장했습니다.",
+                data=_bulk_response_data(results)
+            )
+        
+        except SQLAlchemyError as e:
+            return await self.handle_db_error(e, "submit daily checklists")
+        except Exception as e:
+            logger.error(f"Unexpected error in submit_daily_checklists: {str(e)}")
+            return self.create_error_response(
+                message="서버 오류가 발생했습니다.",
+                error_code="INTERNAL_ERROR"
+            )
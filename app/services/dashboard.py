@@ -0,0 +1,207 @@
+"""
+Dashboard Service for Sinabro API
+가디언 홈 화면용 채널 요약 (단일 SQL 조회)
+"""
+
+from sqlalchemy import select, func, true
+from sqlalchemy.exc import SQLAlchemyError
+from datetime import date
+from typing import Optional, Dict, Any
+from uuid import UUID
+import logging
+
+from ..models import Channel, Senior, DailyChecklist, CareNote, Photo, AIReport, GuardianFeedback
+from .base import BaseService, AsyncBaseService
+from .channel import _user_filter
+
+logger = logging.getLogger(__name__)
+
+# 대시보드에 포함하는 리포트 요약 길이
+REPORT_SUMMARY_LENGTH = 200
+
+
+def _dashboard_statement(user_filter, day: date, since: date):
+    """
+    채널별 요약을 한 번에 조회하는 쿼리
+    채널마다 LATERAL 서브쿼리로 (channel_id, 날짜) 인덱스 범위만 읽음
+    """
+    checklist = (
+        select(
+            func.count().label("checklist_count"),
+            func.avg(DailyChecklist.completion_rate).label("completion_rate")
+        )
+        .where(DailyChecklist.channel_id == Channel.id, DailyChecklist.created_date == day)
+        .lateral("today_checklist")
+    )
+    latest_report = (
+        select(
+            AIReport.id.label("report_id"),
+            AIReport.report_date,
+            func.left(AIReport.summary_text, REPORT_SUMMARY_LENGTH).label("summary_text")
+        )
+        .where(AIReport.channel_id == Channel.id)
+        .order_by(AIReport.report_date.desc(), AIReport.created_at.desc())
+        .limit(1)
+        .lateral("latest_report")
+    )
+    notes = (
+        select(func.count().label("new_care_notes"))
+        .where(CareNote.channel_id == Channel.id, CareNote.related_date >= since)
+        .lateral("new_notes")
+    )
+    photos = (
+        select(func.count().label("new_photos"))
+        .where(Photo.channel_id == Channel.id, Photo.taken_date >= since)
+        .lateral("new_photos")
+    )
+    feedback = (
+        select(func.count().label("pending_feedback"))
+        .where(GuardianFeedback.channel_id == Channel.id, GuardianFeedback.status == "pending")
+        .lateral("pending_feedback")
+    )
+    
+    return (
+        select(
+            Channel.id,
+            Channel.channel_name,
+            Channel.status,
+            Senior.full_name.label("senior_name"),
+            checklist.c.checklist_count,
+            checklist.c.completion_rate,
+            latest_report.c.report_id,
+            latest_report.c.report_date,
+            latest_report.c.summary_text,
+            notes.c.new_care_notes,
+            photos.c.new_photos,
+            feedback.c.pending_feedback
+        )
+        .join(Senior, Senior.id == Channel.senior_id)
+        .join(checklist, true())
+        .outerjoin(latest_report, true())
+        .join(notes, true())
+        .join(photos, true())
+        .join(feedback, true())
+        .where(user_filter)
+        .order_by(Channel.created_at.desc(), Channel.id.desc())
+    )
+
+
+def _serialize_dashboard_row(row, day: date) -> Dict[str, Any]:
+    """대시보드 조회 결과를 딕셔너리로 변환"""
+    return {
+        "channel_id": str(row.id),
+        "channel_name": row.channel_name,
+        "status": row.status,
+        "senior_name": row.senior_name,
+        "today_checklist": {
+            "target_date": day.isoformat(),
+            "checklist_count": row.checklist_count,
+            "completion_rate": float(row.completion_rate) if row.completion_rate is not None else None
+        },
+        "latest_report": {
+            "id": str(row.report_id),
+            "report_date": row.report_date.isoformat() if row.report_date else None,
+            "summary_text": row.summary_text
+        } if row.report_id else None,
+        "new_care_notes": row.new_care_notes,
+        "new_photos": row.new_photos,
+        "pending_feedback": row.pending_feedback
+    }
+
+
+class DashboardService(BaseService):
+    """대시보드 서비스"""
+    
+    def get_channel_dashboard(
+        self,
+        user_id: UUID,
+        user_type: str,
+        day: Optional[date] = None,
+        since: Optional[date] = None
+    ) -> Dict[str, Any]:
+        """
+        사용자의 채널별 홈 화면 요약 조회
+        
+        Args:
+            user_id: 사용자 ID
+            user_type: 사용자 유형 ('guardian' or 'caregiver')
+            day: 체크리스트 완료율 기준 날짜 (기본값: 오늘)
+            since: 새 돌봄노트/사진 집계 시작 날짜 (기본값: day)
+        
+        Returns:
+            Dict containing per-channel summaries
+        """
+        try:
+            user_filter = _user_filter(user_id, user_type)
+            if user_filter is None:
+                return self.create_error_response(
+                    message="유효하지 않은 사용자 유형입니다.",
+                    error_code="INVALID_USER_TYPE"
+                )
+            
+            day = day or date.today()
+            rows = self.db.execute(_dashboard_statement(user_filter, day, since or day)).all()
+            dashboard_data = [_serialize_dashboard_row(row, day) for row in rows]
+            
+            return self.create_response(
+                message=f"{len(dashboard_data)}개 채널의 요약을 성공적으로 조회했습니다.",
+                data=dashboard_data
+            )
+        
+        except SQLAlchemyError as e:
+            return self.handle_db_error(e, "get channel dashboard")
+        except Exception as e:
+            logger.error(f"Unexpected error in get_channel_dashboard: {str(e)}")
+            return self.create_error_response(
+                message="서버 오류가 발생했습니다.",
+                error_code="INTERNAL_ERROR"
+            )
+
+
+class AsyncDashboardService(AsyncBaseService):
+    """대시보드 서비스 (비동기)"""
+    
+    async def get_channel_dashboard(
+        self,
+        user_id: UUID,
+        user_type: str,
+        day: Optional[date] = None,
+        since: Optional[date] = None
+    ) -> Dict[str, Any]:
+        """
+        사용자의 채널별 홈 화면 요약 조회
+        
+        Args:
+            user_id: 사용자 ID
+            user_type: 사용자 유형 ('guardian' or 'caregiver')
+            day: 체크리스트 완료율 기준 날짜 (기본값: 오늘)
+            since: 새 돌봄노트/사진 집계 시작 날짜 (기본값: day)
+        
+        Returns:
+            Dict containing per-channel summaries
+        """
+        try:
+            user_filter = _user_filter(user_id, user_type)
+            if user_filter is None:
+                return self.create_error_response(
+                    message="유효하지 않은 사용자 유형입니다.",
+                    error_code="INVALID_USER_TYPE"
+                )
+            
+            day = day or date.today()
+            rows = (await self.db.execute(_dashboard_statement(user_filter, day, since or day))).all()
+            dashboard_data = [_serialize_dashboard_row(row, day) for row in rows]
+            
+            return self.create_response(
+                message=f"{len(dashboard_data)}개 채널의 요약을 성공적으로 조회했습니다.",
+                data=dashboard_data
+            )
+        
+        except SQLAlchemyError as e:
+            return await self.handle_db_error(e, "get channel dashboard")
+        except Exception as e:
+            logger.error(f"Unexpected error in get_channel_dashboard: {str(e)}")
+            return self.create_error_response(
+                message="서버 오류가 발생했습니다.",
+                error_code="INTERNAL_ERROR"
+            )
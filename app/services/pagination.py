@@ -0,0 +1,161 @@
+"""
+Pagination helpers for Sinabro API
+키셋(커서) 기반 페이지네이션 유틸리티
+
+OFFSET 대신 마지막 항목의 정렬 키를 불투명한 커서로 전달하여
+깊은 페이지도 인덱스 범위 스캔 한 번으로 조회합니다.
+채널 하위 목록(케어노트, 사진, 리포트 등)은 (channel_id, 날짜) 인덱스에 맞춰
+channel_id로 필터링하고 (날짜, id)를 정렬 키로 사용합니다.
+"""
+
+from sqlalchemy import select, func, tuple_, bindparam
+from datetime import datetime, date
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+import base64
+import json
+
+
+class InvalidCursorError(ValueError):
+    """잘못된 커서"""
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """정렬 키 값 목록을 URL-safe 커서 문자열로 인코딩"""
+    raw = json.dumps([
+        value.isoformat() if isinstance(value, (datetime, date)) else
+        str(value) if isinstance(value, UUID) else value
+        for value in values
+    ], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[List[Any]]:
+    """커서 문자열을 정렬 키 값 목록으로 디코딩 (없으면 None)"""
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError("유효하지 않은 커서입니다.") from e
+    if not isinstance(values, list):
+        raise InvalidCursorError("유효하지 않은 커서입니다.")
+    return values
+
+
+def _coerce(value: Any, column) -> Any:
+    """커서 값을 컬럼 타입의 파이썬 값으로 변환"""
+    if value is None:
+        return None
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+    try:
+        if python_type is datetime:
+            return datetime.fromisoformat(value)
+        if python_type is date:
+            return date.fromisoformat(value)
+        if python_type is UUID:
+            return UUID(value)
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError("유효하지 않은 커서입니다.") from e
+    return value
+
+
+def keyset_statement(stmt, columns: Sequence[Any], cursor_values: Optional[List[Any]], size: int, descending: bool = True):
+    """
+    조회 쿼리에 키셋 조건, 정렬, LIMIT(size + 1) 적용
+    
+    Args:
+        stmt: 필터가 적용된 select 문
+        columns: 정렬 키 컬럼 (마지막 컬럼은 유일해야 함, 보통 id)
+        cursor_values: decode_cursor 결과
+        size: 페이지 크기
+        descending: 내림차순 여부
+    
+    Returns:
+        다음 페이지 존재 여부 확인을 위해 size + 1개를 조회하는 select 문
+    """
+    if cursor_values is not None:
+        if len(cursor_values) != len(columns):
+            raise InvalidCursorError("유효하지 않은 커서입니다.")
+        bound = tuple_(*[
+            bindparam(None, _coerce(value, column), type_=column.type)
+            for column, value in zip(columns, cursor_values)
+        ])
+        key = tuple_(*columns)
+        stmt = stmt.where(key < bound if descending else key > bound)
+    
+    order = [column.desc() if descending else column.asc() for column in columns]
+    return stmt.order_by(None).order_by(*order).limit(size + 1)
+
+
+def capped_count_statement(stmt, cap: int):
+    """
+    최대 cap + 1개까지만 세는 COUNT 쿼리
+    큰 목록에서도 스캔 범위가 제한되며, cap을 넘으면 근사치로 표시
+    """
+    limited = stmt.order_by(None).limit(cap + 1).subquery()
+    return select(func.count()).select_from(limited)
+
+
+def build_page(
+    rows: Sequence[Any],
+    size: int,
+    key: Callable[[Any], Sequence[Any]],
+    total: Optional[int] = None,
+    cap: Optional[int] = None
+) -> Tuple[List[Any], Dict[str, Any]]:
+    """
+    size + 1개 조회 결과로 페이지와 페이지네이션 정보 구성
+    
+    Args:
+        rows: keyset_statement 조회 결과
+        size: 페이지 크기
+        key: 항목의 정렬 키 값 목록을 반환하는 함수
+        total: capped_count_statement 결과 (선택사항)
+        cap: COUNT 상한
+    
+    Returns:
+        (페이지 항목 목록, 페이지네이션 정보)
+    """
+    items = list(rows[:size])
+    has_more = len(rows) > size
+    pagination = {
+        "size": size,
+        "has_more": has_more,
+        "next_cursor": encode_cursor(key(items[-1])) if has_more and items else None,
+        "total": None,
+        "total_is_exact": None
+    }
+    if total is not None:
+        exact = cap is None or total <= cap
+        pagination["total"] = total if exact else cap
+        pagination["total_is_exact"] = exact
+    return items, pagination
+
+
+def paginate_sequence(
+    entries: Sequence[Any],
+    key: Callable[[Any], Sequence[Any]],
+    cursor_values: Optional[List[Any]],
+    size: int,
+    include_total: bool = False
+) -> Tuple[List[Any], Dict[str, Any]]:
+    """
+    이미 정렬 키 내림차순으로 정렬된 메모리 목록에 동일한 커서 규칙 적용
+    (템플릿 카탈로그 등)
+    """
+    if cursor_values is not None:
+        if len(cursor_values) != len(key(entries[0]) if entries else cursor_values):
+            raise InvalidCursorError("유효하지 않은 커서입니다.")
+        boundary = tuple(cursor_values)
+        try:
+            remaining = [entry for entry in entries if tuple(key(entry)) < boundary]
+        except TypeError as e:
+            raise InvalidCursorError("유효하지 않은 커서입니다.") from e
+    else:
+        remaining = list(entries)
+    return build_page(remaining[:size + 1], size, key, total=len(entries) if include_total else None)
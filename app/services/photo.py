@@ -0,0 +1,518 @@
+"""
+Photo Service for Sinabro API
+사진 관련 비즈니스 로직
+"""
+
+from sqlalchemy import select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import SQLAlchemyError
+from datetime import date
+from typing import Optional, List, Dict, Any, Callable
+from uuid import UUID
+import asyncio
+import logging
+
+from ..models import Channel, Photo, PhotoRendition
+from .base import BaseService, AsyncBaseService
+
+logger = logging.getLogger(__name__)
+
+# 업로드할 blob 선점
+# 이미 있는 blob이 참조되지 않는 상태면 수거 유예 시간을 다시 시작하여
+# 사진 행이 저장되기 전에 수거되지 않도록 함 (참조 카운트는 photos 트리거가 관리)
+CLAIM_BLOB_SQL = text("""
+    INSERT INTO photo_blobs AS b (sha256, file_url, file_size, file_type)
+    VALUES (:sha256, :file_url, :file_size, :file_type)
+    ON CONFLICT (sha256) DO UPDATE SET
+        orphaned_at = CASE WHEN b.ref_count = 0 THEN NOW() ELSE NULL END
+    RETURNING file_url, (xmax = 0) AS created
+""")
+
+# 유예 시간이 지난 참조되지 않는 blob (행 잠금 후 파일 삭제 → 행 삭제 순으로 처리하여
+# 동시에 같은 blob을 선점하는 업로드는 잠금 해제 후 새 행을 만들고 파일을 다시 저장)
+ORPHANED_BLOBS_SQL = text("""
+    SELECT sha256, file_url
+    FROM photo_blobs
+    WHERE ref_count = 0
+      AND orphaned_at < NOW() - make_interval(secs => :grace_seconds)
+    ORDER BY orphaned_at
+    LIMIT :limit
+    FOR UPDATE SKIP LOCKED
+""")
+
+DELETE_BLOBS_SQL = text("DELETE FROM photo_blobs WHERE sha256 = ANY(:sha256s)")
+
+
+def _channel_caregiver_statement(channel_id: UUID):
+    return select(Channel.caregiver_id).where(Channel.id == channel_id)
+
+
+def _check_uploader(service: BaseService, channel_caregiver_id: Optional[UUID], caregiver_id: UUID) -> Optional[Dict[str, Any]]:
+    """채널 존재 및 업로드 권한 확인 (문제가 있으면 에러 응답 반환)"""
+    if channel_caregiver_id is None:
+        return service.create_error_response(
+            message="채널을 찾을 수 없습니다.",
+            error_code="CHANNEL_NOT_FOUND"
+        )
+    if channel_caregiver_id != caregiver_id:
+        return service.create_error_response(
+            message="해당 채널의 케어기버만 사진을 업로드할 수 있습니다.",
+            error_code="CAREGIVER_MISMATCH"
+        )
+    return None
+
+
+def _new_photo(
+    photo_id: UUID,
+    channel_id: UUID,
+    caregiver_id: UUID,
+    file_url: str,
+    file_name: Optional[str],
+    description: Optional[str],
+    photo_type: Optional[str],
+    taken_date: Optional[date],
+    blob_sha256: Optional[str]
+) -> Photo:
+    return Photo(
+        id=photo_id,
+        channel_id=channel_id,
+        caregiver_id=caregiver_id,
+        file_url=file_url,
+        file_name=file_name,
+        description=description,
+        photo_type=photo_type,
+        taken_date=taken_date or date.today(),
+        blob_sha256=blob_sha256
+    )
+
+
+def _photo_file_statement(photo_id: UUID):
+    return select(Photo.channel_id, Photo.file_url, Photo.file_name).where(Photo.id == photo_id)
+
+
+def _renditions_statement(photo_id: UUID):
+    return select(PhotoRendition).where(PhotoRendition.photo_id == photo_id).order_by(PhotoRendition.width)
+
+
+def _upsert_renditions_statement(photo_id: UUID, renditions: List[Dict[str, Any]]):
+    """렌디션 메타데이터 저장 (재생성 시 덮어쓰기)"""
+    statement = insert(PhotoRendition).values([
+        {
+            "photo_id": photo_id,
+            "width": rendition["width"],
+            "height": rendition["height"],
+            "format": rendition["format"],
+            "file_url": rendition["file_url"],
+            "file_size": rendition["file_size"]
+        }
+        for rendition in renditions
+    ])
+    return statement.on_conflict_do_update(
+        index_elements=[PhotoRendition.photo_id, PhotoRendition.width, PhotoRendition.format],
+        set_={
+            "height": statement.excluded.height,
+            "file_url": statement.excluded.file_url,
+            "file_size": statement.excluded.file_size
+        }
+    )
+
+
+def _photo_file_data(photo, renditions) -> Dict[str, Any]:
+    return {
+        "channel_id": str(photo.channel_id),
+        "file_url": photo.file_url,
+        "file_name": photo.file_name,
+        "renditions": [rendition.to_dict() for rendition in renditions]
+    }
+
+
+class PhotoService(BaseService):
+    """사진 서비스"""
+    
+    def create_photo(
+        self,
+        photo_id: UUID,
+        channel_id: UUID,
+        caregiver_id: UUID,
+        file_url: str,
+        file_name: Optional[str] = None,
+        description: Optional[str] = None,
+        photo_type: Optional[str] = None,
+        taken_date: Optional[date] = None,
+        blob_sha256: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        사진 메타데이터 저장 (파일이 디스크에 기록된 뒤 호출)
+        
+        Args:
+            photo_id: 사진 ID
+            channel_id: 채널 ID
+            caregiver_id: 업로드한 케어기버 ID
+            file_url: UPLOAD_DIR 기준 파일 경로
+            file_name: 원본 파일명
+            description: 사진 설명
+            photo_type: 사진 타입
+            taken_date: 촬영 날짜 (기본값: 오늘)
+            blob_sha256: 원본 파일 blob SHA-256 (claim_blob으로 선점한 blob)
+        
+        Returns:
+            Dict containing created photo information
+        """
+        try:
+            channel_caregiver_id = self.db.execute(_channel_caregiver_statement(channel_id)).scalar_one_or_none()
+            error = _check_uploader(self, channel_caregiver_id, caregiver_id)
+            if error:
+                return error
+            
+            photo = _new_photo(
+                photo_id, channel_id, caregiver_id, file_url, file_name, description, photo_type, taken_date, blob_sha256
+            )
+            self.db.add(photo)
+            self.db.commit()
+            self.db.refresh(photo)
+            
+            return self.create_response(
+                message="사진을 성공적으로 업로드했습니다.",
+                data=photo.to_dict()
+            )
+        
+        except SQLAlchemyError as e:
+            return self.handle_db_error(e, "create photo")
+        except Exception as e:
+            logger.error(f"Unexpected error in create_photo: {str(e)}")
+            return self.create_error_response(
+                message="서버 오류가 발생했습니다.",
+                error_code="INTERNAL_ERROR"
+            )
+    
+    def get_photo_file(self, photo_id: UUID) -> Dict[str, Any]:
+        """
+        사진 파일 경로와 렌디션 목록 조회
+        
+        Args:
+            photo_id: 사진 ID
+        
+        Returns:
+            Dict containing channel ID, original file path and renditions ordered by width
+        """
+        try:
+            photo = self.db.execute(_photo_file_statement(photo_id)).first()
+            if not photo:
+                return self.create_error_response(
+                    message="사진을 찾을 수 없습니다.",
+                    error_code="PHOTO_NOT_FOUND"
+                )
+            
+            renditions = self.db.execute(_renditions_statement(photo_id)).scalars().all()
+            
+            return self.create_response(
+                message="사진 파일 정보를 조회했습니다.",
+                data=_photo_file_data(photo, renditions)
+            )
+        
+        except SQLAlchemyError as e:
+            return self.handle_db_error(e, "get photo file")
+        except Exception as e:
+            logger.error(f"Unexpected error in get_photo_file: {str(e)}")
+            return self.create_error_response(
+                message="서버 오류가 발생했습니다.",
+                error_code="INTERNAL_ERROR"
+            )
+    
+    def record_renditions(self, photo_id: UUID, renditions: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        생성된 렌디션 메타데이터 저장
+        
+        Args:
+            photo_id: 사진 ID
+            renditions: 렌디션 목록 ({"width", "height", "format", "file_url", "file_size"})
+        
+        Returns:
+            Dict containing the number of recorded renditions
+        """
+        try:
+            if renditions:
+                self.db.execute(_upsert_renditions_statement(photo_id, renditions))
+                self.db.commit()
+            
+            return self.create_response(
+                message=f"{len(renditions)}개의 렌디션을 저장했습니다.",
+                data={"count": len(renditions)}
+            )
+        
+        except SQLAlchemyError as e:
+            return self.handle_db_error(e, "record renditions")
+        except Exception as e:
+            logger.error(f"Unexpected error in record_renditions: {str(e)}")
+            return self.create_error_response(
+                message="서버 오류가 발생했습니다.",
+                error_code="INTERNAL_ERROR"
+            )
+    
+    def claim_blob(self, sha256: str, file_url: str, file_size: int, file_type: str) -> Dict[str, Any]:
+        """
+        업로드할 blob 등록 또는 기존 blob 선점 (파일 저장 전에 호출)
+        
+        Args:
+            sha256: 파일 내용 SHA-256 (hex)
+            file_url: UPLOAD_DIR 기준 blob 경로
+            file_size: 파일 크기
+            file_type: 파일 형식
+        
+        Returns:
+            Dict containing blob path and whether the blob is new
+        """
+        try:
+            blob = self.db.execute(CLAIM_BLOB_SQL, {
+                "sha256": sha256, "file_url": file_url, "file_size": file_size, "file_type": file_type
+            }).one()
+            self.db.commit()
+            
+            return self.create_response(
+                message="blob을 선점했습니다.",
+                data={"sha256": sha256, "file_url": blob.file_url, "created": blob.created}
+            )
+        
+        except SQLAlchemyError as e:
+            return self.handle_db_error(e, "claim blob")
+        except Exception as e:
+            logger.error(f"Unexpected error in claim_blob: {str(e)}")
+            return self.create_error_response(
+                message="서버 오류가 발생했습니다.",
+                error_code="INTERNAL_ERROR"
+            )
+    
+    def collect_orphaned_blobs(
+        self,
+        remove_files: Callable[[List[str]], None],
+        grace_seconds: int,
+        limit: int
+    ) -> Dict[str, Any]:
+        """
+        참조되지 않는 blob 수거
+        
+        Args:
+            remove_files: blob 경로 목록을 받아 파일(렌디션 포함)을 삭제하는 함수
+            grace_seconds: 참조가 0이 된 뒤 수거까지의 유예 시간 (초)
+            limit: 한 번에 수거할 최대 blob 수
+        
+        Returns:
+            Dict containing the number of collected blobs
+        """
+        try:
+            blobs = self.db.execute(ORPHANED_BLOBS_SQL, {"grace_seconds": grace_seconds, "limit": limit}).all()
+            if blobs:
+                remove_files([blob.file_url for blob in blobs])
+                self.db.execute(DELETE_BLOBS_SQL, {"sha256s": [blob.sha256 for blob in blobs]})
+            self.db.commit()
+            
+            return self.create_response(
+                message=f"{len(blobs)}개의 blob을 수거했습니다.",
+                data={"collected": len(blobs)}
+            )
+        
+        except SQLAlchemyError as e:
+            return self.handle_db_error(e, "collect orphaned blobs")
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Unexpected error in collect_orphaned_blobs: {str(e)}")
+            return self.create_error_response(
+                message="서버 오류가 발생했습니다.",
+                error_code="INTERNAL_ERROR"
+            )
+
+
+class AsyncPhotoService(AsyncBaseService):
+    """사진 서비스 (비동기)"""
+    
+    async def create_photo(
+        self,
+        photo_id: UUID,
+        channel_id: UUID,
+        caregiver_id: UUID,
+        file_url: str,
+        file_name: Optional[str] = None,
+        description: Optional[str] = None,
+        photo_type: Optional[str] = None,
+        taken_date: Optional[date] = None,
+        blob_sha256: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        사진 메타데이터 저장 (파일이 디스크에 기록된 뒤 호출)
+        
+        Args:
+            photo_id: 사진 ID
+            channel_id: 채널 ID
+            caregiver_id: 업로드한 케어기버 ID
+            file_url: UPLOAD_DIR 기준 파일 경로
+            file_name: 원본 파일명
+            description: 사진 설명
+            photo_type: 사진 타입
+            taken_date: 촬영 날짜 (기본값: 오늘)
+            blob_sha256: 원본 파일 blob SHA-256 (claim_blob으로 선점한 blob)
+        
+        Returns:
+            Dict containing created photo information
+        """
+        try:
+            channel_caregiver_id = (await self.db.execute(_channel_caregiver_statement(channel_id))).scalar_one_or_none()
+            error = _check_uploader(self, channel_caregiver_id, caregiver_id)
+            if error:
+                return error
+            
+            photo = _new_photo(
+                photo_id, channel_id, caregiver_id, file_url, file_name, description, photo_type, taken_date, blob_sha256
+            )
+            self.db.add(photo)
+            await self.db.commit()
+            await self.db.refresh(photo)
+            
+            return self.create_response(
+                message="사진을 성공적으로 업로드했습니다.",
+                data=photo.to_dict()
+            )
+        
+        except SQLAlchemyError as e:
+            return await self.handle_db_error(e, "create photo")
+        except Exception as e:
+            logger.error(f"Unexpected error in create_photo: {str(e)}")
+            return self.create_error_response(
+                message="서버 오류가 발생했습니다.",
+                error_code="INTERNAL_ERROR"
+            )
+    
+    async def get_photo_file(self, photo_id: UUID) -> Dict[str, Any]:
+        """
+        사진 파일 경로와 렌디션 목록 조회
+        
+        Args:
+            photo_id: 사진 ID
+        
+        Returns:
+            Dict containing channel ID, original file path and renditions ordered by width
+        """
+        try:
+            photo = (await self.db.execute(_photo_file_statement(photo_id))).first()
+            if not photo:
+                return self.create_error_response(
+                    message="사진을 찾을 수 없습니다.",
+                    error_code="PHOTO_NOT_FOUND"
+                )
+            
+            renditions = (await self.db.execute(_renditions_statement(photo_id))).scalars().all()
+            
+            return self.create_response(
+                message="사진 파일 정보를 조회했습니다.",
+                data=_photo_file_data(photo, renditions)
+            )
+        
+        except SQLAlchemyError as e:
+            return await self.handle_db_error(e, "get photo file")
+        except Exception as e:
+            logger.error(f"Unexpected error in get_photo_file: {str(e)}")
+            return self.create_error_response(
+                message="서버 오류가 발생했습니다.",
+                error_code="INTERNAL_ERROR"
+            )
+    
+    async def record_renditions(self, photo_id: UUID, renditions: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        생성된 렌디션 메타데이터 저장
+        
+        Args:
+            photo_id: 사진 ID
+            renditions: 렌디션 목록 ({"width", "height", "format", "file_url", "file_size"})
+        
+        Returns:
+            Dict containing the number of recorded renditions
+        """
+        try:
+            if renditions:
+                await self.db.execute(_upsert_renditions_statement(photo_id, renditions))
+                await self.db.commit()
+            
+            return self.create_response(
+                message=f"{len(renditions)}개의 렌디션을 저장했습니다.",
+                data={"count": len(renditions)}
+            )
+        
+        except SQLAlchemyError as e:
+            return await self.handle_db_error(e, "record renditions")
+        except Exception as e:
+            logger.error(f"Unexpected error in record_renditions: {str(e)}")
+            return self.create_error_response(
+                message="서버 오류가 발생했습니다.",
+                error_code="INTERNAL_ERROR"
+            )
+    
+    async def claim_blob(self, sha256: str, file_url: str, file_size: int, file_type: str) -> Dict[str, Any]:
+        """
+        업로드할 blob 등록 또는 기존 blob 선점 (파일 저장 전에 호출)
+        
+        Args:
+            sha256: 파일 내용 SHA-256 (hex)
+            file_url: UPLOAD_DIR 기준 blob 경로
+            file_size: 파일 크기
+            file_type: 파일 형식
+        
+        Returns:
+            Dict containing blob path and whether the blob is new
+        """
+        try:
+            blob = (await self.db.execute(CLAIM_BLOB_SQL, {
+                "sha256": sha256, "file_url": file_url, "file_size": file_size, "file_type": file_type
+            })).one()
+            await self.db.commit()
+            
+            return self.create_response(
+                message="blob을 선점했습니다.",
+                data={"sha256": sha256, "file_url": blob.file_url, "created": blob.created}
+            )
+        
+        except SQLAlchemyError as e:
+            return await self.handle_db_error(e, "claim blob")
+        except Exception as e:
+            logger.error(f"Unexpected error in claim_blob: {str(e)}")
+            return self.create_error_response(
+                message="서버 오류가 발생했습니다.",
+                error_code="INTERNAL_ERROR"
+            )
+    
+    async def collect_orphaned_blobs(
+        self,
+        remove_files: Callable[[List[str]], None],
+        grace_seconds: int,
+        limit: int
+    ) -> Dict[str, Any]:
+        """
+        참조되지 않는 blob 수거
+        
+        Args:
+            remove_files: blob 경로 목록을 받아 파일(렌디션 포함)을 삭제하는 함수
+            grace_seconds: 참조가 0이 된 뒤 수거까지의 유예 시간 (초)
+            limit: 한 번에 수거할 최대 blob 수
+        
+        Returns:
+            Dict containing the number of collected blobs
+        """
+        try:
+            blobs = (await self.db.execute(ORPHANED_BLOBS_SQL, {"grace_seconds": grace_seconds, "limit": limit})).all()
+            if blobs:
+                await asyncio.to_thread(remove_files, [blob.file_url for blob in blobs])
+                await self.db.execute(DELETE_BLOBS_SQL, {"sha256s": [blob.sha256 for blob in blobs]})
+            await self.db.commit()
+            
+            return self.create_response(
+                message=f"{len(blobs)}개의 blob을 수거했습니다.",
+                data={"collected": len(blobs)}
+            )
+        
+        except SQLAlchemyError as e:
+            return await self.handle_db_error(e, "collect orphaned blobs")
+        except Exception as e:
+            await self.db.rollback()
+            logger.error(f"Unexpected error in collect_orphaned_blobs: {str(e)}")
+            return self.create_error_response(
+                message="서버 오류가 발생했습니다.",
+                error_code="INTERNAL_ERROR"
+            )
@@ -0,0 +1,1270 @@
+"""
+Report Service for Sinabro API
+AI 리포트 생성 작업 관련 비즈니스 로직
+"""
+
+from sqlalchemy import and_, exists, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import SQLAlchemyError
+from datetime import date, datetime
+from typing import Optional, Dict, Any, List
+from uuid import UUID
+import json
+import logging
+import uuid
+
+from ..models import (
+    AIReport,
+    Channel,
+    DailyDigest,
+    ReportBatchRun,
+    ReportJob,
+    Senior
+)
+from .base import BaseService, AsyncBaseService
+
+logger = logging.getLogger(__name__)
+
+# 작업 등록 (같은 채널/날짜에 대기 중이거나 실행 중인 작업이 있으면 등록하지 않음)
+ENQUEUE_JOB_SQL = text("""
+    INSERT INTO report_jobs (channel_id, report_date, max_attempts)
+    VALUES (:channel_id, :report_date, :max_attempts)
+    ON CONFLICT (channel_id, report_date) WHERE status IN ('queued', 'running') DO NOTHING
+    RETURNING id
+""")
+
+# 작업 선점 (큐에 같은 작업이 중복으로 들어가도 한 워커만 실행, 재시도 대기 시간 전에는 선점하지 않음)
+CLAIM_JOB_SQL = text("""
+    UPDATE report_jobs
+    SET status = 'running', attempts = attempts + 1, started_at = NOW(), updated_at = NOW()
+    WHERE id = :job_id AND status = 'queued' AND run_after <= NOW()
+    RETURNING id, channel_id, report_date, attempts, max_attempts
+""")
+
+# 선점하지 못한 작업이 아직 실행 시각 전이면 남은 대기 시간 (초)
+JOB_DELAY_SQL = text("""
+    SELECT GREATEST(EXTRACT(EPOCH FROM run_after - NOW()), 0)::float
+    FROM report_jobs
+    WHERE id = :job_id AND status = 'queued'
+""")
+
+# 완료/실패 기록은 선점한 실행(attempts)이 아직 유효할 때만 반영
+# (실행 제한 시간을 넘겨 복구 작업이 다시 큐에 넣은 경우 늦게 끝난 이전 실행은 무시)
+COMPLETE_JOB_SQL = text("""
+    UPDATE report_jobs
+    SET status = 'succeeded', report_id = :report_id, last_error = NULL,
+        finished_at = NOW(), updated_at = NOW()
+    WHERE id = :job_id AND status = 'running' AND attempts = :attempts
+    RETURNING id
+""")
+
+FAIL_JOB_SQL = text("""
+    UPDATE report_jobs
+    SET status = CASE WHEN :retry THEN 'queued' ELSE 'failed' END,
+        run_after = NOW() + make_interval(secs => :delay),
+        last_error = :error,
+        finished_at = CASE WHEN :retry THEN NULL ELSE NOW() END,
+        updated_at = NOW()
+    WHERE id = :job_id AND status = 'running' AND attempts = :attempts
+    RETURNING status
+""")
+
+# 워커가 중단되어 끝나지 않은 실행을 다시 대기 상태로 (횟수를 다 쓴 작업은 실패 처리)
+RESET_STALE_JOBS_SQL = text("""
+    UPDATE report_jobs
+    SET status = CASE WHEN attempts >= max_attempts THEN 'failed' ELSE 'queued' END,
+        run_after = NOW(),
+        last_error = '실행 제한 시간 안에 완료되지 않았습니다.',
+        finished_at = CASE WHEN attempts >= max_attempts THEN NOW() END,
+        updated_at = NOW()
+    WHERE status = 'running'
+      AND started_at < NOW() - make_interval(secs => :stale_seconds)
+""")
+
+QUEUED_JOBS_SQL = text("""
+    SELECT id, GREATEST(EXTRACT(EPOCH FROM run_after - NOW()), 0)::float AS delay
+    FROM report_jobs
+    WHERE status = 'queued'
+    ORDER BY run_after
+    LIMIT :limit
+""")
+
+# 일괄 생성 실행 선점 (날짜별 한 행, 실패했거나 제한 시간을 넘긴 실행은 다시 선점 가능)
+START_BATCH_RUN_SQL = text("""
+    INSERT INTO report_batch_runs (report_date, status, started_at)
+    VALUES (:report_date, 'running', NOW())
+    ON CONFLICT (report_date) DO UPDATE
+    SET status = 'running', started_at = NOW(), finished_at = NULL, last_error = NULL
+    WHERE report_batch_runs.status = 'failed'
+       OR (report_batch_runs.status = 'running'
+           AND report_batch_runs.started_at < NOW() - make_interval(secs => :stale_seconds))
+       OR :force
+    RETURNING report_date
+""")
+
+FINISH_BATCH_RUN_SQL = text("""
+    UPDATE report_batch_runs
+    SET status = :status, finished_at = NOW(),
+        channel_count = :channels, generated = :generated, skipped = :skipped, failed = :failed,
+        wall_time_ms = :wall_time_ms,
+        latency_p50_ms = :p50, latency_p90_ms = :p90, latency_p99_ms = :p99, latency_max_ms = :max,
+        last_error = :error
+    WHERE report_date = :report_date
+""")
+
+# 언어별 번역 병합 (다른 언어를 동시에 저장해도 서로 덮어쓰지 않음)
+SAVE_TRANSLATIONS_SQL = text("""
+    UPDATE ai_reports
+    SET translations = COALESCE(translations, '{}'::jsonb) || CAST(:translations AS jsonb)
+    WHERE id = :report_id
+    RETURNING id
+""")
+
+# 리포트 생성 중 오류 메시지 최대 길이
+MAX_ERROR_LENGTH = 1000
+
+CHANNEL_NOT_FOUND_MESSAGE = "채널을 찾을 수 없습니다."
+
+
+def _channel_exists_statement(channel_id: UUID):
+    return select(Channel.id).where(Channel.id == channel_id)
+
+
+def _pending_job_statement(channel_id: UUID, report_date: date):
+    return select(ReportJob).where(
+        ReportJob.channel_id == channel_id,
+        ReportJob.report_date == report_date,
+        ReportJob.status.in_(("queued", "running"))
+    )
+
+
+def _channel_report_statement(channel_id: UUID, report_date: date):
+    return select(AIReport.id).where(AIReport.channel_id == channel_id, AIReport.report_date == report_date)
+
+
+def _job_statement(job_id: UUID):
+    return select(ReportJob).where(ReportJob.id == job_id)
+
+
+def _with_digest(statement, report_date: date):
+    """채널 조회에 시니어 이름(없으면 None)과 리포트 날짜의 다이제스트(없으면 None)를 붙임"""
+    return statement.select_from(Channel).outerjoin(Senior, Senior.id == Channel.senior_id).outerjoin(
+        DailyDigest,
+        and_(DailyDigest.channel_id == Channel.id, DailyDigest.digest_date == report_date)
+    )
+
+
+def _batch_channels_statement(report_date: date, after_id: Optional[UUID], limit: int):
+    """
+    리포트가 아직 없는 활성 채널과 그 날짜의 다이제스트 (idx_channels_status, ID 기준 키셋 페이지)
+    같은 날짜의 개별 생성 작업이 대기/실행 중인 채널은 그 작업에 맡김
+    """
+    statement = _with_digest(select(Channel.id, Senior.full_name, DailyDigest), report_date).where(
+        Channel.status == "active",
+        ~exists().where(and_(AIReport.channel_id == Channel.id, AIReport.report_date == report_date)),
+        ~exists().where(and_(
+            ReportJob.channel_id == Channel.id,
+            ReportJob.report_date == report_date,
+            ReportJob.status.in_(("queued", "running"))
+        ))
+    )
+    if after_id is not None:
+        statement = statement.where(Channel.id > after_id)
+    return statement.order_by(Channel.id).limit(limit)
+
+
+def _digest_statement(channel_id: UUID, report_date: date):
+    return _with_digest(select(Channel.id, Senior.full_name, DailyDigest), report_date).where(Channel.id == channel_id)
+
+
+def _entry_time(entry: Dict[str, Any]) -> float:
+    created_at = entry.get("created_at")
+    return datetime.fromisoformat(created_at).timestamp() if created_at else 0.0
+
+
+def _digest_entries(digest: Optional[DailyDigest], kind: str) -> List[Dict[str, Any]]:
+    """다이제스트 항목을 작성 순서로 정렬"""
+    entries = getattr(digest, kind) if digest is not None else None
+    return sorted((entries or {}).values(), key=_entry_time)
+
+
+def _build_sources(channel_id: UUID, report_date: date, senior_name: Optional[str], digest: Optional[DailyDigest]) -> Dict[str, Any]:
+    """생성기에 전달할 하루치 기록 (ID는 리포트의 참조 배열로 저장)"""
+    return {
+        "channel_id": str(channel_id),
+        "report_date": report_date.isoformat(),
+        "senior_name": senior_name or "어르신",
+        "checklists": [
+            {
+                "id": entry["id"],
+                "completion_rate": float(entry.get("completion_rate") or 0),
+                "additional_notes": entry.get("additional_notes"),
+                "checked": entry.get("checked", 0),
+                "total": entry.get("total", 0)
+            }
+            for entry in _digest_entries(digest, "checklists")
+        ],
+        "care_notes": [
+            {"id": entry["id"], "note_type": entry.get("note_type"), "content": entry.get("content")}
+            for entry in _digest_entries(digest, "care_notes")
+        ],
+        "photos": [
+            {"id": entry["id"], "photo_type": entry.get("photo_type"), "description": entry.get("description")}
+            for entry in _digest_entries(digest, "photos")
+        ],
+        "question_responses": [
+            {
+                "id": entry["id"],
+                "responder_type": entry.get("responder_type"),
+                "question": entry.get("question"),
+                "response_text": entry.get("response_text")
+            }
+            for entry in _digest_entries(digest, "question_responses")
+        ]
+    }
+
+
+def _batch_run_params(report_date: date, status: str, summary: Dict[str, Any], error: Optional[str]) -> Dict[str, Any]:
+    latency = summary.get("latency_ms", {})
+    return {
+        "report_date": report_date,
+        "status": status,
+        "channels": summary.get("channels", 0),
+        "generated": summary.get("generated", 0),
+        "skipped": summary.get("skipped", 0),
+        "failed": summary.get("failed", 0),
+        "wall_time_ms": summary.get("wall_time_ms"),
+        "p50": latency.get("p50"),
+        "p90": latency.get("p90"),
+        "p99": latency.get("p99"),
+        "max": latency.get("max"),
+        "error": error[:MAX_ERROR_LENGTH] if error else None
+    }
+
+
+def _claimed_job_data(job) -> Dict[str, Any]:
+    return {
+        "id": str(job.id),
+        "channel_id": str(job.channel_id),
+        "report_date": job.report_date.isoformat(),
+        "attempts": job.attempts,
+        "max_attempts": job.max_attempts
+    }
+
+
+def _report_values(sources: Dict[str, Any], content: Dict[str, Any], generation_model: str, generation_time_ms: int) -> Dict[str, Any]:
+    return dict(
+        id=uuid.uuid4(),
+        channel_id=UUID(sources["channel_id"]),
+        report_date=date.fromisoformat(sources["report_date"]),
+        checklist_ids=[UUID(item["id"]) for item in sources["checklists"]],
+        care_note_ids=[UUID(item["id"]) for item in sources["care_notes"]],
+        photo_ids=[UUID(item["id"]) for item in sources["photos"]],
+        question_response_ids=[UUID(item["id"]) for item in sources["question_responses"]],
+        summary_text=content["summary_text"],
+        family_comment=content["family_comment"],
+        mood_analysis=content["mood_analysis"],
+        health_status=content["health_status"],
+        recommendations=content["recommendations"],
+        generation_model=generation_model[:50],
+        generation_time_ms=generation_time_ms,
+        confidence_score=content["confidence_score"]
+    )
+
+
+def _insert_reports_statement(rows: List[Dict[str, Any]]):
+    """
+    리포트 저장 (채널/날짜별 한 건, uq_ai_reports_channel_date)
+    야간 일괄 생성과 개별 생성 작업이 같은 채널/날짜를 동시에 저장해도 먼저 저장한 한 건만 남음
+    """
+    return insert(AIReport).values(rows).on_conflict_do_nothing(
+        index_elements=["channel_id", "report_date"]
+    ).returning(AIReport.id)
+
+
+class ReportService(BaseService):
+    """AI 리포트 서비스"""
+    
+    def enqueue_report(self, channel_id: UUID, report_date: date, max_attempts: int) -> Dict[str, Any]:
+        """
+        리포트 생성 작업 등록
+        
+        같은 채널/날짜에 대기 중이거나 실행 중인 작업이 있으면 새로 만들지 않고 그 작업을 반환하며,
+        이미 리포트가 있으면 등록하지 않습니다 (REPORT_EXISTS).
+        
+        Args:
+            channel_id: 채널 ID
+            report_date: 리포트 날짜
+            max_attempts: 최대 실행 횟수
+        
+        Returns:
+            Dict containing job information and whether a new job was created
+        """
+        try:
+            if self.db.execute(_channel_exists_statement(channel_id)).scalar_one_or_none() is None:
+                return self.create_error_response(
+                    message="채널을 찾을 수 없습니다.",
+                    error_code="CHANNEL_NOT_FOUND"
+                )
+            
+            # 이미 생성된 리포트가 있으면 다시 만들지 않음
+            report_id = self.db.execute(_channel_report_statement(channel_id, report_date)).scalar_one_or_none()
+            if report_id is not None:
+                return self.create_error_response(
+                    message="이미 생성된 리포트가 있습니다.",
+                    error_code="REPORT_EXISTS",
+                    details={"report_id": str(report_id)}
+                )
+            
+            # 기존 작업이 그 사이에 끝나면 다시 등록 시도
+            for _ in range(3):
+                job_id = self.db.execute(ENQUEUE_JOB_SQL, {
+                    "channel_id": channel_id, "report_date": report_date, "max_attempts": max_attempts
+                }).scalar_one_or_none()
+                self.db.commit()
+                
+                if job_id is not None:
+                    job = self.db.execute(_job_statement(job_id)).scalar_one()
+                    return self.create_response(
+                        message="리포트 생성 작업을 등록했습니다.",
+                        data={**job.to_dict(), "created": True}
+                    )
+                
+                job = self.db.execute(_pending_job_statement(channel_id, report_date)).scalar_one_or_none()
+                if job is not None:
+                    return self.create_response(
+                        message="이미 진행 중인 리포트 생성 작업이 있습니다.",
+                        data={**job.to_dict(), "created": False}
+                    )
+            
+            return self.create_error_response(
+                message="리포트 생성 작업을 등록하지 못했습니다.",
+                error_code="ENQUEUE_CONFLICT"
+            )
+        
+        except SQLAlchemyError as e:
+            return self.handle_db_error(e, "enqueue report")
+        except Exception as e:
+            logger.error(f"Unexpected error in enqueue_report: {str(e)}")
+            return self.create_error_response(
+                message="서버 오류가 발생했습니다.",
+                error_code="INTERNAL_ERROR"
+            )
+    
+    def get_job(self, job_id: UUID) -> Dict[str, Any]:
+        """
+        리포트 생성 작업 상태 조회
+        
+        Args:
+            job_id: 작업 ID
+        
+        Returns:
+            Dict containing job status
+        """
+        try:
+            job = self.db.execute(_job_statement(job_id)).scalar_one_or_none()
+            if not job:
+                return self.create_error_response(
+                    message="리포트 생성 작업을 찾을 수 없습니다.",
+                    error_code="JOB_NOT_FOUND"
+                )
+            
+            return self.create_response(
+                message="리포트 생성 작업을 조회했습니다.",
+                data=job.to_dict()
+            )
+        
+        except SQLAlchemyError as e:
+            return self.handle_db_error(e, "get report job")
+        except Exception as e:
+            logger.error(f"Unexpected error in get_job: {str(e)}")
+            return self.create_error_response(
+                message="서버 오류가 발생했습니다.",
+                error_code="INTERNAL_ERROR"
+            )
+    
+    def get_report(self, report_id: UUID) -> Dict[str, Any]:
+        """
+        AI 리포트 조회
+        
+        Args:
+            report_id: 리포트 ID
+        
+        Returns:
+            Dict containing report information
+        """
+        try:
+            report = self.db.get(AIReport, report_id)
+            if not report:
+                return self.create_error_response(
+                    message="리포트를 찾을 수 없습니다.",
+                    error_code="REPORT_NOT_FOUND"
+                )
+            
+            return self.create_response(
+                message="리포트를 성공적으로 조회했습니다.",
+                data=report.to_dict(include_relations=True)
+            )
+        
+        except SQLAlchemyError as e:
+            return self.handle_db_error(e, "get report")
+        except Exception as e:
+            logger.error(f"Unexpected error in get_report: {str(e)}")
+            return self.create_error_response(
+                message="서버 오류가 발생했습니다.",
+                error_code="INTERNAL_ERROR"
+            )
+    
+    def save_translations(self, report_id: UUID, translations: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        리포트 번역 저장 (AIReport.translations에 언어별로 병합)
+        
+        Args:
+            report_id: 리포트 ID
+            translations: 언어 코드별 번역
+        
+        Returns:
+            Dict containing the saved languages
+        """
+        try:
+            row = self.db.execute(SAVE_TRANSLATIONS_SQL, {
+                "report_id": report_id, "translations": json.dumps(translations, ensure_ascii=False)
+            }).first()
+            self.db.commit()
+            if not row:
+                return self.create_error_response(
+                    message="리포트를 찾을 수 없습니다.",
+                    error_code="REPORT_NOT_FOUND"
+                )
+            
+            return self.create_response(
+                message="리포트 번역을 저장했습니다.",
+                data={"report_id": str(report_id), "languages": sorted(translations)}
+            )
+        
+        except SQLAlchemyError as e:
+            return self.handle_db_error(e, "save report translations")
+        except Exception as e:
+            logger.error(f"Unexpected error in save_translations: {str(e)}")
+            return self.create_error_response(
+                message="서버 오류가 발생했습니다.",
+                error_code="INTERNAL_ERROR"
+            )
+    
+    def claim_job(self, job_id: UUID) -> Dict[str, Any]:
+        """
+        대기 중인 작업을 실행 상태로 선점하고 리포트 날짜의 기록 수집
+        
+        Args:
+            job_id: 작업 ID
+        
+        Returns:
+            Dict containing the claimed job and its source records
+        """
+        try:
+            job = self.db.execute(CLAIM_JOB_SQL, {"job_id": job_id}).first()
+            self.db.commit()
+            if not job:
+                # 중복/오래된 큐 메시지로 실행 시각 전에 꺼낸 작업은 남은 시간 뒤에 다시 실행
+                delay = self.db.execute(JOB_DELAY_SQL, {"job_id": job_id}).scalar_one_or_none()
+                if delay is not None:
+                    return self.create_error_response(
+                        message="아직 실행 시각이 되지 않은 작업입니다.",
+                        error_code="JOB_NOT_DUE",
+                        details={"delay": delay}
+                    )
+                return self.create_error_response(
+                    message="대기 중인 작업이 아닙니다.",
+                    error_code="JOB_NOT_QUEUED"
+                )
+            
+            # 원본 테이블 대신 트리거가 미리 조립해 둔 다이제스트 한 행만 조회
+            row = self.db.execute(_digest_statement(job.channel_id, job.report_date)).first()
+            if row is None:
+                # 작업을 등록한 뒤 채널이 삭제됨 (재시도해도 성공할 수 없으므로 바로 실패 처리)
+                self.db.execute(FAIL_JOB_SQL, {
+                    "job_id": job.id, "attempts": job.attempts, "retry": False, "delay": 0,
+                    "error": CHANNEL_NOT_FOUND_MESSAGE
+                })
+                self.db.commit()
+                return self.create_error_response(
+                    message=CHANNEL_NOT_FOUND_MESSAGE,
+                    error_code="CHANNEL_NOT_FOUND"
+                )
+            channel_id, senior_name, digest = row
+            
+            return self.create_response(
+                message="리포트 생성 작업을 시작했습니다.",
+                data={"job": _claimed_job_data(job), "sources": _build_sources(channel_id, job.report_date, senior_name, digest)}
+            )
+        
+        except SQLAlchemyError as e:
+            return self.handle_db_error(e, "claim report job")
+        except Exception as e:
+            logger.error(f"Unexpected error in claim_job: {str(e)}")
+            return self.create_error_response(
+                message="서버 오류가 발생했습니다.",
+                error_code="INTERNAL_ERROR"
+            )
+    
+    def complete_job(
+        self,
+        job: Dict[str, Any],
+        sources: Dict[str, Any],
+        content: Dict[str, Any],
+        generation_model: str,
+        generation_time_ms: int
+    ) -> Dict[str, Any]:
+        """
+        생성된 리포트 저장 및 작업 완료 처리 (한 트랜잭션)
+        
+        Args:
+            job: claim_job 결과의 작업 정보
+            sources: claim_job 결과의 기록 (ID를 참조 배열로 저장)
+            content: 생성기 결과
+            generation_model: 생성 모델 이름
+            generation_time_ms: 생성 소요 시간 (밀리초)
+        
+        Returns:
+            Dict containing the created report ID
+        """
+        try:
+            values = _report_values(sources, content, generation_model, generation_time_ms)
+            report_id = self.db.execute(_insert_reports_statement([values])).scalar_one_or_none()
+            if report_id is None:
+                # 생성하는 동안 일괄 생성이 같은 채널/날짜의 리포트를 먼저 저장한 경우 그 리포트로 작업 완료
+                report_id = self.db.execute(_channel_report_statement(values["channel_id"], values["report_date"])).scalar_one()
+            
+            completed = self.db.execute(COMPLETE_JOB_SQL, {
+                "job_id": job["id"], "attempts": job["attempts"], "report_id": report_id
+            }).first()
+            if not completed:
+                self.db.rollback()
+                return self.create_error_response(
+                    message="더 이상 유효하지 않은 작업 실행입니다.",
+                    error_code="JOB_NOT_RUNNING"
+                )
+            self.db.commit()
+            
+            return self.create_response(
+                message="리포트를 생성했습니다.",
+                data={"job_id": job["id"], "report_id": str(report_id)}
+            )
+        
+        except SQLAlchemyError as e:
+            return self.handle_db_error(e, "complete report job")
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Unexpected error in complete_job: {str(e)}")
+            return self.create_error_response(
+                message="서버 오류가 발생했습니다.",
+                error_code="INTERNAL_ERROR"
+            )
+    
+    def fail_job(self, job: Dict[str, Any], error: str, retry_delay: Optional[float]) -> Dict[str, Any]:
+        """
+        작업 실패 기록
+        
+        Args:
+            job: claim_job 결과의 작업 정보
+            error: 실패 사유
+            retry_delay: 재시도 대기 시간 (초, None이면 최종 실패)
+        
+        Returns:
+            Dict containing the resulting job status
+        """
+        try:
+            row = self.db.execute(FAIL_JOB_SQL, {
+                "job_id": job["id"],
+                "attempts": job["attempts"],
+                "retry": retry_delay is not None,
+                "delay": retry_delay or 0,
+                "error": error[:MAX_ERROR_LENGTH]
+            }).first()
+            self.db.commit()
+            
+            return self.create_response(
+                message="리포트 생성 작업 실패를 기록했습니다.",
+                data={"job_id": job["id"], "status": row.status if row else None}
+            )
+        
+        except SQLAlchemyError as e:
+            return self.handle_db_error(e, "fail report job")
+        except Exception as e:
+            logger.error(f"Unexpected error in fail_job: {str(e)}")
+            return self.create_error_response(
+                message="서버 오류가 발생했습니다.",
+                error_code="INTERNAL_ERROR"
+            )
+    
+    def recover_jobs(self, stale_seconds: int, limit: int) -> Dict[str, Any]:
+        """
+        중단된 실행을 대기 상태로 되돌리고 큐에 다시 넣을 대기 작업 조회
+        
+        Args:
+            stale_seconds: 실행 중 상태로 둘 최대 시간 (초)
+            limit: 조회할 최대 작업 수
+        
+        Returns:
+            Dict containing queued jobs with seconds until they may run
+        """
+        try:
+            reset = self.db.execute(RESET_STALE_JOBS_SQL, {"stale_seconds": stale_seconds}).rowcount
+            jobs = self.db.execute(QUEUED_JOBS_SQL, {"limit": limit}).all()
+            self.db.commit()
+            
+            return self.create_response(
+                message=f"{len(jobs)}개의 대기 작업을 조회했습니다.",
+                data={"reset": reset, "jobs": [{"id": str(job.id), "delay": job.delay} for job in jobs]}
+            )
+        
+        except SQLAlchemyError as e:
+            return self.handle_db_error(e, "recover report jobs")
+        except Exception as e:
+            logger.error(f"Unexpected error in recover_jobs: {str(e)}")
+            return self.create_error_response(
+                message="서버 오류가 발생했습니다.",
+                error_code="INTERNAL_ERROR"
+            )
+    
+    def start_batch_run(self, report_date: date, stale_seconds: int, force: bool = False) -> Dict[str, Any]:
+        """
+        리포트 날짜의 일괄 생성 실행 선점
+        
+        이미 완료했거나 다른 인스턴스가 실행 중인 날짜는 선점하지 않습니다.
+        
+        Args:
+            report_date: 리포트 날짜
+            stale_seconds: 실행 중 상태로 둘 최대 시간 (초, 넘기면 중단된 실행으로 보고 다시 선점)
+            force: 완료된 날짜도 다시 실행 (리포트가 없는 채널만 생성)
+        
+        Returns:
+            Dict containing whether this caller should run the batch
+        """
+        try:
+            claimed = self.db.execute(START_BATCH_RUN_SQL, {
+                "report_date": report_date, "stale_seconds": stale_seconds, "force": force
+            }).first()
+            self.db.commit()
+            
+            return self.create_response(
+                message="일괄 생성 실행을 시작했습니다." if claimed else "이미 완료했거나 실행 중인 날짜입니다.",
+                data={"report_date": report_date.isoformat(), "claimed": claimed is not None}
+            )
+        
+        except SQLAlchemyError as e:
+            return self.handle_db_error(e, "start report batch run")
+        except Exception as e:
+            logger.error(f"Unexpected error in start_batch_run: {str(e)}")
+            return self.create_error_response(
+                message="서버 오류가 발생했습니다.",
+                error_code="INTERNAL_ERROR"
+            )
+    
+    def get_batch_page(self, report_date: date, after_id: Optional[UUID], limit: int) -> Dict[str, Any]:
+        """
+        리포트가 없는 활성 채널 한 페이지와 그 채널들의 하루치 기록 조회
+        
+        채널별 다이제스트를 함께 읽으므로 페이지당 한 번만 조회합니다.
+        
+        Args:
+            report_date: 리포트 날짜
+            after_id: 이전 페이지의 마지막 채널 ID (첫 페이지는 None)
+            limit: 페이지 채널 수
+        
+        Returns:
+            Dict containing per-channel sources and the cursor for the next page
+        """
+        try:
+            channels = self.db.execute(_batch_channels_statement(report_date, after_id, limit)).all()
+            
+            return self.create_response(
+                message=f"{len(channels)}개 채널의 기록을 조회했습니다.",
+                data={
+                    "sources": [
+                        _build_sources(channel_id, report_date, senior_name, digest)
+                        for channel_id, senior_name, digest in channels
+                    ],
+                    "next_after": channels[-1].id if len(channels) == limit else None
+                }
+            )
+        
+        except SQLAlchemyError as e:
+            return self.handle_db_error(e, "get report batch page")
+        except Exception as e:
+            logger.error(f"Unexpected error in get_batch_page: {str(e)}")
+            return self.create_error_response(
+                message="서버 오류가 발생했습니다.",
+                error_code="INTERNAL_ERROR"
+            )
+    
+    def save_batch_reports(self, reports: List[Dict[str, Any]], generation_model: str) -> Dict[str, Any]:
+        """
+        일괄 생성한 리포트 저장 (한 트랜잭션)
+        
+        생성하는 동안 개별 요청으로 리포트가 만들어진 채널은 저장하지 않습니다.
+        
+        Args:
+            reports: sources/content/generation_time_ms 목록
+            generation_model: 생성 모델 이름
+        
+        Returns:
+            Dict containing saved and duplicate counts
+        """
+        try:
+            if not reports:
+                return self.create_response(message="저장할 리포트가 없습니다.", data={"saved": 0, "duplicates": 0})
+            
+            rows = [
+                _report_values(report["sources"], report["content"], generation_model, report["generation_time_ms"])
+                for report in reports
+            ]
+            saved = len(self.db.execute(_insert_reports_statement(rows)).all())
+            self.db.commit()
+            
+            return self.create_response(
+                message=f"{saved}개의 리포트를 저장했습니다.",
+                data={"saved": saved, "duplicates": len(reports) - saved}
+            )
+        
+        except SQLAlchemyError as e:
+            return self.handle_db_error(e, "save batch reports")
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Unexpected error in save_batch_reports: {str(e)}")
+            return self.create_error_response(
+                message="서버 오류가 발생했습니다.",
+                error_code="INTERNAL_ERROR"
+            )
+    
+    def finish_batch_run(
+        self,
+        report_date: date,
+        status: str,
+        summary: Dict[str, Any],
+        error: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        일괄 생성 실행 결과 기록
+        
+        Args:
+            report_date: 리포트 날짜
+            status: 실행 결과 (succeeded/failed)
+            summary: 처리 건수와 소요 시간 통계
+            error: 실행 중단 사유
+        
+        Returns:
+            Dict containing the recorded batch run
+        """
+        try:
+            self.db.execute(FINISH_BATCH_RUN_SQL, _batch_run_params(report_date, status, summary, error))
+            self.db.commit()
+            run = self.db.get(ReportBatchRun, report_date)
+            
+            return self.create_response(
+                message="일괄 생성 실행 결과를 기록했습니다.",
+                data=run.to_dict() if run else None
+            )
+        
+        except SQLAlchemyError as e:
+            return self.handle_db_error(e, "finish report batch run")
+        except Exception as e:
+            logger.error(f"Unexpected error in finish_batch_run: {str(e)}")
+            return self.create_error_response(
+                message="서버 오류가 발생했습니다.",
+                error_code="INTERNAL_ERROR"
+            )
+
+
+class AsyncReportService(AsyncBaseService):
+    """AI 리포트 서비스 (비동기)"""
+    
+    async def enqueue_report(self, channel_id: UUID, report_date: date, max_attempts: int) -> Dict[str, Any]:
+        """
+        리포트 생성 작업 등록
+        
+        같은 채널/날짜에 대기 중이거나 실행 중인 작업이 있으면 새로 만들지 않고 그 작업을 반환하며,
+        이미 리포트가 있으면 등록하지 않습니다 (REPORT_EXISTS).
+        
+        Args:
+            channel_id: 채널 ID
+            report_date: 리포트 날짜
+            max_attempts: 최대 실행 횟수
+        
+        Returns:
+            Dict containing job information and whether a new job was created
+        """
+        try:
+            if (await self.db.execute(_channel_exists_statement(channel_id))).scalar_one_or_none() is None:
+                return self.create_error_response(
+                    message="채널을 찾을 수 없습니다.",
+                    error_code="CHANNEL_NOT_FOUND"
+                )
+            
+            # 이미 생성된 리포트가 있으면 다시 만들지 않음
+            report_id = (await self.db.execute(_channel_report_statement(channel_id, report_date))).scalar_one_or_none()
+            if report_id is not None:
+                return self.create_error_response(
+                    message="이미 생성된 리포트가 있습니다.",
+                    error_code="REPORT_EXISTS",
+                    details={"report_id": str(report_id)}
+                )
+            
+            # 기존 작업이 그 사이에 끝나면 다시 등록 시도
+            for _ in range(3):
+                job_id = (await self.db.execute(ENQUEUE_JOB_SQL, {
+                    "channel_id": channel_id, "report_date": report_date, "max_attempts": max_attempts
+                })).scalar_one_or_none()
+                await self.db.commit()
+                
+                if job_id is not None:
+                    job = (await self.db.execute(_job_statement(job_id))).scalar_one()
+                    return self.create_response(
+                        message="리포트 생성 작업을 등록했습니다.",
+                        data={**job.to_dict(), "created": True}
+                    )
+                
+                job = (await self.db.execute(_pending_job_statement(channel_id, report_date))).scalar_one_or_none()
+                if job is not None:
+                    return self.create_response(
+                        message="이미 진행 중인 리포트 생성 작업이 있습니다.",
+                        data={**job.to_dict(), "created": False}
+                    )
+            
+            return self.create_error_response(
+                message="리포트 생성 작업을 등록하지 못했습니다.",
+                error_code="ENQUEUE_CONFLICT"
+            )
+        
+        except SQLAlchemyError as e:
+            return await self.handle_db_error(e, "enqueue report")
+        except Exception as e:
+            logger.error(f"Unexpected error in enqueue_report: {str(e)}")
+            return self.create_error_response(
+                message="서버 오류가 발생했습니다.",
+                error_code="INTERNAL_ERROR"
+            )
+    
+    async def get_job(self, job_id: UUID) -> Dict[str, Any]:
+        """
+        리포트 생성 작업 상태 조회
+        
+        Args:
+            job_id: 작업 ID
+        
+        Returns:
+            Dict containing job status
+        """
+        try:
+            job = (await self.db.execute(_job_statement(job_id))).scalar_one_or_none()
+            if not job:
+                return self.create_error_response(
+                    message="리포트 생성 작업을 찾을 수 없습니다.",
+                    error_code="JOB_NOT_FOUND"
+                )
+            
+            return self.create_response(
+                message="리포트 생성 작업을 조회했습니다.",
+                data=job.to_dict()
+            )
+        
+        except SQLAlchemyError as e:
+            return await self.handle_db_error(e, "get report job")
+        except Exception as e:
+            logger.error(f"Unexpected error in get_job: {str(e)}")
+            return self.create_error_response(
+                message="서버 오류가 발생했습니다.",
+                error_code="INTERNAL_ERROR"
+            )
+    
+    async def get_report(self, report_id: UUID) -> Dict[str, Any]:
+        """
+        AI 리포트 조회
+        
+        Args:
+            report_id: 리포트 ID
+        
+        Returns:
+            Dict containing report information
+        """
+        try:
+            report = await self.db.get(AIReport, report_id)
+            if not report:
+                return self.create_error_response(
+                    message="리포트를 찾을 수 없습니다.",
+                    error_code="REPORT_NOT_FOUND"
+                )
+            
+            return self.create_response(
+                message="리포트를 성공적으로 조회했습니다.",
+                data=report.to_dict(include_relations=True)
+            )
+        
+        except SQLAlchemyError as e:
+            return await self.handle_db_error(e, "get report")
+        except Exception as e:
+            logger.error(f"Unexpected error in get_report: {str(e)}")
+            return self.create_error_response(
+                message="서버 오류가 발생했습니다.",
+                error_code="INTERNAL_ERROR"
+            )
+    
+    async def save_translations(self, report_id: UUID, translations: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        리포트 번역 저장 (AIReport.translations에 언어별로 병합)
+        
+        Args:
+            report_id: 리포트 ID
+            translations: 언어 코드별 번역
+        
+        Returns:
+            Dict containing the saved languages
+        """
+        try:
+            row = (await self.db.execute(SAVE_TRANSLATIONS_SQL, {
+                "report_id": report_id, "translations": json.dumps(translations, ensure_ascii=False)
+            })).first()
+            await self.db.commit()
+            if not row:
+                return self.create_error_response(
+                    message="리포트를 찾을 수 없습니다.",
+                    error_code="REPORT_NOT_FOUND"
+                )
+            
+            return self.create_response(
+                message="리포트 번역을 저장했습니다.",
+                data={"report_id": str(report_id), "languages": sorted(translations)}
+            )
+        
+        except SQLAlchemyError as e:
+            return await self.handle_db_error(e, "save report translations")
+        except Exception as e:
+            logger.error(f"Unexpected error in save_translations: {str(e)}")
+            return self.create_error_response(
+                message="서버 오류가 발생했습니다.",
+                error_code="INTERNAL_ERROR"
+            )
+    
+    async def claim_job(self, job_id: UUID) -> Dict[str, Any]:
+        """
+        대기 중인 작업을 실행 상태로 선점하고 리포트 날짜의 기록 수집
+        
+        Args:
+            job_id: 작업 ID
+        
+        Returns:
+            Dict containing the claimed job and its source records
+        """
+        try:
+            job = (await self.db.execute(CLAIM_JOB_SQL, {"job_id": job_id})).first()
+            await self.db.commit()
+            if not job:
+                # 중복/오래된 큐 메시지로 실행 시각 전에 꺼낸 작업은 남은 시간 뒤에 다시 실행
+                delay = (await self.db.execute(JOB_DELAY_SQL, {"job_id": job_id})).scalar_one_or_none()
+                if delay is not None:
+                    return self.create_error_response(
+                        message="아직 실행 시각이 되지 않은 작업입니다.",
+                        error_code="JOB_NOT_DUE",
+                        details={"delay": delay}
+                    )
+                return self.create_error_response(
+                    message="대기 중인 작업이 아닙니다.",
+                    error_code="JOB_NOT_QUEUED"
+                )
+            
+            # 원본 테이블 대신 트리거가 미리 조립해 둔 다이제스트 한 행만 조회
+            row = (await self.db.execute(_digest_statement(job.channel_id, job.report_date))).first()
+            if row is None:
+                # 작업을 등록한 뒤 채널이 삭제됨 (재시도해도 성공할 수 없으므로 바로 실패 처리)
+                await self.db.execute(FAIL_JOB_SQL, {
+                    "job_id": job.id, "attempts": job.attempts, "retry": False, "delay": 0,
+                    "error": CHANNEL_NOT_FOUND_MESSAGE
+                })
+                await self.db.commit()
+                return self.create_error_response(
+                    message=CHANNEL_NOT_FOUND_MESSAGE,
+                    error_code="CHANNEL_NOT_FOUND"
+                )
+            channel_id, senior_name, digest = row
+            
+            return self.create_response(
+                message="리포트 생성 작업을 시작했습니다.",
+                data={"job": _claimed_job_data(job), "sources": _build_sources(channel_id, job.report_date, senior_name, digest)}
+            )
+        
+        except SQLAlchemyError as e:
+            return await self.handle_db_error(e, "claim report job")
+        except Exception as e:
+            logger.error(f"Unexpected error in claim_job: {str(e)}")
+            return self.create_error_response(
+                message="서버 오류가 발생했습니다.",
+                error_code="INTERNAL_ERROR"
+            )
+    
+    async def complete_job(
+        self,
+        job: Dict[str, Any],
+        sources: Dict[str, Any],
+        content: Dict[str, Any],
+        generation_model: str,
+        generation_time_ms: int
+    ) -> Dict[str, Any]:
+        """
+        생성된 리포트 저장 및 작업 완료 처리 (한 트랜잭션)
+        
+        Args:
+            job: claim_job 결과의 작업 정보
+            sources: claim_job 결과의 기록 (ID를 참조 배열로 저장)
+            content: 생성기 결과
+            generation_model: 생성 모델 이름
+            generation_time_ms: 생성 소요 시간 (밀리초)
+        
+        Returns:
+            Dict containing the created report ID
+        """
+        try:
+            values = _report_values(sources, content, generation_model, generation_time_ms)
+            report_id = (await self.db.execute(_insert_reports_statement([values]))).scalar_one_or_none()
+            if report_id is None:
+                # 생성하는 동안 일괄 생성이 같은 채널/날짜의 리포트를 먼저 저장한 경우 그 리포트로 작업 완료
+                report_id = (await self.db.execute(_channel_report_statement(values["channel_id"], values["report_date"]))).scalar_one()
+            
+            completed = (await self.db.execute(COMPLETE_JOB_SQL, {
+                "job_id": job["id"], "attempts": job["attempts"], "report_id": report_id
+            })).first()
+            if not completed:
+                await self.db.rollback()
+                return self.create_error_response(
+                    message="더 이상 유효하지 않은 작업 실행입니다.",
+                    error_code="JOB_NOT_RUNNING"
+                )
+            await self.db.commit()
+            
+            return self.create_response(
+                message="리포트를 생성했습니다.",
+                data={"job_id": job["id"], "report_id": str(report_id)}
+            )
+        
+        except SQLAlchemyError as e:
+            return await self.handle_db_error(e, "complete report job")
+        except Exception as e:
+            await self.db.rollback()
+            logger.error(f"Unexpected error in complete_job: {str(e)}")
+            return self.create_error_response(
+                message="서버 오류가 발생했습니다.",
+                error_code="INTERNAL_ERROR"
+            )
+    
+    async def fail_job(self, job: Dict[str, Any], error: str, retry_delay: Optional[float]) -> Dict[str, Any]:
+        """
+        작업 실패 기록
+        
+        Args:
+            job: claim_job 결과의 작업 정보
+            error: 실패 사유
+            retry_delay: 재시도 대기 시간 (초, None이면 최종 실패)
+        
+        Returns:
+            Dict containing the resulting job status
+        """
+        try:
+            row = (await self.db.execute(FAIL_JOB_SQL, {
+                "job_id": job["id"],
+                "attempts": job["attempts"],
+                "retry": retry_delay is not None,
+                "delay": retry_delay or 0,
+                "error": error[:MAX_ERROR_LENGTH]
+            })).first()
+            await self.db.commit()
+            
+            return self.create_response(
+                message="리포트 생성 작업 실패를 기록했습니다.",
+                data={"job_id": job["id"], "status": row.status if row else None}
+            )
+        
+        except SQLAlchemyError as e:
+            return await self.handle_db_error(e, "fail report job")
+        except Exception as e:
+            logger.error(f"Unexpected error in fail_job: {str(e)}")
+            return self.create_error_response(
+                message="서버 오류가 발생했습니다.",
+                error_code="INTERNAL_ERROR"
+            )
+    
+    async def recover_jobs(self, stale_seconds: int, limit: int) -> Dict[str, Any]:
+        """
+        중단된 실행을 대기 상태로 되돌리고 큐에 다시 넣을 대기 작업 조회
+        
+        Args:
+            stale_seconds: 실행 중 상태로 둘 최대 시간 (초)
+            limit: 조회할 최대 작업 수
+        
+        Returns:
+            Dict containing queued jobs with seconds until they may run
+        """
+        try:
+            reset = (await self.db.execute(RESET_STALE_JOBS_SQL, {"stale_seconds": stale_seconds})).rowcount
+            jobs = (await self.db.execute(QUEUED_JOBS_SQL, {"limit": limit})).all()
+            await self.db.commit()
+            
+            return self.create_response(
+                message=f"{len(jobs)}개의 대기 작업을 조회했습니다.",
+                data={"reset": reset, "jobs": [{"id": str(job.id), "delay": job.delay} for job in jobs]}
+            )
+        
+        except SQLAlchemyError as e:
+            return await self.handle_db_error(e, "recover report jobs")
+        except Exception as e:
+            logger.error(f"Unexpected error in recover_jobs: {str(e)}")
+            return self.create_error_response(
+                message="서버 오류가 발생했습니다.",
+                error_code="INTERNAL_ERROR"
+            )
+    
+    async def start_batch_run(self, report_date: date, stale_seconds: int, force: bool = False) -> Dict[str, Any]:
+        """
+        리포트 날짜의 일괄 생성 실행 선점
+        
+        이미 완료했거나 다른 인스턴스가 실행 중인 날짜는 선점하지 않습니다.
+        
+        Args:
+            report_date: 리포트 날짜
+            stale_seconds: 실행 중 상태로 둘 최대 시간 (초, 넘기면 중단된 실행으로 보고 다시 선점)
+            force: 완료된 날짜도 다시 실행 (리포트가 없는 채널만 생성)
+        
+        Returns:
+            Dict containing whether this caller should run the batch
+        """
+        try:
+            claimed = (await self.db.execute(START_BATCH_RUN_SQL, {
+                "report_date": report_date, "stale_seconds": stale_seconds, "force": force
+            })).first()
+            await self.db.commit()
+            
+            return self.create_response(
+                message="일괄 생성 실행을 시작했습니다." if claimed else "이미 완료했거나 실행 중인 날짜입니다.",
+                data={"report_date": report_date.isoformat(), "claimed": claimed is not None}
+            )
+        
+        except SQLAlchemyError as e:
+            return await self.handle_db_error(e, "start report batch run")
+        except Exception as e:
+            logger.error(f"Unexpected error in start_batch_run: {str(e)}")
+            return self.create_error_response(
+                message="서버 오류가 발생했습니다.",
+                error_code="INTERNAL_ERROR"
+            )
+    
+    async def get_batch_page(self, report_date: date, after_id: Optional[UUID], limit: int) -> Dict[str, Any]:
+        """
+        리포트가 없는 활성 채널 한 페이지와 그 채널들의 하루치 기록 조회
+        
+        채널별 다이제스트를 함께 읽으므로 페이지당 한 번만 조회합니다.
+        
+        Args:
+            report_date: 리포트 날짜
+            after_id: 이전 페이지의 마지막 채널 ID (첫 페이지는 None)
+            limit: 페이지 채널 수
+        
+        Returns:
+            Dict containing per-channel sources and the cursor for the next page
+        """
+        try:
+            channels = (await self.db.execute(_batch_channels_statement(report_date, after_id, limit))).all()
+            
+            return self.create_response(
+                message=f"{len(channels)}개 채널의 기록을 조회했습니다.",
+                data={
+                    "sources": [
+                        _build_sources(channel_id, report_date, senior_name, digest)
+                        for channel_id, senior_name, digest in channels
+                    ],
+                    "next_after": channels[-1].id if len(channels) == limit else None
+                }
+            )
+        
+        except SQLAlchemyError as e:
+            return await self.handle_db_error(e, "get report batch page")
+        except Exception as e:
+            logger.error(f"Unexpected error in get_batch_page: {str(e)}")
+            return self.create_error_response(
+                message="서버 오류가 발생했습니다.",
+                error_code="INTERNAL_ERROR"
+            )
+    
+    async def save_batch_reports(self, reports: List[Dict[str, Any]], generation_model: str) -> Dict[str, Any]:
+        """
+        일괄 생성한 리포트 저장 (한 트랜잭션)
+        
+        생성하는 동안 개별 요청으로 리포트가 만들어진 채널은 저장하지 않습니다.
+        
+        Args:
+            reports: sources/content/generation_time_ms 목록
+            generation_model: 생성 모델 이름
+        
+        Returns:
+            Dict containing saved and duplicate counts
+        """
+        try:
+            if not reports:
+                return self.create_response(message="저장할 리포트가 없습니다.", data={"saved": 0, "duplicates": 0})
+            
+            rows = [
+                _report_values(report["sources"], report["content"], generation_model, report["generation_time_ms"])
+                for report in reports
+            ]
+            saved = len((await self.db.execute(_insert_reports_statement(rows))).all())
+            await self.db.commit()
+            
+            return self.create_response(
+                message=f"{saved}개의 리포트를 저장했습니다.",
+                data={"saved": saved, "duplicates": len(reports) - saved}
+            )
+        
+        except SQLAlchemyError as e:
+            return await self.handle_db_error(e, "save batch reports")
+        except Exception as e:
+            await self.db.rollback()
+            logger.error(f"Unexpected error in save_batch_reports: {str(e)}")
+            return self.create_error_response(
+                message="서버 오류가 발생했습니다.",
+                error_code="INTERNAL_ERROR"
+            )
+    
+    async def finish_batch_run(
+        self,
+        report_date: date,
+        status: str,
+        summary: Dict[str, Any],
+        error: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        일괄 생성 실행 결과 기록
+        
+        Args:
+            report_date: 리포트 날짜
+            status: 실행 결과 (succeeded/failed)
+            summary: 처리 건수와 소요 시간 통계
+            error: 실행 중단 사유
+        
+        Returns:
+            Dict containing the recorded batch run
+        """
+        try:
+            await self.db.execute(FINISH_BATCH_RUN_SQL, _batch_run_params(report_date, status, summary, error))
+            await self.db.commit()
+            run = await self.db.get(ReportBatchRun, report_date)
+            
+            return self.create_response(
+                message="일괄 생성 실행 결과를 기록했습니다.",
+                data=run.to_dict() if run else None
+            )
+        
+        except SQLAlchemyError as e:
+            return await self.handle_db_error(e, "finish report batch run")
+        except Exception as e:
+            logger.error(f"Unexpected error in finish_batch_run: {str(e)}")
+            return self.create_error_response(
+                message="서버 오류가 발생했습니다.",
+                error_code="INTERNAL_ERROR"
+            )
@@ -0,0 +1,380 @@
+"""
+Sync Service for Sinabro API
+오프라인 앱용 채널 델타 동기화 (sync_changelog 워터마크 기반)
+"""
+
+from sqlalchemy import select, text
+from sqlalchemy.exc import SQLAlchemyError
+from typing import Optional, List, Dict, Any, Tuple
+from uuid import UUID
+import asyncio
+import logging
+
+from ..config import settings
+from ..database import SessionLocal, AsyncSessionLocal
+from ..models import DailyChecklist, CareNote, Photo, QuestionResponse, AIReport
+from .base import BaseService, AsyncBaseService
+from .pagination import InvalidCursorError, encode_cursor, decode_cursor
+
+logger = logging.getLogger(__name__)
+
+# 동기화 대상 엔티티 (sync_changelog.entity = 테이블명)
+SYNC_ENTITIES = {
+    "daily_checklists": DailyChecklist,
+    "care_notes": CareNote,
+    "photos": Photo,
+    "question_responses": QuestionResponse,
+    "ai_reports": AIReport
+}
+
+# 워터마크 이후 변경 조회
+# 아직 진행 중인 트랜잭션보다 앞선 트랜잭션의 변경만 반환하여
+# 늦게 커밋된 변경이 워터마크 뒤로 밀려 누락되지 않도록 (txid, seq) 순으로 정렬
+# 오래 열린 트랜잭션이 있으면 그 트랜잭션이 끝날 때까지 이후 변경이 모든 채널에서 반환되지 않음
+# (누락이 아니라 지연이며, 트랜잭션 종료 후 한 번에 전달됨 - 장시간 트랜잭션은 idle_in_transaction_session_timeout 등으로 제한)
+CHANGES_SQL = text("""
+    SELECT entity, entity_id, operation, txid::text AS txid, seq
+    FROM sync_changelog
+    WHERE channel_id = :channel_id
+      AND txid < pg_snapshot_xmin(pg_current_snapshot())
+      AND (txid, seq) > (CAST(:txid AS xid8), :seq)
+    ORDER BY txid, seq
+    LIMIT :limit
+""")
+
+# 워터마크가 정리된 삭제 기록보다 앞서는지 확인 (정리 기록이 없으면 NULL)
+WATERMARK_EXPIRED_SQL = text("""
+    SELECT (CAST(:txid AS xid8), :seq) < (txid, seq)
+    FROM sync_changelog_horizon
+    WHERE id = 1
+""")
+
+# 보관 기간이 지난 삭제 기록(tombstone) 정리
+# 정리한 기록 중 가장 늦은 위치를 같은 트랜잭션에서 horizon에 남겨 워터마크 만료 판단에 사용
+COMPACT_CHANGELOG_SQL = text("""
+    WITH pruned AS (
+        DELETE FROM sync_changelog
+        WHERE (entity, entity_id) IN (
+            SELECT entity, entity_id
+            FROM sync_changelog
+            WHERE operation = 'delete'
+              AND changed_at < NOW() - make_interval(secs => :retention_seconds)
+            ORDER BY changed_at
+            LIMIT :limit
+            FOR UPDATE SKIP LOCKED
+        )
+        RETURNING txid, seq
+    ), horizon AS (
+        INSERT INTO sync_changelog_horizon AS h (id, txid, seq)
+        SELECT 1, txid, seq FROM pruned ORDER BY txid DESC, seq DESC LIMIT 1
+        ON CONFLICT (id) DO UPDATE SET txid = EXCLUDED.txid, seq = EXCLUDED.seq, compacted_at = NOW()
+        WHERE (h.txid, h.seq) < (EXCLUDED.txid, EXCLUDED.seq)
+    )
+    SELECT count(*) FROM pruned
+""")
+
+INITIAL_POSITION = ("0", 0)
+WATERMARK_EXPIRED_MESSAGE = "워터마크가 만료되었습니다. 저장된 데이터를 지우고 워터마크 없이 전체 동기화하세요."
+
+
+def _decode_watermark(watermark: Optional[str]) -> Tuple[str, int]:
+    """워터마크를 (txid, seq)로 디코딩 (없으면 처음부터)"""
+    values = decode_cursor(watermark)
+    if values is None:
+        return INITIAL_POSITION
+    if len(values) != 2 or not str(values[0]).isdigit() or not isinstance(values[1], int):
+        raise InvalidCursorError("유효하지 않은 워터마크입니다.")
+    return str(values[0]), values[1]
+
+
+def _horizon_params(position: Tuple[str, int]) -> Dict[str, Any]:
+    return {"txid": position[0], "seq": position[1]}
+
+
+def _changes_params(channel_id: UUID, position: Tuple[str, int], size: int) -> Dict[str, Any]:
+    return {"channel_id": channel_id, "txid": position[0], "seq": position[1], "limit": size + 1}
+
+
+def _group_changes(changes) -> Dict[str, Dict[str, List[UUID]]]:
+    """변경 로그를 엔티티별 upsert/delete ID 목록으로 분류"""
+    grouped = {entity: {"upsert": [], "delete": []} for entity in SYNC_ENTITIES}
+    for change in changes:
+        if change.entity in grouped:
+            grouped[change.entity][change.operation].append(change.entity_id)
+    return grouped
+
+
+def _entity_statement(entity: str, ids: List[UUID]):
+    model = SYNC_ENTITIES[entity]
+    return select(model).where(model.id.in_(ids))
+
+
+def _sync_data(
+    channel_id: UUID,
+    watermark: Optional[str],
+    changes,
+    has_more: bool,
+    grouped: Dict[str, Dict[str, List[UUID]]],
+    loaded: Dict[str, List[Any]]
+) -> Dict[str, Any]:
+    """동기화 응답 구성 (조회 시점에 이미 삭제된 행은 deleted로 전달)"""
+    result = {}
+    for entity, operations in grouped.items():
+        rows = loaded.get(entity, [])
+        found = {row.id for row in rows}
+        result[entity] = {
+            "upserted": [row.to_dict() for row in rows],
+            "deleted": [str(entity_id) for entity_id in operations["delete"]] + [
+                str(entity_id) for entity_id in operations["upsert"] if entity_id not in found
+            ]
+        }
+    
+    last = changes[-1] if changes else None
+    return {
+        "channel_id": str(channel_id),
+        "watermark": encode_cursor([last.txid, last.seq]) if last else (watermark or encode_cursor(INITIAL_POSITION)),
+        "has_more": has_more,
+        "changes": result
+    }
+
+
+class SyncService(BaseService):
+    """델타 동기화 서비스"""
+    
+    def get_channel_changes(
+        self,
+        channel_id: UUID,
+        watermark: Optional[str] = None,
+        size: int = settings.SYNC_PAGE_SIZE
+    ) -> Dict[str, Any]:
+        """
+        채널의 워터마크 이후 변경 조회
+        
+        Args:
+            channel_id: 채널 ID
+            watermark: 이전 동기화 응답의 watermark (없으면 전체 동기화)
+            size: 최대 변경 건수
+        
+        Returns:
+            Dict containing upserted rows and deleted IDs per entity with the next watermark
+            (WATERMARK_EXPIRED error if deletions older than the watermark were compacted)
+        """
+        try:
+            position = _decode_watermark(watermark)
+            # 처음부터 동기화하는 경우가 아니면 정리된 삭제 기록을 놓치지 않았는지 확인
+            if position != INITIAL_POSITION and self.db.execute(WATERMARK_EXPIRED_SQL, _horizon_params(position)).scalar():
+                return self.create_error_response(message=WATERMARK_EXPIRED_MESSAGE, error_code="WATERMARK_EXPIRED")
+            
+            changes = self.db.execute(CHANGES_SQL, _changes_params(channel_id, position, size)).all()
+            has_more = len(changes) > size
+            changes = changes[:size]
+            
+            grouped = _group_changes(changes)
+            loaded = {
+                entity: self.db.execute(_entity_statement(entity, operations["upsert"])).scalars().all()
+                for entity, operations in grouped.items() if operations["upsert"]
+            }
+            
+            data = _sync_data(channel_id, watermark, changes, has_more, grouped, loaded)
+            
+            return self.create_response(
+                message=f"{len(changes)}건의 변경 사항을 조회했습니다.",
+                data=data
+            )
+        
+        except InvalidCursorError as e:
+            return self.create_error_response(message=str(e), error_code="INVALID_WATERMARK")
+        except SQLAlchemyError as e:
+            return self.handle_db_error(e, "get channel changes")
+        except Exception as e:
+            logger.error(f"Unexpected error in get_channel_changes: {str(e)}")
+            return self.create_error_response(
+                message="서버 오류가 발생했습니다.",
+                error_code="INTERNAL_ERROR"
+            )
+    
+    def compact_changelog(self, retention_seconds: int, limit: int) -> Dict[str, Any]:
+        """
+        보관 기간이 지난 삭제 기록 정리
+        
+        Args:
+            retention_seconds: 삭제 기록 보관 기간 (초)
+            limit: 한 번에 정리할 최대 건수
+        
+        Returns:
+            Dict containing the number of compacted tombstones
+        """
+        try:
+            params = {"retention_seconds": retention_seconds, "limit": limit}
+            deleted = self.db.execute(COMPACT_CHANGELOG_SQL, params).scalar()
+            self.db.commit()
+            
+            return self.create_response(
+                message=f"{deleted}건의 삭제 기록을 정리했습니다.",
+                data={"deleted": deleted}
+            )
+        
+        except SQLAlchemyError as e:
+            return self.handle_db_error(e, "compact sync changelog")
+        except Exception as e:
+            logger.error(f"Unexpected error in compact_changelog: {str(e)}")
+            return self.create_error_response(
+                message="서버 오류가 발생했습니다.",
+                error_code="INTERNAL_ERROR"
+            )
+
+
+class AsyncSyncService(AsyncBaseService):
+    """델타 동기화 서비스 (비동기)"""
+    
+    async def get_channel_changes(
+        self,
+        channel_id: UUID,
+        watermark: Optional[str] = None,
+        size: int = settings.SYNC_PAGE_SIZE
+    ) -> Dict[str, Any]:
+        """
+        채널의 워터마크 이후 변경 조회
+        
+        Args:
+            channel_id: 채널 ID
+            watermark: 이전 동기화 응답의 watermark (없으면 전체 동기화)
+            size: 최대 변경 건수
+        
+        Returns:
+            Dict containing upserted rows and deleted IDs per entity with the next watermark
+            (WATERMARK_EXPIRED error if deletions older than the watermark were compacted)
+        """
+        try:
+            position = _decode_watermark(watermark)
+            # 처음부터 동기화하는 경우가 아니면 정리된 삭제 기록을 놓치지 않았는지 확인
+            if position != INITIAL_POSITION and (await self.db.execute(WATERMARK_EXPIRED_SQL, _horizon_params(position))).scalar():
+                return self.create_error_response(message=WATERMARK_EXPIRED_MESSAGE, error_code="WATERMARK_EXPIRED")
+            
+            changes = (await self.db.execute(CHANGES_SQL, _changes_params(channel_id, position, size))).all()
+            has_more = len(changes) > size
+            changes = changes[:size]
+            
+            grouped = _group_changes(changes)
+            loaded = {}
+            for entity, operations in grouped.items():
+                if operations["upsert"]:
+                    loaded[entity] = (await self.db.execute(_entity_statement(entity, operations["upsert"]))).scalars().all()
+            
+            data = _sync_data(channel_id, watermark, changes, has_more, grouped, loaded)
+            
+            return self.create_response(
+                message=f"{len(changes)}건의 변경 사항을 조회했습니다.",
+                data=data
+            )
+        
+        except InvalidCursorError as e:
+            return self.create_error_response(message=str(e), error_code="INVALID_WATERMARK")
+        except SQLAlchemyError as e:
+            return await self.handle_db_error(e, "get channel changes")
+        except Exception as e:
+            logger.error(f"Unexpected error in get_channel_changes: {str(e)}")
+            return self.create_error_response(
+                message="서버 오류가 발생했습니다.",
+                error_code="INTERNAL_ERROR"
+            )
+    
+    async def compact_changelog(self, retention_seconds: int, limit: int) -> Dict[str, Any]:
+        """
+        보관 기간이 지난 삭제 기록 정리
+        
+        Args:
+            retention_seconds: 삭제 기록 보관 기간 (초)
+            limit: 한 번에 정리할 최대 건수
+        
+        Returns:
+            Dict containing the number of compacted tombstones
+        """
+        try:
+            params = {"retention_seconds": retention_seconds, "limit": limit}
+            deleted = (await self.db.execute(COMPACT_CHANGELOG_SQL, params)).scalar()
+            await self.db.commit()
+            
+            return self.create_response(
+                message=f"{deleted}건의 삭제 기록을 정리했습니다.",
+                data={"deleted": deleted}
+            )
+        
+        except SQLAlchemyError as e:
+            return await self.handle_db_error(e, "compact sync changelog")
+        except Exception as e:
+            logger.error(f"Unexpected error in compact_changelog: {str(e)}")
+            return self.create_error_response(
+                message="서버 오류가 발생했습니다.",
+                error_code="INTERNAL_ERROR"
+            )
+
+
+class SyncChangelogCompactor:
+    """보관 기간이 지난 동기화 삭제 기록 주기적 정리"""
+    
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+    
+    async def compact(self) -> int:
+        """
+        보관 기간이 지난 삭제 기록을 배치 단위로 모두 정리
+        
+        Returns:
+            정리한 삭제 기록 수
+        """
+        total = 0
+        while True:
+            result = await self._compact_batch()
+            if not result.get("success", True):
+                logger.error(f"Sync changelog compaction failed: {result.get('message')}")
+                break
+            deleted = result["data"]["deleted"]
+            total += deleted
+            if deleted < settings.SYNC_COMPACTION_BATCH_SIZE:
+                break
+        if total:
+            logger.info(f"Compacted {total} sync changelog tombstones")
+        return total
+    
+    async def _compact_batch(self) -> Dict[str, Any]:
+        args = (settings.SYNC_TOMBSTONE_RETENTION_DAYS * 86400, settings.SYNC_COMPACTION_BATCH_SIZE)
+        if settings.DB_ASYNC_MODE:
+            async with AsyncSessionLocal() as db:
+                return await AsyncSyncService(db).compact_changelog(*args)
+        
+        def _compact_with_session() -> Dict[str, Any]:
+            db = SessionLocal()
+            try:
+                return SyncService(db).compact_changelog(*args)
+            finally:
+                db.close()
+        
+        return await asyncio.to_thread(_compact_with_session)
+    
+    async def _compact_loop(self) -> None:
+        while True:
+            await asyncio.sleep(settings.SYNC_COMPACTION_INTERVAL_SECONDS)
+            try:
+                await self.compact()
+            except Exception as e:
+                logger.error(f"Sync changelog compaction failed: {e}")
+    
+    def start(self) -> None:
+        """백그라운드 정리 작업 시작"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._compact_loop())
+    
+    async def stop(self) -> None:
+        """백그라운드 정리 작업 종료"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+# 전역 동기화 변경 로그 정리기
+sync_changelog_compactor = SyncChangelogCompactor()
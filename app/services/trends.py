@@ -0,0 +1,147 @@
+"""
+Checklist Trend Service for Sinabro API
+체크리스트 롤업 테이블 기반 완료율 트렌드 조회
+"""
+
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+from datetime import date
+from typing import Optional, Dict, Any
+from uuid import UUID
+import logging
+
+from ..models import ChecklistRollup
+from .base import BaseService, AsyncBaseService
+
+logger = logging.getLogger(__name__)
+
+TREND_PERIODS = ("day", "week", "month")
+
+
+def _trend_statement(
+    channel_id: UUID,
+    period: str,
+    start_date: Optional[date],
+    end_date: Optional[date],
+    limit: int
+):
+    """롤업 조회 쿼리 (최근 기간부터 limit개)"""
+    stmt = select(ChecklistRollup).where(
+        ChecklistRollup.channel_id == channel_id,
+        ChecklistRollup.period == period,
+        ChecklistRollup.checklist_count > 0
+    )
+    if start_date:
+        stmt = stmt.where(ChecklistRollup.period_start >= start_date)
+    if end_date:
+        stmt = stmt.where(ChecklistRollup.period_start <= end_date)
+    return stmt.order_by(ChecklistRollup.period_start.desc()).limit(limit)
+
+
+def _trend_data(channel_id: UUID, period: str, rollups) -> Dict[str, Any]:
+    """롤업 목록을 시간순 트렌드 응답으로 변환"""
+    return {
+        "channel_id": str(channel_id),
+        "period": period,
+        "points": [rollup.to_dict() for rollup in reversed(rollups)]
+    }
+
+
+class ChecklistTrendService(BaseService):
+    """체크리스트 트렌드 서비스"""
+    
+    def get_completion_trends(
+        self,
+        channel_id: UUID,
+        period: str = "day",
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        limit: int = 30
+    ) -> Dict[str, Any]:
+        """
+        채널의 체크리스트 완료율 트렌드 조회 (원본 체크리스트 JSONB는 읽지 않음)
+        
+        Args:
+            channel_id: 채널 ID
+            period: 집계 단위 ('day', 'week', 'month')
+            start_date: 조회 시작일 (선택사항)
+            end_date: 조회 종료일 (선택사항)
+            limit: 최대 기간 수
+        
+        Returns:
+            Dict containing trend points in chronological order
+        """
+        try:
+            if period not in TREND_PERIODS:
+                return self.create_error_response(
+                    message="period는 'day', 'week', 'month' 중 하나여야 합니다.",
+                    error_code="INVALID_PERIOD"
+                )
+            
+            rollups = self.db.execute(
+                _trend_statement(channel_id, period, start_date, end_date, limit)
+            ).scalars().all()
+            
+            return self.create_response(
+                message=f"{len(rollups)}개 기간의 체크리스트 트렌드를 성공적으로 조회했습니다.",
+                data=_trend_data(channel_id, period, rollups)
+            )
+        
+        except SQLAlchemyError as e:
+            return self.handle_db_error(e, "get completion trends")
+        except Exception as e:
+            logger.error(f"Unexpected error in get_completion_trends: {str(e)}")
+            return self.create_error_response(
+                message="서버 오류가 발생했습니다.",
+                error_code="INTERNAL_ERROR"
+            )
+
+
+class AsyncChecklistTrendService(AsyncBaseService):
+    """체크리스트 트렌드 서비스 (비동기)"""
+    
+    async def get_completion_trends(
+        self,
+        channel_id: UUID,
+        period: str = "day",
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        limit: int = 30
+    ) -> Dict[str, Any]:
+        """
+        채널의 체크리스트 완료율 트렌드 조회 (원본 체크리스트 JSONB는 읽지 않음)
+        
+        Args:
+            channel_id: 채널 ID
+            period: 집계 단위 ('day', 'week', 'month')
+            start_date: 조회 시작일 (선택사항)
+            end_date: 조회 종료일 (선택사항)
+            limit: 최대 기간 수
+        
+        Returns:
+            Dict containing trend points in chronological order
+        """
+        try:
+            if period not in TREND_PERIODS:
+                return self.create_error_response(
+                    message="period는 'day', 'week', 'month' 중 하나여야 합니다.",
+                    error_code="INVALID_PERIOD"
+                )
+            
+            rollups = (await self.db.execute(
+                _trend_statement(channel_id, period, start_date, end_date, limit)
+            )).scalars().all()
+            
+            return self.create_response(
+                message=f"{len(rollups)}개 기간의 체크리스트 트렌드를 성공적으로 조회했습니다.",
+                data=_trend_data(channel_id, period, rollups)
+            )
+        
+        except SQLAlchemyError as e:
+            return await self.handle_db_error(e, "get completion trends")
+        except Exception as e:
+            logger.error(f"Unexpected error in get_completion_trends: {str(e)}")
+            return self.create_error_response(
+                message="서버 오류가 발생했습니다.",
+                error_code="INTERNAL_ERROR"
+            )
@@ -0,0 +1,142 @@
+"""
+Sinabro 사진 blob 저장소
+파일 내용의 SHA-256으로 주소를 정하는 저장소 (같은 내용은 한 번만 저장, 참조되지 않는 blob은 백그라운드 수거)
+"""
+
+from typing import Any, Dict, List, Optional
+import asyncio
+import glob
+import logging
+import os
+
+from config import settings
+from database import SessionLocal, AsyncSessionLocal
+from services import PhotoService, AsyncPhotoService
+from uploads import StreamedUpload, discard_file
+
+logger = logging.getLogger(__name__)
+
+# UPLOAD_DIR 아래 blob 디렉토리 (해시 앞 2+2자리로 분산하여 디렉토리당 파일 수 제한)
+BLOB_SUBDIR = "blobs"
+
+
+def blob_relative_path(sha256: str, file_type: str) -> str:
+    """blob의 UPLOAD_DIR 기준 경로 (blobs/ab/cd/<sha256>.<ext>)"""
+    return os.path.join(BLOB_SUBDIR, sha256[:2], sha256[2:4], f"{sha256}.{file_type}")
+
+
+def _fsync_directory(directory: str) -> None:
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+async def store_blob(upload: StreamedUpload, relative_path: str) -> bool:
+    """
+    임시 파일을 blob 경로로 원자적으로 이동 (같은 내용의 blob이 이미 있으면 임시 파일만 삭제)
+    
+    claim_blob으로 blob 행을 선점한 뒤 호출해야 수거 작업과 경합하지 않습니다.
+    
+    Args:
+        upload: receive_upload 결과
+        relative_path: blob_relative_path 결과
+    
+    Returns:
+        새로 저장했는지 여부
+    """
+    path = os.path.join(settings.UPLOAD_DIR, relative_path)
+    directory = os.path.dirname(path)
+    
+    def _store() -> bool:
+        if os.path.exists(path):
+            discard_file(upload.temp_path)
+            return False
+        os.makedirs(directory, exist_ok=True)
+        os.replace(upload.temp_path, path)
+        # 이름 변경(디렉토리 항목)까지 디스크에 반영
+        _fsync_directory(directory)
+        return True
+    
+    return await asyncio.to_thread(_store)
+
+
+def remove_blob_files(relative_paths: List[str]) -> None:
+    """blob 파일과 같은 이름으로 시작하는 렌디션 파일 삭제"""
+    for relative_path in relative_paths:
+        path = os.path.join(settings.UPLOAD_DIR, relative_path)
+        stem = os.path.splitext(path)[0]
+        for rendition_path in glob.glob(f"{glob.escape(stem)}_*"):
+            discard_file(rendition_path)
+        discard_file(path)
+
+
+class BlobCollector:
+    """참조되지 않는 blob 주기적 수거"""
+    
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+    
+    async def collect(self) -> int:
+        """
+        유예 시간이 지난 참조되지 않는 blob 수거
+        
+        Returns:
+            수거한 blob 수
+        """
+        total = 0
+        while True:
+            result = await self._collect_batch()
+            if not result.get("success", True):
+                logger.error(f"Blob collection failed: {result.get('message')}")
+                break
+            collected = result["data"]["collected"]
+            total += collected
+            if collected < settings.BLOB_GC_BATCH_SIZE:
+                break
+        if total:
+            logger.info(f"Collected {total} orphaned photo blobs")
+        return total
+    
+    async def _collect_batch(self) -> Dict[str, Any]:
+        args = (remove_blob_files, settings.BLOB_GC_GRACE_SECONDS, settings.BLOB_GC_BATCH_SIZE)
+        if settings.DB_ASYNC_MODE:
+            async with AsyncSessionLocal() as db:
+                return await AsyncPhotoService(db).collect_orphaned_blobs(*args)
+        
+        def _collect_with_session() -> Dict[str, Any]:
+            db = SessionLocal()
+            try:
+                return PhotoService(db).collect_orphaned_blobs(*args)
+            finally:
+                db.close()
+        
+        return await asyncio.to_thread(_collect_with_session)
+    
+    async def _collect_loop(self) -> None:
+        while True:
+            await asyncio.sleep(settings.BLOB_GC_INTERVAL_SECONDS)
+            try:
+                await self.collect()
+            except Exception as e:
+                logger.error(f"Blob collection failed: {e}")
+    
+    def start(self) -> None:
+        """백그라운드 수거 작업 시작"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._collect_loop())
+    
+    async def stop(self) -> None:
+        """백그라운드 수거 작업 종료"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+# 전역 blob 수거기
+blob_collector = BlobCollector()
@@ -0,0 +1,372 @@
+"""
+Sinabro AI 리포트 번역
+리포트 문장을 가족의 언어로 번역 (문장 단위 2단계 캐시, 요청 묶음 전송, 언어별 동시 번역)
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+import asyncio
+import hashlib
+import json
+import logging
+import re
+
+from config import settings
+from cache import CacheManager, TTLCache, cache_manager
+
+logger = logging.getLogger(__name__)
+
+GOOGLE_TRANSLATE_URL = "https://translation.googleapis.com/language/translate/v2"
+
+# 문장 경계 (마침표/물음표/느낌표 뒤 공백)
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?。！？])\s+")
+
+# 번역문을 문장 사이 공백 없이 잇는 언어
+NO_SPACE_LANGUAGES = ("ja", "zh")
+
+# 번역하는 리포트 항목 (recommendations는 문장 목록)
+REPORT_TEXT_FIELDS = ("summary_text", "family_comment")
+
+
+class TranslationError(Exception):
+    """번역 실패 (retryable이면 백오프 후 다시 요청)"""
+    
+    def __init__(self, message: str, retryable: bool = True):
+        super().__init__(message)
+        self.retryable = retryable
+
+
+def split_sentences(text: Optional[str]) -> List[str]:
+    """번역/캐시 단위인 문장으로 분리 (리포트마다 반복되는 문장은 한 번만 번역되도록)"""
+    return [sentence for sentence in SENTENCE_BOUNDARY.split((text or "").strip()) if sentence]
+
+
+def join_sentences(sentences: List[str], language: str) -> str:
+    separator = "" if language.split("-")[0].lower() in NO_SPACE_LANGUAGES else " "
+    return separator.join(sentence.strip() for sentence in sentences)
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def pack_batches(texts: List[str], max_segments: int, max_chars: int) -> List[List[str]]:
+    """
+    번역 API 요청 단위로 문장 묶기
+    
+    Args:
+        texts: 번역할 문장들
+        max_segments: 요청 1건의 최대 문장 수
+        max_chars: 요청 1건의 최대 글자 수 (이보다 긴 문장은 단독 요청)
+    
+    Returns:
+        요청별 문장 목록
+    """
+    batches: List[List[str]] = []
+    current: List[str] = []
+    chars = 0
+    for text in texts:
+        if current and (len(current) >= max_segments or chars + len(text) > max_chars):
+            batches.append(current)
+            current, chars = [], 0
+        current.append(text)
+        chars += len(text)
+    if current:
+        batches.append(current)
+    return batches
+
+
+class Translator(ABC):
+    """번역기 기본 클래스"""
+    
+    name = "unknown"
+    
+    @abstractmethod
+    async def translate(self, texts: List[str], target: str, source: str) -> List[str]:
+        """
+        문장 묶음 번역 (요청 1건)
+        
+        Args:
+            texts: 번역할 문장들
+            target: 대상 언어 코드
+            source: 원문 언어 코드
+        
+        Returns:
+            texts와 같은 순서의 번역문
+        
+        Raises:
+            TranslationError: 번역 실패
+        """
+    
+    async def close(self) -> None:
+        """클라이언트 연결 정리"""
+
+
+class StubTranslator(Translator):
+    """
+    로컬 대역 번역기
+    외부 API 없이 개발/테스트 환경에서 캐시/묶음 전송 경로를 실행하기 위해 언어 표시만 붙여 돌려줌
+    (응답 지연은 TRANSLATION_STUB_LATENCY_MS로 흉내 냄)
+    """
+    
+    name = "sinabro-stub"
+    
+    async def translate(self, texts: List[str], target: str, source: str) -> List[str]:
+        await asyncio.sleep(settings.TRANSLATION_STUB_LATENCY_MS / 1000)
+        return [f"[{target}] {text}" for text in texts]
+
+
+class GoogleTranslator(Translator):
+    """Google Cloud Translation (v2 REST, API 키 인증) 기반 번역기"""
+    
+    name = "google-translate-v2"
+    
+    def __init__(self):
+        import httpx
+        
+        self.client = httpx.AsyncClient(timeout=settings.TRANSLATION_TIMEOUT_SECONDS)
+    
+    async def translate(self, texts: List[str], target: str, source: str) -> List[str]:
+        import httpx
+        
+        try:
+            response = await self.client.post(
+                GOOGLE_TRANSLATE_URL,
+                params={"key": settings.GOOGLE_TRANSLATE_API_KEY},
+                json={"q": texts, "target": target, "source": source, "format": "text"}
+            )
+        except httpx.HTTPError as e:
+            raise TranslationError(f"Google 번역 연결 오류: {e}")
+        
+        if response.status_code == 429 or response.status_code >= 500:
+            raise TranslationError(f"Google 번역 일시 오류: HTTP {response.status_code}")
+        if response.status_code >= 400:
+            # 인증/언어 코드 오류는 다시 시도해도 같은 결과
+            raise TranslationError(f"Google 번역 요청 오류: HTTP {response.status_code} {response.text[:200]}", retryable=False)
+        
+        try:
+            translations = [item["translatedText"] for item in response.json()["data"]["translations"]]
+        except (ValueError, KeyError, TypeError):
+            raise TranslationError("Google 번역 응답 형식을 해석할 수 없습니다.")
+        if len(translations) != len(texts):
+            raise TranslationError("Google 번역 응답의 문장 수가 요청과 다릅니다.")
+        return translations
+    
+    async def close(self) -> None:
+        await self.client.aclose()
+
+
+def create_translator() -> Translator:
+    """설정(TRANSLATION_PROVIDER)에 맞는 번역기 생성"""
+    provider = settings.TRANSLATION_PROVIDER.lower()
+    if provider == "stub":
+        return StubTranslator()
+    if provider == "google":
+        if not settings.GOOGLE_TRANSLATE_API_KEY:
+            raise ValueError("TRANSLATION_PROVIDER=google에는 GOOGLE_TRANSLATE_API_KEY가 필요합니다.")
+        return GoogleTranslator()
+    raise ValueError(f"지원하지 않는 TRANSLATION_PROVIDER입니다: {settings.TRANSLATION_PROVIDER}")
+
+
+class TranslationManager:
+    """
+    문장 번역 캐시 및 번역 API 요청 관리
+    프로세스 내 캐시 → Redis 공유 캐시 → 번역 API 순으로 조회하며,
+    동시에 들어온 같은 문장은 진행 중인 요청 하나의 결과를 함께 기다림
+    """
+    
+    KEY_PREFIX = "translation:"
+    
+    def __init__(self, cache: CacheManager):
+        self.cache = cache
+        self.local = TTLCache(
+            maxsize=settings.TRANSLATION_LOCAL_CACHE_SIZE,
+            ttl=settings.TRANSLATION_LOCAL_CACHE_TTL
+        )
+        self.translator: Optional[Translator] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.stats = {
+            "local_hits": 0, "shared_hits": 0, "misses": 0, "inflight_waits": 0,
+            "api_calls": 0, "api_errors": 0
+        }
+    
+    def start(self) -> None:
+        """번역기 생성"""
+        if self.translator is None:
+            self.translator = create_translator()
+            self._semaphore = asyncio.Semaphore(settings.TRANSLATION_CONCURRENCY)
+    
+    async def stop(self) -> None:
+        """번역기 연결 정리"""
+        if self.translator is not None:
+            await self.translator.close()
+            self.translator = None
+    
+    def _key(self, text: str, target: str, source: str) -> str:
+        return f"{self.KEY_PREFIX}{source}:{target}:{content_hash(text)}"
+    
+    async def translate_texts(self, texts: List[str], target: str, source: Optional[str] = None) -> List[str]:
+        """
+        문장 목록 번역
+        
+        Args:
+            texts: 번역할 문장들 (중복 가능)
+            target: 대상 언어 코드
+            source: 원문 언어 코드 (기본값: TRANSLATION_SOURCE_LANGUAGE)
+        
+        Returns:
+            texts와 같은 순서의 번역문
+        
+        Raises:
+            TranslationError: 캐시에 없는 문장의 번역 실패
+        """
+        source = source or settings.TRANSLATION_SOURCE_LANGUAGE
+        if target == source:
+            return list(texts)
+        self.start()
+        
+        keys = {text: self._key(text, target, source) for text in texts if text.strip()}
+        found: Dict[str, str] = {}
+        
+        # 1단계: 프로세스 내 캐시
+        missing = []
+        for text, key in keys.items():
+            value = self.local.get(key)
+            if value is not None:
+                found[text] = value
+            else:
+                missing.append(text)
+        local_hits = len(found)
+        self.stats["local_hits"] += local_hits
+        
+        # 2단계: Redis 공유 캐시 (한 번의 MGET)
+        if missing:
+            shared = await self.cache.get_many_json([keys[text] for text in missing])
+            for text in missing:
+                if keys[text] in shared:
+                    found[text] = shared[keys[text]]
+                    self.local.set(keys[text], found[text])
+            missing = [text for text in missing if text not in found]
+            self.stats["shared_hits"] += len(found) - local_hits
+        
+        # 3단계: 번역 API (다른 요청이 이미 번역 중인 문장은 그 결과를 기다림)
+        waiting: Dict[str, asyncio.Future] = {}
+        owned: List[str] = []
+        for text in missing:
+            future = self._inflight.get(keys[text])
+            if future is not None:
+                waiting[text] = future
+            else:
+                self._inflight[keys[text]] = asyncio.get_running_loop().create_future()
+                owned.append(text)
+        self.stats["misses"] += len(owned)
+        self.stats["inflight_waits"] += len(waiting)
+        
+        if owned:
+            try:
+                translated = await self._translate_missing(owned, target, source)
+            except BaseException as e:
+                # 이 요청이 취소되어도 같은 문장을 기다리는 다른 요청은 취소가 아닌 번역 실패로 처리
+                error = e if isinstance(e, Exception) else TranslationError("번역 요청이 취소되었습니다.")
+                for text in owned:
+                    future = self._inflight.pop(keys[text])
+                    future.set_exception(error)
+                    # 기다리는 요청이 없을 때 미확인 예외 경고가 남지 않도록
+                    future.exception()
+                raise
+            
+            for text in owned:
+                self._inflight.pop(keys[text]).set_result(translated[text])
+                self.local.set(keys[text], translated[text])
+            found.update(translated)
+            await self.cache.set_many_json(
+                {keys[text]: translated[text] for text in owned},
+                settings.TRANSLATION_CACHE_TTL
+            )
+        
+        for text, future in waiting.items():
+            found[text] = await asyncio.shield(future)
+        
+        return [found.get(text, text) for text in texts]
+    
+    async def _translate_missing(self, texts: List[str], target: str, source: str) -> Dict[str, str]:
+        batches = pack_batches(texts, settings.TRANSLATION_BATCH_SEGMENTS, settings.TRANSLATION_BATCH_CHARS)
+        results = await asyncio.gather(*(self._request(batch, target, source) for batch in batches))
+        return {text: translated for batch, result in zip(batches, results) for text, translated in zip(batch, result)}
+    
+    async def _request(self, batch: List[str], target: str, source: str) -> List[str]:
+        """번역 API 요청 1건 (동시 요청 수 제한, 일시 오류는 지수 백오프로 재시도)"""
+        for attempt in range(1, settings.TRANSLATION_MAX_ATTEMPTS + 1):
+            async with self._semaphore:
+                self.stats["api_calls"] += 1
+                try:
+                    return await asyncio.wait_for(
+                        self.translator.translate(batch, target, source),
+                        settings.TRANSLATION_TIMEOUT_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    error = TranslationError(f"번역 API가 {settings.TRANSLATION_TIMEOUT_SECONDS:g}초 안에 응답하지 않았습니다.")
+                except TranslationError as e:
+                    error = e
+            
+            self.stats["api_errors"] += 1
+            if not error.retryable or attempt == settings.TRANSLATION_MAX_ATTEMPTS:
+                raise error
+            await asyncio.sleep(settings.TRANSLATION_RETRY_BASE_SECONDS * 2 ** (attempt - 1))
+    
+    async def translate_report(self, report: Dict[str, Any], languages: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        리포트를 여러 언어로 번역
+        
+        원문이 바뀌지 않은 기존 번역은 그대로 사용하고, 나머지 언어는 동시에 번역합니다.
+        (번역 API 동시 요청 수는 언어와 관계없이 TRANSLATION_CONCURRENCY로 제한)
+        
+        Args:
+            report: AIReport.to_dict() 결과
+            languages: 대상 언어 코드들
+        
+        Returns:
+            언어별 번역 (AIReport.translations 항목 형식)
+        """
+        self.start()
+        original = {field: report.get(field) or "" for field in REPORT_TEXT_FIELDS}
+        original["recommendations"] = [str(item) for item in report.get("recommendations") or []]
+        source_hash = content_hash(json.dumps(original, ensure_ascii=False, sort_keys=True))
+        
+        sentences = {field: split_sentences(original[field]) for field in REPORT_TEXT_FIELDS}
+        recommendation_sentences = [split_sentences(item) for item in original["recommendations"]]
+        texts = [text for field in REPORT_TEXT_FIELDS for text in sentences[field]]
+        texts += [text for item in recommendation_sentences for text in item]
+        
+        existing = report.get("translations") or {}
+        
+        async def _translate(language: str) -> Tuple[str, Dict[str, Any]]:
+            current = existing.get(language)
+            if isinstance(current, dict) and current.get("source_hash") == source_hash:
+                return language, current
+            
+            translated = dict(zip(texts, await self.translate_texts(texts, language)))
+            return language, {
+                **{field: join_sentences([translated[text] for text in sentences[field]], language) for field in REPORT_TEXT_FIELDS},
+                "recommendations": [join_sentences([translated[text] for text in item], language) for item in recommendation_sentences],
+                "source_language": settings.TRANSLATION_SOURCE_LANGUAGE,
+                "source_hash": source_hash,
+                "provider": self.translator.name,
+                "translated_at": datetime.now(timezone.utc).isoformat()
+            }
+        
+        return dict(await asyncio.gather(*(_translate(language) for language in languages)))
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """번역 캐시/요청 통계"""
+        return {
+            "provider": self.translator.name if self.translator else None,
+            "local_size": len(self.local),
+            **self.stats
+        }
+
+
+# 전역 번역 관리자
+translation_manager = TranslationManager(cache_manager)
@@ -0,0 +1,300 @@
+"""
+Sinabro 파일 업로드 스트리밍
+multipart 요청 본문을 메모리에 모으지 않고 청크 단위로 디스크에 기록
+"""
+
+from fastapi import Request
+from multipart.multipart import MultipartParser, parse_options_header
+from typing import Dict, List, Optional, Tuple
+import aiofiles
+import asyncio
+import hashlib
+import logging
+import os
+import uuid
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+# 파일 형식 판별에 필요한 선두 바이트 수
+SNIFF_SIZE = 12
+
+# 일반 폼 필드 제한 (파일 외 필드는 작은 텍스트만 허용)
+MAX_FIELD_SIZE = 4096
+MAX_FIELDS = 16
+
+# multipart 경계/헤더 등 파일 외 본문 여유분
+MULTIPART_OVERHEAD = 64 * 1024
+
+# 임시 파일 디렉토리 (같은 파일 시스템 안에서 원자적으로 이동)
+TEMP_SUBDIR = ".incoming"
+
+
+class UploadRejected(Exception):
+    """업로드 거부 (라우터에서 HTTP 오류로 변환)"""
+    
+    def __init__(self, message: str, status_code: int = 400, error_code: str = "INVALID_UPLOAD"):
+        super().__init__(message)
+        self.message = message
+        self.status_code = status_code
+        self.error_code = error_code
+
+
+def detect_file_type(head: bytes) -> Optional[str]:
+    """선두 바이트(매직 넘버)로 파일 형식 판별 (확장자 이름으로 반환)"""
+    if head.startswith(b"\xff\xd8\xff"):
+        return "jpg"
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "png"
+    if head.startswith((b"GIF87a", b"GIF89a")):
+        return "gif"
+    if head.startswith(b"RIFF") and head[8:12] == b"WEBP":
+        return "webp"
+    if head.startswith(b"%PDF-"):
+        return "pdf"
+    return None
+
+
+def allowed_file_types() -> set:
+    """설정의 허용 확장자 (jpeg는 jpg로 통일)"""
+    return {"jpg" if ext.lower() == "jpeg" else ext.lower() for ext in settings.ALLOWED_EXTENSIONS}
+
+
+class StreamedUpload:
+    """디스크 임시 파일로 수신된 업로드"""
+    
+    def __init__(self, fields: Dict[str, str], temp_path: str, file_name: Optional[str], file_type: str, size: int, sha256: str):
+        self.fields = fields
+        self.temp_path = temp_path
+        self.file_name = file_name
+        self.file_type = file_type
+        self.size = size
+        self.sha256 = sha256
+    
+    def discard(self) -> None:
+        """임시 파일 삭제"""
+        discard_file(self.temp_path)
+
+
+def discard_file(path: Optional[str]) -> None:
+    if path:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Failed to remove upload file {path}: {e}")
+
+
+class _PartEvents:
+    """
+    python-multipart 콜백 수집기
+    파서 콜백은 동기 함수이므로 요청 청크 하나 분량의 이벤트만 모아 두고 비동기 루프에서 처리
+    """
+    
+    def __init__(self):
+        self.events: List[Tuple[str, object]] = []
+        self._headers: Dict[bytes, bytes] = {}
+        self._field = b""
+        self._value = b""
+    
+    def drain(self) -> List[Tuple[str, object]]:
+        events, self.events = self.events, []
+        return events
+    
+    def on_part_begin(self) -> None:
+        self._headers = {}
+    
+    def on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._field += data[start:end]
+    
+    def on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._value += data[start:end]
+    
+    def on_header_end(self) -> None:
+        self._headers[self._field.lower()] = self._value
+        self._field, self._value = b"", b""
+    
+    def on_headers_finished(self) -> None:
+        _, options = parse_options_header(self._headers.get(b"content-disposition", b""))
+        name = options.get(b"name", b"").decode("utf-8", "replace")
+        filename = options.get(b"filename")
+        self.events.append(("begin", (name, filename.decode("utf-8", "replace") if filename is not None else None)))
+    
+    def on_part_data(self, data: bytes, start: int, end: int) -> None:
+        self.events.append(("data", data[start:end]))
+    
+    def on_part_end(self) -> None:
+        self.events.append(("end", None))
+    
+    def callbacks(self) -> dict:
+        return {
+            "on_part_begin": self.on_part_begin,
+            "on_header_field": self.on_header_field,
+            "on_header_value": self.on_header_value,
+            "on_header_end": self.on_header_end,
+            "on_headers_finished": self.on_headers_finished,
+            "on_part_data": self.on_part_data,
+            "on_part_end": self.on_part_end
+        }
+
+
+class _UploadWriter:
+    """파트 이벤트를 받아 폼 필드는 메모리에, 파일은 임시 파일에 기록"""
+    
+    def __init__(self, file_field: str, max_size: int, temp_dir: str):
+        self.file_field = file_field
+        self.max_size = max_size
+        self.temp_dir = temp_dir
+        self.fields: Dict[str, str] = {}
+        self.temp_path: Optional[str] = None
+        self.file_name: Optional[str] = None
+        self.file_type: Optional[str] = None
+        self.size = 0
+        self.digest = hashlib.sha256()
+        self._part: Optional[str] = None
+        self._value = bytearray()
+        self._head = b""
+        self._file = None
+    
+    async def handle(self, kind: str, payload) -> None:
+        if kind == "begin":
+            name, filename = payload
+            if name == self.file_field and filename is not None:
+                if self.temp_path is not None:
+                    raise UploadRejected("파일은 하나만 업로드할 수 있습니다.")
+                await self._open(filename)
+            elif len(self.fields) >= MAX_FIELDS:
+                raise UploadRejected("폼 필드가 너무 많습니다.")
+            self._part = name
+        elif kind == "data":
+            if self._file is not None:
+                await self._write(payload)
+            else:
+                self._value.extend(payload)
+                if len(self._value) > MAX_FIELD_SIZE:
+                    raise UploadRejected(f"'{self._part}' 필드가 너무 깁니다.")
+        elif kind == "end":
+            if self._file is not None:
+                await self._close()
+            else:
+                self.fields[self._part] = self._value.decode("utf-8", "replace")
+                self._value = bytearray()
+            self._part = None
+    
+    async def _open(self, filename: str) -> None:
+        self.file_name = os.path.basename(filename) or None
+        self.temp_path = os.path.join(self.temp_dir, uuid.uuid4().hex)
+        self._file = await aiofiles.open(self.temp_path, "wb")
+    
+    async def _write(self, data: bytes) -> None:
+        self.size += len(data)
+        if self.size > self.max_size:
+            raise UploadRejected(
+                f"파일 크기가 최대 허용 크기({self.max_size} bytes)를 초과했습니다.",
+                status_code=413,
+                error_code="FILE_TOO_LARGE"
+            )
+        
+        if self.file_type is None:
+            # 형식 판별에 필요한 선두 바이트가 모일 때까지 확인 후 나머지는 그대로 기록
+            self._head += data[:SNIFF_SIZE - len(self._head)]
+            if len(self._head) >= SNIFF_SIZE:
+                self._check_type()
+        
+        # 기록하면서 내용 해시 계산 (저장 후 파일을 다시 읽지 않음)
+        self.digest.update(data)
+        await self._file.write(data)
+    
+    def _check_type(self) -> None:
+        file_type = detect_file_type(self._head)
+        if file_type is None or file_type not in allowed_file_types():
+            raise UploadRejected(
+                "허용되지 않는 파일 형식입니다.",
+                status_code=415,
+                error_code="UNSUPPORTED_FILE_TYPE"
+            )
+        self.file_type = file_type
+    
+    async def _close(self) -> None:
+        if self.file_type is None:
+            # SNIFF_SIZE보다 작은 파일
+            self._check_type()
+        # 디스크에 기록된 뒤에만 DB 행을 쓰도록 fsync
+        await self._file.flush()
+        await asyncio.to_thread(os.fsync, self._file.fileno())
+        await self._file.close()
+        self._file = None
+    
+    async def abort(self) -> None:
+        if self._file is not None:
+            await self._file.close()
+            self._file = None
+        discard_file(self.temp_path)
+
+
+async def receive_upload(request: Request, file_field: str = "file", max_size: Optional[int] = None) -> StreamedUpload:
+    """
+    multipart 요청 본문을 스트리밍으로 수신
+    
+    메모리 사용량은 요청 청크 크기로 제한되며, 최대 크기를 넘거나
+    선두 바이트가 허용된 형식이 아니면 본문을 끝까지 읽지 않고 즉시 중단합니다.
+    
+    Args:
+        request: multipart/form-data 요청
+        file_field: 파일 파트 이름
+        max_size: 최대 파일 크기 (기본값: settings.MAX_FILE_SIZE)
+    
+    Returns:
+        임시 파일로 저장된 업로드 (storage.store_blob 또는 discard로 정리)
+    
+    Raises:
+        UploadRejected: 형식/크기 위반
+    """
+    max_size = max_size or settings.MAX_FILE_SIZE
+    
+    content_type, options = parse_options_header(request.headers.get("content-type", ""))
+    boundary = options.get(b"boundary")
+    if content_type != b"multipart/form-data" or not boundary:
+        raise UploadRejected("multipart/form-data 요청이어야 합니다.", status_code=415, error_code="UNSUPPORTED_MEDIA_TYPE")
+    
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > max_size + MULTIPART_OVERHEAD:
+        raise UploadRejected(
+            f"파일 크기가 최대 허용 크기({max_size} bytes)를 초과했습니다.",
+            status_code=413,
+            error_code="FILE_TOO_LARGE"
+        )
+    
+    temp_dir = os.path.join(settings.UPLOAD_DIR, TEMP_SUBDIR)
+    os.makedirs(temp_dir, exist_ok=True)
+    
+    events = _PartEvents()
+    parser = MultipartParser(boundary, events.callbacks())
+    writer = _UploadWriter(file_field, max_size, temp_dir)
+    
+    try:
+        async for chunk in request.stream():
+            parser.write(chunk)
+            for kind, payload in events.drain():
+                await writer.handle(kind, payload)
+        parser.finalize()
+        for kind, payload in events.drain():
+            await writer.handle(kind, payload)
+    except UploadRejected:
+        await writer.abort()
+        raise
+    except Exception as e:
+        await writer.abort()
+        logger.warning(f"Malformed multipart upload: {e}")
+        raise UploadRejected("잘못된 multipart 요청입니다.")
+    
+    if writer.temp_path is None or writer.file_type is None:
+        await writer.abort()
+        raise UploadRejected(f"'{file_field}' 파일이 필요합니다.", error_code="FILE_REQUIRED")
+    
+    return StreamedUpload(
+        writer.fields, writer.temp_path, writer.file_name, writer.file_type, writer.size, writer.digest.hexdigest()
+    )
+
@@ -0,0 +1,163 @@
+"""
+Sinabro 응답 페이로드 크기 벤치마크
+대표 응답 봉투를 JSON / JSON+gzip / MessagePack / MessagePack+gzip으로 인코딩한 크기 비교
+
+사용법:
+    python benchmarks/payload_size.py [--items N]
+"""
+
+from datetime import datetime, timedelta, timezone, date
+import argparse
+import gzip
+import uuid
+
+import msgpack
+import orjson
+
+# 앱의 GZIP_MINIMUM_SIZE 기본값과 동일 (이보다 작은 응답은 압축하지 않음)
+GZIP_MINIMUM_SIZE = 1024
+GZIP_LEVEL = 9  # starlette GZipMiddleware 기본 압축 수준
+
+
+def _envelope(message, data, **extra):
+    """BaseService.create_response와 같은 응답 봉투"""
+    return {"success": True, "message": message, "data": data, **extra}
+
+
+def _timestamp(offset_minutes):
+    return (datetime(2024, 1, 15, 9, 0, tzinfo=timezone.utc) + timedelta(minutes=offset_minutes)).isoformat()
+
+
+def _person(prefix, index):
+    return {
+        "id": str(uuid.uuid4()),
+        "full_name": f"{prefix} {index}",
+        "phone": "+82-10-1234-5678",
+        "email": f"{prefix.lower()}{index}@example.com",
+        "created_at": _timestamp(index)
+    }
+
+
+def my_channels(count):
+    """GET /api/v1/channels/my"""
+    channels = [
+        {
+            "id": str(uuid.uuid4()),
+            "channel_name": f"김영희 어르신 돌봄 채널 {index}",
+            "status": "active",
+            "start_date": date(2024, 1, 1).isoformat(),
+            "end_date": None,
+            "created_at": _timestamp(index),
+            "updated_at": _timestamp(index + 60),
+            "guardian": _person("Guardian", index),
+            "caregiver": _person("Caregiver", index),
+            "senior": {**_person("Senior", index), "birth_date": "1940-03-01", "care_level": "3등급"}
+        }
+        for index in range(count)
+    ]
+    return _envelope(
+        f"{count}개의 채널을 성공적으로 조회했습니다.",
+        channels,
+        pagination={"size": count, "has_more": True, "next_cursor": "WyIyMDI0LTAxLTE1VDA5OjAwOjAwKzAwOjAwIl0", "total": None, "total_is_exact": None}
+    )
+
+
+def checklist_templates(count):
+    """GET /api/v1/checklists/templates"""
+    templates = [
+        {
+            "id": str(uuid.uuid4()),
+            "name": f"기본 건강관리 체크리스트 {index}",
+            "category": "health_management",
+            "items": [
+                {"id": item, "text": f"혈압 측정 및 기록 {item}", "required": item % 2 == 0, "type": "health"}
+                for item in range(1, 11)
+            ],
+            "is_active": True,
+            "created_at": _timestamp(index)
+        }
+        for index in range(count)
+    ]
+    return _envelope(f"{count}개의 체크리스트 템플릿을 성공적으로 조회했습니다.", templates)
+
+
+def channel_sync(count):
+    """GET /api/v1/channels/{id}/sync"""
+    channel_id = str(uuid.uuid4())
+    checklists = [
+        {
+            "id": str(uuid.uuid4()),
+            "channel_id": channel_id,
+            "template_id": str(uuid.uuid4()),
+            "checked_items": {"items": [{"id": item, "checked": item % 3 != 0} for item in range(1, 11)]},
+            "additional_notes": "오늘은 컨디션이 좋으셨습니다.",
+            "completion_rate": 70.0,
+            "created_date": date(2024, 1, 15).isoformat(),
+            "created_by": str(uuid.uuid4()),
+            "created_at": _timestamp(index)
+        }
+        for index in range(count)
+    ]
+    return _envelope(
+        f"{count}건의 변경 사항을 조회했습니다.",
+        {
+            "channel_id": channel_id,
+            "watermark": "WyI3NTEiLDEwMjRd",
+            "has_more": False,
+            "changes": {"daily_checklists": {"upserted": checklists, "deleted": []}}
+        }
+    )
+
+
+def access_code():
+    """GET /api/v1/access/{code}"""
+    return _envelope(
+        "접속 코드 정보를 성공적으로 조회했습니다.",
+        {
+            "access_code": {"code": "GUARD001", "user_type": "guardian", "is_used": False, "expires_at": _timestamp(0)},
+            "user_info": _person("Guardian", 1),
+            "channel_info": {
+                "id": str(uuid.uuid4()),
+                "channel_name": "김영희 어르신 돌봄 채널",
+                "status": "active",
+                "start_date": "2024-01-01",
+                "senior_name": "김영희"
+            }
+        }
+    )
+
+
+def _encoded_sizes(payload):
+    json_body = orjson.dumps(payload)
+    msgpack_body = msgpack.packb(payload, use_bin_type=True)
+    
+    def compressed(body):
+        # 미들웨어와 같이 임계값 미만이면 압축하지 않음
+        return len(body) if len(body) < GZIP_MINIMUM_SIZE else len(gzip.compress(body, GZIP_LEVEL))
+    
+    return len(json_body), compressed(json_body), len(msgpack_body), compressed(msgpack_body)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=20, help="목록 응답의 항목 수 (기본값: 20)")
+    args = parser.parse_args()
+    
+    cases = [
+        ("access_code", access_code()),
+        ("my_channels", my_channels(args.items)),
+        ("checklist_templates", checklist_templates(args.items)),
+        ("channel_sync", channel_sync(args.items))
+    ]
+    
+    header = f"{'response':<22}{'json':>10}{'json+gzip':>12}{'msgpack':>10}{'msgpack+gzip':>14}{'saved':>8}"
+    print(header)
+    print("-" * len(header))
+    for name, payload in cases:
+        json_size, json_gzip, msgpack_size, msgpack_gzip = _encoded_sizes(payload)
+        saved = 1 - min(json_gzip, msgpack_gzip) / json_size
+        print(f"{name:<22}{json_size:>10}{json_gzip:>12}{msgpack_size:>10}{msgpack_gzip:>14}{saved:>8.0%}")
+
+
+if __name__ == "__main__":
+    main()
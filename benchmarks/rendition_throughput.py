@@ -0,0 +1,121 @@
+"""
+Sinabro 사진 렌디션 처리량 벤치마크
+샘플 이미지 묶음에 대해 렌디션 생성을 직렬 실행 / 프로세스 풀 워커 수별로 실행한 처리량 비교
+
+사용법:
+    python benchmarks/rendition_throughput.py [--corpus DIR] [--count N] [--workers 1,2,4]
+
+--corpus를 지정하지 않으면 휴대폰 사진 크기(4032x3024)의 JPEG/PNG 샘플을 임시 디렉토리에 생성합니다.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import multiprocessing
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+from PIL import Image, ImageDraw, ImageFilter
+
+# 워커 함수는 앱 설정/DB 없이 임포트 가능한 imaging 모듈에서 가져옴
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+from imaging import render_renditions  # noqa: E402
+
+# 앱의 RENDITION_* 기본값과 동일
+WIDTHS = [320, 640, 1280]
+FORMATS = ["jpeg", "webp"]
+QUALITY = 80
+
+SAMPLE_SIZE = (4032, 3024)
+
+
+def _sample_image(index, size):
+    """사진과 비슷하게 압축되도록 그라디언트 + 도형 + 노이즈로 구성한 샘플"""
+    rng = random.Random(index)
+    width, height = size
+    gradient = Image.linear_gradient("L").resize(size)
+    image = Image.merge("RGB", (gradient, gradient.rotate(90).resize(size), Image.new("L", size, rng.randrange(256))))
+    draw = ImageDraw.Draw(image)
+    for _ in range(40):
+        x, y = rng.randrange(width), rng.randrange(height)
+        radius = rng.randrange(50, 600)
+        draw.ellipse((x - radius, y - radius, x + radius, y + radius), fill=tuple(rng.randrange(256) for _ in range(3)))
+    image = image.filter(ImageFilter.GaussianBlur(4))
+    noise = Image.effect_noise(size, 24).convert("RGB")
+    return Image.blend(image, noise, 0.15)
+
+
+def build_corpus(directory, count):
+    paths = []
+    for index in range(count):
+        image = _sample_image(index, SAMPLE_SIZE)
+        # 일부는 PNG로 (JPEG 축소 디코딩이 적용되지 않는 경우)
+        extension = "png" if index % 4 == 3 else "jpg"
+        path = os.path.join(directory, f"sample_{index}.{extension}")
+        image.save(path, quality=90) if extension == "jpg" else image.save(path)
+        paths.append(path)
+    return paths
+
+
+def _render(path, output_dir):
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return render_renditions(path, output_dir, stem, WIDTHS, FORMATS, QUALITY)
+
+
+def run_serial(paths, output_dir):
+    started = time.perf_counter()
+    for path in paths:
+        _render(path, output_dir)
+    return time.perf_counter() - started
+
+
+def run_pool(paths, output_dir, workers):
+    # 앱과 같이 spawn 컨텍스트 사용 (워커 기동 시간은 측정에서 제외)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+        list(executor.map(abs, range(workers)))
+        started = time.perf_counter()
+        list(executor.map(_render, paths, [output_dir] * len(paths)))
+        return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", help="샘플 이미지 디렉토리 (기본값: 생성)")
+    parser.add_argument("--count", type=int, default=16, help="생성할 샘플 이미지 수 (기본값: 16)")
+    parser.add_argument("--workers", default=None, help="비교할 워커 수 목록 (기본값: 1,2,...,CPU 수)")
+    args = parser.parse_args()
+    
+    cpu_count = os.cpu_count() or 1
+    workers = [int(value) for value in args.workers.split(",")] if args.workers else sorted({1, 2, cpu_count} | {cpu_count // 2 or 1})
+    
+    work_dir = tempfile.mkdtemp(prefix="sinabro-renditions-")
+    try:
+        if args.corpus:
+            paths = sorted(
+                os.path.join(args.corpus, name) for name in os.listdir(args.corpus)
+                if name.lower().endswith((".jpg", ".jpeg", ".png", ".gif", ".webp"))
+            )
+        else:
+            print(f"Generating {args.count} sample images ({SAMPLE_SIZE[0]}x{SAMPLE_SIZE[1]})...")
+            paths = build_corpus(work_dir, args.count)
+        
+        print(f"{len(paths)} images, {len(WIDTHS) * len(FORMATS)} renditions each, {cpu_count} CPUs")
+        header = f"{'mode':<14}{'seconds':>10}{'images/s':>10}{'speedup':>9}"
+        print(header)
+        print("-" * len(header))
+        
+        # 이미 있는 렌디션은 재사용되므로 실행마다 별도 디렉토리에 생성
+        serial = run_serial(paths, os.path.join(work_dir, "serial"))
+        print(f"{'serial':<14}{serial:>10.2f}{len(paths) / serial:>10.2f}{1:>8.2f}x")
+        for count in workers:
+            elapsed = run_pool(paths, os.path.join(work_dir, f"pool_{count}"), count)
+            print(f"{f'pool x{count}':<14}{elapsed:>10.2f}{len(paths) / elapsed:>10.2f}{serial / elapsed:>8.2f}x")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
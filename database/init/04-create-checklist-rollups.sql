@@ -0,0 +1,150 @@
+-- ==========================================
+-- Sinabro 데이터베이스 초기화 스크립트 4
+-- 일일 체크리스트 완료율 롤업 테이블 및 트리거
+-- ==========================================
+
+-- 채널별 일/주/월 단위 체크리스트 집계 (트렌드 조회 전용)
+-- 채널 삭제 시 하위 체크리스트 삭제 트리거가 채널 삭제 이후에 실행되므로 channel_id에는 외래키를 두지 않음
+-- (체크리스트가 모두 빠진 집계 행은 함께 삭제)
+CREATE TABLE IF NOT EXISTS checklist_rollups (
+    channel_id UUID NOT NULL,
+    period VARCHAR(10) NOT NULL CHECK (period IN ('day', 'week', 'month')),
+    period_start DATE NOT NULL,
+    checklist_count INTEGER NOT NULL DEFAULT 0,
+    completion_sum DECIMAL(12,2) NOT NULL DEFAULT 0,
+    checked_items INTEGER NOT NULL DEFAULT 0,
+    total_items INTEGER NOT NULL DEFAULT 0,
+    required_checked INTEGER NOT NULL DEFAULT 0,
+    required_unchecked INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    PRIMARY KEY (channel_id, period, period_start)
+);
+
+-- 체크리스트 한 건이 롤업에 더한 값
+-- 필수 항목 여부는 작성 이후 템플릿이 수정될 수 있으므로, 뺄 때 다시 계산하지 않고 더한 값을 그대로 뺌
+-- (체크리스트 삭제 트리거가 이 행을 읽어야 하므로 외래키 없음)
+CREATE TABLE IF NOT EXISTS checklist_rollup_contributions (
+    checklist_id UUID PRIMARY KEY,
+    channel_id UUID NOT NULL,
+    created_date DATE NOT NULL,
+    completion_rate DECIMAL(5,2) NOT NULL DEFAULT 0,
+    checked_items INTEGER NOT NULL DEFAULT 0,
+    total_items INTEGER NOT NULL DEFAULT 0,
+    required_checked INTEGER NOT NULL DEFAULT 0,
+    required_unchecked INTEGER NOT NULL DEFAULT 0
+);
+
+-- 체크리스트 한 건을 롤업에 더하거나(sign = 1) 빼는(sign = -1) 함수
+CREATE OR REPLACE FUNCTION checklist_rollup_apply(rec daily_checklists, sign INTEGER)
+RETURNS VOID AS $$
+DECLARE
+    v_contribution checklist_rollup_contributions%ROWTYPE;
+    v_period TEXT;
+BEGIN
+    IF sign > 0 THEN
+        -- 템플릿의 필수 항목 여부와 함께 체크 항목 집계 후 기록
+        INSERT INTO checklist_rollup_contributions AS c (
+            checklist_id, channel_id, created_date, completion_rate,
+            checked_items, total_items, required_checked, required_unchecked
+        )
+        SELECT
+            rec.id,
+            rec.channel_id,
+            rec.created_date,
+            COALESCE(rec.completion_rate, 0),
+            COUNT(*) FILTER (WHERE COALESCE((item->>'checked')::BOOLEAN, FALSE)),
+            COUNT(*),
+            COUNT(*) FILTER (WHERE tpl.required AND COALESCE((item->>'checked')::BOOLEAN, FALSE)),
+            COUNT(*) FILTER (WHERE tpl.required AND NOT COALESCE((item->>'checked')::BOOLEAN, FALSE))
+        FROM jsonb_array_elements(COALESCE(rec.checked_items->'items', '[]'::JSONB)) AS item
+        LEFT JOIN LATERAL (
+            SELECT COALESCE((template_item->>'required')::BOOLEAN, FALSE) AS required
+            FROM checklist_templates ct,
+                 jsonb_array_elements(COALESCE(ct.items->'items', '[]'::JSONB)) AS template_item
+            WHERE ct.id = rec.template_id
+              AND template_item->>'id' = item->>'id'
+            LIMIT 1
+        ) tpl ON TRUE
+        RETURNING c.* INTO v_contribution;
+    ELSE
+        -- 더할 때 기록한 값을 그대로 뺌 (기록이 없으면 롤업에 반영된 적이 없는 행)
+        DELETE FROM checklist_rollup_contributions
+        WHERE checklist_id = rec.id
+        RETURNING * INTO v_contribution;
+        IF NOT FOUND THEN
+            RETURN;
+        END IF;
+    END IF;
+
+    FOREACH v_period IN ARRAY ARRAY['day', 'week', 'month'] LOOP
+        INSERT INTO checklist_rollups AS r (
+            channel_id, period, period_start, checklist_count, completion_sum,
+            checked_items, total_items, required_checked, required_unchecked, updated_at
+        ) VALUES (
+            v_contribution.channel_id,
+            v_period,
+            date_trunc(v_period, v_contribution.created_date)::DATE,
+            sign,
+            sign * v_contribution.completion_rate,
+            sign * v_contribution.checked_items,
+            sign * v_contribution.total_items,
+            sign * v_contribution.required_checked,
+            sign * v_contribution.required_unchecked,
+            NOW()
+        )
+        ON CONFLICT (channel_id, period, period_start) DO UPDATE SET
+            checklist_count = r.checklist_count + EXCLUDED.checklist_count,
+            completion_sum = r.completion_sum + EXCLUDED.completion_sum,
+            checked_items = r.checked_items + EXCLUDED.checked_items,
+            total_items = r.total_items + EXCLUDED.total_items,
+            required_checked = r.required_checked + EXCLUDED.required_checked,
+            required_unchecked = r.required_unchecked + EXCLUDED.required_unchecked,
+            updated_at = NOW();
+    END LOOP;
+
+    IF sign < 0 THEN
+        DELETE FROM checklist_rollups
+        WHERE channel_id = v_contribution.channel_id
+          AND checklist_count <= 0
+          AND period_start IN (
+              date_trunc('day', v_contribution.created_date)::DATE,
+              date_trunc('week', v_contribution.created_date)::DATE,
+              date_trunc('month', v_contribution.created_date)::DATE
+          );
+    END IF;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 체크리스트 변경 시 이전 값은 빼고 새 값은 더해 롤업을 증분 갱신
+CREATE OR REPLACE FUNCTION checklist_rollup_trigger()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM checklist_rollup_apply(OLD, -1);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM checklist_rollup_apply(NEW, 1);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_daily_checklists_rollup ON daily_checklists;
+CREATE TRIGGER trg_daily_checklists_rollup
+    AFTER INSERT OR DELETE ON daily_checklists
+    FOR EACH ROW EXECUTE FUNCTION checklist_rollup_trigger();
+
+-- 메모 수정 등 집계와 무관한 변경은 롤업을 건드리지 않음
+DROP TRIGGER IF EXISTS trg_daily_checklists_rollup_update ON daily_checklists;
+CREATE TRIGGER trg_daily_checklists_rollup_update
+    AFTER UPDATE OF channel_id, template_id, checked_items, completion_rate, created_date ON daily_checklists
+    FOR EACH ROW EXECUTE FUNCTION checklist_rollup_trigger();
+
+-- 기존 체크리스트로 롤업 초기화
+TRUNCATE checklist_rollups, checklist_rollup_contributions;
+SELECT checklist_rollup_apply(dc, 1) FROM daily_checklists dc;
+
+DO $$
+BEGIN
+    RAISE NOTICE '✅ 체크리스트 롤업 테이블 및 트리거 생성 완료';
+END $$;
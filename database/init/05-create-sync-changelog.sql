@@ -0,0 +1,91 @@
+-- ==========================================
+-- Sinabro 데이터베이스 초기화 스크립트 5
+-- 오프라인 앱 델타 동기화용 변경 로그 및 트리거
+-- ==========================================
+
+CREATE SEQUENCE IF NOT EXISTS sync_changelog_seq;
+
+-- 엔티티별 마지막 변경 한 건만 유지 (같은 행이 여러 번 바뀌어도 로그가 늘어나지 않음)
+-- 채널 삭제 시 하위 행 삭제 트리거가 채널 삭제 이후에 실행되므로 channel_id에는 외래키를 두지 않음
+CREATE TABLE IF NOT EXISTS sync_changelog (
+    entity VARCHAR(30) NOT NULL,
+    entity_id UUID NOT NULL,
+    channel_id UUID NOT NULL,
+    operation VARCHAR(10) NOT NULL CHECK (operation IN ('upsert', 'delete')),
+    txid XID8 NOT NULL DEFAULT pg_current_xact_id(),
+    seq BIGINT NOT NULL DEFAULT nextval('sync_changelog_seq'),
+    changed_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    PRIMARY KEY (entity, entity_id)
+);
+
+-- 채널별 워터마크 (txid, seq) 이후 변경 조회용
+-- 조회는 진행 중인 가장 오래된 트랜잭션(xmin) 이전 변경만 반환하므로, 장시간 열린 트랜잭션이 끝날 때까지 동기화가 지연됨
+CREATE INDEX IF NOT EXISTS idx_sync_changelog_channel_position ON sync_changelog(channel_id, txid, seq);
+
+-- 보관 기간이 지난 삭제 기록(tombstone) 정리용
+-- upsert 기록은 살아 있는 행마다 한 건이므로 테이블 크기에 비례하고, 삭제 기록만 계속 쌓임
+CREATE INDEX IF NOT EXISTS idx_sync_changelog_tombstones ON sync_changelog(changed_at) WHERE operation = 'delete';
+
+-- 정리된 삭제 기록 중 가장 늦은 위치 (단일 행)
+-- 이보다 앞선 워터마크를 가진 앱은 삭제를 놓쳤을 수 있으므로 워터마크 없이 전체 재동기화해야 함
+CREATE TABLE IF NOT EXISTS sync_changelog_horizon (
+    id SMALLINT PRIMARY KEY DEFAULT 1 CHECK (id = 1),
+    txid XID8 NOT NULL,
+    seq BIGINT NOT NULL,
+    compacted_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+-- 행 변경 시 변경 로그를 최신 상태로 갱신
+CREATE OR REPLACE FUNCTION sync_changelog_trigger()
+RETURNS TRIGGER AS $$
+DECLARE
+    rec RECORD;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        rec := OLD;
+    ELSE
+        rec := NEW;
+    END IF;
+
+    INSERT INTO sync_changelog AS c (entity, entity_id, channel_id, operation)
+    VALUES (
+        TG_TABLE_NAME,
+        rec.id,
+        rec.channel_id,
+        CASE WHEN TG_OP = 'DELETE' THEN 'delete' ELSE 'upsert' END
+    )
+    ON CONFLICT (entity, entity_id) DO UPDATE SET
+        channel_id = EXCLUDED.channel_id,
+        operation = EXCLUDED.operation,
+        txid = EXCLUDED.txid,
+        seq = EXCLUDED.seq,
+        changed_at = EXCLUDED.changed_at;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DO $$
+DECLARE
+    v_table TEXT;
+BEGIN
+    FOREACH v_table IN ARRAY ARRAY['daily_checklists', 'care_notes', 'photos', 'question_responses', 'ai_reports'] LOOP
+        EXECUTE format('DROP TRIGGER IF EXISTS trg_%s_sync_changelog ON %I', v_table, v_table);
+        EXECUTE format(
+            'CREATE TRIGGER trg_%s_sync_changelog AFTER INSERT OR UPDATE OR DELETE ON %I '
+            'FOR EACH ROW EXECUTE FUNCTION sync_changelog_trigger()',
+            v_table, v_table
+        );
+
+        -- 기존 행을 초기 동기화 대상으로 등록
+        EXECUTE format(
+            'INSERT INTO sync_changelog (entity, entity_id, channel_id, operation) '
+            'SELECT %L, id, channel_id, ''upsert'' FROM %I ON CONFLICT (entity, entity_id) DO NOTHING',
+            v_table, v_table
+        );
+    END LOOP;
+END $$;
+
+DO $$
+BEGIN
+    RAISE NOTICE '✅ 동기화 변경 로그 테이블 및 트리거 생성 완료';
+END $$;
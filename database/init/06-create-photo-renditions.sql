@@ -0,0 +1,18 @@
+-- ==========================================
+-- Sinabro 데이터베이스 초기화 스크립트 6
+-- 사진 렌디션(썸네일/축소본) 메타데이터
+-- ==========================================
+
+-- 사진별 크기/형식 렌디션 (업로드 후 프로세스 풀에서 생성)
+CREATE TABLE IF NOT EXISTS photo_renditions (
+    photo_id UUID NOT NULL REFERENCES photos(id) ON DELETE CASCADE,
+    width INTEGER NOT NULL CHECK (width > 0),
+    format VARCHAR(10) NOT NULL CHECK (format IN ('jpeg', 'webp')),
+    height INTEGER NOT NULL CHECK (height > 0),
+    file_url TEXT NOT NULL,
+    file_size INTEGER NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    PRIMARY KEY (photo_id, width, format)
+);
+
+COMMENT ON TABLE photo_renditions IS '사진 렌디션 (갤러리 조회 시 원본 대신 전달)';
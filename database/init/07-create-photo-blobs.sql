@@ -0,0 +1,60 @@
+-- ==========================================
+-- Sinabro 데이터베이스 초기화 스크립트 7
+-- 사진 원본 콘텐츠 주소 저장소 (SHA-256 중복 제거, 참조 카운트)
+-- ==========================================
+
+-- 고유한 파일 내용 한 건 (같은 사진을 여러 번 올려도 파일은 하나만 저장)
+-- ref_count가 0이 된 시점을 orphaned_at에 기록하고, 유예 시간이 지나면 백그라운드 수거 작업이 삭제
+CREATE TABLE IF NOT EXISTS photo_blobs (
+    sha256 CHAR(64) PRIMARY KEY,
+    file_url TEXT NOT NULL,
+    file_size BIGINT NOT NULL,
+    file_type VARCHAR(10) NOT NULL,
+    ref_count INTEGER NOT NULL DEFAULT 0 CHECK (ref_count >= 0),
+    orphaned_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+-- 수거 대상 조회용 (참조되지 않는 blob만)
+CREATE INDEX IF NOT EXISTS idx_photo_blobs_orphaned ON photo_blobs(orphaned_at) WHERE ref_count = 0;
+
+ALTER TABLE photos ADD COLUMN IF NOT EXISTS blob_sha256 CHAR(64) REFERENCES photo_blobs(sha256);
+CREATE INDEX IF NOT EXISTS idx_photos_blob ON photos(blob_sha256);
+
+-- blob 참조 카운트 증감 (0이 되면 수거 유예 시작, 다시 참조되면 해제)
+CREATE OR REPLACE FUNCTION photo_blob_ref_apply(p_sha256 CHAR(64), p_delta INTEGER)
+RETURNS VOID AS $$
+BEGIN
+    IF p_sha256 IS NULL THEN
+        RETURN;
+    END IF;
+
+    UPDATE photo_blobs
+    SET ref_count = ref_count + p_delta,
+        orphaned_at = CASE WHEN ref_count + p_delta = 0 THEN NOW() ELSE NULL END
+    WHERE sha256 = p_sha256;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION photo_blob_ref_trigger()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM photo_blob_ref_apply(OLD.blob_sha256, -1);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM photo_blob_ref_apply(NEW.blob_sha256, 1);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_photos_blob_ref ON photos;
+CREATE TRIGGER trg_photos_blob_ref
+    AFTER INSERT OR DELETE OR UPDATE OF blob_sha256 ON photos
+    FOR EACH ROW EXECUTE FUNCTION photo_blob_ref_trigger();
+
+DO $$
+BEGIN
+    RAISE NOTICE '✅ 사진 blob 저장소 테이블 및 참조 카운트 트리거 생성 완료';
+END $$;
@@ -0,0 +1,40 @@
+-- ==========================================
+-- Sinabro 데이터베이스 초기화 스크립트 8
+-- AI 리포트 생성 작업 (비동기 생성 요청 상태 및 재시도 관리)
+-- ==========================================
+
+-- 리포트 생성 요청 한 건
+-- 큐(Redis/프로세스 내)에는 작업 ID만 들어가고 상태/재시도 횟수는 이 테이블이 기준
+CREATE TABLE IF NOT EXISTS report_jobs (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    channel_id UUID NOT NULL REFERENCES channels(id) ON DELETE CASCADE,
+    report_date DATE NOT NULL,
+    status VARCHAR(20) NOT NULL DEFAULT 'queued'
+        CHECK (status IN ('queued', 'running', 'succeeded', 'failed')),
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL DEFAULT 3,
+    run_after TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    last_error TEXT,
+    report_id UUID REFERENCES ai_reports(id) ON DELETE SET NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    started_at TIMESTAMP WITH TIME ZONE,
+    finished_at TIMESTAMP WITH TIME ZONE,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+-- 채널/날짜별로 대기 중이거나 실행 중인 작업은 하나만 (중복 요청은 기존 작업 반환)
+CREATE UNIQUE INDEX IF NOT EXISTS uq_report_jobs_pending
+    ON report_jobs(channel_id, report_date)
+    WHERE status IN ('queued', 'running');
+
+-- 큐 메시지 유실/워커 중단 복구용 (미완료 작업만)
+CREATE INDEX IF NOT EXISTS idx_report_jobs_unfinished
+    ON report_jobs(status, run_after)
+    WHERE status IN ('queued', 'running');
+
+CREATE INDEX IF NOT EXISTS idx_report_jobs_channel ON report_jobs(channel_id, created_at DESC);
+
+DO $$
+BEGIN
+    RAISE NOTICE '✅ AI 리포트 생성 작업 테이블 생성 완료';
+END $$;
@@ -0,0 +1,33 @@
+-- ==========================================
+-- Sinabro 데이터베이스 초기화 스크립트 9
+-- 야간 AI 리포트 일괄 생성 실행 기록 (날짜별 1회 실행 보장 및 소요 시간 통계)
+-- ==========================================
+
+-- 리포트 날짜별 일괄 생성 실행 한 건
+-- 여러 API 인스턴스가 같은 시각에 스케줄을 실행해도 이 행을 선점한 인스턴스만 실행
+CREATE TABLE IF NOT EXISTS report_batch_runs (
+    report_date DATE PRIMARY KEY,
+    status VARCHAR(20) NOT NULL DEFAULT 'running'
+        CHECK (status IN ('running', 'succeeded', 'failed')),
+    started_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    finished_at TIMESTAMP WITH TIME ZONE,
+    
+    -- 처리 결과
+    channel_count INTEGER NOT NULL DEFAULT 0,
+    generated INTEGER NOT NULL DEFAULT 0,
+    skipped INTEGER NOT NULL DEFAULT 0,
+    failed INTEGER NOT NULL DEFAULT 0,
+    
+    -- 소요 시간 (전체 실행 시간 및 리포트 1건 생성 시간 백분위수, 밀리초)
+    wall_time_ms INTEGER,
+    latency_p50_ms INTEGER,
+    latency_p90_ms INTEGER,
+    latency_p99_ms INTEGER,
+    latency_max_ms INTEGER,
+    last_error TEXT
+);
+
+DO $$
+BEGIN
+    RAISE NOTICE '✅ AI 리포트 일괄 생성 실행 기록 테이블 생성 완료';
+END $$;
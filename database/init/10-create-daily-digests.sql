@@ -0,0 +1,217 @@
+-- ==========================================
+-- Sinabro 데이터베이스 초기화 스크립트 10
+-- 채널별 일일 기록 다이제스트 (AI 리포트 생성용 하루치 기록을 트리거로 증분 조립)
+-- ==========================================
+
+-- 채널/날짜별 체크리스트, 돌봄노트, 사진, 질문답변 요약 문서
+-- 항목은 원본 ID를 키로 저장해 수정/삭제 시 해당 항목만 교체하고, ID 배열은 AI 리포트 참조용
+-- 채널 삭제 시 하위 행 삭제 트리거가 채널 삭제 이후에 실행되므로 channel_id에는 외래키를 두지 않음
+-- (빈 다이제스트는 마지막 항목이 삭제될 때 함께 삭제)
+CREATE TABLE IF NOT EXISTS daily_digests (
+    channel_id UUID NOT NULL,
+    digest_date DATE NOT NULL,
+
+    -- 항목 (원본 ID → 리포트 생성에 필요한 필드)
+    checklists JSONB NOT NULL DEFAULT '{}'::jsonb,
+    care_notes JSONB NOT NULL DEFAULT '{}'::jsonb,
+    photos JSONB NOT NULL DEFAULT '{}'::jsonb,
+    question_responses JSONB NOT NULL DEFAULT '{}'::jsonb,
+
+    -- 원본 ID (추가된 순서, 같은 다이제스트 안에서 수정된 항목은 위치 유지)
+    checklist_ids UUID[] NOT NULL DEFAULT ARRAY[]::UUID[],
+    care_note_ids UUID[] NOT NULL DEFAULT ARRAY[]::UUID[],
+    photo_ids UUID[] NOT NULL DEFAULT ARRAY[]::UUID[],
+    question_response_ids UUID[] NOT NULL DEFAULT ARRAY[]::UUID[],
+
+    -- 집계
+    checklist_count INTEGER NOT NULL DEFAULT 0,
+    completion_sum DECIMAL(12,2) NOT NULL DEFAULT 0,
+    checked_items INTEGER NOT NULL DEFAULT 0,
+    total_items INTEGER NOT NULL DEFAULT 0,
+    care_note_count INTEGER NOT NULL DEFAULT 0,
+    photo_count INTEGER NOT NULL DEFAULT 0,
+    question_response_count INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    PRIMARY KEY (channel_id, digest_date)
+);
+
+-- 원본 행(JSONB)을 다이제스트 항목으로 변환
+-- 질문답변은 작성 시점의 질문 문구를 함께 저장
+CREATE OR REPLACE FUNCTION daily_digest_entry(p_kind TEXT, p_row JSONB)
+RETURNS JSONB AS $$
+DECLARE
+    v_items JSONB := p_row->'checked_items'->'items';
+    v_counts JSONB;
+BEGIN
+    IF p_kind = 'checklists' THEN
+        SELECT jsonb_build_object(
+            'checked', COUNT(*) FILTER (WHERE COALESCE((item->>'checked')::BOOLEAN, FALSE)),
+            'total', COUNT(*)
+        )
+        INTO v_counts
+        FROM jsonb_array_elements(CASE WHEN jsonb_typeof(v_items) = 'array' THEN v_items ELSE '[]'::JSONB END) AS item
+        WHERE jsonb_typeof(item) = 'object';
+
+        RETURN jsonb_build_object(
+            'id', p_row->'id',
+            'completion_rate', COALESCE((p_row->>'completion_rate')::NUMERIC, 0),
+            'additional_notes', p_row->'additional_notes',
+            'created_at', p_row->'created_at'
+        ) || v_counts;
+    ELSIF p_kind = 'care_notes' THEN
+        RETURN jsonb_build_object(
+            'id', p_row->'id',
+            'note_type', p_row->'note_type',
+            'content', p_row->'content',
+            'created_at', p_row->'created_at'
+        );
+    ELSIF p_kind = 'photos' THEN
+        RETURN jsonb_build_object(
+            'id', p_row->'id',
+            'photo_type', p_row->'photo_type',
+            'description', p_row->'description',
+            'created_at', p_row->'created_at'
+        );
+    ELSE
+        RETURN jsonb_build_object(
+            'id', p_row->'id',
+            'responder_type', p_row->'responder_type',
+            'question', (SELECT to_jsonb(question_text) FROM admin_questions WHERE id = (p_row->>'question_id')::UUID),
+            'response_text', p_row->'response_text',
+            'created_at', p_row->'created_at'
+        );
+    END IF;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 항목 한 건을 다이제스트에 더하거나(sign = 1) 빼는(sign = -1) 함수
+-- p_keep_id: 같은 다이제스트 안의 수정이면 뺄 때 ID 배열에서 지우지 않아 다시 더할 때 위치가 유지됨
+CREATE OR REPLACE FUNCTION daily_digest_apply(p_kind TEXT, p_date_column TEXT, p_row JSONB, sign INTEGER, p_keep_id BOOLEAN DEFAULT FALSE)
+RETURNS VOID AS $$
+DECLARE
+    v_channel_id UUID := (p_row->>'channel_id')::UUID;
+    v_date DATE := (p_row->>p_date_column)::DATE;
+    v_id UUID := (p_row->>'id')::UUID;
+    v_entry JSONB := daily_digest_entry(p_kind, p_row);
+    -- 체크리스트 외 항목에는 완료율/체크 수 필드가 없으므로 0으로 계산
+    v_completion NUMERIC := COALESCE((v_entry->>'completion_rate')::NUMERIC, 0);
+    v_checked INTEGER := COALESCE((v_entry->>'checked')::INTEGER, 0);
+    v_total INTEGER := COALESCE((v_entry->>'total')::INTEGER, 0);
+    v_ids_column TEXT;
+    v_count_column TEXT;
+BEGIN
+    v_ids_column := CASE p_kind
+        WHEN 'checklists' THEN 'checklist_ids'
+        WHEN 'care_notes' THEN 'care_note_ids'
+        WHEN 'photos' THEN 'photo_ids'
+        ELSE 'question_response_ids'
+    END;
+    v_count_column := CASE p_kind
+        WHEN 'checklists' THEN 'checklist_count'
+        WHEN 'care_notes' THEN 'care_note_count'
+        WHEN 'photos' THEN 'photo_count'
+        ELSE 'question_response_count'
+    END;
+
+    IF sign > 0 THEN
+        -- 행 생성과 항목 추가를 한 문장으로 처리
+        -- (두 문장으로 나누면 그 사이 다른 트랜잭션이 마지막 항목을 빼며 행을 삭제해 추가가 유실될 수 있음)
+        EXECUTE format(
+            'INSERT INTO daily_digests AS d (channel_id, digest_date, %1$I, %2$I, %3$I, completion_sum, checked_items, total_items) '
+            'VALUES ($1, $2, jsonb_build_object($3::TEXT, $4), ARRAY[$3], 1, $5, $6, $7) '
+            'ON CONFLICT (channel_id, digest_date) DO UPDATE SET '
+            '%1$I = d.%1$I || EXCLUDED.%1$I, '
+            '%2$I = CASE WHEN $3 = ANY(d.%2$I) THEN d.%2$I ELSE array_append(d.%2$I, $3) END, '
+            '%3$I = d.%3$I + 1, '
+            'completion_sum = d.completion_sum + EXCLUDED.completion_sum, '
+            'checked_items = d.checked_items + EXCLUDED.checked_items, '
+            'total_items = d.total_items + EXCLUDED.total_items, '
+            'updated_at = NOW()',
+            p_kind, v_ids_column, v_count_column
+        ) USING v_channel_id, v_date, v_id, v_entry, v_completion, v_checked, v_total;
+        RETURN;
+    END IF;
+
+    EXECUTE format(
+        'UPDATE daily_digests SET '
+        '%1$I = %1$I - $3::TEXT, '
+        '%2$I = CASE WHEN $4 THEN %2$I ELSE array_remove(%2$I, $3) END, '
+        '%3$I = %3$I - 1, '
+        'completion_sum = completion_sum - $5, '
+        'checked_items = checked_items - $6, '
+        'total_items = total_items - $7, '
+        'updated_at = NOW() '
+        'WHERE channel_id = $1 AND digest_date = $2',
+        p_kind, v_ids_column, v_count_column
+    ) USING v_channel_id, v_date, v_id, p_keep_id, v_completion, v_checked, v_total;
+
+    IF NOT p_keep_id THEN
+        DELETE FROM daily_digests
+        WHERE channel_id = v_channel_id AND digest_date = v_date
+          AND checklist_count <= 0 AND care_note_count <= 0
+          AND photo_count <= 0 AND question_response_count <= 0;
+    END IF;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 원본 변경 시 이전 항목은 빼고 새 항목은 더해 다이제스트를 증분 갱신
+-- TG_ARGV: (다이제스트 항목 종류, 기록 날짜 컬럼)
+CREATE OR REPLACE FUNCTION daily_digest_trigger()
+RETURNS TRIGGER AS $$
+DECLARE
+    v_same_digest BOOLEAN := FALSE;
+BEGIN
+    IF TG_OP = 'UPDATE' THEN
+        v_same_digest := to_jsonb(OLD)->>'channel_id' = to_jsonb(NEW)->>'channel_id'
+            AND to_jsonb(OLD)->>TG_ARGV[1] = to_jsonb(NEW)->>TG_ARGV[1];
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM daily_digest_apply(TG_ARGV[0], TG_ARGV[1], to_jsonb(OLD), -1, v_same_digest);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM daily_digest_apply(TG_ARGV[0], TG_ARGV[1], to_jsonb(NEW), 1);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DO $$
+DECLARE
+    v_source TEXT[];
+BEGIN
+    TRUNCATE daily_digests;
+
+    -- (원본 테이블, 항목 종류, 기록 날짜 컬럼, 리포트에 쓰이는 컬럼)
+    FOREACH v_source SLICE 1 IN ARRAY ARRAY[
+        ['daily_checklists', 'checklists', 'created_date', 'checked_items, completion_rate, additional_notes'],
+        ['care_notes', 'care_notes', 'related_date', 'note_type, content'],
+        ['photos', 'photos', 'taken_date', 'photo_type, description'],
+        ['question_responses', 'question_responses', 'response_date', 'question_id, responder_type, response_text']
+    ] LOOP
+        EXECUTE format('DROP TRIGGER IF EXISTS trg_%s_digest ON %I', v_source[1], v_source[1]);
+        EXECUTE format(
+            'CREATE TRIGGER trg_%s_digest AFTER INSERT OR DELETE ON %I '
+            'FOR EACH ROW EXECUTE FUNCTION daily_digest_trigger(%L, %L)',
+            v_source[1], v_source[1], v_source[2], v_source[3]
+        );
+
+        -- 리포트에 쓰이지 않는 컬럼만 바뀐 수정은 다이제스트를 건드리지 않음
+        EXECUTE format('DROP TRIGGER IF EXISTS trg_%s_digest_update ON %I', v_source[1], v_source[1]);
+        EXECUTE format(
+            'CREATE TRIGGER trg_%s_digest_update AFTER UPDATE OF channel_id, %s, %s ON %I '
+            'FOR EACH ROW EXECUTE FUNCTION daily_digest_trigger(%L, %L)',
+            v_source[1], v_source[3], v_source[4], v_source[1], v_source[2], v_source[3]
+        );
+
+        -- 기존 기록으로 다이제스트 초기화
+        EXECUTE format(
+            'SELECT daily_digest_apply(%L, %L, to_jsonb(t), 1) FROM %I t ORDER BY t.created_at',
+            v_source[2], v_source[3], v_source[1]
+        );
+    END LOOP;
+END $$;
+
+DO $$
+BEGIN
+    RAISE NOTICE '✅ 일일 기록 다이제스트 테이블 및 트리거 생성 완료';
+END $$;
@@ -0,0 +1,69 @@
+-- ==========================================
+-- Sinabro 데이터베이스 초기화 스크립트 11
+-- 접속 코드 캐시 무효화 로그 (채널/사용자/접속 코드 변경을 API 서버의 Redis 캐시에 전달)
+-- ==========================================
+
+-- 채널/시니어/사용자/접속 코드는 API 밖(관리 도구, SQL)에서 변경되므로
+-- 트리거가 무효화 대상을 기록하고 각 API 서버가 (txid, seq) 워터마크로 읽어 캐시를 지움
+-- scope: channel (채널 ID), user (가디언/케어기버 ID), code (접속 코드)
+CREATE SEQUENCE IF NOT EXISTS access_code_invalidations_seq;
+
+CREATE TABLE IF NOT EXISTS access_code_invalidations (
+    scope VARCHAR(10) NOT NULL CHECK (scope IN ('channel', 'user', 'code')),
+    target TEXT NOT NULL,
+    txid XID8 NOT NULL DEFAULT pg_current_xact_id(),
+    seq BIGINT NOT NULL DEFAULT nextval('access_code_invalidations_seq'),
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    PRIMARY KEY (txid, seq)
+);
+
+-- 캐시 TTL이 지난 기록 정리용
+CREATE INDEX IF NOT EXISTS idx_access_code_invalidations_created ON access_code_invalidations(created_at);
+
+-- 변경된 행이 영향을 주는 접속 코드 캐시를 무효화 로그에 기록
+CREATE OR REPLACE FUNCTION access_code_invalidation_trigger()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_TABLE_NAME = 'access_codes' THEN
+        -- 새 코드도 기록 (검증 캐시에 남은 '유효하지 않은 코드' 항목 제거)
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            INSERT INTO access_code_invalidations (scope, target) VALUES ('code', upper(OLD.code));
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            INSERT INTO access_code_invalidations (scope, target) VALUES ('code', upper(NEW.code));
+        END IF;
+    ELSIF TG_TABLE_NAME = 'channels' THEN
+        INSERT INTO access_code_invalidations (scope, target) VALUES ('channel', OLD.id::TEXT);
+    ELSIF TG_TABLE_NAME = 'seniors' THEN
+        -- 채널 요약에 시니어 이름이 들어가므로 시니어의 채널들을 무효화
+        INSERT INTO access_code_invalidations (scope, target)
+        SELECT 'channel', id::TEXT FROM channels WHERE senior_id = OLD.id;
+    ELSE
+        INSERT INTO access_code_invalidations (scope, target) VALUES ('user', OLD.id::TEXT);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DO $$
+DECLARE
+    v_table TEXT;
+BEGIN
+    DROP TRIGGER IF EXISTS trg_access_codes_cache_invalidation ON access_codes;
+    CREATE TRIGGER trg_access_codes_cache_invalidation AFTER INSERT OR UPDATE OR DELETE ON access_codes
+        FOR EACH ROW EXECUTE FUNCTION access_code_invalidation_trigger();
+
+    FOREACH v_table IN ARRAY ARRAY['channels', 'seniors', 'guardians', 'caregivers'] LOOP
+        EXECUTE format('DROP TRIGGER IF EXISTS trg_%s_cache_invalidation ON %I', v_table, v_table);
+        EXECUTE format(
+            'CREATE TRIGGER trg_%s_cache_invalidation AFTER UPDATE OR DELETE ON %I '
+            'FOR EACH ROW EXECUTE FUNCTION access_code_invalidation_trigger()',
+            v_table, v_table
+        );
+    END LOOP;
+END $$;
+
+DO $$
+BEGIN
+    RAISE NOTICE '✅ 접속 코드 캐시 무효화 로그 테이블 및 트리거 생성 완료';
+END $$;
@@ -0,0 +1,18 @@
+-- ==========================================
+-- Sinabro 데이터베이스 초기화 스크립트 12
+-- 내 채널 목록 커서 페이지네이션 인덱스
+-- ==========================================
+
+-- 가디언/케어기버별 채널을 생성일, ID 역순으로 페이지 조회 (키셋 커서의 정렬 키 포함)
+-- 02의 단일 컬럼 인덱스는 이미 만들어진 데이터베이스에서 IF NOT EXISTS로 바뀌지 않으므로 새 이름으로 생성
+CREATE INDEX IF NOT EXISTS idx_channels_guardian_created ON channels(guardian_id, created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_channels_caregiver_created ON channels(caregiver_id, created_at DESC, id DESC);
+
+-- 새 인덱스가 앞 컬럼으로 같은 조회를 처리하므로 단일 컬럼 인덱스 제거
+DROP INDEX IF EXISTS idx_channels_guardian;
+DROP INDEX IF EXISTS idx_channels_caregiver;
+
+DO $$
+BEGIN
+    RAISE NOTICE '✅ 채널 목록 페이지네이션 인덱스 생성 완료';
+END $$;
@@ -0,0 +1,16 @@
+-- ==========================================
+-- Sinabro 데이터베이스 초기화 스크립트 13
+-- AI 리포트 채널/날짜별 유일 인덱스
+-- ==========================================
+
+-- 채널/날짜별 리포트 한 건
+-- 야간 일괄 생성과 개별 생성 작업이 같은 채널/날짜를 동시에 저장해도 ON CONFLICT DO NOTHING으로 한 건만 남김
+CREATE UNIQUE INDEX IF NOT EXISTS uq_ai_reports_channel_date ON ai_reports(channel_id, report_date);
+
+-- 유일 인덱스가 같은 컬럼으로 조회를 처리하므로 02의 일반 인덱스 제거
+DROP INDEX IF EXISTS idx_reports_channel_date;
+
+DO $$
+BEGIN
+    RAISE NOTICE '✅ AI 리포트 유일 인덱스 생성 완료';
+END $$;
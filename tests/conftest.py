@@ -0,0 +1,16 @@
+"""
+Sinabro 테스트 공통 설정
+앱 모듈은 app/ 기준 절대 import, 모델/서비스는 app 패키지 기준 상대 import를 사용하므로 두 경로를 모두 추가
+"""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [ROOT, os.path.join(ROOT, "app")]
+
+# 설정 필수값 (테스트는 DB/Redis에 접속하지 않음)
+os.environ.setdefault("DB_NAME", "sinabro_test")
+os.environ.setdefault("DB_USER", "sinabro")
+os.environ.setdefault("DB_PASSWORD", "sinabro")
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
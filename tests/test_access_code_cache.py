@@ -0,0 +1,94 @@
+"""
+접속 코드 응답 캐시 테스트
+ETag 버전이 캐시에 저장된 본문과 함께 보관되어, 무효화 전후로 본문과 버전이 항상 함께 바뀌는지 확인
+"""
+
+import asyncio
+import json
+
+from cache import AccessCodeCache
+
+
+class FakeCacheManager:
+    """Redis 대신 사용하는 메모리 캐시 (JSON 왕복으로 Redis 직렬화를 흉내)"""
+    
+    def __init__(self):
+        self.values = {}
+        self.indexes = {}
+    
+    async def get_json(self, key):
+        raw = self.values.get(key)
+        return json.loads(raw) if raw is not None else None
+    
+    async def set_json(self, key, value, ttl, index_keys=()):
+        self.values[key] = json.dumps(value, ensure_ascii=False, default=str)
+        for index_key in index_keys:
+            self.indexes.setdefault(index_key, set()).add(key)
+        return True
+    
+    async def delete(self, key):
+        self.values.pop(key, None)
+    
+    async def delete_indexed(self, index_key):
+        for key in self.indexes.pop(index_key, set()):
+            self.values.pop(key, None)
+
+
+def _result(senior_name):
+    return {
+        "success": True,
+        "message": "접속 코드 정보를 성공적으로 조회했습니다.",
+        "data": {
+            "access_code": {"code": "GUARD001", "user_type": "guardian", "is_used": False, "expires_at": None},
+            "user_info": {"id": "guardian-1", "full_name": "김철수"},
+            "channel_info": {"id": "channel-1", "channel_name": "김영희님 케어채널", "senior_name": senior_name}
+        }
+    }
+
+
+def _loader(results, calls):
+    async def load():
+        calls.append(1)
+        return results[0]
+    return load
+
+
+def test_cached_version_travels_with_cached_body():
+    cache = AccessCodeCache(FakeCacheManager())
+    results, calls = [_result("김영희")], []
+    
+    first, first_version = asyncio.run(cache.get_or_load("guard001", _loader(results, calls)))
+    # 원본이 바뀌어도 무효화 전에는 캐시된 본문과 그 버전을 그대로 반환
+    results[0] = _result("김영순")
+    cached, cached_version = asyncio.run(cache.get_or_load("GUARD001", _loader(results, calls)))
+    
+    assert len(calls) == 1
+    assert cached == first
+    assert cached_version == first_version
+
+
+def test_invalidation_changes_body_and_version_together():
+    cache = AccessCodeCache(FakeCacheManager())
+    results, calls = [_result("김영희")], []
+    
+    _, old_version = asyncio.run(cache.get_or_load("GUARD001", _loader(results, calls)))
+    results[0] = _result("김영순")
+    asyncio.run(cache.invalidate_channel("channel-1"))
+    result, new_version = asyncio.run(cache.get_or_load("GUARD001", _loader(results, calls)))
+    
+    assert len(calls) == 2
+    assert result["data"]["channel_info"]["senior_name"] == "김영순"
+    assert new_version != old_version
+
+
+def test_error_results_have_no_version_and_are_not_cached():
+    cache = AccessCodeCache(FakeCacheManager())
+    error = {"success": False, "message": "유효하지 않은 접속 코드입니다.", "error_code": "INVALID_ACCESS_CODE"}
+    calls = []
+    
+    result, version = asyncio.run(cache.get_or_load("NOPE", _loader([error], calls)))
+    asyncio.run(cache.get_or_load("NOPE", _loader([error], calls)))
+    
+    assert result == error
+    assert version is None
+    assert len(calls) == 2
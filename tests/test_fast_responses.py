@@ -0,0 +1,454 @@
+"""
+빠른 응답 경로(fast_response) 스키마 적합성 테스트
+FAST_JSON_RESPONSES를 켜면 response_model 재검증을 건너뛰므로, 각 라우트의 서비스 결과를
+orjson으로 직렬화한 본문이 라우트에 선언된 response_model을 그대로 만족하는지 확인
+(서비스 결과는 DB 대신 ORM 객체/조회 행을 만들어 서비스의 직렬화 함수로 구성)
+"""
+
+import asyncio
+from collections import namedtuple
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from config import settings
+from responses import FastJSONResponse, fast_response
+from schemas import (
+    AccessCodeResponse,
+    AccessTokenResponse,
+    AIReportResponse,
+    ChannelBatchResponse,
+    ChannelDashboardResponse,
+    ChannelResponse,
+    ChannelSyncResponse,
+    ChecklistItem,
+    ChecklistTemplateListResponse,
+    ChecklistTemplateResponse,
+    ChecklistTrendResponse,
+    DailyChecklistBulkResponse,
+    DailyChecklistSubmission,
+    MyChannelsResponse,
+    PhotoResponse,
+    PhotoUrlResponse,
+    ReportJobResponse,
+    ReportTranslationsResponse
+)
+from security import create_access_token
+from translation import StubTranslator, TranslationManager
+from app.models import (
+    AIReport,
+    CareNote,
+    Caregiver,
+    Channel,
+    ChecklistRollup,
+    DailyChecklist,
+    Guardian,
+    Photo,
+    PhotoRendition,
+    ReportJob,
+    Senior
+)
+from app.services.base import BaseService
+from app.services.channel import _batch_result, _serialize_channel
+from app.services.checklist_ingest import _bulk_response_data, _mark_duplicates, _prepare_batch
+from app.services.dashboard import _dashboard_statement, _serialize_dashboard_row
+from app.services.photo import _new_photo, _photo_file_data
+from app.services.report import _report_values
+from app.services.sync import _group_changes, _sync_data
+from app.services.trends import _trend_data
+
+NOW = datetime(2024, 1, 31, 9, 30, tzinfo=timezone.utc)
+TODAY = date(2024, 1, 31)
+
+# 서비스 응답 봉투 (create_response)
+service = BaseService(None)
+
+# 델타 동기화 변경 로그 조회 행 (CHANGES_SQL)
+ChangeRow = namedtuple("ChangeRow", ["txid", "seq", "entity", "operation", "entity_id"])
+
+
+class FakeCacheManager:
+    """Redis 대신 사용하는 번역 공유 캐시"""
+    
+    def __init__(self):
+        self.values = {}
+    
+    async def get_many_json(self, keys):
+        return {key: self.values[key] for key in keys if key in self.values}
+    
+    async def set_many_json(self, values, ttl):
+        self.values.update(values)
+        return True
+
+
+def _guardian():
+    return Guardian(
+        id=uuid4(), full_name="김철수", email="guardian@example.com", phone_number=None,
+        country="미국", city="뉴욕", language_preference="en", timezone="America/New_York", created_at=NOW
+    )
+
+
+def _caregiver():
+    return Caregiver(
+        id=uuid4(), full_name="최간병", email=None, phone_number="010-0000-0000", license_number="L-1",
+        experience_years=5, languages=["ko"], specialties=None, profile_image_url=None, created_at=NOW
+    )
+
+
+def _senior():
+    return Senior(
+        id=uuid4(), full_name="김영희", birth_date=date(1940, 5, 1), gender="female", nationality="KR",
+        emergency_contact_name=None, emergency_contact_phone=None, medical_conditions=["고혈압"], allergies=None,
+        medications=[], mobility_level="assisted", cognitive_level=None, preferred_language="ko",
+        dietary_restrictions=None, cultural_preferences={"food": "korean"}, profile_image_url=None, notes=None,
+        created_at=NOW, updated_at=NOW
+    )
+
+
+def _channel():
+    guardian, caregiver, senior = _guardian(), _caregiver(), _senior()
+    return Channel(
+        id=uuid4(), channel_name="김영희님 케어채널", guardian_id=guardian.id, caregiver_id=caregiver.id,
+        senior_id=senior.id, status="active", start_date=date(2024, 1, 15), end_date=None,
+        created_at=NOW, updated_at=NOW, guardian=guardian, caregiver=caregiver, senior=senior
+    )
+
+
+def _channel_data():
+    """채널 서비스 직렬화 함수로 만든 관계 포함 채널"""
+    return _serialize_channel(_channel())
+
+
+def _template_data():
+    """템플릿 카탈로그 항목 (검증된 ChecklistItem을 덤프한 형태)"""
+    items = [
+        ChecklistItem(id=1, text="혈압 측정", required=True, type="health"),
+        ChecklistItem(id=2, text="산책", type="activity")
+    ]
+    return {
+        "id": str(uuid4()),
+        "name": "기본 건강관리 체크리스트",
+        "category": "health_management",
+        "items": [item.model_dump() for item in items],
+        "is_active": True,
+        "created_at": NOW.isoformat()
+    }
+
+
+def _pagination(has_more: bool = True):
+    return {"size": 2, "has_more": has_more, "next_cursor": "eyJrIjpbXX0" if has_more else None}
+
+
+def _access_code_result():
+    guardian = _guardian()
+    return {
+        "success": True,
+        "message": "접속 코드 정보를 성공적으로 조회했습니다.",
+        "data": {
+            "access_code": {
+                "code": "GUARD001",
+                "user_type": "guardian",
+                "is_used": False,
+                "expires_at": NOW.isoformat()
+            },
+            "user_info": guardian.to_dict(),
+            "channel_info": {
+                "id": str(uuid4()),
+                "channel_name": "김영희님 케어채널",
+                "status": "active",
+                "start_date": "2024-01-15",
+                "senior_name": "김영희"
+            }
+        }
+    }
+
+
+def _access_token_result():
+    """mark-used 라우트가 서비스 결과의 주체 정보로 토큰 응답을 구성하는 방식 그대로"""
+    principal = {
+        "access_code": "GUARD001",
+        "user_type": "guardian",
+        "user_id": str(uuid4()),
+        "channel_id": str(uuid4()),
+        "is_used": True,
+        "expires_ts": NOW.timestamp() + 86400
+    }
+    return {
+        "success": True,
+        "message": "접속 코드가 사용됨으로 표시되었습니다.",
+        "data": {
+            **create_access_token(principal),
+            "user_type": principal["user_type"],
+            "user_id": principal["user_id"],
+            "channel_id": principal["channel_id"]
+        }
+    }
+
+
+def _dashboard_result():
+    """대시보드 조회 행 (조회 쿼리의 컬럼 이름 그대로)"""
+    statement = _dashboard_statement(Channel.guardian_id == uuid4(), TODAY, TODAY)
+    DashboardRow = namedtuple("DashboardRow", statement.selected_columns.keys())
+    rows = [
+        DashboardRow(
+            id=uuid4(), channel_name="김영희님 케어채널", status="active", senior_name="김영희",
+            checklist_count=2, completion_rate=Decimal("87.5000000000000000"), report_id=uuid4(),
+            report_date=TODAY - timedelta(days=1), summary_text="오늘 컨디션이 좋으셨습니다.",
+            new_care_notes=1, new_photos=3, pending_feedback=0
+        ),
+        DashboardRow(
+            id=uuid4(), channel_name="박순자님 케어채널", status="active", senior_name="박순자",
+            checklist_count=0, completion_rate=None, report_id=None, report_date=None, summary_text=None,
+            new_care_notes=0, new_photos=0, pending_feedback=2
+        )
+    ]
+    data = [_serialize_dashboard_row(row, TODAY) for row in rows]
+    return service.create_response(message=f"{len(data)}개 채널의 요약을 성공적으로 조회했습니다.", data=data)
+
+
+def _channel_batch_result():
+    channel, missing_id = _channel(), uuid4()
+    data = _batch_result([channel.id, missing_id], [channel], None)
+    return service.create_response(message="1/2개의 채널을 조회했습니다.", data=data)
+
+
+def _sync_result():
+    channel_id = uuid4()
+    note = CareNote(
+        id=uuid4(), channel_id=channel_id, caregiver_id=uuid4(), note_type="daily_summary",
+        content="점심을 잘 드셨습니다.", related_date=TODAY, tags=["식사"], created_at=NOW
+    )
+    checklist = DailyChecklist(
+        id=uuid4(), channel_id=channel_id, template_id=uuid4(), checked_items={"items": [{"id": 1, "checked": True}]},
+        additional_notes=None, completion_rate=Decimal("100.00"), created_date=TODAY, created_by=uuid4(), created_at=NOW
+    )
+    changes = [
+        ChangeRow(1001, 1, "care_notes", "upsert", note.id),
+        ChangeRow(1001, 2, "daily_checklists", "upsert", checklist.id),
+        ChangeRow(1002, 1, "photos", "delete", uuid4()),
+        # 조회 시점에 이미 삭제된 행
+        ChangeRow(1003, 1, "photos", "upsert", uuid4())
+    ]
+    loaded = {"care_notes": [note], "daily_checklists": [checklist], "photos": []}
+    data = _sync_data(channel_id, None, changes, True, _group_changes(changes), loaded)
+    return service.create_response(message=f"{len(changes)}건의 변경 사항을 조회했습니다.", data=data)
+
+
+def _trend_result():
+    channel_id = uuid4()
+    rollups = [
+        ChecklistRollup(
+            channel_id=channel_id, period="day", period_start=TODAY - timedelta(days=offset), checklist_count=2,
+            completion_sum=Decimal("175.00"), checked_items=7, total_items=8, required_checked=3, required_unchecked=1
+        )
+        for offset in range(3)
+    ]
+    return service.create_response(
+        message=f"{len(rollups)}개 기간의 체크리스트 트렌드를 성공적으로 조회했습니다.",
+        data=_trend_data(channel_id, "day", rollups)
+    )
+
+
+def _bulk_result():
+    channel_id, template_id, creator_id = uuid4(), uuid4(), uuid4()
+    items = {item.id: item for item in [
+        ChecklistItem(id=1, text="혈압 측정", required=True, type="health"),
+        ChecklistItem(id=2, text="산책", type="activity")
+    ]}
+    resent_id = uuid4()
+    submissions = [
+        DailyChecklistSubmission(
+            channel_id=channel_id, template_id=template_id, created_by=creator_id,
+            checked_items=[{"id": 1, "checked": True}, {"id": 2, "checked": False}]
+        ),
+        DailyChecklistSubmission(
+            id=resent_id, channel_id=channel_id, template_id=template_id,
+            checked_items=[{"id": 1, "checked": True}]
+        ),
+        DailyChecklistSubmission(channel_id=channel_id, template_id=template_id, checked_items=[{"id": 9, "checked": True}]),
+        DailyChecklistSubmission(channel_id=uuid4(), template_id=template_id, checked_items=[])
+    ]
+    results, rows = _prepare_batch(submissions, {template_id: items}, {channel_id}, {creator_id})
+    # 재전송된 행은 이미 저장되어 있어 INSERT가 건너뜀
+    _mark_duplicates(results, {row["id"] for row in rows if row["id"] != resent_id})
+    return service.create_response(message="1/4개의 체크리스트를 저장했습니다.", data=_bulk_response_data(results))
+
+
+def _photo():
+    photo = _new_photo(
+        uuid4(), uuid4(), uuid4(), "blobs/ab/abcdef.jpg", "lunch.jpg", None, "meal", None, "ab" * 32
+    )
+    photo.created_at = NOW
+    return photo
+
+
+def _photo_upload_result():
+    return service.create_response(message="사진을 성공적으로 업로드했습니다.", data=_photo().to_dict())
+
+
+def _photo_url_result():
+    """서명 URL 라우트가 사진 파일 정보의 렌디션으로 응답을 구성하는 방식 그대로"""
+    photo = _photo()
+    rendition = PhotoRendition(
+        photo_id=photo.id, width=640, height=480, format="webp", file_url="renditions/ab/abcdef-640.webp",
+        file_size=20480, created_at=NOW
+    )
+    rendition = _photo_file_data(photo, [rendition])["renditions"][0]
+    return {
+        "success": True,
+        "message": "사진 서명 URL을 발급했습니다.",
+        "data": {
+            "url": f"/media/{rendition['file_url']}?expires=1706697000&signature=c2lnbmF0dXJl",
+            "expires_at": datetime.fromtimestamp(1706697000, timezone.utc),
+            "width": rendition["width"],
+            "format": rendition["format"]
+        }
+    }
+
+
+def _report_job(**values):
+    return ReportJob(**{
+        "id": uuid4(), "channel_id": uuid4(), "report_date": TODAY, "attempts": 0, "max_attempts": 3,
+        "run_after": NOW, "last_error": None, "report_id": None, "created_at": NOW, "started_at": None,
+        "finished_at": None, **values
+    })
+
+
+def _report():
+    """리포트 저장 시 서비스가 만드는 값으로 구성한 리포트"""
+    sources = {
+        "channel_id": str(uuid4()),
+        "report_date": TODAY.isoformat(),
+        "checklists": [{"id": str(uuid4())}],
+        "care_notes": [{"id": str(uuid4())}, {"id": str(uuid4())}],
+        "photos": [],
+        "question_responses": []
+    }
+    content = {
+        "summary_text": "오늘 컨디션이 좋으셨습니다. 점심을 잘 드셨습니다.",
+        "family_comment": "편안한 하루를 보내셨습니다.",
+        "mood_analysis": {"overall": "good"},
+        "health_status": {"blood_pressure": "normal"},
+        "recommendations": ["수분 섭취를 늘려 주세요."],
+        "confidence_score": Decimal("0.85")
+    }
+    report = AIReport(**_report_values(sources, content, "gpt-4o-mini", 1200))
+    report.translations = {}
+    report.created_at = NOW
+    return report
+
+
+def _report_translations_result():
+    """번역 라우트가 stub 번역기의 번역 결과로 응답을 구성하는 방식 그대로"""
+    report = _report().to_dict(include_relations=True)
+    manager = TranslationManager(FakeCacheManager())
+    manager.translator = StubTranslator()
+    manager._semaphore = asyncio.Semaphore(settings.TRANSLATION_CONCURRENCY)
+    translations = asyncio.run(manager.translate_report(report, ["en", "ja"]))
+    return {
+        "success": True,
+        "message": "리포트를 번역했습니다.",
+        "data": {"report_id": report["id"], "translations": translations}
+    }
+
+
+# (라우트, 라우트에 선언된 response_model, 서비스 결과)
+ROUTE_CASES = [
+    ("GET /api/v1/access/{code}", AccessCodeResponse, _access_code_result),
+    ("POST /api/v1/access/{code}/mark-used", AccessTokenResponse, _access_token_result),
+    ("GET /api/v1/channels/my", MyChannelsResponse, lambda: {
+        "success": True,
+        "message": "2개의 채널을 성공적으로 조회했습니다.",
+        "data": [_channel_data(), _channel_data()],
+        "pagination": _pagination()
+    }),
+    ("GET /api/v1/channels/{channel_id}", ChannelResponse, lambda: {
+        "success": True,
+        "message": "채널 정보를 성공적으로 조회했습니다.",
+        "data": _channel_data()
+    }),
+    ("GET /api/v1/checklists/templates", ChecklistTemplateListResponse, lambda: {
+        "success": True,
+        "message": "1개의 체크리스트 템플릿을 성공적으로 조회했습니다.",
+        "data": [_template_data()],
+        "pagination": {**_pagination(has_more=False), "total": 1, "total_is_exact": True}
+    }),
+    ("GET /api/v1/checklists/templates/{template_id}", ChecklistTemplateResponse, lambda: {
+        "success": True,
+        "message": "체크리스트 템플릿을 성공적으로 조회했습니다.",
+        "data": _template_data()
+    }),
+    ("GET /api/v1/checklists/templates/category/{category}", ChecklistTemplateListResponse, lambda: {
+        "success": True,
+        "message": "0개의 체크리스트 템플릿을 성공적으로 조회했습니다.",
+        "data": [],
+        "pagination": _pagination(has_more=False)
+    }),
+    ("GET /api/v1/channels/dashboard", ChannelDashboardResponse, _dashboard_result),
+    ("POST /api/v1/channels/batch", ChannelBatchResponse, _channel_batch_result),
+    ("GET /api/v1/channels/{channel_id}/sync", ChannelSyncResponse, _sync_result),
+    ("GET /api/v1/checklists/trends/{channel_id}", ChecklistTrendResponse, _trend_result),
+    ("POST /api/v1/checklists/daily/bulk", DailyChecklistBulkResponse, _bulk_result),
+    ("POST /api/v1/photos", PhotoResponse, _photo_upload_result),
+    ("GET /api/v1/photos/{photo_id}/url", PhotoUrlResponse, _photo_url_result),
+    ("POST /api/v1/reports/jobs", ReportJobResponse, lambda: service.create_response(
+        message="리포트 생성 작업을 등록했습니다.",
+        data={**_report_job(status="queued").to_dict(), "created": True}
+    )),
+    ("GET /api/v1/reports/jobs/{job_id}", ReportJobResponse, lambda: service.create_response(
+        message="리포트 생성 작업을 조회했습니다.",
+        data=_report_job(status="succeeded", attempts=1, report_id=uuid4(), started_at=NOW, finished_at=NOW).to_dict()
+    )),
+    ("GET /api/v1/reports/{report_id}", AIReportResponse, lambda: service.create_response(
+        message="리포트를 성공적으로 조회했습니다.",
+        data=_report().to_dict(include_relations=True)
+    )),
+    ("POST /api/v1/reports/{report_id}/translations", ReportTranslationsResponse, _report_translations_result)
+]
+
+
+@pytest.fixture
+def fast_json(monkeypatch):
+    monkeypatch.setattr(settings, "FAST_JSON_RESPONSES", True)
+    monkeypatch.setattr(settings, "FAST_JSON_VALIDATE", False)
+
+
+@pytest.mark.parametrize("route, response_model, build", ROUTE_CASES, ids=[case[0] for case in ROUTE_CASES])
+def test_fast_response_matches_response_model(fast_json, route, response_model, build):
+    result = build()
+    response = fast_response(result, response_model)
+
+    assert isinstance(response, FastJSONResponse)
+    # 빠른 경로 본문이 스키마 검증을 통과하고, 표준 경로(response_model 직렬화)와 같은 값을 가져야 함
+    fast = response_model.model_validate_json(response.body)
+    standard = response_model.model_validate(result)
+    assert fast.model_dump(mode="json") == standard.model_dump(mode="json")
+
+
+def test_fast_response_encodes_native_types(fast_json):
+    channel_id = uuid4()
+    response = fast_response({
+        "success": True,
+        "message": "OK",
+        "data": {"id": channel_id, "day": date(2024, 1, 31), "at": NOW, "rate": Decimal("87.50")}
+    })
+
+    body = AccessCodeResponse.model_validate_json(response.body)
+    assert body.data == {"id": str(channel_id), "day": "2024-01-31", "at": "2024-01-31T09:30:00+00:00", "rate": "87.50"}
+
+
+def test_fast_response_rejects_schema_drift(fast_json):
+    result = {"success": True, "message": "OK", "data": {**_channel_data(), "start_date": None}}
+    response = fast_response(result, ChannelResponse)
+
+    with pytest.raises(ValueError):
+        ChannelResponse.model_validate_json(response.body)
+
+
+def test_fast_response_disabled_returns_result(monkeypatch):
+    monkeypatch.setattr(settings, "FAST_JSON_RESPONSES", False)
+    result = _access_code_result()
+
+    assert fast_response(result, AccessCodeResponse) is result
@@ -0,0 +1,73 @@
+"""
+응답 압축 미들웨어 테스트
+JSON 응답은 압축하고, 사진/부분 응답/이미 압축된 타입은 그대로 전달하는지 확인
+"""
+
+import re
+
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from negotiation import SelectiveGZipMiddleware
+
+BODY = b"x" * 4096
+
+
+def _json(request):
+    return JSONResponse({"data": "x" * 4096})
+
+
+def _photo(request):
+    return Response(BODY, media_type="image/jpeg")
+
+
+def _partial(request):
+    return Response(BODY[:100], status_code=206, media_type="text/plain", headers={"Content-Range": "bytes 0-99/4096"})
+
+
+def _excluded(request):
+    return Response(BODY, media_type="text/plain")
+
+
+def _client():
+    app = Starlette(routes=[
+        Route("/json", _json),
+        Route("/photo", _photo),
+        Route("/partial", _partial),
+        Route("/media/file", _excluded)
+    ])
+    app.add_middleware(SelectiveGZipMiddleware, minimum_size=1024, exclude_path=re.compile(r"^/media/"))
+    return TestClient(app)
+
+
+def test_json_response_is_compressed():
+    response = _client().get("/json", headers={"Accept-Encoding": "gzip"})
+    
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.json() == {"data": "x" * 4096}
+
+
+def test_precompressed_type_is_not_compressed():
+    response = _client().get("/photo", headers={"Accept-Encoding": "gzip"})
+    
+    assert "content-encoding" not in response.headers
+    assert response.headers["content-length"] == str(len(BODY))
+    assert response.content == BODY
+
+
+def test_partial_response_is_not_compressed():
+    response = _client().get("/partial", headers={"Accept-Encoding": "gzip"})
+    
+    assert response.status_code == 206
+    assert "content-encoding" not in response.headers
+    assert response.headers["content-range"] == "bytes 0-99/4096"
+    assert response.content == BODY[:100]
+
+
+def test_excluded_path_is_not_compressed():
+    response = _client().get("/media/file", headers={"Accept-Encoding": "gzip"})
+    
+    assert "content-encoding" not in response.headers
+    assert response.content == BODY
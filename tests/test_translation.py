@@ -0,0 +1,139 @@
+"""
+리포트 번역 계층 테스트
+외부 API/Redis 없이 stub 번역기와 메모리 캐시로 캐시 적중/미스, 요청 묶음, 진행 중 요청 공유를 확인
+"""
+
+import asyncio
+
+import pytest
+
+from config import settings
+from translation import StubTranslator, TranslationError, TranslationManager, pack_batches
+
+
+class FakeCacheManager:
+    """Redis 대신 사용하는 메모리 공유 캐시"""
+    
+    def __init__(self):
+        self.values = {}
+    
+    async def get_many_json(self, keys):
+        return {key: self.values[key] for key in keys if key in self.values}
+    
+    async def set_many_json(self, values, ttl):
+        self.values.update(values)
+        return True
+
+
+class RecordingTranslator(StubTranslator):
+    """요청마다 받은 문장 묶음을 기록하는 stub 번역기"""
+    
+    def __init__(self):
+        self.requests = []
+    
+    async def translate(self, texts, target, source):
+        self.requests.append(list(texts))
+        return await super().translate(texts, target, source)
+
+
+@pytest.fixture(autouse=True)
+def translation_settings(monkeypatch):
+    monkeypatch.setattr(settings, "TRANSLATION_PROVIDER", "stub")
+    monkeypatch.setattr(settings, "TRANSLATION_STUB_LATENCY_MS", 0)
+    monkeypatch.setattr(settings, "TRANSLATION_SOURCE_LANGUAGE", "ko")
+
+
+def _manager(cache=None, translator=None):
+    manager = TranslationManager(cache or FakeCacheManager())
+    manager.translator = translator or RecordingTranslator()
+    manager._semaphore = asyncio.Semaphore(settings.TRANSLATION_CONCURRENCY)
+    return manager
+
+
+def test_stub_translator_marks_target_language():
+    assert asyncio.run(StubTranslator().translate(["안녕하세요.", "식사하셨어요?"], "en", "ko")) == [
+        "[en] 안녕하세요.",
+        "[en] 식사하셨어요?"
+    ]
+
+
+def test_source_language_is_returned_unchanged():
+    manager = _manager()
+    
+    assert asyncio.run(manager.translate_texts(["안녕하세요."], "ko")) == ["안녕하세요."]
+    assert manager.translator.requests == []
+
+
+def test_cache_miss_then_local_and_shared_hits():
+    cache = FakeCacheManager()
+    manager = _manager(cache)
+    texts = ["식사를 잘 하셨습니다.", "산책을 하셨습니다.", "식사를 잘 하셨습니다."]
+    
+    first = asyncio.run(manager.translate_texts(texts, "en"))
+    second = asyncio.run(manager.translate_texts(texts, "en"))
+    
+    assert first == second == ["[en] 식사를 잘 하셨습니다.", "[en] 산책을 하셨습니다.", "[en] 식사를 잘 하셨습니다."]
+    # 반복되는 문장은 한 번만 요청하고, 두 번째 호출은 프로세스 내 캐시에서 응답
+    assert manager.translator.requests == [["식사를 잘 하셨습니다.", "산책을 하셨습니다."]]
+    assert manager.stats["misses"] == 2
+    assert manager.stats["local_hits"] == 2
+    
+    # 다른 프로세스는 Redis 공유 캐시에서 응답
+    other = _manager(cache)
+    assert asyncio.run(other.translate_texts(texts, "en")) == first
+    assert other.translator.requests == []
+    assert other.stats["shared_hits"] == 2
+
+
+def test_missing_sentences_are_sent_in_batches(monkeypatch):
+    monkeypatch.setattr(settings, "TRANSLATION_BATCH_SEGMENTS", 2)
+    manager = _manager()
+    texts = [f"문장 {index}." for index in range(5)]
+    
+    translated = asyncio.run(manager.translate_texts(texts, "ja"))
+    
+    assert translated == [f"[ja] 문장 {index}." for index in range(5)]
+    assert sorted(len(batch) for batch in manager.translator.requests) == [1, 2, 2]
+    assert manager.stats["api_calls"] == 3
+
+
+def test_pack_batches_limits_segments_and_characters():
+    assert pack_batches(["a", "b", "c"], max_segments=2, max_chars=100) == [["a", "b"], ["c"]]
+    assert pack_batches(["aaaa", "bb", "cccccc"], max_segments=10, max_chars=6) == [["aaaa", "bb"], ["cccccc"]]
+
+
+def test_concurrent_requests_share_inflight_translation(monkeypatch):
+    monkeypatch.setattr(settings, "TRANSLATION_STUB_LATENCY_MS", 20)
+    manager = _manager()
+    
+    async def run():
+        return await asyncio.gather(
+            manager.translate_texts(["오늘 컨디션이 좋으셨습니다."], "vi"),
+            manager.translate_texts(["오늘 컨디션이 좋으셨습니다."], "vi")
+        )
+    
+    first, second = asyncio.run(run())
+    
+    assert first == second == ["[vi] 오늘 컨디션이 좋으셨습니다."]
+    assert len(manager.translator.requests) == 1
+    assert manager.stats["inflight_waits"] == 1
+
+
+def test_cancelled_owner_fails_waiters_without_cancelling_them(monkeypatch):
+    monkeypatch.setattr(settings, "TRANSLATION_STUB_LATENCY_MS", 1000)
+    manager = _manager()
+    
+    async def run():
+        owner = asyncio.create_task(manager.translate_texts(["혈압이 정상이었습니다."], "en"))
+        await asyncio.sleep(0.01)
+        waiter = asyncio.create_task(manager.translate_texts(["혈압이 정상이었습니다."], "en"))
+        await asyncio.sleep(0.01)
+        owner.cancel()
+        
+        with pytest.raises(asyncio.CancelledError):
+            await owner
+        with pytest.raises(TranslationError):
+            await waiter
+        return manager._inflight
+    
+    assert asyncio.run(run()) == {}